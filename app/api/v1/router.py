@@ -16,6 +16,10 @@ from app.modules.products.products_route import router as products_router
 # ── Variants ──────────────────────────────────────────────
 from app.modules.product_variants.product_variants_route import router as product_variants_router
 
+# ── Search ────────────────────────────────────────────────
+from app.modules.search.search_route import router as search_router
+from app.modules.lookup.lookup_route import router as lookup_router
+
 # ── Media ─────────────────────────────────────────────────
 from app.modules.product_images.product_images_route import router as product_images_router
 from app.modules.variant_images.variant_images_route import router as variant_images_router
@@ -27,6 +31,9 @@ from app.modules.product_variant_standards.product_variant_standards_route impor
 # ── Attributes ────────────────────────────────────────────
 from app.modules.attributes.attributes_route import router as attributes_router
 from app.modules.product_variant_attributes.product_variant_attributes_route import router as pva_router
+from app.modules.variant_attribute_values.variant_attribute_values_route import (
+    router as variant_attribute_values_router,
+)
 
 # ── Applications ──────────────────────────────────────────
 from app.modules.applications.applications_route import router as applications_router
@@ -36,6 +43,14 @@ from app.modules.product_applications.product_applications_route import router a
 from app.modules.warehouses.warehouses_route import router as warehouses_router
 from app.modules.inventory.inventory_route import router as inventory_router
 from app.modules.inventory_movements.inventory_movements_route import router as inv_movements_router
+from app.modules.availability.availability_route import router as availability_router
+from app.modules.inventory_ledger.inventory_ledger_route import router as inventory_ledger_router
+from app.modules.stock_sync.stock_sync_route import router as stock_sync_router
+from app.modules.price_imports.price_imports_route import router as price_imports_router
+from app.modules.price_tiers.price_tiers_route import router as price_tiers_router
+
+# ── Shipping ──────────────────────────────────────────────
+from app.modules.shipping.shipping_route import router as shipping_router
 
 # ── Orders ────────────────────────────────────────────────
 from app.modules.orders.orders_route import router as orders_router
@@ -70,6 +85,10 @@ router.include_router(products_router,      prefix="/products",
 # Variants
 router.include_router(product_variants_router,  prefix="/product-variants",      tags=["Product Variants"])
 
+# Search
+router.include_router(search_router,            prefix="/search",                tags=["Search"])
+router.include_router(lookup_router,            prefix="/lookup",                tags=["Lookup"])
+
 # Media
 router.include_router(product_images_router,    prefix="/product-images",        tags=["Product Images"])
 router.include_router(variant_images_router,    prefix="/variant-images",        tags=["Variant Images"])
@@ -81,6 +100,11 @@ router.include_router(pvs_router,           prefix="/product-variant-standards",
 # Attributes
 router.include_router(attributes_router,    prefix="/attributes",                tags=["Attributes"])
 router.include_router(pva_router,           prefix="/product-variant-attributes", tags=["Product Variant Attributes"])
+router.include_router(
+    variant_attribute_values_router,
+    prefix="/variant-attribute-values",
+    tags=["Variant Attribute Values"],
+)
 
 # Applications
 router.include_router(applications_router,  prefix="/applications",              tags=["Applications"])
@@ -90,6 +114,14 @@ router.include_router(pa_router,            prefix="/product-applications",
 router.include_router(warehouses_router,    prefix="/warehouses",                tags=["Warehouses"])
 router.include_router(inventory_router,     prefix="/inventory",                 tags=["Inventory"])
 router.include_router(inv_movements_router, prefix="/inventory-movements",       tags=["Inventory Movements"])
+router.include_router(availability_router,  prefix="/availability",              tags=["Availability"])
+router.include_router(inventory_ledger_router, prefix="/inventory-ledger",        tags=["Inventory Ledger"])
+router.include_router(stock_sync_router,    prefix="/stock-sync",                tags=["Stock Sync"])
+router.include_router(price_imports_router, prefix="/price-imports",             tags=["Price Imports"])
+router.include_router(price_tiers_router,   prefix="/price-tiers",               tags=["Price Tiers"])
+
+# Shipping
+router.include_router(shipping_router,      prefix="/shipping",                  tags=["Shipping"])
 
 # Orders
 router.include_router(orders_router,        prefix="/orders",                    tags=["Orders"])
@@ -1,3 +1,8 @@
-from app.common.services.http_client import HTTPClient, ShippingClient
+from app.common.services.http_client import (
+    HTTPClient,
+    ShippingClient,
+    close_http_clients,
+    get_http_metrics,
+)
 
-__all__ = ["HTTPClient", "ShippingClient"]
+__all__ = ["HTTPClient", "ShippingClient", "close_http_clients", "get_http_metrics"]
@@ -1,45 +1,345 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Optional
+
 import httpx
 from loguru import logger
-from typing import Optional
+
+from app.core.config import settings
+from app.core.exceptions import ExternalServiceError
+
+
+# Methods that are safe to replay after a transport failure or gateway error
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+
+_LATENCY_WINDOW = 512
+
+
+# ── Per-upstream metrics ─────────────────────────────────
+
+class UpstreamStats:
+    """Call counts and a rolling latency window for one upstream."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self._latencies_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def observe(self, elapsed_ms: float, ok: bool) -> None:
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self._latencies_ms.append(elapsed_ms)
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self._latencies_ms)
+
+        def pct(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 2)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "p50Ms": pct(0.50),
+            "p95Ms": pct(0.95),
+        }
+
+
+# ── Circuit breaker ──────────────────────────────────────
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: open after N failures, probe after a cool-down.
+
+    While open, calls fail fast instead of queueing on a dead upstream.
+    After `reset_seconds` one probe call is let through (half-open); its
+    outcome closes or re-opens the circuit. A probe that ends without an
+    outcome (cancelled, unexpected error) hands its slot back with
+    `release_probe`, and one that never reports back is replaced after
+    another `reset_seconds`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self._opened_at >= self.reset_seconds:
+            self.state = self.HALF_OPEN
+            self._probe_started_at = now
+            return True
+        if self.state == self.HALF_OPEN and now - self._probe_started_at >= self.reset_seconds:
+            # The probe in flight never reported back; let another one through
+            self._probe_started_at = now
+            return True
+        # OPEN within cool-down, or a HALF_OPEN probe is already in flight
+        return False
+
+    def release_probe(self) -> None:
+        """Give the half-open slot back: the next call probes straight away."""
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic() - self.reset_seconds
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+# ── Shared client registry ───────────────────────────────
+
+_clients: dict[str, httpx.AsyncClient] = {}
+_breakers: dict[str, CircuitBreaker] = {}
+_stats: dict[str, UpstreamStats] = {}
 
 
+def _http2_available() -> bool:
+    if not settings.http2_enabled:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP/2 requested but `h2` is not installed, falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _build_client(
+    base_url: str, transport: httpx.AsyncBaseTransport | None = None
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(
+            settings.http_timeout_seconds, connect=settings.http_connect_timeout_seconds
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+        http2=_http2_available() if transport is None else False,
+        transport=transport,
+    )
+
+
+def _get_shared_client(upstream: str, base_url: str) -> httpx.AsyncClient:
+    """Return the app-lifespan client for `upstream`, creating it on first use."""
+    client = _clients.get(upstream)
+    if client is None or client.is_closed:
+        client = _build_client(base_url)
+        _clients[upstream] = client
+        logger.info("HTTP client created | upstream={} base_url={}", upstream, base_url)
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every pooled upstream client (called from main.py lifespan)."""
+    for upstream, client in list(_clients.items()):
+        await client.aclose()
+        logger.info("HTTP client closed | upstream={}", upstream)
+    _clients.clear()
+
+
+def get_http_metrics() -> dict:
+    """Per-upstream call metrics and breaker state, for /health."""
+    return {
+        upstream: {**stats.snapshot(), "circuit": _breakers[upstream].state}
+        for upstream, stats in _stats.items()
+    }
+
+
+# ── Client ───────────────────────────────────────────────
+
 class HTTPClient:
     """
     Reusable async HTTP client wrapper.
     Use this to call third-party APIs (Stripe, shipping providers, etc.)
+
+    All instances with the same `upstream` name share one pooled
+    `httpx.AsyncClient` for the app lifespan, plus one circuit breaker and
+    one metrics bucket. Idempotent calls are retried with jittered
+    exponential backoff; failures surface as ExternalServiceError.
+
+    Passing `transport` (e.g. `httpx.ASGITransport(app=stub_app)`) gives the
+    instance its own client instead of the shared one; close it with `aclose()`.
     """
 
-    def __init__(self, base_url: str, headers: Optional[dict] = None):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[dict] = None,
+        upstream: Optional[str] = None,
+        max_retries: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.base_url = base_url
         self.default_headers = headers or {}
+        self.upstream = upstream or httpx.URL(base_url).host or base_url
+        self.max_retries = settings.http_max_retries if max_retries is None else max_retries
+        self._own_client = _build_client(base_url, transport) if transport is not None else None
 
-    async def get(self, path: str, params: dict = None) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}{path}",
-                params=params,
-                headers=self.default_headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        self._breaker = _breakers.setdefault(
+            self.upstream,
+            CircuitBreaker(
+                settings.http_circuit_failure_threshold, settings.http_circuit_reset_seconds
+            ),
+        )
+        self._stats = _stats.setdefault(self.upstream, UpstreamStats())
 
-    async def post(self, path: str, payload: dict) -> dict:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}{path}",
-                json=payload,
-                headers=self.default_headers,
-            )
-            response.raise_for_status()
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._own_client is not None:
+            return self._own_client
+        return _get_shared_client(self.upstream, self.base_url)
+
+    async def aclose(self) -> None:
+        """Close an instance-owned client (shared clients close with the app)."""
+        if self._own_client is not None:
+            await self._own_client.aclose()
+
+    async def get(self, path: str, params: dict = None, timeout: float | None = None) -> dict:
+        return await self.request("GET", path, params=params, timeout=timeout)
+
+    async def post(
+        self,
+        path: str,
+        payload: dict,
+        timeout: float | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict:
+        # A POST is only replayed when the upstream can dedupe it
+        headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+        return await self.request(
+            "POST", path, json=payload, headers=headers, timeout=timeout,
+            idempotent=idempotency_key is not None,
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict | None = None,
+        json: dict | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+        idempotent: bool | None = None,
+    ) -> dict:
+        method = method.upper()
+        retryable = method in IDEMPOTENT_METHODS if idempotent is None else idempotent
+        attempts = 1 + (self.max_retries if retryable else 0)
+        request_timeout = (
+            httpx.Timeout(timeout, connect=settings.http_connect_timeout_seconds)
+            if timeout
+            else None
+        )
+
+        for attempt in range(attempts):
+            if not self._breaker.allow():
+                raise ExternalServiceError(
+                    self.upstream, f"{self.upstream} circuit open, failing fast", status_code=503
+                )
+
+            probing = self._breaker.state == CircuitBreaker.HALF_OPEN
+            started = time.perf_counter()
+            try:
+                kwargs = {
+                    "params": params,
+                    "json": json,
+                    "headers": {**self.default_headers, **(headers or {})},
+                }
+                if request_timeout is not None:
+                    kwargs["timeout"] = request_timeout
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError as exc:
+                self._record(started, ok=False)
+                logger.warning(
+                    "Upstream transport error | upstream={} method={} path={} attempt={} error={}",
+                    self.upstream, method, path, attempt + 1, repr(exc),
+                )
+                if attempt + 1 < attempts:
+                    await self._backoff(attempt)
+                    continue
+                raise ExternalServiceError(self.upstream, f"{self.upstream} unreachable") from exc
+            except BaseException:
+                # Cancelled, or failed in a way that says nothing about the upstream
+                if probing:
+                    self._breaker.release_probe()
+                raise
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                self._record(started, ok=False)
+                logger.warning(
+                    "Upstream gateway error | upstream={} method={} path={} status={} attempt={}",
+                    self.upstream, method, path, response.status_code, attempt + 1,
+                )
+                if attempt + 1 < attempts:
+                    await self._backoff(attempt)
+                    continue
+                raise ExternalServiceError(
+                    self.upstream, f"{self.upstream} returned {response.status_code}"
+                )
+
+            # 4xx is the caller's problem, not upstream health; a non-retryable 5xx still is
+            self._record(started, ok=response.status_code < 500)
+            if response.is_error:
+                raise ExternalServiceError(
+                    self.upstream,
+                    f"{self.upstream} rejected request with {response.status_code}",
+                    status_code=502,
+                )
             return response.json()
 
+        raise AssertionError("unreachable")  # loop always returns or raises
+
+    def _record(self, started: float, ok: bool) -> None:
+        self._stats.observe((time.perf_counter() - started) * 1000, ok)
+        if ok:
+            self._breaker.record_success()
+        else:
+            self._breaker.record_failure()
+
+    async def _backoff(self, attempt: int) -> None:
+        # Full jitter keeps retrying workers from stampeding a recovering upstream
+        self._stats.retries += 1
+        await asyncio.sleep(random.uniform(0, settings.http_retry_backoff_seconds * (2 ** attempt)))
+
 
 # ── Example: Shipping provider client ────────────────────
 class ShippingClient(HTTPClient):
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         super().__init__(
-            base_url="https://api.yourshippingprovider.com",
-            headers={"Authorization": f"Bearer {api_key}"},
+            base_url=base_url or settings.shipping_api_url,
+            headers={"Authorization": f"Bearer {api_key or settings.shipping_api_key}"},
+            upstream="shipping",
+            transport=transport,
         )
 
     async def get_shipping_rates(self, from_zip: str, to_zip: str, weight: float) -> dict:
@@ -48,4 +348,10 @@ class ShippingClient(HTTPClient):
 
     async def create_shipment(self, order_data: dict) -> dict:
         logger.info("Creating shipment | order_id={}", order_data.get("order_id"))
-        return await self.post("/shipments", payload=order_data)
+        # Keyed on the order so a retried create cannot double-ship
+        order_id = order_data.get("order_id")
+        return await self.post(
+            "/shipments",
+            payload=order_data,
+            idempotency_key=f"shipment-{order_id}" if order_id else None,
+        )
@@ -0,0 +1,74 @@
+"""Local stand-in for the shipping provider API.
+
+Mount it in-process with `httpx.ASGITransport`:
+
+    stub = create_shipping_stub_app(latency_ms=40, fail_every=5)
+    client = ShippingClient(api_key="test", base_url="http://stub",
+                            transport=httpx.ASGITransport(app=stub))
+
+or run it as a real server for end-to-end checks (pooling, HTTP/2, timeouts):
+
+    uvicorn app.common.services.http_stub:app --port 8081
+    SHIPPING_API_URL=http://127.0.0.1:8081
+"""
+
+import asyncio
+import hashlib
+import itertools
+
+from fastapi import FastAPI, Query, Response
+
+
+def create_shipping_stub_app(latency_ms: int = 0, fail_every: int = 0) -> FastAPI:
+    """Build a stub provider.
+
+    `latency_ms` delays every response; `fail_every=N` answers every Nth call
+    with a 503 so retry and circuit-breaker paths can be exercised.
+    """
+    stub = FastAPI(title="Shipping provider stub", docs_url=None, redoc_url=None)
+    stub.state.calls = 0
+    counter = itertools.count(1)
+
+    async def _simulate(response: Response) -> bool:
+        stub.state.calls = next(counter)
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if fail_every and stub.state.calls % fail_every == 0:
+            response.status_code = 503
+            return False
+        return True
+
+    @stub.get("/rates")
+    async def rates(
+        response: Response,
+        from_: str = Query(..., alias="from"),
+        to: str = Query(...),
+        weight: float = Query(..., gt=0),
+    ):
+        if not await _simulate(response):
+            return {"error": "temporarily unavailable"}
+
+        # Deterministic per (from, to) so cached and live quotes can be compared
+        seed = int(hashlib.sha256(f"{from_}:{to}".encode()).hexdigest()[:6], 16)
+        base = 8 + (seed % 1200) / 100
+        return {
+            "from": from_,
+            "to": to,
+            "weight": weight,
+            "currency": "CAD",
+            "rates": [
+                {"service": "GROUND", "amount": round(base + weight * 0.45, 2), "days": 5},
+                {"service": "EXPRESS", "amount": round(base * 1.8 + weight * 0.9, 2), "days": 2},
+            ],
+        }
+
+    @stub.post("/shipments")
+    async def shipments(payload: dict, response: Response):
+        if not await _simulate(response):
+            return {"error": "temporarily unavailable"}
+        return {"shipment_id": f"SHP-{stub.state.calls:06d}", "order_id": payload.get("order_id")}
+
+    return stub
+
+
+app = create_shipping_stub_app()
@@ -8,6 +8,7 @@ from .sanitization import (
     sanitize_url,
     sanitize_user_input,
 )
+from .tabular import iter_lines, iter_rows
 
 __all__ = [
     "sanitize_html",
@@ -16,4 +17,6 @@ __all__ = [
     "sanitize_filename",
     "sanitize_url",
     "sanitize_user_input",
+    "iter_lines",
+    "iter_rows",
 ]
@@ -0,0 +1,104 @@
+"""Streaming reader for CSV / NDJSON uploads.
+
+Bulk endpoints receive files too large to buffer: `iter_rows` decodes the
+request body line by line and yields one dict per data row, keyed by the
+canonical column names of the caller's `aliases` (header names are matched
+case-, space- and underscore-insensitively; unknown columns are dropped).
+A quoted CSV field may span lines.
+"""
+
+import csv
+import json
+from typing import AsyncIterator, Iterable, Optional
+
+from app.core.exceptions import ValidationError
+
+FORMATS = ("csv", "ndjson")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into text lines (UTF-8, BOM and CR stripped)."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for raw in complete:
+            yield raw.decode("utf-8-sig").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8-sig").rstrip("\r")
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[list[str]]:
+    """Parse CSV records, joining lines while a quoted field is still open."""
+    pending: list[str] = []
+    quotes = 0
+    async for line in lines:
+        if not pending and not line.strip():
+            continue
+        pending.append(line)
+        # An odd number of quotes so far ("" escapes count two) means the newline is data
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        yield next(csv.reader(["\n".join(pending)]))
+        pending, quotes = [], 0
+    if pending:
+        raise ValidationError("CSV ends inside a quoted field", field="file")
+
+
+def canonical_column(name, aliases: dict[str, str]) -> Optional[str]:
+    return aliases.get(str(name).strip().lower().replace("_", "").replace(" ", ""))
+
+
+async def iter_rows(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    aliases: dict[str, str],
+    required: Iterable[str] = (),
+) -> AsyncIterator[dict]:
+    """Yield the data rows of a CSV (with header) or NDJSON stream.
+
+    Blank lines are skipped. A CSV header lacking a `required` column, or a
+    row whose field count differs from the header's, rejects the file; an
+    NDJSON line that is not a JSON object yields an
+    empty row, so the caller's validation reports it by line number.
+    """
+    if fmt not in FORMATS:
+        raise ValidationError(f"Unsupported format {fmt}", field="format", value=fmt)
+    if fmt == "csv":
+        header = None
+        row_no = 0
+        async for fields in _csv_records(iter_lines(chunks)):
+            if header is None:
+                header = [canonical_column(name, aliases) for name in fields]
+                missing = set(required) - set(header)
+                if missing:
+                    raise ValidationError(
+                        f"CSV header is missing: {', '.join(sorted(missing))}", field="file"
+                    )
+                continue
+            row_no += 1
+            if len(fields) != len(header):
+                raise ValidationError(
+                    f"CSV row {row_no} has {len(fields)} fields, the header has {len(header)}",
+                    field="file",
+                )
+            yield {name: value for name, value in zip(header, fields, strict=True) if name}
+        return
+
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            parsed = json.loads(line)
+        except json.JSONDecodeError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            yield {}
+            continue
+        row = {}
+        for key, value in parsed.items():
+            name = canonical_column(key, aliases)
+            if name:
+                row[name] = value
+        yield row
@@ -7,7 +7,7 @@ from .supabase_client import get_supabase_client
 from .security import (
     hash_password, verify_password,
     create_access_token, create_refresh_token,
-    decode_token, get_current_user, require_admin, oauth2_scheme
+    decode_token, get_current_user, get_optional_user, require_admin, oauth2_scheme
 )
 from .exceptions import (
     EcommerceException,
@@ -23,7 +23,8 @@ from .exceptions import (
     ConfigurationError,
     ProductValidationError,
     OrderValidationError,
-    UserValidationError
+    UserValidationError,
+    InsufficientStockError,
 )
 
 __all__ = [
@@ -39,6 +40,7 @@ __all__ = [
     "create_refresh_token",
     "decode_token",
     "get_current_user",
+    "get_optional_user",
     "require_admin",
     "oauth2_scheme",
     "EcommerceException",
@@ -55,4 +57,5 @@ __all__ = [
     "ProductValidationError",
     "OrderValidationError",
     "UserValidationError",
+    "InsufficientStockError",
 ]
@@ -0,0 +1,131 @@
+"""Cross-process cache invalidation over Redis pub/sub (optional).
+
+In-process caches register a handler per channel; writers publish the keys
+they changed after commit. Each API worker runs one listener task started
+from the lifespan. Without REDIS_URL publishing is a no-op and caches rely on
+their own TTLs.
+
+Pub/sub is fire-and-forget: after a reconnect handlers receive `"*"`, meaning
+"messages may have been lost — drop everything".
+
+Writers record what they changed on the session (`session.info[key]`); a
+hook registered with `after_commit(key, handler)` hands it to the handler
+once that session commits and drops it on rollback. Handlers run inside
+SQLAlchemy's sync event, so async follow-ups go through `spawn` /
+`publish_soon`.
+"""
+
+import asyncio
+from typing import Any, Callable, Coroutine
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.redis_client import get_redis
+
+FLUSH_ALL = "*"
+
+_handlers: dict[str, list[Callable[[str], None]]] = {}
+_listener: asyncio.Task | None = None
+_tasks: set[asyncio.Task] = set()
+
+
+def subscribe(channel: str, handler: Callable[[str], None]) -> None:
+    """Register a handler for a channel (call at import time, before startup)."""
+    _handlers.setdefault(channel, []).append(handler)
+
+
+async def publish(channel: str, message: str) -> None:
+    """Best-effort broadcast; failures are logged, never raised to the writer."""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.publish(channel, message)
+    except RedisError as exc:
+        logger.warning("Cache bus publish failed | channel={} error={}", channel, str(exc))
+
+
+def spawn(coro: Coroutine) -> None:
+    """Run `coro` as a background task on the running loop; dropped when there is none."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()
+        return
+    task = loop.create_task(coro)
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+def publish_soon(channel: str, message: str) -> None:
+    """`publish` from sync code (after-commit hooks), without waiting for it."""
+    spawn(publish(channel, message))
+
+
+def after_commit(key: str, handler: Callable[[Any], None]) -> None:
+    """Call `handler(session.info[key])` once a session that set it commits.
+
+    Sessions that never set the key (or set a falsy value) are ignored; a
+    rollback discards the value. Register at import time.
+    """
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(sync_session: Session) -> None:
+        changed = sync_session.info.pop(key, None)
+        if changed:
+            handler(changed)
+
+    @event.listens_for(Session, "after_rollback")
+    def _after_rollback(sync_session: Session) -> None:
+        sync_session.info.pop(key, None)
+
+
+def _dispatch(channel: str, message: str) -> None:
+    for handler in _handlers.get(channel, ()):
+        try:
+            handler(message)
+        except Exception:
+            logger.exception("Cache bus handler failed | channel={}", channel)
+
+
+async def _listen() -> None:
+    connected_before = False
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(*_handlers)
+            if connected_before:
+                for channel in _handlers:
+                    _dispatch(channel, FLUSH_ALL)
+            connected_before = True
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    _dispatch(message["channel"], message["data"])
+        except asyncio.CancelledError:
+            raise
+        except (RedisError, OSError) as exc:
+            logger.warning("Cache bus disconnected | error={}", str(exc))
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.close()
+
+
+def start_cache_bus() -> None:
+    """Start the listener on the running loop (no-op without Redis or handlers)."""
+    global _listener
+    if get_redis() is None or not _handlers or _listener is not None:
+        return
+    _listener = asyncio.create_task(_listen(), name="cache-bus")
+    logger.info("Cache bus listening | channels={}", list(_handlers))
+
+
+async def stop_cache_bus() -> None:
+    global _listener
+    if _listener is None:
+        return
+    _listener.cancel()
+    await asyncio.gather(_listener, return_exceptions=True)
+    _listener = None
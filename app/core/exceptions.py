@@ -199,12 +199,20 @@ class ProductValidationError(ValidationError):
 class OrderValidationError(ValidationError):
     """Order-specific validation errors."""
     
-    def __init__(self, message: str, order_id: str = None, item_index: int = None):
+    def __init__(
+        self,
+        message: str,
+        order_id: str = None,
+        item_index: int = None,
+        item_indexes: list[int] = None,
+    ):
         details = {}
         if order_id:
             details["order_id"] = order_id
         if item_index is not None:
             details["item_index"] = item_index
+        if item_indexes:
+            details["item_indexes"] = item_indexes
         
         super().__init__(message=message, details=details)
 
@@ -215,3 +223,14 @@ class UserValidationError(ValidationError):
     def __init__(self, field: str, value: Any, constraint: str):
         message = f"Invalid {field}: '{value}'. {constraint}"
         super().__init__(message=message, field=field, value=value)
+
+
+class InsufficientStockError(BusinessRuleError):
+    """Raised when a stock reservation cannot be covered in full."""
+    
+    def __init__(self, shortfalls: list[dict]):
+        super().__init__(
+            message=f"Insufficient stock for {len(shortfalls)} line(s)",
+            rule_name="stock_available",
+        )
+        self.details["shortfalls"] = shortfalls
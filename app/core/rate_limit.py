@@ -112,3 +112,9 @@ class RateLimits:
 
     # Search/Query endpoints - moderate to prevent scraping
     SEARCH = "20/minute"
+
+    # Typeahead - one request per keystroke, served from memory
+    SUGGEST = "120/minute"
+
+    # Natural-key lookups - scanners and quick-order pads, served from memory
+    LOOKUP = "600/minute"
@@ -0,0 +1,37 @@
+"""Shared async Redis client (lazy-initialised, optional)."""
+
+from loguru import logger
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+_redis_client: aioredis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis | None:
+    """Return the shared async Redis client, or None when REDIS_URL is not set.
+
+    The client owns a connection pool, so callers should reuse it rather than
+    calling `from_url` per request.
+    """
+    global _redis_client
+
+    if not settings.redis_url:
+        return None
+
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(
+            settings.redis_url, encoding="utf-8", decode_responses=True
+        )
+        logger.info("Async Redis client initialised")
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared client's connection pool (called from main.py lifespan)."""
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
+        logger.info("Async Redis client closed")
@@ -87,7 +87,27 @@ async def get_current_user(request: Request, token: str | None = Depends(oauth2_
         logger.warning("Attempted to use revoked user token | user_id={}", user_id)
         raise AuthenticationError("All sessions have been terminated. Please login again.")
 
-    return {"user_id": user_id, "role": payload.get("role", "DEALER")}
+    return {
+        "user_id": user_id,
+        "role": payload.get("role", "DEALER"),
+        "session_id": payload.get("sid"),  # refresh session that minted this token
+    }
+
+
+async def get_optional_user(
+    request: Request, token: str | None = Depends(oauth2_scheme)
+) -> dict | None:
+    """The signed-in user on public routes that personalize (e.g. dealer prices).
+
+    None when anonymous, and also when the token is expired, revoked or
+    malformed: a public route serves the anonymous view rather than a 401.
+    """
+    if not token and not request.cookies.get(settings.access_token_cookie_name):
+        return None
+    try:
+        return await get_current_user(request, token)
+    except AuthenticationError:
+        return None
 
 
 async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
@@ -10,6 +10,10 @@ from loguru import logger
 
 from app.core import settings, setup_logging, verify_db_connection, close_db_connection
 from app.core.rate_limit import setup_rate_limiting
+from app.core.redis_client import close_redis, get_redis
+from app.core.cache_bus import start_cache_bus, stop_cache_bus
+from app.common.services.http_client import close_http_clients, get_http_metrics
+from app.tasks.background import start_periodic, stop_background_jobs
 from app.api.v1.router import router as v1_router
 from app.middleware import (
     add_request_context,
@@ -55,12 +59,10 @@ async def lifespan(app: FastAPI):
     # ── Redis cache (optional) ───────────────────────────
     if settings.redis_url:
         try:
-            from redis import asyncio as aioredis
             from fastapi_cache import FastAPICache
             from fastapi_cache.backends.redis import RedisBackend
 
-            redis = aioredis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
-            FastAPICache.init(RedisBackend(redis), prefix="ecom-cache")
+            FastAPICache.init(RedisBackend(get_redis()), prefix="ecom-cache")
             logger.info("Redis cache initialized")
         except Exception as e:
             logger.warning("Redis not available, caching disabled | error={}", str(e))
@@ -70,9 +72,57 @@ async def lifespan(app: FastAPI):
     # Store connection status for health check
     app.state.db_connected = db_connected
 
+    # ── Background jobs ──────────────────────────────────
+    start_cache_bus()
+
+    if db_connected and settings.redis_url and settings.outbox_relay_enabled:
+        from app.tasks.outbox_relay import purge_published, relay_pending
+
+        start_periodic("outbox-relay", relay_pending, settings.outbox_relay_interval_seconds)
+        start_periodic("outbox-purge", purge_published, 3600)
+
+    if db_connected and settings.reservation_sweeper_enabled:
+        from app.tasks.reservation_sweeper import sweep_expired
+
+        start_periodic(
+            "reservation-sweeper", sweep_expired, settings.reservation_sweep_interval_seconds
+        )
+
+    if db_connected and settings.ledger_snapshots_enabled:
+        from app.tasks.ledger_snapshots import snapshot_if_due
+
+        # Runs hourly; take_snapshot writes only once per snapshot interval
+        start_periodic(
+            "ledger-snapshots",
+            snapshot_if_due,
+            min(3600, settings.ledger_snapshot_interval_seconds),
+        )
+
+    if db_connected and settings.search_suggest_enabled:
+        from app.modules.search.search_suggest import rebuild_suggest_index
+
+        # First run builds the index; later runs refresh popularity
+        start_periodic(
+            "search-suggest",
+            rebuild_suggest_index,
+            settings.search_suggest_rebuild_interval_seconds,
+        )
+
+    if db_connected and settings.search_bitmap_enabled:
+        from app.modules.search.search_bitmap import rebuild_bitmap_index
+
+        # Compacts ordinals left behind by removed variants
+        start_periodic(
+            "search-bitmap", rebuild_bitmap_index, settings.search_bitmap_rebuild_interval_seconds
+        )
+
     yield
 
     # ── Shutdown ─────────────────────────────────────────
+    await stop_background_jobs()
+    await stop_cache_bus()
+    await close_http_clients()
+    await close_redis()
     await close_db_connection()
     logger.info("Shutting down...")
 
@@ -162,7 +212,8 @@ async def health_check(request: Request):
             "database": getattr(app.state, "db_connected", False),
             "redis": settings.redis_url != "",
             "logging": True,
-        }
+        },
+        "upstreams": get_http_metrics(),
     }
 
     return respond(
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.modules.applications import applications_service as service
 from app.modules.applications.applications_dto import ApplicationDTO
 from app.modules.applications.applications_dco import ApplicationDCO, ApplicationUpdateDCO
+from app.modules.product_applications import product_applications_service
+from app.modules.product_applications.product_applications_dto import LinkedProductsPageDTO
 
 
 async def create(session: AsyncSession, data: ApplicationDCO) -> ApplicationDTO:
@@ -27,3 +29,16 @@ async def update(session: AsyncSession, record_id: UUID, data: ApplicationUpdate
 
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     return await service.delete_record(session, record_id)
+
+
+async def list_products(
+    session: AsyncSession,
+    record_id: UUID,
+    page: int,
+    limit: int,
+    include_inactive: bool,
+    include_deleted: bool,
+) -> LinkedProductsPageDTO | None:
+    return await product_applications_service.list_application_products(
+        session, record_id, page, limit, include_inactive, include_deleted
+    )
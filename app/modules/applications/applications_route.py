@@ -2,11 +2,11 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
-from app.core import get_db_session
+from app.core import AuthorizationError, get_db_session, get_optional_user
 from app.modules.applications import applications_controller as controller
 from app.modules.applications.applications_dco import ApplicationDCO, ApplicationUpdateDCO
 
@@ -41,6 +41,30 @@ async def get_application(
     return respond(data=record, message="Application fetched")
 
 
+@router.get("/{record_id}/products")
+async def list_application_products(
+    record_id: UUID,
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=200),
+    include_inactive: bool = Query(False, alias="includeInactive"),
+    include_deleted: bool = Query(False, alias="includeDeleted"),
+    current_user: dict | None = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Products linked to the application, by name; live products only unless asked otherwise.
+
+    Deleted products are listed for admins only.
+    """
+    if include_deleted and (current_user is None or current_user.get("role") != "ADMIN"):
+        raise AuthorizationError("Admin access required", required_role="ADMIN")
+    records = await controller.list_products(
+        db, record_id, page, limit, include_inactive, include_deleted
+    )
+    if records is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return respond(data=records, message="Application products fetched")
+
+
 @router.patch("/{record_id}")
 async def update_application(
     record_id: UUID,
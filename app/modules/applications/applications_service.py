@@ -10,6 +10,7 @@ from sqlalchemy.sql import func
 from app.modules.applications.applications_entity import Application
 from app.modules.applications.applications_dto import ApplicationDTO
 from app.modules.applications.applications_dco import ApplicationDCO, ApplicationUpdateDCO
+from app.modules.product_applications.product_applications_index import mark_changed
 
 
 async def create(session: AsyncSession, data: ApplicationDCO) -> ApplicationDTO:
@@ -18,6 +19,7 @@ async def create(session: AsyncSession, data: ApplicationDCO) -> ApplicationDTO:
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    mark_changed(session)
     return ApplicationDTO.model_validate(entity_obj)
 
 
@@ -49,6 +51,7 @@ async def update(session: AsyncSession, record_id: UUID, data: ApplicationUpdate
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    mark_changed(session)
     return ApplicationDTO.model_validate(entity_obj)
 
 
@@ -61,4 +64,5 @@ async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
         return False
     await session.delete(entity_obj)
     await session.flush()
+    mark_changed(session)
     return True
@@ -10,6 +10,7 @@ from sqlalchemy.sql import func
 from app.modules.attributes.attributes_entity import Attribute
 from app.modules.attributes.attributes_dto import AttributeDTO
 from app.modules.attributes.attributes_dco import AttributeDCO, AttributeUpdateDCO
+from app.modules.variant_attribute_values.variant_attribute_values_service import refresh_values
 
 
 async def create(session: AsyncSession, data: AttributeDCO) -> AttributeDTO:
@@ -44,11 +45,15 @@ async def update(session: AsyncSession, record_id: UUID, data: AttributeUpdateDC
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return None
+    previous = (entity_obj.data_type, entity_obj.unit)
     updates = data.model_dump(exclude_unset=True)
     for key, value in updates.items():
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    if (entity_obj.data_type, entity_obj.unit) != previous:
+        # Values are parsed per type and default unit
+        await refresh_values(session, attribute_ids=[record_id])
     return AttributeDTO.model_validate(entity_obj)
 
 
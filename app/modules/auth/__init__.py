@@ -7,11 +7,13 @@ from app.modules.auth.auth_dto import (
     LoginRequestDTO,
     TokenResponseDTO,
     RefreshTokenRequestDTO,
+    RevokeSessionsRequestDTO,
+    SessionResponseDTO,
     UpdateMyProfileRequestDTO,
     UserResponseDTO,
     UserRole,
 )
-from app.modules.auth.auth_dco import UserDCO
+from app.modules.auth.auth_dco import RefreshSessionDCO, UserDCO
 from app.modules.auth.auth_model import (
     create_user,
     find_user_by_email,
@@ -25,10 +27,13 @@ __all__ = [
     "LoginRequestDTO",
     "TokenResponseDTO",
     "RefreshTokenRequestDTO",
+    "RevokeSessionsRequestDTO",
+    "SessionResponseDTO",
     "UpdateMyProfileRequestDTO",
     "UserResponseDTO",
     "UserRole",
     "UserDCO",
+    "RefreshSessionDCO",
     "create_user",
     "find_user_by_email",
     "find_user_by_id",
@@ -22,9 +22,6 @@ class UserDCO(BaseDCO):
     updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     deleted_at: str | None = None
 
-    # Internal auth state (not exposed in response DTOs)
-    current_refresh_jti: str | None = None
-
     def to_dict(self) -> dict:
         """Serialize for storage."""
         return {
@@ -41,7 +38,6 @@ class UserDCO(BaseDCO):
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "deleted_at": self.deleted_at,
-            "current_refresh_jti": self.current_refresh_jti,
         }
 
     @classmethod
@@ -61,5 +57,45 @@ class UserDCO(BaseDCO):
             created_at=data.get("created_at", ""),
             updated_at=data.get("updated_at", ""),
             deleted_at=data.get("deleted_at"),
-            current_refresh_jti=data.get("current_refresh_jti"),
+        )
+
+
+@dataclass
+class RefreshSessionDCO:
+    """One signed-in device: the refresh-token chain it is allowed to rotate."""
+
+    id: str = ""
+    user_id: str = ""
+    jti: str = ""
+    user_agent: str | None = None
+    ip_address: str | None = None
+    created_at: str = ""
+    last_used_at: str = ""
+    expires_at: str = ""
+
+    def to_dict(self) -> dict:
+        """Serialize for storage."""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "jti": self.jti,
+            "user_agent": self.user_agent or "",
+            "ip_address": self.ip_address or "",
+            "created_at": self.created_at,
+            "last_used_at": self.last_used_at,
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RefreshSessionDCO":
+        """Hydrate from a stored dict."""
+        return cls(
+            id=data.get("id", ""),
+            user_id=data.get("user_id", ""),
+            jti=data.get("jti", ""),
+            user_agent=data.get("user_agent") or None,
+            ip_address=data.get("ip_address") or None,
+            created_at=data.get("created_at", ""),
+            last_used_at=data.get("last_used_at", ""),
+            expires_at=data.get("expires_at", ""),
         )
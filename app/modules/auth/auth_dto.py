@@ -6,7 +6,7 @@ import re
 from pydantic import EmailStr, Field, field_validator, model_validator
 
 from app.common.schemas.base import BaseSchema
-from app.modules.auth.auth_dco import UserDCO
+from app.modules.auth.auth_dco import RefreshSessionDCO, UserDCO
 
 class UserRole(str, Enum):
     ADMIN = "ADMIN"
@@ -135,6 +135,11 @@ class RefreshTokenRequestDTO(BaseSchema):
 
     refresh_token: str
 
+class RevokeSessionsRequestDTO(BaseSchema):
+    """DTO for revoking several of the caller's sessions at once."""
+
+    session_ids: list[str] = Field(..., min_length=1, max_length=100)
+
 class UpdateMyProfileRequestDTO(BaseSchema):
     """Self-service profile updates for authenticated users."""
 
@@ -250,3 +255,29 @@ class UserResponseDTO(BaseSchema):
             updated_at=dco.updated_at,
             deleted_at=dco.deleted_at,
         )
+
+class SessionResponseDTO(BaseSchema):
+    """DTO describing one signed-in device session."""
+
+    id: str
+    user_agent: str | None = None
+    ip_address: str | None = None
+    created_at: str
+    last_used_at: str
+    expires_at: str
+    is_current: bool = False
+
+    @classmethod
+    def from_dco(
+        cls, dco: RefreshSessionDCO, current_session_id: str | None = None
+    ) -> "SessionResponseDTO":
+        """Build a response DTO from a refresh-session DCO."""
+        return cls(
+            id=dco.id,
+            user_agent=dco.user_agent,
+            ip_address=dco.ip_address,
+            created_at=dco.created_at,
+            last_used_at=dco.last_used_at,
+            expires_at=dco.expires_at,
+            is_current=dco.id == current_session_id,
+        )
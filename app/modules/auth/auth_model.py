@@ -5,16 +5,35 @@ import uuid
 from datetime import datetime, timezone
 
 from loguru import logger
-from sqlalchemy import select, update
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ConflictError
 from app.modules.auth.auth_dco import UserDCO
 from app.modules.auth.auth_entity import UserEntity
 
 
+# Unique constraints on `users` → the request field they protect
+_UNIQUE_CONSTRAINT_FIELDS = {
+    "users_email_key": "email",
+    "uq_users_phone_active": "phone",
+}
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
+def _conflicting_field(exc: IntegrityError) -> Optional[str]:
+    """Map a unique-violation on `users` to the offending field, or None."""
+    cause = getattr(exc.orig, "__cause__", None)
+    constraint = getattr(cause, "constraint_name", None)
+    message = str(exc.orig)
+    for name, field in _UNIQUE_CONSTRAINT_FIELDS.items():
+        if constraint == name or name in message:
+            return field
+    return None
+
 def _entity_to_dco(entity: UserEntity) -> UserDCO:
     """Convert a SQLAlchemy entity to a domain object."""
     return UserDCO(
@@ -31,29 +50,39 @@ def _entity_to_dco(entity: UserEntity) -> UserDCO:
         created_at=entity.created_at.isoformat() if entity.created_at else "",
         updated_at=entity.updated_at.isoformat() if entity.updated_at else "",
         deleted_at=entity.deleted_at.isoformat() if entity.deleted_at else None,
-        current_refresh_jti=entity.current_refresh_jti,
-    )
-
-def _dco_to_entity(dco: UserDCO) -> UserEntity:
-    """Convert a domain object to a new SQLAlchemy entity for INSERT."""
-    return UserEntity(
-        role=dco.role,
-        business_name=dco.business_name,
-        email=dco.email,
-        password_hash=dco.password_hash,
-        province=dco.province,
-        contact_name=dco.contact_name,
-        phone=dco.phone,
-        is_active=dco.is_active,
     )
 
 async def create_user(session: AsyncSession, dco: UserDCO) -> UserDCO:
-    """Insert a new user row and return the hydrated DCO."""
-    entity = _dco_to_entity(dco)
-    session.add(entity)
-    await session.flush()           # populate id + created_at from DB
-    await session.refresh(entity)
-
+    """Insert a new user row with a single INSERT … RETURNING round trip.
+
+    Email/phone uniqueness is enforced by the table constraints rather than
+    pre-insert lookups; a violation is raised as ConflictError on that field.
+    """
+    stmt = (
+        insert(UserEntity)
+        .values(
+            role=dco.role,
+            business_name=dco.business_name,
+            email=dco.email,
+            password_hash=dco.password_hash,
+            province=dco.province,
+            contact_name=dco.contact_name,
+            phone=dco.phone,
+            is_active=dco.is_active,
+        )
+        .returning(UserEntity)
+    )
+    try:
+        result = await session.execute(stmt)
+    except IntegrityError as exc:
+        field = _conflicting_field(exc)
+        if field is None:
+            raise
+        raise ConflictError(
+            message=f"{field.capitalize()} already registered", resource="user", field=field
+        ) from exc
+
+    entity = result.scalar_one()
     logger.debug("User row inserted | id={}", entity.id)
     return _entity_to_dco(entity)
 
@@ -127,11 +156,31 @@ async def update_user(session: AsyncSession, user_id: str, updates: dict) -> Opt
     await session.refresh(entity)
     return _entity_to_dco(entity)
 
-async def set_last_login(session: AsyncSession, user_id: str) -> Optional[UserDCO]:
-    return await update_user(session, user_id, {"last_login_at": _utc_now()})
+async def record_login(session: AsyncSession, user_id: str) -> Optional[UserDCO]:
+    """Stamp last_login_at in one UPDATE … RETURNING.
 
-async def set_current_refresh_jti(session: AsyncSession, user_id: str, refresh_jti: str | None) -> Optional[UserDCO]:
-    return await update_user(session, user_id, {"current_refresh_jti": refresh_jti})
+    Returns the refreshed user, or None if the account was deleted or
+    deactivated since it was looked up.
+    """
+    try:
+        uid = uuid.UUID(user_id)
+    except ValueError:
+        return None
+
+    stmt = (
+        update(UserEntity)
+        .where(
+            UserEntity.id == uid,
+            UserEntity.deleted_at.is_(None),
+            UserEntity.is_active.is_(True),
+        )
+        .values(last_login_at=func.now())
+        .returning(UserEntity)
+        .execution_options(populate_existing=True)
+    )
+    result = await session.execute(stmt)
+    entity = result.scalar_one_or_none()
+    return _entity_to_dco(entity) if entity else None
 
 async def soft_delete_user(session: AsyncSession, user_id: str) -> bool:
     try:
@@ -148,7 +197,6 @@ async def soft_delete_user(session: AsyncSession, user_id: str) -> bool:
 
     entity.deleted_at = _utc_now()
     entity.is_active = False
-    entity.current_refresh_jti = None
     
     await session.flush()
     return True
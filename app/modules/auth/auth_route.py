@@ -14,6 +14,7 @@ from app.modules.auth.auth_dto import (
     LoginRequestDTO,
     RefreshTokenRequestDTO,
     RegisterRequestDTO,
+    RevokeSessionsRequestDTO,
     UpdateMyProfileRequestDTO,
     UserRole,
 )
@@ -83,7 +84,12 @@ async def login(
     db: AsyncSession = Depends(get_db_session),
 ):
     """Login with email and password to get JWT access + refresh tokens."""
-    tokens = await auth_service.login_user(db, body)
+    tokens = await auth_service.login_user(
+        db,
+        body,
+        user_agent=request.headers.get("User-Agent"),
+        ip_address=request.client.host if request.client else None,
+    )
     response = respond(data=tokens, message="Login successful")
     _set_auth_cookies(response, tokens.access_token, tokens.refresh_token)
     return response
@@ -123,12 +129,12 @@ async def logout(
     token: str | None = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db_session),
 ):
-    """Logout current session by revoking access token and refresh token chain."""
+    """Logout current device by revoking its access token and refresh session."""
     access_token = token or request.cookies.get(getattr(settings, "access_token_cookie_name", "access_token"))
     if access_token:
         expires_in_seconds = settings.access_token_expire_minutes * 60
         blacklist_token(access_token, expires_in_seconds)
-    await auth_service.logout_user(db, current_user["user_id"])
+    await auth_service.logout_user(db, current_user["user_id"], current_user.get("session_id"))
 
     response = respond(
         message="Successfully logged out. Please login again to access protected endpoints.",
@@ -138,6 +144,56 @@ async def logout(
     return response
 
 
+@router.get("/sessions")
+@limiter.limit(RateLimits.API_READ)
+async def list_sessions(
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """List the current user's signed-in devices."""
+    sessions = await auth_service.list_my_sessions(db, current_user)
+    return respond(data=sessions, message="Sessions fetched")
+
+
+@router.post("/sessions/revoke")
+@limiter.limit(RateLimits.API_WRITE)
+async def revoke_sessions(
+    request: Request,
+    body: RevokeSessionsRequestDTO,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Revoke several of the current user's sessions."""
+    revoked = await auth_service.revoke_my_sessions(db, current_user, body)
+    return respond(data={"revoked": revoked}, message="Sessions revoked")
+
+
+@router.delete("/sessions")
+@limiter.limit(RateLimits.API_DELETE)
+async def revoke_all_sessions(
+    request: Request,
+    keep_current: bool = Query(default=True),
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Sign out every device (optionally keeping the one making this call)."""
+    revoked = await auth_service.revoke_all_my_sessions(db, current_user, keep_current)
+    return respond(data={"revoked": revoked}, message="Sessions revoked")
+
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit(RateLimits.API_DELETE)
+async def revoke_session(
+    request: Request,
+    session_id: str,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Revoke one of the current user's sessions."""
+    await auth_service.revoke_my_session(db, current_user, session_id)
+
+
 @router.get("/me")
 @limiter.limit(RateLimits.API_READ)
 async def get_me(
@@ -232,3 +288,16 @@ async def delete_user_by_admin(
 ):
     """Soft-delete user as admin."""
     await auth_service.delete_user_by_admin(db, user_id, admin)
+
+
+@router.delete("/users/{user_id}/sessions")
+@limiter.limit(RateLimits.API_DELETE)
+async def revoke_user_sessions_by_admin(
+    request: Request,
+    user_id: str,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Sign a user out of every device (admin only)."""
+    revoked = await auth_service.revoke_user_sessions_by_admin(db, user_id, admin)
+    return respond(data={"revoked": revoked}, message="User sessions revoked")
@@ -4,6 +4,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import create_access_token, create_refresh_token, decode_token, hash_password, verify_password
+from app.core.database import AsyncSessionLocal
 from app.core.exceptions import AuthenticationError, AuthorizationError, ConflictError, NotFoundError
 from app.modules.auth.auth_dco import UserDCO
 from app.modules.auth.auth_dto import (
@@ -12,6 +13,8 @@ from app.modules.auth.auth_dto import (
     LoginRequestDTO,
     RefreshTokenRequestDTO,
     RegisterRequestDTO,
+    RevokeSessionsRequestDTO,
+    SessionResponseDTO,
     TokenResponseDTO,
     UpdateMyProfileRequestDTO,
     UserResponseDTO,
@@ -22,22 +25,19 @@ from app.modules.auth.auth_model import (
     find_user_by_id,
     find_users_by_phone,
     list_users,
-    set_current_refresh_jti,
-    set_last_login,
+    record_login,
     soft_delete_user,
     update_user,
 )
+from app.modules.auth.auth_session_store import RotationOutcome, get_refresh_session_store
 
 
-async def _issue_token_pair(session: AsyncSession, user: UserDCO) -> TokenResponseDTO:
-    refresh_jti = str(uuid4())
-    token_data = {"sub": user.id, "role": user.role}
+def _build_token_pair(user: UserDCO, session_id: str, refresh_jti: str) -> TokenResponseDTO:
+    token_data = {"sub": user.id, "role": user.role, "sid": session_id}
 
     access_token = create_access_token(token_data)
     refresh_token = create_refresh_token(token_data, refresh_jti)
 
-    await set_current_refresh_jti(session, user.id, refresh_jti)
-
     return TokenResponseDTO(access_token=access_token, refresh_token=refresh_token)
 
 
@@ -53,10 +53,7 @@ async def _assert_phone_available(session: AsyncSession, phone: str | None, excl
 
 
 async def register_user(session: AsyncSession, body: RegisterRequestDTO) -> UserResponseDTO:
-    if await find_user_by_email(session, body.email, include_deleted=True):
-        raise ConflictError(message="Email already registered", resource="user", field="email")
-    await _assert_phone_available(session, body.phone)
-
+    # Email/phone uniqueness is enforced by create_user's INSERT (ConflictError on violation)
     hashed = hash_password(body.password)
 
     dco = UserDCO(
@@ -79,10 +76,6 @@ async def create_user_by_admin(session: AsyncSession, body: AdminCreateUserReque
     if admin_user.get("role") != "ADMIN":
         raise AuthorizationError("Only admins can create users", required_role="ADMIN")
 
-    if await find_user_by_email(session, body.email, include_deleted=True):
-        raise ConflictError(message="Email already registered", resource="user", field="email")
-    await _assert_phone_available(session, body.phone)
-
     dco = UserDCO(
         role=body.role.value,
         business_name=body.business_name,
@@ -104,7 +97,12 @@ async def create_user_by_admin(session: AsyncSession, body: AdminCreateUserReque
     return UserResponseDTO.from_dco(created)
 
 
-async def login_user(session: AsyncSession, body: LoginRequestDTO) -> TokenResponseDTO:
+async def login_user(
+    session: AsyncSession,
+    body: LoginRequestDTO,
+    user_agent: str | None = None,
+    ip_address: str | None = None,
+) -> TokenResponseDTO:
     lookup_email = body.email
     lookup_phone = body.phone
 
@@ -130,13 +128,20 @@ async def login_user(session: AsyncSession, body: LoginRequestDTO) -> TokenRespo
     if not user.is_active:
         raise AuthenticationError("Account is inactive. Contact administrator")
 
-    await set_last_login(session, user.id)
-    user = await find_user_by_id(session, user.id)
+    # Single round trip after bcrypt: last-login stamp + fresh row
+    user = await record_login(session, user.id)
     if not user:
         raise AuthenticationError("Unable to load user session")
 
-    logger.info("User logged in | user_id={} role={}", user.id, user.role)
-    return await _issue_token_pair(session, user)
+    refresh_jti = str(uuid4())
+    refresh_session = await get_refresh_session_store().create(
+        session, user.id, refresh_jti, user_agent=user_agent, ip_address=ip_address
+    )
+
+    logger.info(
+        "User logged in | user_id={} role={} session_id={}", user.id, user.role, refresh_session.id
+    )
+    return _build_token_pair(user, refresh_session.id, refresh_jti)
 
 
 async def refresh_user_token(session: AsyncSession, body: RefreshTokenRequestDTO) -> TokenResponseDTO:
@@ -150,7 +155,8 @@ async def refresh_user_token(session: AsyncSession, body: RefreshTokenRequestDTO
 
     user_id = payload.get("sub")
     refresh_jti = payload.get("jti")
-    if not user_id or not refresh_jti:
+    session_id = payload.get("sid")
+    if not user_id or not refresh_jti or not session_id:
         raise AuthenticationError("Malformed refresh token")
 
     user = await find_user_by_id(session, user_id)
@@ -160,16 +166,97 @@ async def refresh_user_token(session: AsyncSession, body: RefreshTokenRequestDTO
     if not user.is_active:
         raise AuthenticationError("Account is inactive. Contact administrator")
 
-    if user.current_refresh_jti != refresh_jti:
+    store = get_refresh_session_store()
+    new_jti = str(uuid4())
+    outcome = await store.rotate(session, session_id, user.id, refresh_jti, new_jti)
+
+    if outcome is RotationOutcome.REUSED:
+        # A rotated token came back: assume it leaked and kill the whole chain.
+        # Committed on its own: the request transaction rolls back on the raise below.
+        async with AsyncSessionLocal() as revoke_session:
+            async with revoke_session.begin():
+                await store.revoke(revoke_session, user.id, [session_id])
+        logger.warning(
+            "Refresh token reuse detected | user_id={} session_id={}", user.id, session_id
+        )
         raise AuthenticationError("Refresh token already rotated or revoked")
 
-    logger.info("Token refreshed | user_id={}", user.id)
-    return await _issue_token_pair(session, user)
+    if outcome is RotationOutcome.MISSING:
+        raise AuthenticationError("Refresh token already rotated or revoked")
+
+    logger.info("Token refreshed | user_id={} session_id={}", user.id, session_id)
+    return _build_token_pair(user, session_id, new_jti)
+
+
+async def logout_user(session: AsyncSession, user_id: str, session_id: str | None = None) -> None:
+    store = get_refresh_session_store()
+    if session_id:
+        await store.revoke(session, user_id, [session_id])
+    else:
+        # Tokens minted before per-device sessions carry no sid
+        await store.revoke_all(session, user_id)
+    logger.info("User logged out | user_id={} session_id={}", user_id, session_id)
+
 
+async def list_my_sessions(session: AsyncSession, current_user: dict) -> list[SessionResponseDTO]:
+    sessions = await get_refresh_session_store().list_for_user(session, current_user["user_id"])
+    current_session_id = current_user.get("session_id")
+    return [SessionResponseDTO.from_dco(s, current_session_id) for s in sessions]
 
-async def logout_user(session: AsyncSession, user_id: str) -> None:
-    await set_current_refresh_jti(session, user_id, None)
-    logger.info("User logged out | user_id={}", user_id)
+
+async def revoke_my_session(session: AsyncSession, current_user: dict, session_id: str) -> None:
+    revoked = await get_refresh_session_store().revoke(
+        session, current_user["user_id"], [session_id]
+    )
+    if not revoked:
+        raise NotFoundError("session", session_id)
+
+    logger.info("Session revoked | user_id={} session_id={}", current_user["user_id"], session_id)
+
+
+async def revoke_my_sessions(
+    session: AsyncSession, current_user: dict, body: RevokeSessionsRequestDTO
+) -> int:
+    revoked = await get_refresh_session_store().revoke(
+        session, current_user["user_id"], body.session_ids
+    )
+    logger.info("Sessions revoked | user_id={} count={}", current_user["user_id"], revoked)
+    return revoked
+
+
+async def revoke_all_my_sessions(
+    session: AsyncSession, current_user: dict, keep_current: bool
+) -> int:
+    except_session_id = current_user.get("session_id") if keep_current else None
+    revoked = await get_refresh_session_store().revoke_all(
+        session, current_user["user_id"], except_session_id=except_session_id
+    )
+    logger.info(
+        "All sessions revoked | user_id={} kept_current={} count={}",
+        current_user["user_id"],
+        except_session_id is not None,
+        revoked,
+    )
+    return revoked
+
+
+async def revoke_user_sessions_by_admin(
+    session: AsyncSession, target_user_id: str, admin_user: dict
+) -> int:
+    if admin_user.get("role") != "ADMIN":
+        raise AuthorizationError("Only admins can revoke user sessions", required_role="ADMIN")
+
+    if not await find_user_by_id(session, target_user_id, include_deleted=True):
+        raise NotFoundError("user", target_user_id)
+
+    revoked = await get_refresh_session_store().revoke_all(session, target_user_id)
+    logger.info(
+        "User sessions revoked by admin | admin_id={} user_id={} count={}",
+        admin_user["user_id"],
+        target_user_id,
+        revoked,
+    )
+    return revoked
 
 
 async def get_user_profile(session: AsyncSession, user_id: str) -> UserResponseDTO:
@@ -235,24 +322,24 @@ async def update_user_by_admin(
         raise NotFoundError("user", target_user_id)
 
     updates = body.model_dump(exclude_none=True)
+    revoke_sessions = "password" in updates or updates.get("is_active") is False
 
     if "role" in updates:
         updates["role"] = updates["role"].value
 
     if "password" in updates:
         updates["password_hash"] = hash_password(updates.pop("password"))
-        updates["current_refresh_jti"] = None
 
     if "phone" in updates:
         await _assert_phone_available(session, updates["phone"], exclude_user_id=target_user_id)
 
-    if "is_active" in updates and updates["is_active"] is False:
-        updates["current_refresh_jti"] = None
-
     updated_user = await update_user(session, target_user_id, updates)
     if not updated_user:
         raise NotFoundError("user", target_user_id)
 
+    if revoke_sessions:
+        await get_refresh_session_store().revoke_all(session, target_user_id)
+
     logger.info(
         "User updated by admin | admin_id={} user_id={}",
         admin_user["user_id"],
@@ -268,6 +355,8 @@ async def delete_user_by_admin(session: AsyncSession, target_user_id: str, admin
     if not await soft_delete_user(session, target_user_id):
         raise NotFoundError("user", target_user_id)
 
+    await get_refresh_session_store().revoke_all(session, target_user_id)
+
     logger.info(
         "User soft-deleted by admin | admin_id={} user_id={}",
         admin_user["user_id"],
@@ -0,0 +1,33 @@
+"""SQLAlchemy entity for the `refresh_sessions` table.
+
+Postgres fallback for the refresh-session store when Redis is not configured.
+One row per signed-in device; the row's `jti` is the only refresh token that
+may be exchanged for that session.
+"""
+
+import uuid
+from uuid import uuid4
+
+from sqlalchemy import Column, Text, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class RefreshSession(Base):
+    __tablename__ = "refresh_sessions"
+
+    __table_args__ = (
+        Index("ix_refresh_sessions_user_id", "user_id"),
+        Index("ix_refresh_sessions_expires_at", "expires_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    jti = Column(Text, nullable=False)
+    user_agent = Column(Text, nullable=True)
+    ip_address = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,362 @@
+"""Refresh-session store — per-device refresh-token sessions.
+
+Each login opens a session (one per device) holding the single refresh-token
+jti that may be exchanged next. Refresh rotates the jti with an atomic
+compare-and-swap, so a replayed (already rotated) token is detected and the
+session revoked.
+
+Redis is used when REDIS_URL is configured (hash per session + sorted-set index
+per user, both with TTLs); otherwise sessions live in the `refresh_sessions`
+table. Neither backend writes to `users`.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional
+import uuid
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.core.redis_client import get_redis
+from app.modules.auth.auth_dco import RefreshSessionDCO
+from app.modules.auth.auth_session_entity import RefreshSession
+
+
+class RotationOutcome(str, Enum):
+    ROTATED = "ROTATED"
+    REUSED = "REUSED"      # session is live but the presented jti is stale (replay)
+    MISSING = "MISSING"    # session expired, revoked, or belongs to another user
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _session_ttl() -> timedelta:
+    return timedelta(days=settings.refresh_token_expire_days)
+
+def _as_uuid(value: str) -> Optional[uuid.UUID]:
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ── Redis backend ────────────────────────────────────────────
+
+_SESSION_KEY = "refresh:session:{}"
+_USER_KEY = "refresh:user:{}"
+
+# KEYS: session hash, user index
+# ARGV: user_id, expected_jti, new_jti, now_iso, expires_iso, expires_ts, ttl_seconds, session_id
+_ROTATE_SCRIPT = """
+local current = redis.call('HMGET', KEYS[1], 'user_id', 'jti')
+if not current[1] or current[1] ~= ARGV[1] then
+    return -1
+end
+if current[2] ~= ARGV[2] then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'jti', ARGV[3], 'last_used_at', ARGV[4], 'expires_at', ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[7])
+redis.call('ZADD', KEYS[2], ARGV[6], ARGV[8])
+redis.call('EXPIRE', KEYS[2], ARGV[7])
+return 1
+"""
+
+_ROTATION_CODES = {
+    1: RotationOutcome.ROTATED,
+    0: RotationOutcome.REUSED,
+    -1: RotationOutcome.MISSING,
+}
+
+
+@contextmanager
+def _redis_errors():
+    """Surface Redis outages as 503s instead of unhandled 500s."""
+    try:
+        yield
+    except RedisError as exc:
+        logger.error("Refresh-session store unavailable | error={}", str(exc))
+        raise ServiceUnavailableError(
+            "Session store temporarily unavailable", service_name="redis"
+        ) from exc
+
+
+class RedisRefreshSessionStore:
+    """Sessions as Redis hashes with a per-user sorted set scored by expiry."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._rotate = redis.register_script(_ROTATE_SCRIPT)
+
+    async def create(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        jti: str,
+        user_agent: str | None = None,
+        ip_address: str | None = None,
+    ) -> RefreshSessionDCO:
+        now = _utc_now()
+        expires_at = now + _session_ttl()
+        ttl_seconds = int(_session_ttl().total_seconds())
+        dco = RefreshSessionDCO(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            jti=jti,
+            user_agent=user_agent,
+            ip_address=ip_address,
+            created_at=now.isoformat(),
+            last_used_at=now.isoformat(),
+            expires_at=expires_at.isoformat(),
+        )
+        user_key = _USER_KEY.format(user_id)
+
+        with _redis_errors():
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(_SESSION_KEY.format(dco.id), mapping=dco.to_dict())
+                pipe.expire(_SESSION_KEY.format(dco.id), ttl_seconds)
+                pipe.zremrangebyscore(user_key, "-inf", now.timestamp())
+                pipe.zadd(user_key, {dco.id: expires_at.timestamp()})
+                pipe.expire(user_key, ttl_seconds)
+                # Everything except the newest N sessions (oldest expiry first)
+                pipe.zrange(user_key, 0, -(settings.max_refresh_sessions_per_user + 1))
+                *_, evicted = await pipe.execute()
+
+            if evicted:
+                await self._delete(user_id, evicted)
+                logger.info("Evicted oldest sessions | user_id={} count={}", user_id, len(evicted))
+
+        return dco
+
+    async def rotate(
+        self,
+        db: AsyncSession,
+        session_id: str,
+        user_id: str,
+        expected_jti: str,
+        new_jti: str,
+    ) -> RotationOutcome:
+        now = _utc_now()
+        expires_at = now + _session_ttl()
+        with _redis_errors():
+            code = await self._rotate(
+                keys=[_SESSION_KEY.format(session_id), _USER_KEY.format(user_id)],
+                args=[
+                    user_id,
+                    expected_jti,
+                    new_jti,
+                    now.isoformat(),
+                    expires_at.isoformat(),
+                    expires_at.timestamp(),
+                    int(_session_ttl().total_seconds()),
+                    session_id,
+                ],
+            )
+        return _ROTATION_CODES[int(code)]
+
+    async def list_for_user(self, db: AsyncSession, user_id: str) -> list[RefreshSessionDCO]:
+        user_key = _USER_KEY.format(user_id)
+        with _redis_errors():
+            await self._redis.zremrangebyscore(user_key, "-inf", _utc_now().timestamp())
+            session_ids = await self._redis.zrevrange(user_key, 0, -1)
+            if not session_ids:
+                return []
+
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for session_id in session_ids:
+                    pipe.hgetall(_SESSION_KEY.format(session_id))
+                rows = await pipe.execute()
+
+            stale = [sid for sid, row in zip(session_ids, rows, strict=True) if not row]
+            if stale:
+                await self._redis.zrem(user_key, *stale)
+
+        return [RefreshSessionDCO.from_dict(row) for row in rows if row]
+
+    async def revoke(self, db: AsyncSession, user_id: str, session_ids: list[str]) -> int:
+        if not session_ids:
+            return 0
+        user_key = _USER_KEY.format(user_id)
+        with _redis_errors():
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for session_id in session_ids:
+                    pipe.zscore(user_key, session_id)
+                scores = await pipe.execute()
+
+            owned = [
+                sid for sid, score in zip(session_ids, scores, strict=True) if score is not None
+            ]
+            await self._delete(user_id, owned)
+        return len(owned)
+
+    async def revoke_all(
+        self, db: AsyncSession, user_id: str, except_session_id: str | None = None
+    ) -> int:
+        with _redis_errors():
+            session_ids = await self._redis.zrange(_USER_KEY.format(user_id), 0, -1)
+            targets = [sid for sid in session_ids if sid != except_session_id]
+            await self._delete(user_id, targets)
+        return len(targets)
+
+    async def _delete(self, user_id: str, session_ids: list[str]) -> None:
+        if not session_ids:
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*[_SESSION_KEY.format(sid) for sid in session_ids])
+            pipe.zrem(_USER_KEY.format(user_id), *session_ids)
+            await pipe.execute()
+
+
+# ── Postgres backend ─────────────────────────────────────────
+
+def _entity_to_dco(entity: RefreshSession) -> RefreshSessionDCO:
+    return RefreshSessionDCO(
+        id=str(entity.id),
+        user_id=str(entity.user_id),
+        jti=entity.jti,
+        user_agent=entity.user_agent,
+        ip_address=entity.ip_address,
+        created_at=entity.created_at.isoformat() if entity.created_at else "",
+        last_used_at=entity.last_used_at.isoformat() if entity.last_used_at else "",
+        expires_at=entity.expires_at.isoformat() if entity.expires_at else "",
+    )
+
+
+class DatabaseRefreshSessionStore:
+    """Sessions as rows in `refresh_sessions`; rotation is a conditional UPDATE."""
+
+    async def create(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        jti: str,
+        user_agent: str | None = None,
+        ip_address: str | None = None,
+    ) -> RefreshSessionDCO:
+        uid = uuid.UUID(user_id)
+        result = await db.execute(
+            insert(RefreshSession)
+            .values(
+                user_id=uid,
+                jti=jti,
+                user_agent=user_agent,
+                ip_address=ip_address,
+                expires_at=_utc_now() + _session_ttl(),
+            )
+            .returning(RefreshSession)
+        )
+        entity = result.scalar_one()
+
+        # Drop expired sessions and anything beyond the per-user cap
+        keep = (
+            select(RefreshSession.id)
+            .where(RefreshSession.user_id == uid, RefreshSession.expires_at > func.now())
+            .order_by(RefreshSession.last_used_at.desc())
+            .limit(settings.max_refresh_sessions_per_user)
+        )
+        await db.execute(
+            delete(RefreshSession)
+            .where(RefreshSession.user_id == uid, RefreshSession.id.not_in(keep))
+            .execution_options(synchronize_session=False)
+        )
+        return _entity_to_dco(entity)
+
+    async def rotate(
+        self,
+        db: AsyncSession,
+        session_id: str,
+        user_id: str,
+        expected_jti: str,
+        new_jti: str,
+    ) -> RotationOutcome:
+        sid, uid = _as_uuid(session_id), _as_uuid(user_id)
+        if sid is None or uid is None:
+            return RotationOutcome.MISSING
+
+        result = await db.execute(
+            update(RefreshSession)
+            .where(
+                RefreshSession.id == sid,
+                RefreshSession.user_id == uid,
+                RefreshSession.jti == expected_jti,
+                RefreshSession.expires_at > func.now(),
+            )
+            .values(jti=new_jti, last_used_at=func.now(), expires_at=_utc_now() + _session_ttl())
+            .returning(RefreshSession.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is not None:
+            return RotationOutcome.ROTATED
+
+        # Slow path only: distinguish a replayed token from a dead session
+        live = await db.execute(
+            select(RefreshSession.id).where(
+                RefreshSession.id == sid,
+                RefreshSession.user_id == uid,
+                RefreshSession.expires_at > func.now(),
+            )
+        )
+        return RotationOutcome.REUSED if live.scalar_one_or_none() else RotationOutcome.MISSING
+
+    async def list_for_user(self, db: AsyncSession, user_id: str) -> list[RefreshSessionDCO]:
+        uid = _as_uuid(user_id)
+        if uid is None:
+            return []
+        result = await db.execute(
+            select(RefreshSession)
+            .where(RefreshSession.user_id == uid, RefreshSession.expires_at > func.now())
+            .order_by(RefreshSession.last_used_at.desc())
+        )
+        return [_entity_to_dco(e) for e in result.scalars().all()]
+
+    async def revoke(self, db: AsyncSession, user_id: str, session_ids: list[str]) -> int:
+        uid = _as_uuid(user_id)
+        sids = [sid for sid in (_as_uuid(s) for s in session_ids) if sid is not None]
+        if uid is None or not sids:
+            return 0
+        result = await db.execute(
+            delete(RefreshSession)
+            .where(RefreshSession.user_id == uid, RefreshSession.id.in_(sids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def revoke_all(
+        self, db: AsyncSession, user_id: str, except_session_id: str | None = None
+    ) -> int:
+        uid = _as_uuid(user_id)
+        if uid is None:
+            return 0
+        stmt = delete(RefreshSession).where(RefreshSession.user_id == uid)
+        keep = _as_uuid(except_session_id) if except_session_id else None
+        if keep is not None:
+            stmt = stmt.where(RefreshSession.id != keep)
+        result = await db.execute(stmt.execution_options(synchronize_session=False))
+        return result.rowcount
+
+
+# ── Factory ──────────────────────────────────────────────────
+
+_store: RedisRefreshSessionStore | DatabaseRefreshSessionStore | None = None
+
+
+def get_refresh_session_store() -> RedisRefreshSessionStore | DatabaseRefreshSessionStore:
+    """Return the process-wide session store (Redis if configured, else Postgres)."""
+    global _store
+
+    if _store is None:
+        redis = get_redis()
+        if redis is not None:
+            _store = RedisRefreshSessionStore(redis)
+            logger.info("Refresh sessions backed by Redis")
+        else:
+            _store = DatabaseRefreshSessionStore()
+            logger.warning("Refresh sessions backed by Postgres (REDIS_URL not set)")
+    return _store
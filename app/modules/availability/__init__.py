@@ -0,0 +1,2 @@
+from .availability_entity import VariantAvailability
+from .availability_service import apply_deltas
@@ -0,0 +1,81 @@
+"""In-process cache of variant availability totals.
+
+Entries live for AVAILABILITY_CACHE_TTL_SECONDS at most. Writers invalidate
+them sooner: locally right after commit, and in other workers through the
+cache bus (`availability:changed`, comma-separated variant ids).
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.core import cache_bus
+from app.core.config import settings
+
+CHANNEL = "availability:changed"
+
+
+@dataclass(frozen=True)
+class AvailabilityEntry:
+    on_hand: int
+    reserved: int
+
+    @property
+    def available(self) -> int:
+        return max(self.on_hand - self.reserved, 0)
+
+
+class AvailabilityCache:
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[UUID, tuple[AvailabilityEntry, float]] = OrderedDict()
+
+    def get_many(self, variant_ids: list[UUID]) -> tuple[dict[UUID, AvailabilityEntry], list[UUID]]:
+        """Split ids into cached entries and misses."""
+        now = time.monotonic()
+        hits, misses = {}, []
+        for variant_id in variant_ids:
+            cached = self._entries.get(variant_id)
+            if cached is not None and cached[1] > now:
+                hits[variant_id] = cached[0]
+            else:
+                misses.append(variant_id)
+        return hits, misses
+
+    def put_many(self, entries: dict[UUID, AvailabilityEntry]) -> None:
+        expires_at = time.monotonic() + self._ttl
+        for variant_id, entry in entries.items():
+            self._entries[variant_id] = (entry, expires_at)
+            self._entries.move_to_end(variant_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, variant_ids) -> None:
+        for variant_id in variant_ids:
+            self._entries.pop(variant_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def on_message(self, message: str) -> None:
+        if message == cache_bus.FLUSH_ALL:
+            self.clear()
+            return
+        self.invalidate(UUID(part) for part in message.split(",") if part)
+
+
+_cache: AvailabilityCache | None = None
+
+
+def get_availability_cache() -> AvailabilityCache:
+    global _cache
+    if _cache is None:
+        _cache = AvailabilityCache(
+            settings.availability_cache_ttl_seconds, settings.availability_cache_max_entries
+        )
+    return _cache
+
+
+cache_bus.subscribe(CHANNEL, lambda message: get_availability_cache().on_message(message))
@@ -0,0 +1,23 @@
+"""Controller layer for the `availability` module."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.availability import availability_service as service
+from app.modules.availability.availability_dco import AvailabilityLookupDCO
+from app.modules.availability.availability_dto import VariantAvailabilityDTO
+
+
+async def lookup(
+    session: AsyncSession, data: AvailabilityLookupDCO
+) -> list[VariantAvailabilityDTO]:
+    return await service.lookup(session, data.variant_ids, data.include_warehouses)
+
+
+async def get_for_variant(session: AsyncSession, variant_id: UUID) -> VariantAvailabilityDTO | None:
+    return await service.get_for_variant(session, variant_id)
+
+
+async def rebuild(session: AsyncSession) -> int:
+    return await service.rebuild(session)
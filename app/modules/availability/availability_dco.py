@@ -0,0 +1,11 @@
+"""DCO for the availability module — bulk lookups."""
+
+from uuid import UUID
+
+from pydantic import Field
+
+from app.common.schemas.base import BaseSchema
+
+class AvailabilityLookupDCO(BaseSchema):
+    variant_ids: list[UUID] = Field(..., min_length=1, max_length=200)
+    include_warehouses: bool = False
@@ -0,0 +1,21 @@
+"""DTO for the availability module — READ operations."""
+
+from uuid import UUID
+from typing import List, Optional
+
+from app.common.schemas.base import BaseSchema
+
+class WarehouseAvailabilityDTO(BaseSchema):
+    warehouse_id: UUID
+    warehouse_code: str
+    on_hand: int
+    reserved: int
+    available: int
+
+class VariantAvailabilityDTO(BaseSchema):
+    variant_id: UUID
+    on_hand: int
+    reserved: int
+    available: int
+    in_stock: bool
+    warehouses: Optional[List[WarehouseAvailabilityDTO]] = None
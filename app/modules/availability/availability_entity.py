@@ -0,0 +1,24 @@
+"""SQLAlchemy entity for the `variant_availability` table.
+
+Available-to-promise totals per variant across warehouses, maintained by
+`availability_service.apply_deltas` in the same transaction as every change
+to `inventory.stock_quantity` / `reserved_quantity`. Per-warehouse figures
+are read from `inventory` itself (unique on variant_id, warehouse_id).
+"""
+
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class VariantAvailability(Base):
+    __tablename__ = "variant_availability"
+
+    variant_id = Column(
+        UUID(as_uuid=True), ForeignKey("product_variants.id", ondelete="CASCADE"), primary_key=True
+    )
+    on_hand = Column(Integer, nullable=False, server_default=text("0"))
+    reserved = Column(Integer, nullable=False, server_default=text("0"))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
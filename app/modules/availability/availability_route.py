@@ -0,0 +1,52 @@
+"""Routes for the `availability` module."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.availability import availability_controller as controller
+from app.modules.availability.availability_dco import AvailabilityLookupDCO
+
+router = APIRouter()
+
+
+@router.post("/lookup")
+@limiter.limit(RateLimits.PUBLIC)
+async def lookup_availability(
+    request: Request,
+    body: AvailabilityLookupDCO,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Available-to-promise for up to 200 variants in one call (catalog pages)."""
+    records = await controller.lookup(db, body)
+    return respond(data=records, message="Availability fetched")
+
+
+@router.post("/rebuild")
+@limiter.limit(RateLimits.ADMIN)
+async def rebuild_availability(
+    request: Request,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Recompute the projection from inventory (backfill or repair)."""
+    corrected = await controller.rebuild(db)
+    return respond(data={"corrected": corrected}, message="Availability rebuilt")
+
+
+@router.get("/{variant_id}")
+@limiter.limit(RateLimits.PUBLIC)
+async def get_variant_availability(
+    request: Request,
+    variant_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Totals plus the per-warehouse split for one variant."""
+    record = await controller.get_for_variant(db, variant_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Product variant not found")
+    return respond(data=record, message="Availability fetched")
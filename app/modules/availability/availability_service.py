@@ -0,0 +1,206 @@
+"""Service layer for the `availability` module.
+
+Every write to `inventory` quantities calls `apply_deltas` in the same
+transaction, so `variant_availability` moves with it (commutative increments:
+concurrent writers never overwrite each other). The changed variant ids are
+collected on the session and, after commit, evicted from the local cache and
+broadcast to other workers.
+"""
+
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache_bus
+from app.modules.availability.availability_cache import (
+    CHANNEL,
+    AvailabilityEntry,
+    get_availability_cache,
+)
+from app.modules.availability.availability_dto import (
+    VariantAvailabilityDTO,
+    WarehouseAvailabilityDTO,
+)
+from app.modules.availability.availability_entity import VariantAvailability
+from app.modules.inventory.inventory_entity import Inventory
+from app.modules.product_variants.product_variants_entity import ProductVariant
+from app.modules.warehouses.warehouses_entity import Warehouse
+
+_CHANGED_KEY = "availability_changed"
+
+_APPLY_SQL = text("""
+INSERT INTO variant_availability AS va (variant_id, on_hand, reserved, updated_at)
+SELECT d.variant_id, d.on_hand, d.reserved, now()
+FROM unnest(
+    CAST(:variant_ids AS uuid[]),
+    CAST(:on_hand AS integer[]),
+    CAST(:reserved AS integer[])
+) AS d(variant_id, on_hand, reserved)
+ORDER BY d.variant_id
+ON CONFLICT (variant_id) DO UPDATE
+SET on_hand = va.on_hand + EXCLUDED.on_hand,
+    reserved = va.reserved + EXCLUDED.reserved,
+    updated_at = now()
+""")
+
+_REBUILD_SQL = text("""
+WITH totals AS (
+    SELECT variant_id,
+           sum(stock_quantity) AS on_hand,
+           sum(COALESCE(reserved_quantity, 0)) AS reserved
+    FROM inventory
+    GROUP BY variant_id
+),
+upserted AS (
+    INSERT INTO variant_availability AS va (variant_id, on_hand, reserved, updated_at)
+    SELECT variant_id, on_hand, reserved, now() FROM totals
+    ON CONFLICT (variant_id) DO UPDATE
+    SET on_hand = EXCLUDED.on_hand, reserved = EXCLUDED.reserved, updated_at = now()
+    WHERE (va.on_hand, va.reserved) IS DISTINCT FROM (EXCLUDED.on_hand, EXCLUDED.reserved)
+    RETURNING va.variant_id
+),
+emptied AS (
+    UPDATE variant_availability AS va
+    SET on_hand = 0, reserved = 0, updated_at = now()
+    WHERE (va.on_hand <> 0 OR va.reserved <> 0)
+      AND NOT EXISTS (SELECT 1 FROM totals AS t WHERE t.variant_id = va.variant_id)
+    RETURNING va.variant_id
+)
+SELECT variant_id FROM upserted UNION ALL SELECT variant_id FROM emptied
+""")
+
+
+async def apply_deltas(session: AsyncSession, deltas: Iterable[tuple[UUID, int, int]]) -> None:
+    """Add (variant_id, Δ on-hand, Δ reserved) to the projection, one statement for all."""
+    totals: dict[UUID, list[int]] = defaultdict(lambda: [0, 0])
+    for variant_id, on_hand, reserved in deltas:
+        totals[variant_id][0] += on_hand
+        totals[variant_id][1] += reserved
+    changed = {variant_id: t for variant_id, t in totals.items() if t[0] or t[1]}
+    if not changed:
+        return
+
+    await session.execute(
+        _APPLY_SQL,
+        {
+            "variant_ids": list(changed),
+            "on_hand": [t[0] for t in changed.values()],
+            "reserved": [t[1] for t in changed.values()],
+        },
+    )
+    session.info.setdefault(_CHANGED_KEY, set()).update(changed)
+
+
+async def rebuild(session: AsyncSession) -> int:
+    """Recompute every total from `inventory` (backfill / repair). Returns rows corrected.
+
+    Takes a SHARE lock on `inventory` for the transaction, so in-flight writers
+    finish first and new ones wait — no delta can slip between read and write.
+    """
+    await session.execute(text("LOCK TABLE inventory IN SHARE MODE"))
+    result = await session.execute(_REBUILD_SQL)
+    corrected = [row.variant_id for row in result.all()]
+    session.info.setdefault(_CHANGED_KEY, set()).update(corrected)
+    logger.info("Availability projection rebuilt | corrected={}", len(corrected))
+    return len(corrected)
+
+
+def _on_commit(changed: set[UUID]) -> None:
+    get_availability_cache().invalidate(changed)
+    cache_bus.publish_soon(CHANNEL, ",".join(str(v) for v in changed))
+
+
+cache_bus.after_commit(_CHANGED_KEY, _on_commit)
+
+
+# ── Lookup ───────────────────────────────────────────────────
+
+async def _totals(session: AsyncSession, variant_ids: list[UUID]) -> dict[UUID, AvailabilityEntry]:
+    cache = get_availability_cache()
+    entries, misses = cache.get_many(variant_ids)
+    if misses:
+        result = await session.execute(
+            select(
+                VariantAvailability.variant_id,
+                VariantAvailability.on_hand,
+                VariantAvailability.reserved,
+            ).where(VariantAvailability.variant_id.in_(misses))
+        )
+        loaded = {
+            row.variant_id: AvailabilityEntry(row.on_hand, row.reserved) for row in result.all()
+        }
+        # Variants never stocked are cached as zero so they stay cheap too
+        loaded.update({v: AvailabilityEntry(0, 0) for v in misses if v not in loaded})
+        cache.put_many(loaded)
+        entries.update(loaded)
+    return entries
+
+
+async def _by_warehouse(
+    session: AsyncSession, variant_ids: list[UUID]
+) -> dict[UUID, list[WarehouseAvailabilityDTO]]:
+    result = await session.execute(
+        select(
+            Inventory.variant_id,
+            Inventory.warehouse_id,
+            Warehouse.code,
+            Inventory.stock_quantity,
+            Inventory.reserved_quantity,
+        )
+        .join(Warehouse, Warehouse.id == Inventory.warehouse_id)
+        .where(Inventory.variant_id.in_(variant_ids))
+        .order_by(Inventory.variant_id, Warehouse.code)
+    )
+    by_variant: dict[UUID, list[WarehouseAvailabilityDTO]] = defaultdict(list)
+    for row in result.all():
+        reserved = row.reserved_quantity or 0
+        by_variant[row.variant_id].append(
+            WarehouseAvailabilityDTO(
+                warehouse_id=row.warehouse_id,
+                warehouse_code=row.code,
+                on_hand=row.stock_quantity,
+                reserved=reserved,
+                available=max(row.stock_quantity - reserved, 0),
+            )
+        )
+    return by_variant
+
+
+async def lookup(
+    session: AsyncSession, variant_ids: list[UUID], include_warehouses: bool = False
+) -> list[VariantAvailabilityDTO]:
+    """Availability for many variants.
+
+    Totals come from the cache or the projection; the per-warehouse split is
+    optional.
+    """
+    variant_ids = list(dict.fromkeys(variant_ids))
+    totals = await _totals(session, variant_ids)
+    warehouses = await _by_warehouse(session, variant_ids) if include_warehouses else None
+
+    return [
+        VariantAvailabilityDTO(
+            variant_id=variant_id,
+            on_hand=totals[variant_id].on_hand,
+            reserved=totals[variant_id].reserved,
+            available=totals[variant_id].available,
+            in_stock=totals[variant_id].available > 0,
+            warehouses=warehouses.get(variant_id, []) if warehouses is not None else None,
+        )
+        for variant_id in variant_ids
+    ]
+
+
+async def get_for_variant(session: AsyncSession, variant_id: UUID) -> VariantAvailabilityDTO | None:
+    """Totals plus the per-warehouse split for one variant; None when the variant does not exist."""
+    stmt = select(ProductVariant.id).where(
+        ProductVariant.id == variant_id, ProductVariant.deleted_at.is_(None)
+    )
+    if (await session.execute(stmt)).first() is None:
+        return None
+    records = await lookup(session, [variant_id], include_warehouses=True)
+    return records[0]
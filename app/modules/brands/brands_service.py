@@ -10,6 +10,7 @@ from sqlalchemy.sql import func
 from app.modules.brands.brands_entity import Brand
 from app.modules.brands.brands_dto import BrandDTO
 from app.modules.brands.brands_dco import BrandDCO, BrandUpdateDCO
+from app.modules.search.search_service import reindex_brands
 
 
 async def create(session: AsyncSession, data: BrandDCO) -> BrandDTO:
@@ -49,6 +50,7 @@ async def update(session: AsyncSession, record_id: UUID, data: BrandUpdateDCO) -
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    await reindex_brands(session, [entity_obj.id])
     return BrandDTO.model_validate(entity_obj)
 
 
@@ -72,4 +74,5 @@ async def soft_delete_brand(session: AsyncSession, record_id: UUID) -> bool:
         return False
     entity_obj.deleted_at = func.now()
     await session.flush()
+    await reindex_brands(session, [record_id])
     return True
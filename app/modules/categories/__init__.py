@@ -1 +1 @@
-from .categories_entity import Category
+from .categories_entity import Category, CategoryProductCount
@@ -5,7 +5,8 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.categories import categories_service as service
-from app.modules.categories.categories_dto import CategoryDTO
+from app.modules.categories import categories_tree
+from app.modules.categories.categories_dto import CategoryDTO, CategoryTreeNodeDTO
 from app.modules.categories.categories_dco import CategoryDCO, CategoryUpdateDCO
 
 
@@ -27,3 +28,11 @@ async def update(session: AsyncSession, record_id: UUID, data: CategoryUpdateDCO
 
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     return await service.delete_record(session, record_id)
+
+
+async def get_tree(session: AsyncSession, root_id: UUID | None) -> list[CategoryTreeNodeDTO]:
+    return await service.get_tree(session, root_id)
+
+
+async def rebuild_product_counts(session: AsyncSession) -> int:
+    return await categories_tree.rebuild_product_counts(session)
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from app.common.schemas.base import BaseSchema
 
@@ -16,3 +16,14 @@ class CategoryDTO(BaseSchema):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
+
+class CategoryTreeNodeDTO(BaseSchema):
+
+    id: UUID
+    name: str
+    slug: str
+    sort_order: Optional[int] = None
+    depth: int
+    product_count: int
+    subtree_product_count: int
+    children: List["CategoryTreeNodeDTO"] = []
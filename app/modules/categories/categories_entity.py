@@ -1,9 +1,15 @@
-"""SQLAlchemy entity for the `categories` table."""
+"""SQLAlchemy entities for the `categories` and `category_product_counts` tables.
+
+`category_product_counts` holds the live products filed directly under each
+category, maintained by `categories_tree.apply_product_counts` in the same
+transaction as product writes. Subtree totals are summed from it in the
+cached tree.
+"""
 
 import uuid
 from uuid import uuid4
 
-from sqlalchemy import Column, Text, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Text, Integer, DateTime, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -27,3 +33,12 @@ class Category(Base):
     parent = relationship("Category", remote_side=[id], back_populates="children")
     children = relationship("Category", back_populates="parent")
     products = relationship("Product", back_populates="category")
+
+
+class CategoryProductCount(Base):
+    __tablename__ = "category_product_counts"
+
+    category_id = Column(
+        UUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True
+    )
+    product_count = Column(Integer, nullable=False, server_default=text("0"))
@@ -1,12 +1,14 @@
 """Routes for the `categories` module."""
 
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
-from app.core import get_db_session
+from app.core import get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
 from app.modules.categories import categories_controller as controller
 from app.modules.categories.categories_dco import CategoryDCO, CategoryUpdateDCO
 
@@ -30,6 +32,28 @@ async def list_categories(
     return respond(data=records, message="Category records fetched")
 
 
+@router.get("/tree")
+async def get_category_tree(
+    root_id: Optional[UUID] = Query(None, alias="rootId"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Nested category tree (or one subtree) with direct and subtree product counts."""
+    records = await controller.get_tree(db, root_id)
+    return respond(data=records, message="Category tree fetched")
+
+
+@router.post("/tree/rebuild-counts")
+@limiter.limit(RateLimits.ADMIN)
+async def rebuild_category_counts(
+    request: Request,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Recount live products per category (backfill or repair)."""
+    corrected = await controller.rebuild_product_counts(db)
+    return respond(data={"corrected": corrected}, message="Category product counts rebuilt")
+
+
 @router.get("/{record_id}")
 async def get_categorie(
     record_id: UUID,
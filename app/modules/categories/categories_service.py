@@ -3,13 +3,36 @@
 import uuid
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
+from app.core.exceptions import BusinessRuleError
 from app.modules.categories.categories_entity import Category
-from app.modules.categories.categories_dto import CategoryDTO
+from app.modules.categories.categories_dto import CategoryDTO, CategoryTreeNodeDTO
 from app.modules.categories.categories_dco import CategoryDCO, CategoryUpdateDCO
+from app.modules.categories.categories_tree import (
+    CategoryTree,
+    get_category_tree,
+    mark_changed,
+)
+
+# Moves are serialised so two concurrent ones (A under B, B under A) cannot
+# each pass the cycle check against a tree the other is about to change
+_MOVE_LOCK_SQL = text("SELECT pg_advisory_xact_lock(hashtext('category_moves'))")
+
+# Whether the category is the new parent or one of its ancestors, read from
+# the table under the move lock; UNION stops on a cycle already in the data
+_MOVE_CYCLE_SQL = text("""
+WITH RECURSIVE ancestors AS (
+    SELECT id, parent_id FROM categories WHERE id = :parent_id
+    UNION
+    SELECT c.id, c.parent_id
+    FROM categories AS c
+    JOIN ancestors AS a ON c.id = a.parent_id
+)
+SELECT EXISTS (SELECT 1 FROM ancestors WHERE id = :category_id)
+""")
 
 
 async def create(session: AsyncSession, data: CategoryDCO) -> CategoryDTO:
@@ -18,6 +41,7 @@ async def create(session: AsyncSession, data: CategoryDCO) -> CategoryDTO:
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    mark_changed(session)
     return CategoryDTO.model_validate(entity_obj)
 
 
@@ -39,16 +63,29 @@ async def list_all(session: AsyncSession) -> list[CategoryDTO]:
 
 async def update(session: AsyncSession, record_id: UUID, data: CategoryUpdateDCO) -> CategoryDTO | None:
     """Update a Category record."""
+    updates = data.model_dump(exclude_unset=True)
+    if updates.get("parent_id") is not None:
+        # Before the first read, so every statement below sees the moves committed ahead of us
+        await session.execute(_MOVE_LOCK_SQL)
     stmt = select(Category).where(Category.id == record_id, Category.deleted_at.is_(None))
     result = await session.execute(stmt)
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return None
-    updates = data.model_dump(exclude_unset=True)
+    if updates.get("parent_id") is not None:
+        cycle = await session.execute(
+            _MOVE_CYCLE_SQL, {"parent_id": updates["parent_id"], "category_id": record_id}
+        )
+        if cycle.scalar_one():
+            raise BusinessRuleError(
+                "A category cannot be moved under itself or one of its descendants",
+                rule_name="category_cycle",
+            )
     for key, value in updates.items():
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    mark_changed(session)
     return CategoryDTO.model_validate(entity_obj)
 
 
@@ -61,6 +98,7 @@ async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
         return False
     await session.delete(entity_obj)
     await session.flush()
+    mark_changed(session)
     return True
 
 async def soft_delete_categories(session: AsyncSession, record_id: UUID) -> bool:
@@ -72,4 +110,27 @@ async def soft_delete_categories(session: AsyncSession, record_id: UUID) -> bool
         return False
     entity_obj.deleted_at = func.now()
     await session.flush()
+    mark_changed(session)
     return True
+
+
+def _tree_node(tree: CategoryTree, category_id: UUID) -> CategoryTreeNodeDTO:
+    node = tree.get(category_id)
+    return CategoryTreeNodeDTO(
+        id=node.id,
+        name=node.name,
+        slug=node.slug,
+        sort_order=node.sort_order,
+        depth=node.depth,
+        product_count=node.product_count,
+        subtree_product_count=node.subtree_product_count,
+        children=[_tree_node(tree, child_id) for child_id in node.children],
+    )
+
+
+async def get_tree(session: AsyncSession, root_id: UUID | None = None) -> list[CategoryTreeNodeDTO]:
+    """The nested tree (or one subtree) with direct and subtree product counts."""
+    tree = await get_category_tree(session)
+    if root_id is not None:
+        return [_tree_node(tree, root_id)] if tree.get(root_id) else []
+    return [_tree_node(tree, category_id) for category_id in tree.roots]
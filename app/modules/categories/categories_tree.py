@@ -0,0 +1,208 @@
+"""Cached, immutable category tree.
+
+The whole adjacency list is loaded with one recursive CTE (soft-deleted
+categories and everything under them are left out) together with the
+direct product counts. Each node carries its ancestor path, its descendant
+id set and its subtree product total, so "products under Engine Oils" is a
+single `category_id IN (...)` against `ix_products_category_id`.
+
+The tree is cached per worker for CATEGORY_TREE_CACHE_TTL_SECONDS and dropped
+after any committed category or product-count change: locally, and in other
+workers through the cache bus (`categories:changed`).
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache_bus
+from app.core.config import settings
+
+CHANNEL = "categories:changed"
+
+_CHANGED_KEY = "category_tree_changed"
+
+_TREE_SQL = text("""
+WITH RECURSIVE tree AS (
+    SELECT c.id, c.name, c.slug, c.parent_id, c.sort_order, ARRAY[c.id] AS path
+    FROM categories AS c
+    WHERE c.parent_id IS NULL AND c.deleted_at IS NULL
+    UNION ALL
+    SELECT c.id, c.name, c.slug, c.parent_id, c.sort_order, t.path || c.id
+    FROM categories AS c
+    JOIN tree AS t ON c.parent_id = t.id
+    WHERE c.deleted_at IS NULL AND NOT c.id = ANY(t.path)
+)
+SELECT t.id, t.name, t.slug, t.parent_id, t.sort_order, t.path,
+       COALESCE(n.product_count, 0) AS product_count
+FROM tree AS t
+LEFT JOIN category_product_counts AS n ON n.category_id = t.id
+ORDER BY cardinality(t.path), t.sort_order NULLS LAST, t.name
+""")
+
+_APPLY_COUNTS_SQL = text("""
+INSERT INTO category_product_counts AS n (category_id, product_count)
+SELECT d.category_id, d.delta
+FROM unnest(CAST(:category_ids AS uuid[]), CAST(:deltas AS integer[])) AS d(category_id, delta)
+ORDER BY d.category_id
+ON CONFLICT (category_id) DO UPDATE
+SET product_count = n.product_count + EXCLUDED.product_count
+""")
+
+_REBUILD_COUNTS_SQL = text("""
+WITH live AS (
+    SELECT category_id, count(*) AS product_count
+    FROM products
+    WHERE deleted_at IS NULL AND is_active
+    GROUP BY category_id
+),
+upserted AS (
+    INSERT INTO category_product_counts AS n (category_id, product_count)
+    SELECT category_id, product_count FROM live
+    ON CONFLICT (category_id) DO UPDATE
+    SET product_count = EXCLUDED.product_count
+    WHERE n.product_count <> EXCLUDED.product_count
+    RETURNING n.category_id
+),
+emptied AS (
+    UPDATE category_product_counts AS n
+    SET product_count = 0
+    WHERE n.product_count <> 0
+      AND NOT EXISTS (SELECT 1 FROM live WHERE live.category_id = n.category_id)
+    RETURNING n.category_id
+)
+SELECT (SELECT count(*) FROM upserted) + (SELECT count(*) FROM emptied) AS corrected
+""")
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    id: UUID
+    name: str
+    slug: str
+    parent_id: Optional[UUID]
+    sort_order: Optional[int]
+    path: tuple[UUID, ...]             # root .. self
+    children: tuple[UUID, ...]         # in display order
+    descendant_ids: frozenset[UUID]    # self included
+    product_count: int                 # filed directly here
+    subtree_product_count: int
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+
+class CategoryTree:
+    def __init__(self, nodes: dict[UUID, CategoryNode], roots: tuple[UUID, ...]):
+        self._nodes = nodes
+        self.roots = roots
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, category_id: UUID) -> Optional[CategoryNode]:
+        return self._nodes.get(category_id)
+
+    def descendant_ids(self, category_id: UUID) -> frozenset[UUID]:
+        """The category and everything below it (empty if unknown or deleted)."""
+        node = self._nodes.get(category_id)
+        return node.descendant_ids if node else frozenset()
+
+    @classmethod
+    def from_rows(cls, rows) -> "CategoryTree":
+        """Build from rows ordered by depth, then sibling order."""
+        children: dict[UUID, list[UUID]] = defaultdict(list)
+        descendants: dict[UUID, set[UUID]] = defaultdict(set)
+        subtree: dict[UUID, int] = defaultdict(int)
+        roots = []
+        for row in rows:
+            (children[row.parent_id] if row.parent_id else roots).append(row.id)
+            for ancestor_id in row.path:
+                descendants[ancestor_id].add(row.id)
+                subtree[ancestor_id] += row.product_count
+
+        nodes = {
+            row.id: CategoryNode(
+                id=row.id,
+                name=row.name,
+                slug=row.slug,
+                parent_id=row.parent_id,
+                sort_order=row.sort_order,
+                path=tuple(row.path),
+                children=tuple(children.get(row.id, ())),
+                descendant_ids=frozenset(descendants[row.id]),
+                product_count=row.product_count,
+                subtree_product_count=subtree[row.id],
+            )
+            for row in rows
+        }
+        return cls(nodes, tuple(roots))
+
+
+_cached: tuple[CategoryTree, float] | None = None
+_generation = 0
+
+
+def invalidate_tree() -> None:
+    global _cached, _generation
+    _cached = None
+    _generation += 1
+
+
+async def get_category_tree(session: AsyncSession) -> CategoryTree:
+    """The cached tree, loaded with one query when missing or expired."""
+    global _cached
+    if _cached is not None and _cached[1] > time.monotonic():
+        return _cached[0]
+
+    generation = _generation
+    rows = (await session.execute(_TREE_SQL)).all()
+    tree = CategoryTree.from_rows(rows)
+    # Don't cache a tree read before an invalidation that arrived meanwhile
+    if generation == _generation:
+        _cached = (tree, time.monotonic() + settings.category_tree_cache_ttl_seconds)
+    return tree
+
+
+# ── Writes ───────────────────────────────────────────────────
+
+def mark_changed(session: AsyncSession) -> None:
+    """Drop the cached tree in every worker once `session` commits."""
+    session.info[_CHANGED_KEY] = True
+
+
+async def apply_product_counts(session: AsyncSession, deltas: dict[UUID, int]) -> None:
+    """Add Δ live products per category (commutative, safe under concurrent writers)."""
+    changed = {category_id: delta for category_id, delta in deltas.items() if category_id and delta}
+    if not changed:
+        return
+    await session.execute(
+        _APPLY_COUNTS_SQL,
+        {"category_ids": list(changed), "deltas": list(changed.values())},
+    )
+    mark_changed(session)
+
+
+async def rebuild_product_counts(session: AsyncSession) -> int:
+    """Recount live products per category (backfill / repair). Returns rows corrected."""
+    await session.execute(text("LOCK TABLE products IN SHARE MODE"))
+    corrected = (await session.execute(_REBUILD_COUNTS_SQL)).scalar_one()
+    mark_changed(session)
+    logger.info("Category product counts rebuilt | corrected={}", corrected)
+    return corrected
+
+
+def _on_commit(_changed) -> None:
+    invalidate_tree()
+    cache_bus.publish_soon(CHANNEL, "1")
+
+
+cache_bus.after_commit(_CHANGED_KEY, _on_commit)
+cache_bus.subscribe(CHANNEL, lambda _message: invalidate_tree())
@@ -5,8 +5,12 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.inventory import inventory_service as service
-from app.modules.inventory.inventory_dto import InventoryDTO
-from app.modules.inventory.inventory_dco import InventoryDCO, InventoryUpdateDCO
+from app.modules.inventory.inventory_dto import InventoryDTO, StockReservationDTO
+from app.modules.inventory.inventory_dco import (
+    InventoryDCO,
+    InventoryUpdateDCO,
+    StockReservationDCO,
+)
 
 
 async def create(session: AsyncSession, data: InventoryDCO) -> InventoryDTO:
@@ -27,3 +31,11 @@ async def update(session: AsyncSession, record_id: UUID, data: InventoryUpdateDC
 
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     return await service.delete_record(session, record_id)
+
+
+async def reserve(session: AsyncSession, data: StockReservationDCO) -> StockReservationDTO:
+    return await service.reserve(session, data)
+
+
+async def release(session: AsyncSession, data: StockReservationDCO) -> StockReservationDTO:
+    return await service.release(session, data)
@@ -1,7 +1,9 @@
 """DCO for the inventory table — WRITE operations."""
 
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import Field
 
 from app.common.schemas.base import BaseSchema
 
@@ -16,3 +18,18 @@ class InventoryUpdateDCO(BaseSchema):
     warehouse_id: Optional[UUID] = None
     stock_quantity: Optional[int] = None
     reserved_quantity: Optional[int] = None
+
+class StockLineDCO(BaseSchema):
+    variant_id: UUID
+    quantity: int = Field(..., gt=0)
+    warehouse_id: Optional[UUID] = None
+
+class StockReservationDCO(BaseSchema):
+    """Reserve (or release) several lines as one unit.
+
+    `warehouse_id` is the default for lines without one.
+    """
+    reference_type: str = Field("ORDER", max_length=50)
+    reference_id: Optional[UUID] = None
+    warehouse_id: Optional[UUID] = None
+    lines: List[StockLineDCO] = Field(..., min_length=1, max_length=200)
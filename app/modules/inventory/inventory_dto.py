@@ -2,7 +2,7 @@
 
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from app.common.schemas.base import BaseSchema
 
@@ -14,3 +14,13 @@ class InventoryDTO(BaseSchema):
     stock_quantity: int
     reserved_quantity: Optional[int] = None
     updated_at: Optional[datetime] = None
+
+class StockLineDTO(BaseSchema):
+    variant_id: UUID
+    warehouse_id: UUID
+    quantity: int
+
+class StockReservationDTO(BaseSchema):
+    reference_type: str
+    reference_id: Optional[UUID] = None
+    lines: List[StockLineDTO]
@@ -2,17 +2,48 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
-from app.core import get_db_session
+from app.core import get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
 from app.modules.inventory import inventory_controller as controller
-from app.modules.inventory.inventory_dco import InventoryDCO, InventoryUpdateDCO
+from app.modules.inventory.inventory_dco import (
+    InventoryDCO,
+    InventoryUpdateDCO,
+    StockReservationDCO,
+)
 
 router = APIRouter()
 
 
+@router.post("/reservations", status_code=status.HTTP_201_CREATED)
+@limiter.limit(RateLimits.API_WRITE)
+async def reserve_stock(
+    request: Request,
+    body: StockReservationDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Reserve every line or none; a 422 lists the lines that fell short."""
+    reservation = await controller.reserve(db, body)
+    return respond(data=reservation, message="Stock reserved", status_code=201)
+
+
+@router.post("/reservations/release")
+@limiter.limit(RateLimits.API_WRITE)
+async def release_stock(
+    request: Request,
+    body: StockReservationDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Give reserved stock back; quantities never go below zero."""
+    released = await controller.release(db, body)
+    return respond(data=released, message="Stock released")
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_inventory(
     body: InventoryDCO,
@@ -7,9 +7,17 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
+from app.core.exceptions import ValidationError
+from app.modules.availability.availability_service import apply_deltas
+from app.modules.inventory_ledger.inventory_ledger_service import record_adjustment
 from app.modules.inventory.inventory_entity import Inventory
-from app.modules.inventory.inventory_dto import InventoryDTO
-from app.modules.inventory.inventory_dco import InventoryDCO, InventoryUpdateDCO
+from app.modules.inventory.inventory_dto import InventoryDTO, StockLineDTO, StockReservationDTO
+from app.modules.inventory.inventory_dco import (
+    InventoryDCO,
+    InventoryUpdateDCO,
+    StockReservationDCO,
+)
+from app.modules.inventory.inventory_stock import StockLine, release_stock, reserve_stock
 
 
 async def create(session: AsyncSession, data: InventoryDCO) -> InventoryDTO:
@@ -18,6 +26,15 @@ async def create(session: AsyncSession, data: InventoryDCO) -> InventoryDTO:
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    await apply_deltas(session, [_totals(entity_obj)])
+    await record_adjustment(
+        session,
+        entity_obj.variant_id,
+        entity_obj.warehouse_id,
+        entity_obj.stock_quantity,
+        _EDIT_REFERENCE,
+        entity_obj.id,
+    )
     return InventoryDTO.model_validate(entity_obj)
 
 
@@ -39,26 +56,118 @@ async def list_all(session: AsyncSession) -> list[InventoryDTO]:
 
 async def update(session: AsyncSession, record_id: UUID, data: InventoryUpdateDCO) -> InventoryDTO | None:
     """Update a Inventory record."""
-    stmt = select(Inventory).where(Inventory.id == record_id)
+    stmt = select(Inventory).where(Inventory.id == record_id).with_for_update()
     result = await session.execute(stmt)
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return None
+    before = _totals(entity_obj, sign=-1)
+    old_item = (entity_obj.variant_id, entity_obj.warehouse_id, entity_obj.stock_quantity)
     updates = data.model_dump(exclude_unset=True)
     for key, value in updates.items():
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    await apply_deltas(session, [before, _totals(entity_obj)])
+    await _record_edit(session, entity_obj, old_item)
     return InventoryDTO.model_validate(entity_obj)
 
 
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     """Delete a Inventory record (hard delete)."""
-    stmt = select(Inventory).where(Inventory.id == record_id)
+    stmt = select(Inventory).where(Inventory.id == record_id).with_for_update()
     result = await session.execute(stmt)
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return False
     await session.delete(entity_obj)
     await session.flush()
+    await apply_deltas(session, [_totals(entity_obj, sign=-1)])
+    await record_adjustment(
+        session,
+        entity_obj.variant_id,
+        entity_obj.warehouse_id,
+        -entity_obj.stock_quantity,
+        _EDIT_REFERENCE,
+        entity_obj.id,
+    )
     return True
+
+
+# Direct edits of a balance are booked as ADJUSTMENT movements so the ledger
+# keeps explaining `stock_quantity`; prefer posting IN/OUT via the ledger.
+_EDIT_REFERENCE = "INVENTORY_EDIT"
+
+
+async def _record_edit(
+    session: AsyncSession, entity_obj: Inventory, old_item: tuple[UUID, UUID, int]
+) -> None:
+    old_variant, old_warehouse, old_stock = old_item
+    if (old_variant, old_warehouse) == (entity_obj.variant_id, entity_obj.warehouse_id):
+        await record_adjustment(
+            session,
+            old_variant,
+            old_warehouse,
+            entity_obj.stock_quantity - old_stock,
+            _EDIT_REFERENCE,
+            entity_obj.id,
+        )
+        return
+    await record_adjustment(
+        session, old_variant, old_warehouse, -old_stock, _EDIT_REFERENCE, entity_obj.id
+    )
+    await record_adjustment(
+        session,
+        entity_obj.variant_id,
+        entity_obj.warehouse_id,
+        entity_obj.stock_quantity,
+        _EDIT_REFERENCE,
+        entity_obj.id,
+    )
+
+
+def _totals(entity_obj: Inventory, sign: int = 1) -> tuple[UUID, int, int]:
+    """A row's contribution to its variant's availability totals."""
+    return (
+        entity_obj.variant_id,
+        sign * entity_obj.stock_quantity,
+        sign * (entity_obj.reserved_quantity or 0),
+    )
+
+
+def _stock_lines(data: StockReservationDCO) -> list[StockLine]:
+    lines = []
+    for index, line in enumerate(data.lines):
+        warehouse_id = line.warehouse_id or data.warehouse_id
+        if warehouse_id is None:
+            raise ValidationError(
+                "warehouseId is required on the line or the request",
+                field=f"lines[{index}].warehouseId",
+            )
+        lines.append(StockLine(line.variant_id, warehouse_id, line.quantity))
+    return lines
+
+
+def _reservation_dto(data: StockReservationDCO, lines: list[StockLine]) -> StockReservationDTO:
+    return StockReservationDTO(
+        reference_type=data.reference_type,
+        reference_id=data.reference_id,
+        lines=[
+            StockLineDTO(
+                variant_id=line.variant_id, warehouse_id=line.warehouse_id, quantity=line.quantity
+            )
+            for line in lines
+        ],
+    )
+
+
+async def reserve(session: AsyncSession, data: StockReservationDCO) -> StockReservationDTO:
+    """Reserve all lines atomically (raises InsufficientStockError if any falls short)."""
+    lines = await reserve_stock(session, _stock_lines(data), data.reference_type, data.reference_id)
+    return _reservation_dto(data, lines)
+
+
+async def release(session: AsyncSession, data: StockReservationDCO) -> StockReservationDTO:
+    """Release previously reserved lines; returns the quantities actually released."""
+    lines = await release_stock(session, _stock_lines(data), data.reference_type, data.reference_id)
+    return _reservation_dto(data, lines)
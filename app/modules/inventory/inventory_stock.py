@@ -0,0 +1,222 @@
+"""Stock reservation for the `inventory` module.
+
+Each operation is one SQL statement over all lines of a request:
+
+1. lock the affected `inventory` rows in primary-key order, so two requests
+   touching overlapping SKUs always queue in the same order and never deadlock;
+2. apply a conditional `UPDATE … WHERE stock - reserved >= qty` (reserve) —
+   all-or-nothing: if any line falls short, no row is touched;
+3. write the matching `inventory_movements` rows in the same statement,
+
+then move the `variant_availability` totals by the same amounts.
+
+Callers run inside the request transaction; nothing here commits.
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import InsufficientStockError, ValidationError
+from app.modules.availability.availability_service import apply_deltas
+from app.modules.inventory.inventory_entity import Inventory
+
+
+@dataclass(frozen=True)
+class StockLine:
+    variant_id: UUID
+    warehouse_id: UUID
+    quantity: int
+
+
+_REQUEST_CTE = """
+    req AS (
+        SELECT r.variant_id, r.warehouse_id, r.quantity
+        FROM unnest(
+            CAST(:variant_ids AS uuid[]),
+            CAST(:warehouse_ids AS uuid[]),
+            CAST(:quantities AS integer[])
+        ) AS r(variant_id, warehouse_id, quantity)
+    ),
+    locked AS (
+        SELECT i.id, i.variant_id, i.warehouse_id, r.quantity,
+               i.stock_quantity - COALESCE(i.reserved_quantity, 0) AS available,
+               COALESCE(i.reserved_quantity, 0) AS reserved
+        FROM inventory AS i
+        JOIN req AS r ON r.variant_id = i.variant_id AND r.warehouse_id = i.warehouse_id
+        ORDER BY i.id
+        FOR UPDATE OF i
+    )
+"""
+
+_RESERVE_SQL = text(f"""
+WITH {_REQUEST_CTE},
+verdict AS (
+    SELECT count(*) = (SELECT count(*) FROM req) AND bool_and(available >= quantity) AS ok
+    FROM locked
+),
+updated AS (
+    UPDATE inventory AS i
+    SET reserved_quantity = COALESCE(i.reserved_quantity, 0) + l.quantity,
+        updated_at = now()
+    FROM locked AS l, verdict AS v
+    WHERE i.id = l.id
+      AND v.ok
+      AND i.stock_quantity - COALESCE(i.reserved_quantity, 0) >= l.quantity
+    RETURNING i.id, i.variant_id, i.warehouse_id, l.quantity
+),
+movements AS (
+    INSERT INTO inventory_movements
+        (id, variant_id, warehouse_id, movement_type, quantity,
+         reference_type, reference_id, created_at)
+    SELECT gen_random_uuid(), u.variant_id, u.warehouse_id, 'RESERVED', u.quantity,
+           :reference_type, CAST(:reference_id AS uuid), now()
+    FROM updated AS u
+)
+SELECT r.variant_id, r.warehouse_id, r.quantity, l.available, (u.id IS NOT NULL) AS reserved
+FROM req AS r
+LEFT JOIN locked AS l ON l.variant_id = r.variant_id AND l.warehouse_id = r.warehouse_id
+LEFT JOIN updated AS u ON u.id = l.id
+""")
+
+_RELEASE_SQL = text(f"""
+WITH {_REQUEST_CTE},
+updated AS (
+    UPDATE inventory AS i
+    SET reserved_quantity = l.reserved - LEAST(l.quantity, l.reserved),
+        updated_at = now()
+    FROM locked AS l
+    WHERE i.id = l.id AND l.reserved > 0
+    RETURNING i.variant_id, i.warehouse_id, LEAST(l.quantity, l.reserved) AS quantity
+),
+movements AS (
+    INSERT INTO inventory_movements
+        (id, variant_id, warehouse_id, movement_type, quantity,
+         reference_type, reference_id, created_at)
+    SELECT gen_random_uuid(), u.variant_id, u.warehouse_id, 'RELEASED', u.quantity,
+           :reference_type, CAST(:reference_id AS uuid), now()
+    FROM updated AS u
+)
+SELECT u.variant_id, u.warehouse_id, u.quantity FROM updated AS u
+""")
+
+
+def merge_lines(lines: list[StockLine]) -> list[StockLine]:
+    """Sum repeated (variant, warehouse) pairs; the statements expect each pair once."""
+    totals: dict[tuple[UUID, UUID], int] = {}
+    for line in lines:
+        if line.quantity <= 0:
+            raise ValidationError(
+                "Quantity must be positive", field="quantity", value=line.quantity
+            )
+        key = (line.variant_id, line.warehouse_id)
+        totals[key] = totals.get(key, 0) + line.quantity
+    return [StockLine(v, w, q) for (v, w), q in totals.items()]
+
+
+def _params(lines: list[StockLine], reference_type: str, reference_id: UUID | None) -> dict:
+    return {
+        "variant_ids": [line.variant_id for line in lines],
+        "warehouse_ids": [line.warehouse_id for line in lines],
+        "quantities": [line.quantity for line in lines],
+        "reference_type": reference_type,
+        "reference_id": reference_id,
+    }
+
+
+async def reserve_stock(
+    session: AsyncSession,
+    lines: list[StockLine],
+    reference_type: str,
+    reference_id: UUID | None,
+) -> list[StockLine]:
+    """Reserve every line or none; raises InsufficientStockError with the shortfalls."""
+    lines = merge_lines(lines)
+    if not lines:
+        return []
+
+    result = await session.execute(_RESERVE_SQL, _params(lines, reference_type, reference_id))
+    rows = result.all()
+
+    shortfalls = [
+        {
+            "variant_id": str(row.variant_id),
+            "warehouse_id": str(row.warehouse_id),
+            "requested": row.quantity,
+            "available": max(row.available or 0, 0),
+        }
+        for row in rows
+        if not row.reserved
+    ]
+    if shortfalls:
+        logger.info(
+            "Stock reservation rejected | reference={}:{} short_lines={}",
+            reference_type,
+            reference_id,
+            len(shortfalls),
+        )
+        raise InsufficientStockError(shortfalls)
+
+    await apply_deltas(session, [(line.variant_id, 0, line.quantity) for line in lines])
+    logger.info(
+        "Stock reserved | reference={}:{} lines={}", reference_type, reference_id, len(lines)
+    )
+    return lines
+
+
+async def release_stock(
+    session: AsyncSession,
+    lines: list[StockLine],
+    reference_type: str,
+    reference_id: UUID | None,
+) -> list[StockLine]:
+    """Give reserved stock back (never below zero). Returns what was actually released."""
+    lines = merge_lines(lines)
+    if not lines:
+        return []
+
+    result = await session.execute(_RELEASE_SQL, _params(lines, reference_type, reference_id))
+    released = [StockLine(row.variant_id, row.warehouse_id, row.quantity) for row in result.all()]
+    await apply_deltas(session, [(line.variant_id, 0, -line.quantity) for line in released])
+
+    logger.info(
+        "Stock released | reference={}:{} lines={}", reference_type, reference_id, len(released)
+    )
+    return released
+
+
+async def allocate_lines(session: AsyncSession, quantities: dict[UUID, int]) -> list[StockLine]:
+    """Pick one warehouse per variant: the one with the most available stock.
+
+    A read-only plan (no locks) in one query; `reserve_stock` re-checks it
+    atomically. Raises InsufficientStockError when no warehouse covers a line.
+    """
+    available = Inventory.stock_quantity - func.coalesce(Inventory.reserved_quantity, 0)
+    result = await session.execute(
+        select(Inventory.variant_id, Inventory.warehouse_id, available.label("available"))
+        .where(Inventory.variant_id.in_(list(quantities)))
+        .order_by(Inventory.variant_id, available.desc(), Inventory.warehouse_id)
+    )
+    best: dict[UUID, tuple[UUID, int]] = {}
+    for row in result.all():
+        best.setdefault(row.variant_id, (row.warehouse_id, row.available))
+
+    lines, shortfalls = [], []
+    for variant_id, quantity in quantities.items():
+        warehouse_id, stock = best.get(variant_id, (None, 0))
+        if warehouse_id is None or stock < quantity:
+            shortfalls.append({
+                "variant_id": str(variant_id),
+                "warehouse_id": str(warehouse_id) if warehouse_id else None,
+                "requested": quantity,
+                "available": max(stock, 0),
+            })
+        else:
+            lines.append(StockLine(variant_id, warehouse_id, quantity))
+
+    if shortfalls:
+        raise InsufficientStockError(shortfalls)
+    return lines
@@ -0,0 +1,2 @@
+from .inventory_ledger_entity import InventorySnapshot
+from .inventory_ledger_service import LedgerEntry, post_movements, record_adjustment
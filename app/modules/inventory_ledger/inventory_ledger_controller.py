@@ -0,0 +1,71 @@
+"""Controller layer for the `inventory_ledger` module."""
+
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.inventory_ledger import inventory_ledger_service as service
+from app.modules.inventory_ledger.inventory_ledger_dco import PostMovementsDCO
+from app.modules.inventory_ledger.inventory_ledger_dto import (
+    PostedMovementsDTO,
+    StockBalanceDTO,
+    StockDriftDTO,
+    StockValuationDTO,
+    WarehouseValuationDTO,
+)
+
+_CENT = Decimal("0.01")
+
+
+async def post_movements(session: AsyncSession, data: PostMovementsDCO) -> PostedMovementsDTO:
+    entries = [
+        service.LedgerEntry(e.variant_id, e.warehouse_id, e.movement_type, e.quantity, e.unit_cost)
+        for e in data.entries
+    ]
+    ids = await service.post_movements(session, entries, data.reference_type, data.reference_id)
+    return PostedMovementsDTO(movement_ids=ids)
+
+
+async def stock_as_of(
+    session: AsyncSession,
+    as_of: datetime | None,
+    variant_ids: list[UUID] | None,
+    warehouse_id: UUID | None,
+) -> list[StockBalanceDTO]:
+    rows = await service.stock_as_of(session, as_of, variant_ids, warehouse_id)
+    return [
+        StockBalanceDTO(
+            variant_id=r.variant_id, warehouse_id=r.warehouse_id, stock_quantity=r.stock_quantity
+        )
+        for r in rows
+    ]
+
+
+async def take_snapshot(session: AsyncSession, as_of: datetime | None) -> int:
+    return await service.take_snapshot(session, as_of, force=True)
+
+
+async def reconcile(session: AsyncSession, limit: int) -> list[StockDriftDTO]:
+    rows = await service.reconcile(session, limit)
+    return [StockDriftDTO.model_validate(r) for r in rows]
+
+
+async def valuation(session: AsyncSession, as_of: datetime | None) -> StockValuationDTO:
+    rows = await service.valuation(session, as_of)
+    warehouses = [
+        WarehouseValuationDTO(
+            warehouse_id=r.warehouse_id,
+            units=r.units,
+            value=Decimal(r.value).quantize(_CENT, rounding=ROUND_HALF_UP),
+            unvalued_items=r.unvalued_items,
+        )
+        for r in rows
+    ]
+    return StockValuationDTO(
+        as_of=as_of,
+        total_units=sum(w.units for w in warehouses),
+        total_value=sum((w.value for w in warehouses), Decimal("0.00")),
+        warehouses=warehouses,
+    )
@@ -0,0 +1,22 @@
+"""DCO for the inventory ledger — posting movements."""
+
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import Field
+
+from app.common.schemas.base import BaseSchema
+from app.modules.inventory_movements.inventory_movements_entity import MovementTypeEnum
+
+class LedgerEntryDCO(BaseSchema):
+    variant_id: UUID
+    warehouse_id: UUID
+    movement_type: MovementTypeEnum
+    quantity: int
+    unit_cost: Optional[Decimal] = Field(None, ge=0)
+
+class PostMovementsDCO(BaseSchema):
+    reference_type: Optional[str] = Field(None, max_length=50)
+    reference_id: Optional[UUID] = None
+    entries: List[LedgerEntryDCO] = Field(..., min_length=1, max_length=1000)
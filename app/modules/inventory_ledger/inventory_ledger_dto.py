@@ -0,0 +1,35 @@
+"""DTO for the inventory ledger — READ operations."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from app.common.schemas.base import BaseSchema
+
+class PostedMovementsDTO(BaseSchema):
+    movement_ids: List[UUID]
+
+class StockBalanceDTO(BaseSchema):
+    variant_id: UUID
+    warehouse_id: UUID
+    stock_quantity: int
+
+class StockDriftDTO(BaseSchema):
+    variant_id: UUID
+    warehouse_id: UUID
+    ledger_quantity: int
+    inventory_quantity: int
+    drift: int
+
+class WarehouseValuationDTO(BaseSchema):
+    warehouse_id: UUID
+    units: int
+    value: Decimal
+    unvalued_items: int
+
+class StockValuationDTO(BaseSchema):
+    as_of: Optional[datetime] = None
+    total_units: int
+    total_value: Decimal
+    warehouses: List[WarehouseValuationDTO]
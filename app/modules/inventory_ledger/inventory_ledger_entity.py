@@ -0,0 +1,34 @@
+"""SQLAlchemy entity for the `inventory_snapshots` table.
+
+Periodic, ledger-derived balances per (variant, warehouse). An as-of query
+starts from the latest snapshot at or before the date and only sums the
+movements after it. Received quantity/cost are running totals of costed IN
+movements, for weighted-average valuation.
+"""
+
+import uuid
+from uuid import uuid4
+
+from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class InventorySnapshot(Base):
+    __tablename__ = "inventory_snapshots"
+
+    __table_args__ = (
+        # Also serves "latest snapshot ≤ date" for one stock item
+        UniqueConstraint("variant_id", "warehouse_id", "taken_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    variant_id = Column(UUID(as_uuid=True), ForeignKey("product_variants.id"), nullable=False)
+    warehouse_id = Column(UUID(as_uuid=True), ForeignKey("warehouses.id"), nullable=False)
+    taken_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    stock_quantity = Column(Integer, nullable=False)
+    received_quantity = Column(Integer, nullable=False, server_default=text("0"))
+    received_cost = Column(Numeric(16, 4), nullable=False, server_default=text("0"))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
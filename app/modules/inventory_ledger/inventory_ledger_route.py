@@ -0,0 +1,83 @@
+"""Routes for the `inventory_ledger` module (admin only)."""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.inventory_ledger import inventory_ledger_controller as controller
+from app.modules.inventory_ledger.inventory_ledger_dco import PostMovementsDCO
+
+router = APIRouter()
+
+
+@router.post("/movements", status_code=status.HTTP_201_CREATED)
+@limiter.limit(RateLimits.ADMIN)
+async def post_movements(
+    request: Request,
+    body: PostMovementsDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Append movements and update stock balances together (all or nothing)."""
+    posted = await controller.post_movements(db, body)
+    return respond(data=posted, message="Movements posted", status_code=201)
+
+
+@router.get("/stock")
+@limiter.limit(RateLimits.ADMIN)
+async def get_stock_as_of(
+    request: Request,
+    as_of: Optional[datetime] = Query(None, alias="asOf"),
+    variant_ids: Optional[List[UUID]] = Query(None, alias="variantIds"),
+    warehouse_id: Optional[UUID] = Query(None, alias="warehouseId"),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Ledger stock per variant and warehouse at a point in time (default now)."""
+    balances = await controller.stock_as_of(db, as_of, variant_ids, warehouse_id)
+    return respond(data=balances, message="Stock balances fetched")
+
+
+@router.get("/valuation")
+@limiter.limit(RateLimits.ADMIN)
+async def get_stock_valuation(
+    request: Request,
+    as_of: Optional[datetime] = Query(None, alias="asOf"),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Stock value per warehouse at weighted-average receipt cost."""
+    valuation = await controller.valuation(db, as_of)
+    return respond(data=valuation, message="Stock valuation calculated")
+
+
+@router.get("/reconciliation")
+@limiter.limit(RateLimits.ADMIN)
+async def get_reconciliation(
+    request: Request,
+    limit: int = Query(1000, ge=1, le=10000),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Stock items where `inventory` disagrees with the ledger."""
+    drift = await controller.reconcile(db, limit)
+    return respond(data=drift, message="Reconciliation completed")
+
+
+@router.post("/snapshots", status_code=status.HTTP_201_CREATED)
+@limiter.limit(RateLimits.ADMIN)
+async def take_snapshot(
+    request: Request,
+    as_of: Optional[datetime] = Query(None, alias="asOf"),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Snapshot ledger balances now (e.g. at month end) instead of waiting for the schedule."""
+    items = await controller.take_snapshot(db, as_of)
+    return respond(data={"items": items}, message="Inventory snapshot taken", status_code=201)
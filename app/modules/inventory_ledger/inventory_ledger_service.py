@@ -0,0 +1,367 @@
+"""Service layer for the `inventory_ledger` module.
+
+`inventory_movements` is the append-only ledger; `inventory.stock_quantity`
+is its running balance. `post_movements` writes both in one statement, so
+they cannot diverge through this path. RESERVED/RELEASED movements record
+holds and never count towards on-hand stock.
+
+- As-of balances: latest `inventory_snapshots` row at or before the date plus
+  the movements after it (index on variant, warehouse, created_at), for
+  every item the ledger knows by then, not only those in `inventory` today.
+- Snapshots are derived from the ledger, not copied from `inventory`, and are
+  taken SETTLE seconds in the past so transactions still in flight (whose
+  movements carry their start time) are never missed.
+- Reconciliation compares the ledger balance with `inventory` for every item
+  in one set-based statement.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import BusinessRuleError, ValidationError
+from app.modules.availability.availability_service import apply_deltas
+from app.modules.inventory_movements.inventory_movements_entity import MovementTypeEnum
+
+# Movement types that change on-hand stock, and their sign
+_STOCK_SIGNS = {
+    MovementTypeEnum.IN: 1,
+    MovementTypeEnum.RETURN: 1,
+    MovementTypeEnum.OUT: -1,
+    MovementTypeEnum.ADJUSTMENT: 1,  # quantity is already signed
+}
+
+_SIGNED_QUANTITY = """
+    CASE m.movement_type
+        WHEN 'IN' THEN m.quantity
+        WHEN 'RETURN' THEN m.quantity
+        WHEN 'OUT' THEN -m.quantity
+        WHEN 'ADJUSTMENT' THEN m.quantity
+        ELSE 0
+    END"""
+
+_COSTED_RECEIPT = "m.movement_type = 'IN' AND m.unit_cost IS NOT NULL"
+
+_POST_SQL = text("""
+WITH entries AS (
+    SELECT *
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:variant_ids AS uuid[]),
+        CAST(:warehouse_ids AS uuid[]),
+        CAST(:movement_types AS text[]),
+        CAST(:quantities AS integer[]),
+        CAST(:deltas AS integer[]),
+        CAST(:unit_costs AS numeric[])
+    ) AS e(id, variant_id, warehouse_id, movement_type, quantity, delta, unit_cost)
+),
+totals AS (
+    SELECT variant_id, warehouse_id, sum(delta) AS delta
+    FROM entries
+    GROUP BY variant_id, warehouse_id
+),
+balances AS (
+    INSERT INTO inventory AS i
+        (id, variant_id, warehouse_id, stock_quantity, reserved_quantity, updated_at)
+    SELECT gen_random_uuid(), t.variant_id, t.warehouse_id, t.delta, 0, now()
+    FROM totals AS t
+    ORDER BY t.variant_id, t.warehouse_id
+    ON CONFLICT (variant_id, warehouse_id) DO UPDATE
+    SET stock_quantity = i.stock_quantity + EXCLUDED.stock_quantity,
+        updated_at = now()
+    RETURNING i.variant_id, i.warehouse_id, i.stock_quantity,
+              COALESCE(i.reserved_quantity, 0) AS reserved
+),
+movements AS (
+    INSERT INTO inventory_movements
+        (id, variant_id, warehouse_id, movement_type, quantity, unit_cost,
+         reference_type, reference_id, created_at)
+    SELECT e.id, e.variant_id, e.warehouse_id, CAST(e.movement_type AS movementtypeenum),
+           e.quantity, e.unit_cost, :reference_type, CAST(:reference_id AS uuid), now()
+    FROM entries AS e
+)
+SELECT b.variant_id, b.warehouse_id, b.stock_quantity, b.reserved, t.delta
+FROM balances AS b
+JOIN totals AS t ON t.variant_id = b.variant_id AND t.warehouse_id = b.warehouse_id
+""")
+
+_ITEM_SCOPE_SQL = (
+    "(CAST(:variant_ids AS uuid[]) IS NULL\n"
+    "           OR {t}.variant_id = ANY(CAST(:variant_ids AS uuid[])))\n"
+    "      AND (CAST(:warehouse_id AS uuid) IS NULL\n"
+    "           OR {t}.warehouse_id = CAST(:warehouse_id AS uuid))"
+)
+
+# The item set comes from the ledger itself, never from `inventory`: the
+# items of the latest snapshot at or before the date (snapshots are never
+# scoped, so they hold every item with history up to then) plus the items
+# that moved between that snapshot and the date.
+_AS_OF_SQL = f"""
+WITH as_of AS (
+    SELECT COALESCE(CAST(:as_of AS timestamptz), now()) AS at
+),
+base AS (
+    SELECT max(s.taken_at) AS taken_at
+    FROM inventory_snapshots AS s
+    CROSS JOIN as_of AS a
+    WHERE s.taken_at <= a.at
+),
+items AS (
+    SELECT s.variant_id, s.warehouse_id
+    FROM inventory_snapshots AS s
+    JOIN base AS b ON s.taken_at = b.taken_at
+    WHERE {_ITEM_SCOPE_SQL.format(t="s")}
+    UNION
+    SELECT m.variant_id, m.warehouse_id
+    FROM inventory_movements AS m
+    CROSS JOIN base AS b
+    CROSS JOIN as_of AS a
+    WHERE m.created_at > COALESCE(b.taken_at, '-infinity')
+      AND m.created_at <= a.at
+      AND {_ITEM_SCOPE_SQL.format(t="m")}
+)
+SELECT k.variant_id, k.warehouse_id,
+       COALESCE(s.stock_quantity, 0) + COALESCE(m.stock_delta, 0) AS stock_quantity,
+       COALESCE(s.received_quantity, 0) + COALESCE(m.received_quantity, 0) AS received_quantity,
+       COALESCE(s.received_cost, 0) + COALESCE(m.received_cost, 0) AS received_cost
+FROM items AS k
+CROSS JOIN as_of AS a
+LEFT JOIN LATERAL (
+    SELECT s.taken_at, s.stock_quantity, s.received_quantity, s.received_cost
+    FROM inventory_snapshots AS s
+    WHERE s.variant_id = k.variant_id AND s.warehouse_id = k.warehouse_id AND s.taken_at <= a.at
+    ORDER BY s.taken_at DESC
+    LIMIT 1
+) AS s ON true
+LEFT JOIN LATERAL (
+    SELECT sum({_SIGNED_QUANTITY}) AS stock_delta,
+           sum(m.quantity) FILTER (WHERE {_COSTED_RECEIPT}) AS received_quantity,
+           sum(m.quantity * m.unit_cost) FILTER (WHERE {_COSTED_RECEIPT}) AS received_cost
+    FROM inventory_movements AS m
+    WHERE m.variant_id = k.variant_id
+      AND m.warehouse_id = k.warehouse_id
+      AND m.created_at > COALESCE(s.taken_at, '-infinity')
+      AND m.created_at <= a.at
+) AS m ON true
+"""
+
+_STOCK_AS_OF_SQL = text(_AS_OF_SQL)
+
+_SNAPSHOT_SQL = text(f"""
+INSERT INTO inventory_snapshots
+    (id, variant_id, warehouse_id, taken_at,
+     stock_quantity, received_quantity, received_cost, created_at)
+SELECT gen_random_uuid(), b.variant_id, b.warehouse_id, CAST(:as_of AS timestamptz),
+       b.stock_quantity, b.received_quantity, b.received_cost, now()
+FROM ({_AS_OF_SQL}) AS b
+ON CONFLICT (variant_id, warehouse_id, taken_at) DO NOTHING
+""")
+
+# Full join: a balance with no ledger history is drift too
+_RECONCILE_SQL = text(f"""
+SELECT COALESCE(b.variant_id, i.variant_id) AS variant_id,
+       COALESCE(b.warehouse_id, i.warehouse_id) AS warehouse_id,
+       COALESCE(b.stock_quantity, 0) AS ledger_quantity,
+       COALESCE(i.stock_quantity, 0) AS inventory_quantity,
+       COALESCE(i.stock_quantity, 0) - COALESCE(b.stock_quantity, 0) AS drift
+FROM ({_AS_OF_SQL}) AS b
+FULL JOIN inventory AS i ON i.variant_id = b.variant_id AND i.warehouse_id = b.warehouse_id
+WHERE COALESCE(i.stock_quantity, 0) <> COALESCE(b.stock_quantity, 0)
+ORDER BY abs(COALESCE(i.stock_quantity, 0) - COALESCE(b.stock_quantity, 0)) DESC
+LIMIT :limit
+""")
+
+_VALUATION_SQL = text(f"""
+SELECT b.warehouse_id,
+       sum(b.stock_quantity) AS units,
+       COALESCE(
+           sum(b.stock_quantity * b.received_cost / NULLIF(b.received_quantity, 0)), 0
+       ) AS value,
+       count(*) FILTER (WHERE b.stock_quantity <> 0 AND b.received_quantity = 0) AS unvalued_items
+FROM ({_AS_OF_SQL}) AS b
+GROUP BY b.warehouse_id
+""")
+
+_SNAPSHOT_LOCK_SQL = text("SELECT pg_try_advisory_xact_lock(hashtext('inventory_snapshots'))")
+_LATEST_SNAPSHOT_SQL = text("SELECT max(taken_at) FROM inventory_snapshots")
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    variant_id: UUID
+    warehouse_id: UUID
+    movement_type: MovementTypeEnum
+    quantity: int
+    unit_cost: Decimal | None = None
+
+    @property
+    def stock_delta(self) -> int:
+        return _STOCK_SIGNS[self.movement_type] * self.quantity
+
+
+def _validate(entries: list[LedgerEntry]) -> None:
+    for index, entry in enumerate(entries):
+        field = f"entries[{index}]"
+        if entry.movement_type not in _STOCK_SIGNS:
+            raise ValidationError(
+                "Holds are posted through stock reservations", field=f"{field}.movementType",
+                value=entry.movement_type.value,
+            )
+        if entry.movement_type == MovementTypeEnum.ADJUSTMENT:
+            if entry.quantity == 0:
+                raise ValidationError(
+                    "Adjustment quantity must not be zero", field=f"{field}.quantity"
+                )
+        elif entry.quantity <= 0:
+            raise ValidationError(
+                "Quantity must be positive", field=f"{field}.quantity", value=entry.quantity
+            )
+
+
+async def post_movements(
+    session: AsyncSession,
+    entries: list[LedgerEntry],
+    reference_type: str | None = None,
+    reference_id: UUID | None = None,
+) -> list[UUID]:
+    """Append movements and move `inventory` balances with them (one statement).
+
+    Raises BusinessRuleError — the caller's transaction must roll back — when a
+    balance would drop below zero or below what is reserved.
+    """
+    if not entries:
+        return []
+    _validate(entries)
+
+    ids = [uuid.uuid4() for _ in entries]
+    result = await session.execute(
+        _POST_SQL,
+        {
+            "ids": ids,
+            "variant_ids": [e.variant_id for e in entries],
+            "warehouse_ids": [e.warehouse_id for e in entries],
+            "movement_types": [e.movement_type.value for e in entries],
+            "quantities": [e.quantity for e in entries],
+            "deltas": [e.stock_delta for e in entries],
+            "unit_costs": [e.unit_cost for e in entries],
+            "reference_type": reference_type,
+            "reference_id": reference_id,
+        },
+    )
+    balances = result.all()
+
+    short = [b for b in balances if b.stock_quantity < max(b.reserved, 0)]
+    if short:
+        raise BusinessRuleError(
+            f"Movements would leave {len(short)} stock item(s) below zero "
+            "or below reserved quantity",
+            rule_name="stock_not_negative",
+        )
+
+    await apply_deltas(session, [(b.variant_id, b.delta, 0) for b in balances])
+    logger.info(
+        "Ledger movements posted | reference={}:{} movements={} items={}",
+        reference_type,
+        reference_id,
+        len(entries),
+        len(balances),
+    )
+    return ids
+
+
+async def record_adjustment(
+    session: AsyncSession,
+    variant_id: UUID,
+    warehouse_id: UUID,
+    delta: int,
+    reference_type: str,
+    reference_id: UUID | None = None,
+) -> None:
+    """Write the ledger side of a balance change already applied to `inventory`."""
+    if delta == 0:
+        return
+    await session.execute(
+        text("""
+            INSERT INTO inventory_movements
+                (id, variant_id, warehouse_id, movement_type, quantity,
+                 reference_type, reference_id, created_at)
+            VALUES (gen_random_uuid(), :variant_id, :warehouse_id, 'ADJUSTMENT', :quantity,
+                    :reference_type, CAST(:reference_id AS uuid), now())
+        """),
+        {
+            "variant_id": variant_id,
+            "warehouse_id": warehouse_id,
+            "quantity": delta,
+            "reference_type": reference_type,
+            "reference_id": reference_id,
+        },
+    )
+
+
+def _filters(
+    as_of: datetime | None, variant_ids: list[UUID] | None = None, warehouse_id: UUID | None = None
+) -> dict:
+    return {"as_of": as_of, "variant_ids": variant_ids or None, "warehouse_id": warehouse_id}
+
+
+async def stock_as_of(
+    session: AsyncSession,
+    as_of: datetime | None,
+    variant_ids: list[UUID] | None = None,
+    warehouse_id: UUID | None = None,
+) -> list:
+    """Ledger balance per stock item at `as_of` (now when None)."""
+    result = await session.execute(_STOCK_AS_OF_SQL, _filters(as_of, variant_ids, warehouse_id))
+    return result.all()
+
+
+async def take_snapshot(
+    session: AsyncSession, as_of: datetime | None = None, force: bool = False
+) -> int:
+    """Snapshot every stock item's ledger balance at `as_of` (default: now − settle).
+
+    One node at a time (advisory lock); unless forced, skipped when the latest
+    snapshot is younger than ~the snapshot interval. Returns rows written.
+    """
+    if not (await session.execute(_SNAPSHOT_LOCK_SQL)).scalar_one():
+        return 0
+
+    now = datetime.now(timezone.utc)
+    as_of = as_of or now - timedelta(seconds=settings.ledger_snapshot_settle_seconds)
+    if as_of > now - timedelta(seconds=settings.ledger_snapshot_settle_seconds):
+        raise ValidationError(
+            "Snapshots must be at least LEDGER_SNAPSHOT_SETTLE_SECONDS in the past", field="asOf"
+        )
+
+    if not force:
+        latest = (await session.execute(_LATEST_SNAPSHOT_SQL)).scalar_one()
+        if latest is not None and as_of - latest < timedelta(
+            seconds=settings.ledger_snapshot_interval_seconds * 0.9
+        ):
+            return 0
+
+    result = await session.execute(_SNAPSHOT_SQL, _filters(as_of))
+    logger.info("Inventory snapshot taken | as_of={} items={}", as_of.isoformat(), result.rowcount)
+    return result.rowcount
+
+
+async def reconcile(session: AsyncSession, limit: int = 1000) -> list:
+    """Stock items whose `inventory` balance differs from the ledger, largest drift first."""
+    result = await session.execute(_RECONCILE_SQL, {**_filters(None), "limit": limit})
+    rows = result.all()
+    if rows:
+        logger.warning("Inventory drift detected | items={}", len(rows))
+    return rows
+
+
+async def valuation(session: AsyncSession, as_of: datetime | None) -> list:
+    """Units and weighted-average receipt cost value per warehouse at `as_of`."""
+    result = await session.execute(_VALUATION_SQL, _filters(as_of))
+    return result.all()
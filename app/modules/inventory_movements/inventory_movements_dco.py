@@ -1,6 +1,7 @@
 """DCO for the inventory_movements table — WRITE operations."""
 
 from uuid import UUID
+from decimal import Decimal
 from typing import Optional
 
 from app.common.schemas.base import BaseSchema
@@ -11,6 +12,7 @@ class InventoryMovementDCO(BaseSchema):
     warehouse_id: UUID
     movement_type: MovementTypeEnum
     quantity: int
+    unit_cost: Optional[Decimal] = None
     reference_type: Optional[str] = None
     reference_id: Optional[UUID] = None
 
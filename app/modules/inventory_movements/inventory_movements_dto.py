@@ -1,6 +1,7 @@
 """DTO for the inventory_movements table — READ operations."""
 
 from uuid import UUID
+from decimal import Decimal
 from datetime import datetime
 from typing import Optional
 
@@ -14,6 +15,7 @@ class InventoryMovementDTO(BaseSchema):
     warehouse_id: UUID
     movement_type: MovementTypeEnum
     quantity: int
+    unit_cost: Optional[Decimal] = None
     reference_type: Optional[str] = None
     reference_id: Optional[UUID] = None
     created_at: Optional[datetime] = None
@@ -4,7 +4,7 @@ import uuid
 from uuid import uuid4
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Text, String, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Text, String, Integer, Numeric, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -17,16 +17,26 @@ class MovementTypeEnum(str, PyEnum):
     OUT = "OUT"
     ADJUSTMENT = "ADJUSTMENT"
     RETURN = "RETURN"
+    RESERVED = "RESERVED"   # stock held for an order; on-hand unchanged
+    RELEASED = "RELEASED"   # hold given back; on-hand unchanged
 
 
 class InventoryMovement(Base):
     __tablename__ = "inventory_movements"
 
+    __table_args__ = (
+        # Ledger range scans: movements of one stock item since a snapshot
+        Index("ix_inventory_movements_item_time", "variant_id", "warehouse_id", "created_at"),
+        # Which stock items moved since a snapshot (as-of item set)
+        Index("ix_inventory_movements_created_at", "created_at"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     variant_id = Column(UUID(as_uuid=True), ForeignKey("product_variants.id"), nullable=False)
     warehouse_id = Column(UUID(as_uuid=True), ForeignKey("warehouses.id"), nullable=False)
     movement_type = Column(Enum(MovementTypeEnum), nullable=False)
-    quantity = Column(Integer, nullable=False)
+    quantity = Column(Integer, nullable=False)  # ADJUSTMENT is signed; other types are positive
+    unit_cost = Column(Numeric(12, 4), nullable=True)  # purchase cost per unit on IN, for valuation
     reference_type = Column(Text, nullable=True)
     reference_id = Column(UUID(as_uuid=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
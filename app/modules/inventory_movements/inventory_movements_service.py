@@ -7,18 +7,30 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
+from app.core.exceptions import BusinessRuleError
+from app.modules.inventory_ledger.inventory_ledger_service import LedgerEntry, post_movements
 from app.modules.inventory_movements.inventory_movements_entity import InventoryMovement
 from app.modules.inventory_movements.inventory_movements_dto import InventoryMovementDTO
 from app.modules.inventory_movements.inventory_movements_dco import InventoryMovementDCO, InventoryMovementUpdateDCO
 
 
 async def create(session: AsyncSession, data: InventoryMovementDCO) -> InventoryMovementDTO:
-    """Create a new InventoryMovement record."""
-    entity_obj = InventoryMovement(**data.model_dump())
-    session.add(entity_obj)
-    await session.flush()
-    await session.refresh(entity_obj)
-    return InventoryMovementDTO.model_validate(entity_obj)
+    """Post one movement through the ledger (also moves the inventory balance)."""
+    [movement_id] = await post_movements(
+        session,
+        [
+            LedgerEntry(
+                data.variant_id,
+                data.warehouse_id,
+                data.movement_type,
+                data.quantity,
+                data.unit_cost,
+            )
+        ],
+        data.reference_type,
+        data.reference_id,
+    )
+    return await get_by_id(session, movement_id)
 
 
 async def get_by_id(session: AsyncSession, record_id: UUID) -> InventoryMovementDTO | None:
@@ -38,27 +50,20 @@ async def list_all(session: AsyncSession) -> list[InventoryMovementDTO]:
 
 
 async def update(session: AsyncSession, record_id: UUID, data: InventoryMovementUpdateDCO) -> InventoryMovementDTO | None:
-    """Update a InventoryMovement record."""
-    stmt = select(InventoryMovement).where(InventoryMovement.id == record_id)
-    result = await session.execute(stmt)
-    entity_obj = result.scalar_one_or_none()
-    if not entity_obj:
+    """Movements are append-only; corrections are new compensating movements."""
+    if await get_by_id(session, record_id) is None:
         return None
-    updates = data.model_dump(exclude_unset=True)
-    for key, value in updates.items():
-        setattr(entity_obj, key, value)
-    await session.flush()
-    await session.refresh(entity_obj)
-    return InventoryMovementDTO.model_validate(entity_obj)
+    raise BusinessRuleError(
+        "Inventory movements are append-only; post a compensating movement instead",
+        rule_name="ledger_append_only",
+    )
 
 
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
-    """Delete a InventoryMovement record (hard delete)."""
-    stmt = select(InventoryMovement).where(InventoryMovement.id == record_id)
-    result = await session.execute(stmt)
-    entity_obj = result.scalar_one_or_none()
-    if not entity_obj:
+    """Movements are append-only; corrections are new compensating movements."""
+    if await get_by_id(session, record_id) is None:
         return False
-    await session.delete(entity_obj)
-    await session.flush()
-    return True
+    raise BusinessRuleError(
+        "Inventory movements are append-only; post a compensating movement instead",
+        rule_name="ledger_append_only",
+    )
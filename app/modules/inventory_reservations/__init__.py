@@ -0,0 +1,8 @@
+from .inventory_reservations_entity import InventoryReservation, ReservationStatusEnum
+from .inventory_reservations_service import (
+    consume_holds,
+    expire_batch,
+    fulfil_holds,
+    hold_stock,
+    release_holds,
+)
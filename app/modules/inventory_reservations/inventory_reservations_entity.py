@@ -0,0 +1,51 @@
+"""SQLAlchemy entity for the `inventory_reservations` table.
+
+One row per (reference, variant, warehouse) hold. While ACTIVE or CONSUMED
+its quantity is counted in `inventory.reserved_quantity`; the sweeper turns
+ACTIVE rows past `expires_at` into EXPIRED and gives the quantity back.
+"""
+
+import uuid
+from uuid import uuid4
+from enum import Enum as PyEnum
+
+from sqlalchemy import Column, Text, Integer, DateTime, ForeignKey, Enum, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class ReservationStatusEnum(str, PyEnum):
+    ACTIVE = "ACTIVE"        # holding stock until expires_at
+    RELEASED = "RELEASED"    # given back on cancellation
+    CONSUMED = "CONSUMED"    # order paid; stays reserved until fulfilment
+    EXPIRED = "EXPIRED"      # given back by the sweeper
+    FULFILLED = "FULFILLED"  # shipped: hold closed, stock left through an OUT movement
+
+
+class InventoryReservation(Base):
+    __tablename__ = "inventory_reservations"
+
+    __table_args__ = (
+        # Sweeper scan: only live holds, soonest expiry first
+        Index(
+            "ix_inventory_reservations_active_expiry",
+            "expires_at",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        Index("ix_inventory_reservations_reference", "reference_type", "reference_id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    variant_id = Column(UUID(as_uuid=True), ForeignKey("product_variants.id"), nullable=False)
+    warehouse_id = Column(UUID(as_uuid=True), ForeignKey("warehouses.id"), nullable=False)
+    quantity = Column(Integer, nullable=False)
+    reference_type = Column(Text, nullable=False)
+    reference_id = Column(UUID(as_uuid=True), nullable=False)
+    status = Column(
+        Enum(ReservationStatusEnum), nullable=False, default=ReservationStatusEnum.ACTIVE
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -0,0 +1,255 @@
+"""Service layer for the `inventory_reservations` module.
+
+Holds are written in the same transaction as the stock they reserve
+(`app.modules.inventory.inventory_stock`). Closing holds — on cancel,
+expiry or shipment — is one statement per batch: close the hold rows,
+decrement `inventory.reserved_quantity` (rows locked in primary-key order)
+and write a RELEASED movement per hold against its original reference. The
+statement returns what each inventory row gave back, for the availability
+projection. A shipment then posts the same quantities as OUT movements
+through the ledger.
+
+Hold lifecycle: ACTIVE (unpaid) -> CONSUMED (paid) -> FULFILLED (shipped);
+ACTIVE -> EXPIRED (sweeper); ACTIVE or CONSUMED -> RELEASED (cancelled).
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.modules.availability.availability_service import apply_deltas
+from app.modules.inventory.inventory_stock import StockLine, merge_lines, reserve_stock
+from app.modules.inventory_ledger.inventory_ledger_service import LedgerEntry, post_movements
+from app.modules.inventory_movements.inventory_movements_entity import MovementTypeEnum
+from app.modules.inventory_reservations.inventory_reservations_entity import (
+    InventoryReservation,
+    ReservationStatusEnum,
+)
+
+
+def _give_back_sql(
+    where: str,
+    lock: str,
+    status: ReservationStatusEnum,
+    limit: str = "",
+    open_statuses: str = "'ACTIVE'",
+) -> str:
+    return f"""
+WITH holds AS (
+    SELECT id, variant_id, warehouse_id, quantity, reference_type, reference_id
+    FROM inventory_reservations
+    WHERE status IN ({open_statuses}) AND {where}
+    ORDER BY expires_at
+    {limit}
+    {lock}
+),
+closed AS (
+    UPDATE inventory_reservations AS r
+    SET status = '{status.value}', updated_at = now()
+    FROM holds AS h
+    WHERE r.id = h.id
+),
+totals AS (
+    SELECT variant_id, warehouse_id, sum(quantity) AS quantity
+    FROM holds
+    GROUP BY variant_id, warehouse_id
+),
+locked AS (
+    SELECT i.id, i.variant_id, i.warehouse_id, t.quantity,
+           COALESCE(i.reserved_quantity, 0) AS reserved
+    FROM inventory AS i
+    JOIN totals AS t ON t.variant_id = i.variant_id AND t.warehouse_id = i.warehouse_id
+    ORDER BY i.id
+    FOR UPDATE OF i
+),
+given_back AS (
+    UPDATE inventory AS i
+    SET reserved_quantity = l.reserved - LEAST(l.quantity, l.reserved),
+        updated_at = now()
+    FROM locked AS l
+    WHERE i.id = l.id
+),
+movements AS (
+    INSERT INTO inventory_movements
+        (id, variant_id, warehouse_id, movement_type, quantity,
+         reference_type, reference_id, created_at)
+    SELECT gen_random_uuid(), h.variant_id, h.warehouse_id, 'RELEASED', h.quantity,
+           h.reference_type, h.reference_id, now()
+    FROM holds AS h
+)
+SELECT c.holds, l.variant_id, l.warehouse_id, l.quantity AS held,
+       LEAST(l.quantity, l.reserved) AS quantity
+FROM (SELECT count(*) AS holds FROM holds) AS c
+LEFT JOIN locked AS l ON true
+"""
+
+
+_REFERENCE = "reference_type = :reference_type AND reference_id = :reference_id"
+
+# Cancel: wait for any sweeper holding these rows, then skip what it closed.
+# Paid (CONSUMED) holds are given back too.
+_RELEASE_SQL = text(_give_back_sql(
+    _REFERENCE,
+    "FOR UPDATE",
+    ReservationStatusEnum.RELEASED,
+    open_statuses="'ACTIVE', 'CONSUMED'",
+))
+
+# Shipment: close the holds; the caller posts the OUT movements
+_FULFIL_SQL = text(_give_back_sql(
+    _REFERENCE,
+    "FOR UPDATE",
+    ReservationStatusEnum.FULFILLED,
+    open_statuses="'CONSUMED'",
+))
+
+# Sweep: each node takes a disjoint batch via the partial index on expires_at
+_EXPIRE_SQL = text(_give_back_sql(
+    "expires_at <= now()",
+    "FOR UPDATE SKIP LOCKED",
+    ReservationStatusEnum.EXPIRED,
+    "LIMIT :batch_size",
+))
+
+
+async def hold_stock(
+    session: AsyncSession,
+    lines: list[StockLine],
+    reference_type: str,
+    reference_id: UUID,
+    ttl_seconds: int | None = None,
+) -> list[StockLine]:
+    """Reserve all lines (all-or-nothing) and record holds that expire after the TTL."""
+    lines = await reserve_stock(session, lines, reference_type, reference_id)
+    if not lines:
+        return lines
+
+    expires_at = datetime.now(timezone.utc) + timedelta(
+        seconds=ttl_seconds or settings.reservation_ttl_seconds
+    )
+    await session.execute(
+        insert(InventoryReservation),
+        [
+            {
+                "variant_id": line.variant_id,
+                "warehouse_id": line.warehouse_id,
+                "quantity": line.quantity,
+                "reference_type": reference_type,
+                "reference_id": reference_id,
+                "status": ReservationStatusEnum.ACTIVE,
+                "expires_at": expires_at,
+            }
+            for line in lines
+        ],
+    )
+    return lines
+
+
+async def _give_back(session: AsyncSession, statement, params: dict) -> list:
+    """Close holds; rows carry the hold count and what each inventory row gave back."""
+    rows = (await session.execute(statement, params)).all()
+    await apply_deltas(
+        session, [(row.variant_id, 0, -row.quantity) for row in rows if row.variant_id]
+    )
+    return rows
+
+
+async def release_holds(session: AsyncSession, reference_type: str, reference_id: UUID) -> int:
+    """Give back every open hold of a reference, paid or not (e.g. a cancelled order)."""
+    rows = await _give_back(
+        session, _RELEASE_SQL, {"reference_type": reference_type, "reference_id": reference_id}
+    )
+    released = rows[0].holds
+    if released:
+        logger.info(
+            "Reservations released | reference={}:{} holds={}",
+            reference_type,
+            reference_id,
+            released,
+        )
+    return released
+
+
+async def consume_holds(session: AsyncSession, reference_type: str, reference_id: UUID) -> int:
+    """Mark a reference's holds CONSUMED so they no longer expire (e.g. order paid).
+
+    Holds the sweeper already expired are re-reserved first; if the stock has
+    gone meanwhile this raises InsufficientStockError and nothing changes.
+    """
+    result = await session.execute(
+        select(InventoryReservation)
+        .where(
+            InventoryReservation.reference_type == reference_type,
+            InventoryReservation.reference_id == reference_id,
+            InventoryReservation.status.in_(
+                [ReservationStatusEnum.ACTIVE, ReservationStatusEnum.EXPIRED]
+            ),
+        )
+        .with_for_update()
+    )
+    holds = result.scalars().all()
+    if not holds:
+        return 0
+
+    expired = [h for h in holds if h.status == ReservationStatusEnum.EXPIRED]
+    if expired:
+        await reserve_stock(
+            session,
+            merge_lines([StockLine(h.variant_id, h.warehouse_id, h.quantity) for h in expired]),
+            reference_type,
+            reference_id,
+        )
+
+    await session.execute(
+        update(InventoryReservation)
+        .where(InventoryReservation.id.in_([h.id for h in holds]))
+        .values(status=ReservationStatusEnum.CONSUMED)
+        .execution_options(synchronize_session=False)
+    )
+    logger.info(
+        "Reservations consumed | reference={}:{} holds={} re_reserved={}",
+        reference_type,
+        reference_id,
+        len(holds),
+        len(expired),
+    )
+    return len(holds)
+
+
+async def fulfil_holds(session: AsyncSession, reference_type: str, reference_id: UUID) -> int:
+    """Ship a reference's stock: close its holds and post the quantities as OUT movements.
+
+    Unpaid or expired holds are consumed first (re-reserving expired ones),
+    so an order shipped on account goes through the same path.
+    """
+    await consume_holds(session, reference_type, reference_id)
+    rows = await _give_back(
+        session, _FULFIL_SQL, {"reference_type": reference_type, "reference_id": reference_id}
+    )
+    fulfilled = rows[0].holds
+    if not fulfilled:
+        return 0
+    await post_movements(
+        session,
+        [
+            LedgerEntry(row.variant_id, row.warehouse_id, MovementTypeEnum.OUT, row.held)
+            for row in rows
+            if row.variant_id
+        ],
+        reference_type,
+        reference_id,
+    )
+    logger.info(
+        "Reservations fulfilled | reference={}:{} holds={}", reference_type, reference_id, fulfilled
+    )
+    return fulfilled
+
+
+async def expire_batch(session: AsyncSession, batch_size: int) -> int:
+    """Expire up to `batch_size` overdue holds not locked by another node."""
+    rows = await _give_back(session, _EXPIRE_SQL, {"batch_size": batch_size})
+    return rows[0].holds
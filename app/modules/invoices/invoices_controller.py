@@ -6,13 +6,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.invoices import invoices_service as service
 from app.modules.invoices.invoices_dto import InvoiceDTO
-from app.modules.invoices.invoices_dco import InvoiceDCO, InvoiceUpdateDCO
+from app.modules.invoices.invoices_dco import InvoiceDCO, InvoiceImportDCO, InvoiceUpdateDCO
 
 
 async def create(session: AsyncSession, data: InvoiceDCO) -> InvoiceDTO:
     return await service.create(session, data)
 
 
+async def import_invoice(session: AsyncSession, data: InvoiceImportDCO) -> InvoiceDTO:
+    return await service.import_invoice(session, data)
+
+
 async def get_by_id(session: AsyncSession, record_id: UUID) -> InvoiceDTO | None:
     return await service.get_by_id(session, record_id)
 
@@ -5,19 +5,23 @@ from decimal import Decimal
 from datetime import datetime
 from typing import Optional
 
+from pydantic import Field
+
 from app.common.schemas.base import BaseSchema
 
 class InvoiceDCO(BaseSchema):
     order_id: UUID
-    invoice_number: str
     gst_amount: Optional[Decimal] = None
     pst_amount: Optional[Decimal] = None
     hst_amount: Optional[Decimal] = None
     pdf_url: Optional[str] = None
     issued_at: Optional[datetime] = None
 
+class InvoiceImportDCO(InvoiceDCO):
+    """An invoice issued outside the system (e.g. migrated), keeping its number."""
+    invoice_number: str = Field(..., min_length=1, max_length=64)
+
 class InvoiceUpdateDCO(BaseSchema):
-    invoice_number: Optional[str] = None
     gst_amount: Optional[Decimal] = None
     pst_amount: Optional[Decimal] = None
     hst_amount: Optional[Decimal] = None
@@ -6,9 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
-from app.core import get_db_session
+from app.core import get_db_session, require_admin
 from app.modules.invoices import invoices_controller as controller
-from app.modules.invoices.invoices_dco import InvoiceDCO, InvoiceUpdateDCO
+from app.modules.invoices.invoices_dco import InvoiceDCO, InvoiceImportDCO, InvoiceUpdateDCO
 
 router = APIRouter()
 
@@ -22,6 +22,17 @@ async def create_invoice(
     return respond(data=record, message="Invoice created", status_code=201)
 
 
+@router.post("/import", status_code=status.HTTP_201_CREATED)
+async def import_invoice(
+    body: InvoiceImportDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Record an invoice issued elsewhere under its existing number."""
+    record = await controller.import_invoice(db, body)
+    return respond(data=record, message="Invoice imported", status_code=201)
+
+
 @router.get("/")
 async def list_invoices(
     db: AsyncSession = Depends(get_db_session),
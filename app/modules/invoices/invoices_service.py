@@ -7,13 +7,31 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
+from app.core.exceptions import ConflictError
 from app.modules.invoices.invoices_entity import Invoice
 from app.modules.invoices.invoices_dto import InvoiceDTO
-from app.modules.invoices.invoices_dco import InvoiceDCO, InvoiceUpdateDCO
+from app.modules.invoices.invoices_dco import InvoiceDCO, InvoiceImportDCO, InvoiceUpdateDCO
+from app.modules.numbering.numbering_service import next_invoice_number
 
 
 async def create(session: AsyncSession, data: InvoiceDCO) -> InvoiceDTO:
-    """Create a new Invoice record."""
+    """Create a new Invoice record, numbered from the gapless series."""
+    entity_obj = Invoice(**data.model_dump())
+    # Last thing before the insert: the series row stays locked until commit
+    entity_obj.invoice_number = await next_invoice_number(session)
+    session.add(entity_obj)
+    await session.flush()
+    await session.refresh(entity_obj)
+    return InvoiceDTO.model_validate(entity_obj)
+
+
+async def import_invoice(session: AsyncSession, data: InvoiceImportDCO) -> InvoiceDTO:
+    """Record an externally issued invoice under its own number (the series is untouched)."""
+    stmt = select(Invoice.id).where(Invoice.invoice_number == data.invoice_number)
+    if (await session.execute(stmt)).first():
+        raise ConflictError(
+            "Invoice number already exists", resource="invoice", field="invoiceNumber"
+        )
     entity_obj = Invoice(**data.model_dump())
     session.add(entity_obj)
     await session.flush()
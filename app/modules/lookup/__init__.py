@@ -0,0 +1 @@
+from .lookup_service import resolve
@@ -0,0 +1,113 @@
+"""In-process cache of natural keys (SKU, barcode, slug).
+
+Entries live for LOOKUP_CACHE_TTL_SECONDS at most and the least recently
+used are evicted beyond LOOKUP_CACHE_MAX_ENTRIES. Every entry is filed under
+its product, so a committed product or variant write (price, status, SKU
+rename, ...) evicts all keys of that product: locally and in other workers,
+through the catalog change fan-out of `search_changes`, price-only changes
+included.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.modules.search.search_changes import PRICE, OwnerKey, on_change
+
+LookupKey = tuple[str, str]   # ("sku" | "barcode" | "slug", normalised value)
+
+
+@dataclass(frozen=True)
+class LookupEntry:
+    product_id: UUID
+    variant_id: Optional[UUID]   # None for slugs (a product, not a variant)
+    sku: Optional[str]
+    price: Optional[Decimal]
+    currency: Optional[str]
+    active: bool                 # variant and product both active and not deleted
+
+
+class LookupCache:
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[LookupKey, tuple[LookupEntry, float]] = OrderedDict()
+        self._by_product: dict[UUID, set[LookupKey]] = {}
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self, keys: list[LookupKey]
+    ) -> tuple[dict[LookupKey, LookupEntry], list[LookupKey]]:
+        """Split keys into cached entries and misses."""
+        now = time.monotonic()
+        hits, misses = {}, []
+        for key in keys:
+            cached = self._entries.get(key)
+            if cached is not None and cached[1] > now:
+                hits[key] = cached[0]
+                self._entries.move_to_end(key)
+            else:
+                misses.append(key)
+        return hits, misses
+
+    def put_many(self, entries: dict[LookupKey, LookupEntry], generation: int) -> None:
+        """Store entries read while `generation` was current (skipped if writes landed since)."""
+        if generation != self.generation:
+            return
+        expires_at = time.monotonic() + self._ttl
+        for key, entry in entries.items():
+            self._drop(key)
+            self._entries[key] = (entry, expires_at)
+            self._by_product.setdefault(entry.product_id, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: LookupKey) -> None:
+        cached = self._entries.pop(key, None)
+        if cached is None:
+            return
+        owned = self._by_product.get(cached[0].product_id)
+        if owned is not None:
+            owned.discard(key)
+            if not owned:
+                del self._by_product[cached[0].product_id]
+
+    def invalidate_products(self, product_ids) -> None:
+        self.generation += 1
+        for product_id in product_ids:
+            for key in self._by_product.pop(product_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._by_product.clear()
+
+
+_cache: LookupCache | None = None
+
+
+def get_lookup_cache() -> LookupCache:
+    global _cache
+    if _cache is None:
+        _cache = LookupCache(settings.lookup_cache_ttl_seconds, settings.lookup_cache_max_entries)
+    return _cache
+
+
+@on_change(prices=True)
+async def _on_catalog_change(owners: Optional[set[OwnerKey]]) -> None:
+    if _cache is None:
+        return
+    if owners is None:
+        _cache.clear()
+    else:
+        _cache.invalidate_products(
+            owner_id for kind, owner_id in owners if kind in ("product", PRICE)
+        )
@@ -0,0 +1,16 @@
+"""Controller layer for the `lookup` module."""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.lookup import lookup_service as service
+from app.modules.lookup.lookup_dco import LookupDCO
+from app.modules.lookup.lookup_dto import LookupHitDTO
+
+
+async def resolve(
+    session: AsyncSession, data: LookupDCO, dealer_id: Optional[UUID] = None
+) -> list[LookupHitDTO]:
+    return await service.resolve(session, data, dealer_id)
@@ -0,0 +1,10 @@
+"""DCO for the lookup module — batch natural-key resolution."""
+
+from typing import List
+
+from app.common.schemas.base import BaseSchema
+
+class LookupDCO(BaseSchema):
+    skus: List[str] = []
+    barcodes: List[str] = []
+    slugs: List[str] = []
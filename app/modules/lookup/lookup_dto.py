@@ -0,0 +1,19 @@
+"""DTO for the lookup module — READ operations."""
+
+from decimal import Decimal
+from uuid import UUID
+from typing import Optional
+
+from app.common.schemas.base import BaseSchema
+
+class LookupHitDTO(BaseSchema):
+    kind: str                          # sku | barcode | slug
+    key: str                           # as requested
+    found: bool
+    product_id: Optional[UUID] = None
+    variant_id: Optional[UUID] = None  # sku / barcode only
+    sku: Optional[str] = None
+    price: Optional[Decimal] = None       # the signed-in dealer's unit price
+    list_price: Optional[Decimal] = None  # set when the dealer's tier price differs
+    currency: Optional[str] = None
+    active: Optional[bool] = None
@@ -0,0 +1,51 @@
+"""Routes for the `lookup` module."""
+
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session, get_optional_user
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.lookup import lookup_controller as controller
+from app.modules.lookup.lookup_dco import LookupDCO
+
+router = APIRouter()
+
+
+@router.get("/")
+@limiter.limit(RateLimits.LOOKUP)
+async def lookup(
+    request: Request,
+    skus: List[str] = Query([], alias="sku"),
+    barcodes: List[str] = Query([], alias="barcode"),
+    slugs: List[str] = Query([], alias="slug"),
+    current_user: Optional[dict] = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Resolve SKUs, barcodes and product slugs (`?sku=a&sku=b&barcode=c`), up to 500 keys.
+
+    Each key maps to product id, variant id, price and whether it is active;
+    unknown keys come back with `found: false`. Signed-in dealers get their
+    tier prices (`listPrice` keeps the original).
+    """
+    data = LookupDCO(skus=skus, barcodes=barcodes, slugs=slugs)
+    dealer_id = UUID(current_user["user_id"]) if current_user else None
+    records = await controller.resolve(db, data, dealer_id)
+    return respond(data=records, message="Keys resolved")
+
+
+@router.post("/")
+@limiter.limit(RateLimits.LOOKUP)
+async def lookup_batch(
+    request: Request,
+    body: LookupDCO,
+    current_user: Optional[dict] = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Same as GET, for batches too long for a query string."""
+    dealer_id = UUID(current_user["user_id"]) if current_user else None
+    records = await controller.resolve(db, body, dealer_id)
+    return respond(data=records, message="Keys resolved")
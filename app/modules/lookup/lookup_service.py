@@ -0,0 +1,130 @@
+"""Service layer for the `lookup` module.
+
+`resolve` answers a batch of SKUs, barcodes and slugs from the in-process
+`LookupCache`; the misses of each kind are fetched with one indexed query
+(`product_variants.sku` unique, `ix_product_variants_barcode`,
+`products.slug` unique) and cached. Unknown keys are not cached, so a newly
+created SKU resolves as soon as it is committed. The cache holds list
+prices; a signed-in dealer's tier prices are overlaid with one query.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.modules.lookup.lookup_cache import LookupEntry, LookupKey, get_lookup_cache
+from app.modules.lookup.lookup_dco import LookupDCO
+from app.modules.lookup.lookup_dto import LookupHitDTO
+from app.modules.price_tiers.price_tiers_effective import resolve_prices
+
+MAX_KEYS = 500
+
+_VARIANT_COLUMNS = """
+    v.id AS variant_id, v.product_id, v.sku, v.barcode, v.price, v.currency,
+    (v.is_active AND v.deleted_at IS NULL AND p.is_active AND p.deleted_at IS NULL) AS active
+"""
+
+_BY_SKU_SQL = text(f"""
+SELECT {_VARIANT_COLUMNS}
+FROM product_variants AS v
+JOIN products AS p ON p.id = v.product_id
+WHERE v.sku = ANY(CAST(:keys AS text[]))
+""")
+
+# A barcode may be shared (re-labelled packs); the active variant wins
+_BY_BARCODE_SQL = text(f"""
+SELECT DISTINCT ON (v.barcode) {_VARIANT_COLUMNS}
+FROM product_variants AS v
+JOIN products AS p ON p.id = v.product_id
+WHERE v.barcode = ANY(CAST(:keys AS text[]))
+ORDER BY v.barcode, active DESC, v.deleted_at DESC NULLS FIRST, v.created_at
+""")
+
+_BY_SLUG_SQL = text("""
+SELECT p.id AS product_id, p.slug, (p.is_active AND p.deleted_at IS NULL) AS active
+FROM products AS p
+WHERE p.slug = ANY(CAST(:keys AS text[]))
+""")
+
+
+def _normalize(kind: str, value: str) -> str:
+    value = value.strip()
+    return value.lower() if kind == "slug" else value
+
+
+async def _fetch(session: AsyncSession, misses: list[LookupKey]) -> dict[LookupKey, LookupEntry]:
+    found: dict[LookupKey, LookupEntry] = {}
+    by_kind: dict[str, list[str]] = {}
+    for kind, value in misses:
+        by_kind.setdefault(kind, []).append(value)
+
+    for kind, statement in (("sku", _BY_SKU_SQL), ("barcode", _BY_BARCODE_SQL)):
+        if kind not in by_kind:
+            continue
+        for row in (await session.execute(statement, {"keys": by_kind[kind]})).all():
+            entry = LookupEntry(
+                row.product_id, row.variant_id, row.sku, row.price, row.currency, row.active
+            )
+            found[(kind, row.sku if kind == "sku" else row.barcode)] = entry
+    if "slug" in by_kind:
+        for row in (await session.execute(_BY_SLUG_SQL, {"keys": by_kind["slug"]})).all():
+            found[("slug", row.slug)] = LookupEntry(
+                row.product_id, None, None, None, None, row.active
+            )
+    return found
+
+
+async def resolve(
+    session: AsyncSession, data: LookupDCO, dealer_id: Optional[UUID] = None
+) -> list[LookupHitDTO]:
+    """One result per requested key, in request order (`found=false` for unknown keys)."""
+    total = len(data.skus) + len(data.barcodes) + len(data.slugs)
+    if not total:
+        raise ValidationError("Pass at least one sku, barcode or slug")
+    if total > MAX_KEYS:
+        raise ValidationError(f"At most {MAX_KEYS} keys per lookup", value=total)
+    requested = [
+        (kind, raw, (kind, _normalize(kind, raw)))
+        for kind, values in (("sku", data.skus), ("barcode", data.barcodes), ("slug", data.slugs))
+        for raw in values
+    ]
+    cache = get_lookup_cache()
+    keys = list(dict.fromkeys(key for _, _, key in requested))
+    hits, misses = cache.get_many(keys)
+    if misses:
+        generation = cache.generation
+        fetched = await _fetch(session, misses)
+        cache.put_many(fetched, generation)
+        hits.update(fetched)
+
+    results = []
+    for kind, raw, key in requested:
+        entry = hits.get(key)
+        if entry is None:
+            results.append(LookupHitDTO(kind=kind, key=raw, found=False))
+            continue
+        results.append(
+            LookupHitDTO(
+                kind=kind,
+                key=raw,
+                found=True,
+                product_id=entry.product_id,
+                variant_id=entry.variant_id,
+                sku=entry.sku,
+                price=entry.price,
+                currency=entry.currency,
+                active=entry.active,
+            )
+        )
+
+    variant_ids = [hit.variant_id for hit in results if hit.variant_id is not None]
+    if dealer_id is not None and variant_ids:
+        prices = await resolve_prices(session, variant_ids, dealer_id=dealer_id)
+        for hit in results:
+            resolved = prices.get(hit.variant_id)
+            if resolved is not None and resolved.unit_price() != hit.price:
+                hit.list_price, hit.price = hit.price, resolved.unit_price()
+    return results
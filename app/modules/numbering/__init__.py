@@ -0,0 +1 @@
+from .numbering_entity import NumberCounter
@@ -0,0 +1,26 @@
+"""Database objects behind document numbers.
+
+`order_number_seq` hands out blocks of ORDER_NUMBER_BLOCK numbers per
+`nextval()` (its increment), cached per worker. `number_counters` holds one
+row per gapless series (e.g. `INV-2026`), incremented inside the
+transaction that uses the number.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Sequence, Text
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+ORDER_NUMBER_BLOCK = 100
+
+order_number_seq = Sequence(
+    "order_number_seq", start=1, increment=ORDER_NUMBER_BLOCK, metadata=Base.metadata
+)
+
+
+class NumberCounter(Base):
+    __tablename__ = "number_counters"
+
+    series = Column(Text, primary_key=True)
+    last_value = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,96 @@
+"""Order and invoice number allocation.
+
+Order numbers (`EC-2026-000123`) come from blocks: one `nextval` of
+`order_number_seq` reserves ORDER_NUMBER_BLOCK consecutive values for this
+worker, which then hands them out from memory. Allocation never waits on
+another transaction and costs one round trip per block; numbers are unique
+but not gapless (an unused block tail, or a rolled-back order, leaves a
+hole) and only roughly chronological across workers.
+
+Invoice numbers (`INV-2026-000045`) are gapless per prefix and year: the
+series row in `number_counters` is incremented inside the caller's
+transaction, so a rollback returns the number and concurrent invoices of
+the series queue on that row lock until the holder commits. Allocate as
+late in the transaction as possible.
+
+The year is the calendar year in NUMBERING_TIMEZONE.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.modules.numbering.numbering_entity import ORDER_NUMBER_BLOCK
+
+_NEXT_BLOCK_SQL = text("SELECT nextval('order_number_seq')")
+
+_GAPLESS_SQL = text("""
+INSERT INTO number_counters (series, last_value) VALUES (:series, 1)
+ON CONFLICT (series) DO UPDATE SET last_value = number_counters.last_value + 1, updated_at = now()
+RETURNING last_value
+""")
+
+
+def _year() -> int:
+    return datetime.now(ZoneInfo(settings.numbering_timezone)).year
+
+
+def format_number(prefix: str, year: int, value: int) -> str:
+    return f"{prefix}-{year}-{value:0{settings.numbering_digits}d}"
+
+
+class BlockAllocator:
+    """Values from blocks reserved with one `nextval` each.
+
+    The sequence's increment is the block size.
+    """
+
+    def __init__(self, next_block_sql, block_size: int):
+        self._sql = next_block_sql
+        self._block_size = block_size
+        self._next = self._end = 0
+        self._pid = os.getpid()
+        self._lock = asyncio.Lock()
+
+    async def allocate(self, session: AsyncSession) -> int:
+        if self._pid != os.getpid():
+            # Forked after a block was reserved: the parent owns it
+            self._pid, self._next, self._end = os.getpid(), 0, 0
+            self._lock = asyncio.Lock()
+        while self._next >= self._end:
+            # One refill at a time; the others wait for it rather than burning blocks
+            async with self._lock:
+                if self._next < self._end:
+                    break
+                start = (await session.execute(self._sql)).scalar_one()
+                self._next, self._end = start, start + self._block_size
+        value = self._next
+        self._next += 1
+        return value
+
+
+_orders = BlockAllocator(_NEXT_BLOCK_SQL, ORDER_NUMBER_BLOCK)
+
+
+async def next_order_number(session: AsyncSession) -> str:
+    """A unique order number from this worker's block."""
+    return format_number(settings.order_number_prefix, _year(), await _orders.allocate(session))
+
+
+async def next_gapless_number(
+    session: AsyncSession, prefix: str, year: Optional[int] = None
+) -> str:
+    """The next number of the `prefix`-`year` series, held by the caller's transaction."""
+    year = year or _year()
+    value = (await session.execute(_GAPLESS_SQL, {"series": f"{prefix}-{year}"})).scalar_one()
+    return format_number(prefix, year, value)
+
+
+async def next_invoice_number(session: AsyncSession) -> str:
+    return await next_gapless_number(session, settings.invoice_number_prefix)
@@ -20,6 +20,7 @@ from app.modules.order.order_model import (
     update_order_status as model_update_order_status,
 )
 from app.common.utils import sanitize_text
+from app.modules.outbox.outbox_service import enqueue_many, outbox_row
 
 
 # Valid status transitions map
@@ -35,6 +36,10 @@ VALID_STATUS_TRANSITIONS = {
 
 VALID_PAYMENT_METHODS = ["stripe", "paypal", "cod"]
 
+# Celery task names (published via the outbox, so no broker import here)
+PROCESS_PAYMENT_TASK = "app.modules.order.order_tasks.process_payment"
+ORDER_CONFIRMATION_EMAIL_TASK = "app.modules.order.order_tasks.send_order_confirmation_email"
+
 
 def validate_order_items(items) -> None:
     """Validate order items — check quantities and prices."""
@@ -134,20 +139,19 @@ async def create_order(
         logger.error("Failed to create order | error={}", str(e))
         raise DatabaseError("create_order", str(e))
 
-    # Fire background tasks (non-blocking, skipped if Celery unavailable)
-    try:
-        from app.modules.order.order_tasks import (
-            send_order_confirmation_email,
-            process_payment
-        )
-        process_payment.delay(created.id, total_amount, body.payment_method)
-        send_order_confirmation_email.delay(current_user["user_id"], created.id)
-    except Exception as e:
-        logger.warning(
-            "Celery not available, background tasks skipped | order_id={} error={}",
-            created.id,
-            str(e)
-        )
+    # Side effects commit with the order; the outbox relay publishes them
+    await enqueue_many(session, [
+        outbox_row(
+            PROCESS_PAYMENT_TASK,
+            args=[created.id, total_amount, body.payment_method],
+            dedupe_key=f"order:{created.id}:payment",
+        ),
+        outbox_row(
+            ORDER_CONFIRMATION_EMAIL_TASK,
+            args=[current_user["user_id"], created.id],
+            dedupe_key=f"order:{created.id}:confirmation-email",
+        ),
+    ])
 
     logger.info(
         "Order created | order_id={} user_id={} total=${:.2f}",
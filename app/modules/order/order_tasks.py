@@ -1,8 +1,10 @@
 from loguru import logger
 from app.tasks.celery_app import celery_app
+from app.tasks.idempotency import deduplicated
 
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+@deduplicated
 def send_order_confirmation_email(self, user_id: str, order_id: str):
     """
     Send order confirmation email via SendGrid or any SMTP provider.
@@ -40,6 +42,7 @@ def send_password_reset_email(self, email: str, reset_token: str):
 
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=30)
+@deduplicated
 def process_payment(self, order_id: str, amount: float, payment_method: str):
     """
     Process payment via Stripe or any payment gateway.
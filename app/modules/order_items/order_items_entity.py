@@ -3,7 +3,7 @@
 import uuid
 from uuid import uuid4
 
-from sqlalchemy import Column, Text, Integer, Numeric, ForeignKey
+from sqlalchemy import Column, Text, Integer, Numeric, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -12,6 +12,9 @@ from app.models.base import Base
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False)
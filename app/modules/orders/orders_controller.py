@@ -5,8 +5,14 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.orders import orders_service as service
-from app.modules.orders.orders_dto import OrderDTO
-from app.modules.orders.orders_dco import OrderDCO, OrderUpdateDCO
+from app.modules.orders.orders_dto import (
+    CheckoutOrderDTO,
+    CheckoutQuoteDTO,
+    OrderDetailDTO,
+    OrderDTO,
+    OrderSearchResultDTO,
+)
+from app.modules.orders.orders_dco import CheckoutDCO, OrderDCO, OrderSearchDCO, OrderUpdateDCO
 
 
 async def create(session: AsyncSession, data: OrderDCO) -> OrderDTO:
@@ -21,9 +27,33 @@ async def list_all(session: AsyncSession) -> list[OrderDTO]:
     return await service.list_all(session)
 
 
+async def get_details(
+    session: AsyncSession, order_ids: list[UUID], dealer_id: UUID | None = None
+) -> list[OrderDetailDTO]:
+    return await service.get_details(session, order_ids, dealer_id)
+
+
+async def search_orders(
+    session: AsyncSession, data: OrderSearchDCO, dealer_id: UUID | None = None
+) -> OrderSearchResultDTO:
+    return await service.search_orders(session, data, dealer_id)
+
+
 async def update(session: AsyncSession, record_id: UUID, data: OrderUpdateDCO) -> OrderDTO | None:
     return await service.update(session, record_id, data)
 
 
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     return await service.delete_record(session, record_id)
+
+
+async def quote_checkout(
+    session: AsyncSession, dealer_id: UUID, data: CheckoutDCO
+) -> CheckoutQuoteDTO:
+    return await service.quote_checkout(session, dealer_id, data)
+
+
+async def place_checkout_order(
+    session: AsyncSession, dealer_id: UUID, data: CheckoutDCO
+) -> CheckoutOrderDTO:
+    return await service.place_checkout_order(session, dealer_id, data)
@@ -1,8 +1,11 @@
 """DCO for the orders table — WRITE operations."""
 
 from uuid import UUID
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import Field
 
 from app.common.schemas.base import BaseSchema
 
@@ -24,3 +27,25 @@ class OrderUpdateDCO(BaseSchema):
     shipping_address_snapshot: Optional[dict] = None
     delivery_fee: Optional[Decimal] = None
     discount_amount: Optional[Decimal] = None
+
+class CheckoutItemDCO(BaseSchema):
+    variant_id: UUID
+    quantity: int = Field(..., gt=0, le=100_000)
+
+class CheckoutDCO(BaseSchema):
+    items: list[CheckoutItemDCO] = Field(..., min_length=1)
+    address_id: Optional[UUID] = None  # defaults to the dealer's default address
+
+class OrderSearchDCO(BaseSchema):
+    statuses: List[OrderStatusEnum] = Field(default_factory=list, max_length=10)
+    placed_from: Optional[datetime] = None   # inclusive
+    placed_to: Optional[datetime] = None     # exclusive
+    order_number: Optional[str] = Field(None, max_length=50)
+    dealer_id: Optional[UUID] = None         # admin search only
+    province: Optional[str] = Field(None, max_length=50)  # admin search only
+    limit: int = Field(20, ge=1, le=100)
+    cursor: Optional[str] = Field(None, max_length=200)
+    include_items: bool = False
+
+class OrderDetailsDCO(BaseSchema):
+    order_ids: List[UUID] = Field(..., min_length=1, max_length=200)
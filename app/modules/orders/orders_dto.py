@@ -3,10 +3,13 @@
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
 from app.common.schemas.base import BaseSchema
+from app.modules.invoices.invoices_dto import InvoiceDTO
+from app.modules.order_items.order_items_dto import OrderItemDTO
 from app.modules.orders.orders_entity import OrderStatusEnum
+from app.modules.payments.payments_dto import PaymentDTO
 
 class OrderDTO(BaseSchema):
 
@@ -22,5 +25,65 @@ class OrderDTO(BaseSchema):
     delivery_fee: Optional[Decimal] = None
     discount_amount: Optional[Decimal] = None
     placed_at: Optional[datetime] = None
+    item_count: int = 0
+    province: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+
+class OrderDetailDTO(OrderDTO):
+
+    order_items: List[OrderItemDTO] = []
+    payments: List[PaymentDTO] = []
+    invoice: Optional[InvoiceDTO] = None
+
+class CheckoutLineDTO(BaseSchema):
+
+    variant_id: UUID
+    sku: str
+    name: str
+    quantity: int
+    unit_price: Decimal
+    total_price: Decimal
+
+class TaxBreakdownDTO(BaseSchema):
+
+    province: str
+    gst: Decimal
+    pst: Decimal
+    hst: Decimal
+
+class CheckoutQuoteDTO(BaseSchema):
+
+    currency: str
+    lines: list[CheckoutLineDTO]
+    subtotal: Decimal
+    discount_amount: Decimal
+    delivery_fee: Decimal
+    taxes: TaxBreakdownDTO
+    tax_amount: Decimal
+    total_amount: Decimal
+
+class CheckoutOrderDTO(BaseSchema):
+
+    order: OrderDTO
+    pricing: CheckoutQuoteDTO
+
+class OrderSummaryDTO(BaseSchema):
+
+    id: UUID
+    order_number: Optional[str] = None
+    status: OrderStatusEnum
+    currency: str
+    subtotal: Decimal
+    tax_amount: Decimal
+    total_amount: Decimal
+    item_count: int
+    placed_at: datetime
+    dealer_id: Optional[UUID] = None                  # admin search only
+    province: Optional[str] = None                    # admin search only
+    order_items: Optional[List[OrderItemDTO]] = None  # with includeItems only
+
+class OrderSearchResultDTO(BaseSchema):
+
+    items: List[OrderSummaryDTO]
+    next_cursor: Optional[str] = None
@@ -4,7 +4,18 @@ import uuid
 from uuid import uuid4
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Text, String, Numeric, DateTime, ForeignKey, Enum
+from sqlalchemy import (
+    Column,
+    Text,
+    String,
+    Integer,
+    Numeric,
+    DateTime,
+    ForeignKey,
+    Enum,
+    Index,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -21,8 +32,40 @@ class OrderStatusEnum(str, PyEnum):
     CANCELLED = "CANCELLED"
 
 
+# Order history summaries, read by `orders_service.search_orders` with an index-only scan
+_SUMMARY_COLUMNS = [
+    "order_number",
+    "status",
+    "currency",
+    "subtotal",
+    "tax_amount",
+    "total_amount",
+    "item_count",
+    "province",
+]
+
+
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # A dealer's history, newest first
+        Index(
+            "ix_orders_dealer_placed",
+            "dealer_id",
+            text("placed_at DESC"),
+            text("id DESC"),
+            postgresql_include=_SUMMARY_COLUMNS,
+            postgresql_where=text("placed_at IS NOT NULL"),
+        ),
+        # Admin search across dealers, newest first
+        Index(
+            "ix_orders_placed",
+            text("placed_at DESC"),
+            text("id DESC"),
+            postgresql_include=["dealer_id", *_SUMMARY_COLUMNS],
+            postgresql_where=text("placed_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     dealer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -36,6 +79,9 @@ class Order(Base):
     delivery_fee = Column(Numeric(12, 2), nullable=True)
     discount_amount = Column(Numeric(12, 2), nullable=True, default=0)
     placed_at = Column(DateTime(timezone=True), nullable=True)
+    # Denormalized at checkout so history pages never touch order_items or the snapshot
+    item_count = Column(Integer, nullable=False, default=0, server_default="0")
+    province = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
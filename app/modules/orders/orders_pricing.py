@@ -0,0 +1,78 @@
+"""Checkout pricing for the `orders` module — pure Decimal arithmetic, no I/O.
+
+Delivery is taxed along with the goods; tax rates come from the in-process
+tax table (`app.modules.tax_rules.tax_rules_table`).
+"""
+
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+
+from app.core.config import settings
+from app.modules.tax_rules.tax_rules_table import TaxBreakdown, TaxRates, compute_tax
+
+CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+
+
+def money(value: Decimal) -> Decimal:
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class PricedLine:
+    variant_id: object
+    sku: str
+    name: str
+    quantity: int
+    unit_price: Decimal
+    total_price: Decimal
+
+
+@dataclass(frozen=True)
+class PricedOrder:
+    currency: str
+    lines: list[PricedLine]
+    subtotal: Decimal
+    discount_amount: Decimal
+    delivery_fee: Decimal
+    taxes: TaxBreakdown
+    total_amount: Decimal
+
+    @property
+    def tax_amount(self) -> Decimal:
+        return self.taxes.total
+
+
+def price_line(variant_id, sku: str, name: str, unit_price: Decimal, quantity: int) -> PricedLine:
+    return PricedLine(variant_id, sku, name, quantity, unit_price, money(unit_price * quantity))
+
+
+def volume_discount(subtotal: Decimal) -> Decimal:
+    """Discount for the highest volume tier the subtotal reaches."""
+    percent = Decimal("0")
+    for threshold, tier_percent in settings.checkout_volume_discounts:
+        if subtotal >= threshold:
+            percent = max(percent, tier_percent)
+    return money(subtotal * percent / _HUNDRED)
+
+
+def delivery_fee(discounted_subtotal: Decimal) -> Decimal:
+    if discounted_subtotal >= settings.checkout_free_delivery_threshold:
+        return Decimal("0.00")
+    return money(settings.checkout_delivery_fee)
+
+
+def price_order(lines: list[PricedLine], rates: TaxRates, currency: str) -> PricedOrder:
+    subtotal = sum((line.total_price for line in lines), Decimal("0.00"))
+    discount = volume_discount(subtotal)
+    fee = delivery_fee(subtotal - discount)
+    taxes = compute_tax(subtotal - discount + fee, rates)
+    return PricedOrder(
+        currency=currency,
+        lines=lines,
+        subtotal=subtotal,
+        discount_amount=discount,
+        delivery_fee=fee,
+        taxes=taxes,
+        total_amount=subtotal - discount + fee + taxes.total,
+    )
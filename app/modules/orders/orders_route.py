@@ -1,18 +1,153 @@
 """Routes for the `orders` module."""
 
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
-from app.core import get_db_session
+from app.core import get_current_user, get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
 from app.modules.orders import orders_controller as controller
-from app.modules.orders.orders_dco import OrderDCO, OrderUpdateDCO
+from app.modules.orders.orders_dco import (
+    CheckoutDCO,
+    OrderDCO,
+    OrderDetailsDCO,
+    OrderSearchDCO,
+    OrderUpdateDCO,
+)
+from app.modules.orders.orders_entity import OrderStatusEnum
 
 router = APIRouter()
 
 
+@router.post("/checkout/quote")
+@limiter.limit(RateLimits.API_READ)
+async def quote_checkout(
+    request: Request,
+    body: CheckoutDCO,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Price a cart server-side (no writes)."""
+    quote = await controller.quote_checkout(db, UUID(current_user["user_id"]), body)
+    return respond(data=quote, message="Checkout quote calculated")
+
+
+@router.post("/checkout", status_code=status.HTTP_201_CREATED)
+@limiter.limit(RateLimits.API_WRITE)
+async def place_checkout_order(
+    request: Request,
+    body: CheckoutDCO,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Place an order priced server-side from variant ids and quantities."""
+    order = await controller.place_checkout_order(db, UUID(current_user["user_id"]), body)
+    return respond(data=order, message="Order placed", status_code=201)
+
+
+@router.get("/mine")
+@limiter.limit(RateLimits.API_READ)
+async def list_my_orders(
+    request: Request,
+    statuses: List[OrderStatusEnum] = Query([], alias="status"),
+    placed_from: Optional[datetime] = Query(None, alias="placedFrom"),
+    placed_to: Optional[datetime] = Query(None, alias="placedTo"),
+    order_number: Optional[str] = Query(None, alias="orderNumber", max_length=50),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=200),
+    include_items: bool = Query(False, alias="includeItems"),
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """The signed-in dealer's order history, newest first.
+
+    Summary rows only (number, status, totals, item count, placed date)
+    unless `includeItems`; pass `nextCursor` as `cursor` for the next page.
+    """
+    data = OrderSearchDCO(
+        statuses=statuses,
+        placed_from=placed_from,
+        placed_to=placed_to,
+        order_number=order_number,
+        limit=limit,
+        cursor=cursor,
+        include_items=include_items,
+    )
+    result = await controller.search_orders(db, data, UUID(current_user["user_id"]))
+    return respond(data=result, message="Orders fetched")
+
+
+@router.get("/search")
+@limiter.limit(RateLimits.ADMIN)
+async def search_orders(
+    request: Request,
+    dealer_id: Optional[UUID] = Query(None, alias="dealerId"),
+    province: Optional[str] = Query(None, max_length=50),
+    statuses: List[OrderStatusEnum] = Query([], alias="status"),
+    placed_from: Optional[datetime] = Query(None, alias="placedFrom"),
+    placed_to: Optional[datetime] = Query(None, alias="placedTo"),
+    order_number: Optional[str] = Query(None, alias="orderNumber", max_length=50),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=200),
+    include_items: bool = Query(False, alias="includeItems"),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Order search across dealers (admin), newest first.
+
+    Takes the same filters as a dealer's search, plus dealer and province.
+    """
+    data = OrderSearchDCO(
+        dealer_id=dealer_id,
+        province=province,
+        statuses=statuses,
+        placed_from=placed_from,
+        placed_to=placed_to,
+        order_number=order_number,
+        limit=limit,
+        cursor=cursor,
+        include_items=include_items,
+    )
+    result = await controller.search_orders(db, data)
+    return respond(data=result, message="Orders fetched")
+
+
+@router.post("/details")
+@limiter.limit(RateLimits.ADMIN)
+async def get_order_details_batch(
+    request: Request,
+    body: OrderDetailsDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Up to 200 orders with items, payments and invoice (dispatch screen), in request order.
+
+    Unknown ids are left out of the result.
+    """
+    records = await controller.get_details(db, body.order_ids)
+    return respond(data=records, message="Order details fetched")
+
+
+@router.get("/{record_id}/details")
+@limiter.limit(RateLimits.API_READ)
+async def get_order_details(
+    request: Request,
+    record_id: UUID,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """One order with its items, payments and invoice; dealers see their own orders only."""
+    dealer_id = None if current_user.get("role") == "ADMIN" else UUID(current_user["user_id"])
+    records = await controller.get_details(db, [record_id], dealer_id)
+    if not records:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return respond(data=records[0], message="Order details fetched")
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_order(
     body: OrderDCO,
@@ -1,20 +1,57 @@
 """Service layer for the `orders` module."""
 
+import base64
+import binascii
+import json
 import uuid
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from loguru import logger
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from sqlalchemy.sql import func
 
-from app.modules.orders.orders_entity import Order
-from app.modules.orders.orders_dto import OrderDTO
-from app.modules.orders.orders_dco import OrderDCO, OrderUpdateDCO
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, OrderValidationError, ValidationError
+from app.modules.dealer_addresses.dealer_addresses_entity import DealerAddress
+from app.modules.inventory.inventory_stock import allocate_lines
+from app.modules.inventory_reservations.inventory_reservations_service import (
+    consume_holds,
+    fulfil_holds,
+    hold_stock,
+    release_holds,
+)
+from app.modules.numbering.numbering_service import next_order_number
+from app.modules.order_items.order_items_dto import OrderItemDTO
+from app.modules.order_items.order_items_entity import OrderItem
+from app.modules.orders.orders_dco import CheckoutDCO, OrderDCO, OrderSearchDCO, OrderUpdateDCO
+from app.modules.orders.orders_dto import (
+    CheckoutLineDTO,
+    CheckoutOrderDTO,
+    CheckoutQuoteDTO,
+    OrderDetailDTO,
+    OrderDTO,
+    OrderSearchResultDTO,
+    OrderSummaryDTO,
+    TaxBreakdownDTO,
+)
+from app.modules.orders.orders_entity import Order, OrderStatusEnum
+from app.modules.orders.orders_pricing import PricedOrder, TaxRates, price_line, price_order
+from app.modules.outbox.outbox_service import enqueue
+from app.modules.price_tiers.price_tiers_effective import resolve_prices
+from app.modules.product_variants.product_variants_entity import ProductVariant
+from app.modules.products.products_entity import Product
+from app.modules.tax_rules.tax_rules_table import get_tax_table
+
+ORDER_CONFIRMATION_EMAIL_TASK = "app.modules.order.order_tasks.send_order_confirmation_email"
+ORDER_REFERENCE = "ORDER"
 
 
 async def create(session: AsyncSession, data: OrderDCO) -> OrderDTO:
     """Create a new Order record."""
-    entity_obj = Order(**data.model_dump())
+    entity_obj = Order(**data.model_dump(), order_number=await next_order_number(session))
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
@@ -37,6 +74,112 @@ async def list_all(session: AsyncSession) -> list[OrderDTO]:
     return [OrderDTO.model_validate(e) for e in entities]
 
 
+async def get_details(
+    session: AsyncSession, order_ids: list[UUID], dealer_id: UUID | None = None
+) -> list[OrderDetailDTO]:
+    """Orders with their items, payments and invoice, in request order (unknown ids left out).
+
+    Four queries whatever the number of orders: the orders, then one
+    selectin query per relationship. With `dealer_id`, other dealers'
+    orders are left out too.
+    """
+    stmt = (
+        select(Order)
+        .where(Order.id.in_(order_ids))
+        .options(
+            selectinload(Order.order_items),
+            selectinload(Order.payments),
+            selectinload(Order.invoice),
+        )
+    )
+    if dealer_id is not None:
+        stmt = stmt.where(Order.dealer_id == dealer_id)
+    orders = {order.id: order for order in (await session.execute(stmt)).scalars().all()}
+    return [
+        OrderDetailDTO.model_validate(orders[order_id])
+        for order_id in dict.fromkeys(order_ids)
+        if order_id in orders
+    ]
+
+
+def _encode_cursor(placed_at: datetime, order_id: UUID) -> str:
+    raw = json.dumps([placed_at.isoformat(), str(order_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        placed_at, order_id = json.loads(raw)
+        return datetime.fromisoformat(placed_at), UUID(order_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValidationError("Invalid order cursor", field="cursor") from None
+
+
+async def search_orders(
+    session: AsyncSession, data: OrderSearchDCO, dealer_id: UUID | None = None
+) -> OrderSearchResultDTO:
+    """Placed orders, newest first, as summary rows; one dealer's when `dealer_id` is given.
+
+    Pages are keyset-paginated on (placed_at, id) and every projected column
+    is in `ix_orders_dealer_placed` / `ix_orders_placed`, so a page is an
+    index-only range scan however deep it is. Order items are loaded (one
+    query for the page) only with `include_items`.
+    """
+    columns = [
+        Order.id,
+        Order.order_number,
+        Order.status,
+        Order.currency,
+        Order.subtotal,
+        Order.tax_amount,
+        Order.total_amount,
+        Order.item_count,
+        Order.placed_at,
+    ]
+    if dealer_id is None:
+        columns += [Order.dealer_id, Order.province]
+    stmt = select(*columns).where(Order.placed_at.is_not(None))
+
+    if dealer_id is not None:
+        stmt = stmt.where(Order.dealer_id == dealer_id)
+    else:
+        if data.dealer_id is not None:
+            stmt = stmt.where(Order.dealer_id == data.dealer_id)
+        if data.province:
+            stmt = stmt.where(Order.province == data.province.strip().upper())
+    if data.statuses:
+        stmt = stmt.where(Order.status.in_(data.statuses))
+    if data.placed_from is not None:
+        stmt = stmt.where(Order.placed_at >= data.placed_from)
+    if data.placed_to is not None:
+        stmt = stmt.where(Order.placed_at < data.placed_to)
+    if data.order_number:
+        stmt = stmt.where(Order.order_number == data.order_number.strip())
+    if data.cursor:
+        placed_at, order_id = _decode_cursor(data.cursor)
+        stmt = stmt.where(tuple_(Order.placed_at, Order.id) < tuple_(placed_at, order_id))
+
+    stmt = stmt.order_by(Order.placed_at.desc(), Order.id.desc()).limit(data.limit + 1)
+    rows = (await session.execute(stmt)).all()
+    next_cursor = None
+    if len(rows) > data.limit:
+        rows = rows[: data.limit]
+        next_cursor = _encode_cursor(rows[-1].placed_at, rows[-1].id)
+
+    items = [OrderSummaryDTO.model_validate(row) for row in rows]
+    if data.include_items and items:
+        by_order: dict[UUID, list[OrderItemDTO]] = {item.id: [] for item in items}
+        result = await session.execute(
+            select(OrderItem).where(OrderItem.order_id.in_(list(by_order))).order_by(OrderItem.order_id)
+        )
+        for order_item in result.scalars().all():
+            by_order[order_item.order_id].append(OrderItemDTO.model_validate(order_item))
+        for item in items:
+            item.order_items = by_order[item.id]
+    return OrderSearchResultDTO(items=items, next_cursor=next_cursor)
+
+
 async def update(session: AsyncSession, record_id: UUID, data: OrderUpdateDCO) -> OrderDTO | None:
     """Update a Order record."""
     stmt = select(Order).where(Order.id == record_id)
@@ -45,6 +188,8 @@ async def update(session: AsyncSession, record_id: UUID, data: OrderUpdateDCO) -
     if not entity_obj:
         return None
     updates = data.model_dump(exclude_unset=True)
+    if "status" in updates and updates["status"] != entity_obj.status:
+        await _sync_stock_holds(session, entity_obj.id, updates["status"])
     for key, value in updates.items():
         setattr(entity_obj, key, value)
     await session.flush()
@@ -52,6 +197,20 @@ async def update(session: AsyncSession, record_id: UUID, data: OrderUpdateDCO) -
     return OrderDTO.model_validate(entity_obj)
 
 
+async def _sync_stock_holds(session: AsyncSession, order_id: UUID, status: OrderStatusEnum) -> None:
+    """Paid orders keep their stock, shipped ones take it out, cancelled ones give it back.
+
+    Each call only touches holds still open for that step, so repeated or
+    skipped statuses (DISPATCHED then DELIVERED) are safe.
+    """
+    if status == OrderStatusEnum.PAID:
+        await consume_holds(session, ORDER_REFERENCE, order_id)
+    elif status in (OrderStatusEnum.DISPATCHED, OrderStatusEnum.DELIVERED):
+        await fulfil_holds(session, ORDER_REFERENCE, order_id)
+    elif status == OrderStatusEnum.CANCELLED:
+        await release_holds(session, ORDER_REFERENCE, order_id)
+
+
 async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     """Delete a Order record (hard delete)."""
     stmt = select(Order).where(Order.id == record_id)
@@ -62,3 +221,217 @@ async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     await session.delete(entity_obj)
     await session.flush()
     return True
+
+
+# ── Checkout ─────────────────────────────────────────────────
+# Prices, MOQs and tax come from the server, never from the client. Round
+# trips are constant in the number of lines: address (1), variants (1), and on
+# placement allocation (1), order (1), stock hold (2), items (1 executemany),
+# outbox (1). Tax rates come from the in-process tax table. Stock stays held
+# for RESERVATION_TTL_SECONDS unless the order is paid.
+
+async def _load_address(
+    session: AsyncSession, dealer_id: UUID, address_id: UUID | None
+) -> DealerAddress:
+    """Ship-to address: the given one, else the dealer's default."""
+    stmt = select(DealerAddress).where(
+        DealerAddress.dealer_id == dealer_id, DealerAddress.deleted_at.is_(None)
+    )
+    if address_id is not None:
+        stmt = stmt.where(DealerAddress.id == address_id)
+    else:
+        stmt = stmt.order_by(
+            DealerAddress.is_default.desc().nulls_last(), DealerAddress.created_at.desc()
+        )
+
+    address = (await session.execute(stmt.limit(1))).scalar_one_or_none()
+    if address is None:
+        raise NotFoundError("dealer_address", str(address_id) if address_id else None)
+    return address
+
+
+async def _load_variants(session: AsyncSession, variant_ids: list[UUID]) -> dict:
+    """Orderable variants with their product name, in one IN query."""
+    stmt = (
+        select(
+            ProductVariant.id,
+            ProductVariant.sku,
+            ProductVariant.price,
+            ProductVariant.currency,
+            ProductVariant.moq,
+            ProductVariant.pack_size,
+            Product.name,
+        )
+        .join(Product, Product.id == ProductVariant.product_id)
+        .where(
+            ProductVariant.id.in_(variant_ids),
+            ProductVariant.is_active.is_(True),
+            ProductVariant.deleted_at.is_(None),
+            Product.is_active.is_(True),
+            Product.deleted_at.is_(None),
+        )
+    )
+    result = await session.execute(stmt)
+    return {row.id: row for row in result.all()}
+
+
+async def _price_checkout(
+    session: AsyncSession, dealer_id: UUID, data: CheckoutDCO
+) -> tuple[PricedOrder, DealerAddress, TaxRates]:
+    if len(data.items) > settings.checkout_max_lines:
+        raise OrderValidationError(f"An order can have at most {settings.checkout_max_lines} lines")
+
+    # Repeated variants collapse into one line (first position wins); errors
+    # still point at the request's own item positions
+    quantities: dict[UUID, int] = {}
+    positions: dict[UUID, list[int]] = {}
+    for index, item in enumerate(data.items):
+        quantities[item.variant_id] = quantities.get(item.variant_id, 0) + item.quantity
+        positions.setdefault(item.variant_id, []).append(index)
+
+    address = await _load_address(session, dealer_id, data.address_id)
+    rates = (await get_tax_table(session)).rates_for(address.province)
+    variants = await _load_variants(session, list(quantities))
+    # The dealer's tier prices, volume breaks included (list price without a tier)
+    prices = await resolve_prices(session, list(variants), dealer_id=dealer_id)
+
+    missing = [str(variant_id) for variant_id in quantities if variant_id not in variants]
+    if missing:
+        raise OrderValidationError(f"Variants not available: {', '.join(missing)}")
+
+    lines = []
+    currencies = set()
+    for variant_id, quantity in quantities.items():
+        variant = variants[variant_id]
+        if quantity < variant.moq:
+            merged = positions[variant_id]
+            raise OrderValidationError(
+                f"Minimum order quantity for {variant.sku} is {variant.moq}",
+                item_index=merged[0],
+                item_indexes=merged if len(merged) > 1 else None,
+            )
+        name = f"{variant.name} {variant.pack_size}" if variant.pack_size else variant.name
+        unit_price = (
+            prices[variant_id].unit_price(quantity) if variant_id in prices else variant.price
+        )
+        lines.append(price_line(variant_id, variant.sku, name, unit_price, quantity))
+        currencies.add(variant.currency)
+
+    if len(currencies) > 1:
+        raise OrderValidationError("All items in an order must share one currency")
+
+    return price_order(lines, rates, currencies.pop()), address, rates
+
+
+def _quote_dto(priced: PricedOrder, rates: TaxRates) -> CheckoutQuoteDTO:
+    return CheckoutQuoteDTO(
+        currency=priced.currency,
+        lines=[
+            CheckoutLineDTO(
+                variant_id=line.variant_id,
+                sku=line.sku,
+                name=line.name,
+                quantity=line.quantity,
+                unit_price=line.unit_price,
+                total_price=line.total_price,
+            )
+            for line in priced.lines
+        ],
+        subtotal=priced.subtotal,
+        discount_amount=priced.discount_amount,
+        delivery_fee=priced.delivery_fee,
+        taxes=TaxBreakdownDTO(
+            province=rates.province,
+            gst=priced.taxes.gst,
+            pst=priced.taxes.pst,
+            hst=priced.taxes.hst,
+        ),
+        tax_amount=priced.tax_amount,
+        total_amount=priced.total_amount,
+    )
+
+
+def _address_snapshot(address: DealerAddress) -> dict:
+    return {
+        "address_id": str(address.id),
+        "label": address.label,
+        "address_line1": address.address_line1,
+        "address_line2": address.address_line2,
+        "city": address.city,
+        "province": address.province,
+        "postal_code": address.postal_code,
+        "country": address.country,
+    }
+
+
+async def quote_checkout(
+    session: AsyncSession, dealer_id: UUID, data: CheckoutDCO
+) -> CheckoutQuoteDTO:
+    """Price a cart server-side without writing anything."""
+    priced, _, rates = await _price_checkout(session, dealer_id, data)
+    return _quote_dto(priced, rates)
+
+
+async def place_checkout_order(
+    session: AsyncSession, dealer_id: UUID, data: CheckoutDCO
+) -> CheckoutOrderDTO:
+    """Price a cart server-side and write the order, its stock holds, items and side effects."""
+    priced, address, rates = await _price_checkout(session, dealer_id, data)
+    allocation = await allocate_lines(
+        session, {line.variant_id: line.quantity for line in priced.lines}
+    )
+
+    result = await session.execute(
+        insert(Order)
+        .values(
+            dealer_id=dealer_id,
+            order_number=await next_order_number(session),
+            status=OrderStatusEnum.PENDING,
+            currency=priced.currency,
+            shipping_address_snapshot=_address_snapshot(address),
+            subtotal=priced.subtotal,
+            tax_amount=priced.tax_amount,
+            total_amount=priced.total_amount,
+            delivery_fee=priced.delivery_fee,
+            discount_amount=priced.discount_amount,
+            placed_at=func.now(),
+            item_count=len(priced.lines),
+            province=rates.province,
+        )
+        .returning(Order)
+    )
+    order = result.scalar_one()
+
+    await hold_stock(session, allocation, ORDER_REFERENCE, order.id)
+
+    await session.execute(
+        insert(OrderItem),
+        [
+            {
+                "order_id": order.id,
+                "variant_id": line.variant_id,
+                "quantity": line.quantity,
+                "unit_price": line.unit_price,
+                "total_price": line.total_price,
+                "sku_snapshot": line.sku,
+                "name_snapshot": line.name,
+            }
+            for line in priced.lines
+        ],
+    )
+
+    await enqueue(
+        session,
+        ORDER_CONFIRMATION_EMAIL_TASK,
+        args=[str(dealer_id), str(order.id)],
+        dedupe_key=f"order:{order.id}:confirmation-email",
+    )
+
+    logger.info(
+        "Checkout order placed | order_id={} dealer_id={} lines={} total={}",
+        order.id,
+        dealer_id,
+        len(priced.lines),
+        priced.total_amount,
+    )
+    return CheckoutOrderDTO(order=OrderDTO.model_validate(order), pricing=_quote_dto(priced, rates))
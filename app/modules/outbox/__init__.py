@@ -0,0 +1,2 @@
+from .outbox_entity import OutboxEvent
+from .outbox_service import enqueue, enqueue_many, outbox_row
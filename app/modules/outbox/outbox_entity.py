@@ -0,0 +1,40 @@
+"""SQLAlchemy entity for the `outbox_events` table.
+
+Side effects (Celery tasks) are recorded here in the same transaction as the
+business write, then published by `app.tasks.outbox_relay`. A row is the
+durable promise that its task will be sent at least once.
+"""
+
+import uuid
+from uuid import uuid4
+
+from sqlalchemy import Column, Text, Integer, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+
+    __table_args__ = (
+        # Relay scan: only unpublished rows, oldest-due first
+        Index(
+            "ix_outbox_events_pending",
+            "available_at",
+            postgresql_where=text("published_at IS NULL"),
+        ),
+    )
+
+    # Doubles as the Celery task id
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    task_name = Column(Text, nullable=False)
+    args = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))
+    kwargs = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    dedupe_key = Column(Text, nullable=True, unique=True)
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    published_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,52 @@
+"""Service layer for the `outbox` module — enqueue side effects transactionally."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable
+
+from loguru import logger
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.outbox.outbox_entity import OutboxEvent
+
+
+def outbox_row(
+    task_name: str,
+    args: Iterable[Any] = (),
+    kwargs: dict | None = None,
+    dedupe_key: str | None = None,
+    delay_seconds: float = 0,
+) -> dict:
+    """Build one outbox row for `enqueue_many`."""
+    return {
+        "task_name": task_name,
+        "args": list(args),
+        "kwargs": kwargs or {},
+        "dedupe_key": dedupe_key,
+        "available_at": datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+    }
+
+
+async def enqueue_many(session: AsyncSession, rows: list[dict]) -> None:
+    """Record tasks in the caller's transaction (one INSERT, no broker I/O).
+
+    Rows whose `dedupe_key` is already present are skipped, so retrying the
+    business write cannot schedule the same side effect twice.
+    """
+    if not rows:
+        return
+    stmt = insert(OutboxEvent).values(rows).on_conflict_do_nothing(index_elements=["dedupe_key"])
+    await session.execute(stmt)
+    logger.debug("Outbox events enqueued | count={}", len(rows))
+
+
+async def enqueue(
+    session: AsyncSession,
+    task_name: str,
+    args: Iterable[Any] = (),
+    kwargs: dict | None = None,
+    dedupe_key: str | None = None,
+    delay_seconds: float = 0,
+) -> None:
+    """Record a single task; see `enqueue_many`."""
+    await enqueue_many(session, [outbox_row(task_name, args, kwargs, dedupe_key, delay_seconds)])
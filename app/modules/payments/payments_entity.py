@@ -4,7 +4,7 @@ import uuid
 from uuid import uuid4
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Text, String, Numeric, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Text, String, Numeric, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -20,6 +20,9 @@ class PaymentStatusEnum(str, PyEnum):
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("ix_payments_order_id", "order_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     order_id = Column(UUID(as_uuid=True), ForeignKey("orders.id"), nullable=False)
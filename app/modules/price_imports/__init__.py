@@ -0,0 +1 @@
+from .price_imports_entity import PriceImport, PriceImportChange
@@ -0,0 +1,24 @@
+"""Controller layer for the `price_imports` module."""
+
+from decimal import Decimal
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.price_imports import price_imports_service as service
+from app.modules.price_imports.price_imports_dto import PriceImportDTO, PriceImportResultDTO
+
+
+async def import_prices(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    dry_run: bool,
+    max_change_percent: Optional[Decimal],
+    created_by: Optional[UUID],
+) -> PriceImportResultDTO:
+    return await service.import_prices(chunks, fmt, dry_run, max_change_percent, created_by)
+
+
+async def list_imports(session: AsyncSession, limit: int) -> list[PriceImportDTO]:
+    return await service.list_imports(session, limit)
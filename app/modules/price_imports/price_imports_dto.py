@@ -0,0 +1,48 @@
+"""DTO for the price_imports module — import results and audit records."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Optional
+
+from app.common.schemas.base import BaseSchema
+
+class PriceImportErrorsDTO(BaseSchema):
+    unknown_skus: List[str] = []
+    duplicate_skus: List[str] = []
+    invalid_price_lines: List[int] = []
+    invalid_currency_lines: List[int] = []
+    guardrail_violations: List[str] = []   # "sku: old -> new (+x%)"
+
+class PriceImportSummaryDTO(BaseSchema):
+    increased: int
+    decreased: int
+    unchanged: int
+    currency_changed: int
+
+class PriceImportChangeDTO(BaseSchema):
+    sku: str
+    current_price: Decimal
+    new_price: Decimal
+    current_currency: str
+    new_currency: str
+    change_percent: Optional[Decimal] = None   # None when the current price is 0
+
+class PriceImportResultDTO(BaseSchema):
+    import_id: Optional[UUID] = None       # audit record; none for dry runs
+    dry_run: bool
+    applied: bool
+    rows: int
+    errors: PriceImportErrorsDTO
+    summary: PriceImportSummaryDTO
+    changes: List[PriceImportChangeDTO]    # largest relative changes first, capped
+    updated: int
+
+class PriceImportDTO(BaseSchema):
+    id: UUID
+    status: str
+    rows: int
+    changed: int
+    max_change_percent: Optional[Decimal] = None
+    created_by: Optional[UUID] = None
+    created_at: datetime
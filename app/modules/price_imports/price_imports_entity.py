@@ -0,0 +1,42 @@
+"""SQLAlchemy entities for the `price_imports` audit tables.
+
+One `price_imports` row per applied or rejected price file, and one
+`price_import_changes` row per variant whose price or currency it changed.
+"""
+
+from uuid import uuid4
+
+from sqlalchemy import Column, Text, Integer, Numeric, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class PriceImport(Base):
+    __tablename__ = "price_imports"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    status = Column(Text, nullable=False)              # APPLIED | REJECTED
+    rows = Column(Integer, nullable=False)
+    changed = Column(Integer, nullable=False)
+    max_change_percent = Column(Numeric(7, 2), nullable=True)
+    errors = Column(JSONB, nullable=True)              # samples, for rejected files
+    created_by = Column(UUID(as_uuid=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class PriceImportChange(Base):
+    __tablename__ = "price_import_changes"
+    __table_args__ = (
+        # Price history of one variant
+        Index("ix_price_import_changes_variant_id", "variant_id"),
+    )
+
+    import_id = Column(UUID(as_uuid=True), ForeignKey("price_imports.id"), primary_key=True)
+    variant_id = Column(UUID(as_uuid=True), ForeignKey("product_variants.id"), primary_key=True)
+    sku = Column(Text, nullable=False)
+    old_price = Column(Numeric(12, 2), nullable=False)
+    new_price = Column(Numeric(12, 2), nullable=False)
+    old_currency = Column(String(3), nullable=False)
+    new_currency = Column(String(3), nullable=False)
@@ -0,0 +1,70 @@
+"""Routes for the `price_imports` module (admin only)."""
+
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.price_imports import price_imports_controller as controller
+
+router = APIRouter()
+
+_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/")
+@limiter.limit(RateLimits.ADMIN)
+async def import_prices(
+    request: Request,
+    dry_run: bool = Query(True, alias="dryRun"),
+    max_change_percent: Optional[Decimal] = Query(None, alias="maxChangePercent", gt=0),
+    fmt: Optional[str] = Query(
+        None, alias="format", description="csv | ndjson (default: from Content-Type)"
+    ),
+    admin: dict = Depends(require_admin),
+):
+    """Import a supplier price list sent as the raw request body (streamed).
+
+    CSV needs a header with sku and price (currency optional, defaults to the
+    variant's); NDJSON one object per line with the same keys. Changes beyond
+    `maxChangePercent` (default PRICE_IMPORT_MAX_CHANGE_PERCENT) reject the
+    file. Defaults to a dry run.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    result = await controller.import_prices(
+        request.stream(),
+        fmt or _CONTENT_TYPES.get(content_type, "csv"),
+        dry_run,
+        max_change_percent,
+        UUID(admin["user_id"]),
+    )
+    if result.dry_run:
+        message = "Price import dry run completed"
+    elif result.applied:
+        message = "Price import applied"
+    else:
+        message = "Price import rejected"
+    status_code = 422 if not result.dry_run and not result.applied else 200
+    return respond(data=result, message=message, status_code=status_code)
+
+
+@router.get("/")
+@limiter.limit(RateLimits.ADMIN)
+async def list_price_imports(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Audit trail of applied and rejected imports, newest first."""
+    records = await controller.list_imports(db, limit)
+    return respond(data=records, message="Price imports fetched")
@@ -0,0 +1,330 @@
+"""Bulk supplier price lists (CSV or NDJSON of sku, price, optional currency).
+
+Pipeline, for the whole file at once:
+
+1. stream the request body into column arrays (line numbers, SKUs, prices,
+   currencies): no per-row database work;
+2. resolve every SKU with one `sku = ANY(...)` query (row-locked when
+   applying) and validate the columns in bulk: unknown or duplicate SKUs,
+   non-positive or over-precise prices, unsupported currencies, and changes
+   beyond the MAX_CHANGE_PERCENT guardrail. Any error rejects the whole file;
+3. dry run: report the diff; otherwise apply every change with one
+   `UPDATE product_variants ... FROM unnest(...)`, write the audit rows with
+   one INSERT, recompile the dealer prices of those variants, and queue the
+   touched products for the lookup cache (a price-only change: the search
+   indexes are left alone), all in one transaction.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.utils.tabular import FORMATS, iter_rows
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import ValidationError
+from app.modules.price_imports.price_imports_dto import (
+    PriceImportChangeDTO,
+    PriceImportDTO,
+    PriceImportErrorsDTO,
+    PriceImportResultDTO,
+    PriceImportSummaryDTO,
+)
+from app.modules.price_imports.price_imports_entity import PriceImport
+from app.modules.price_tiers.price_tiers_effective import refresh_effective_prices
+from app.modules.search.search_changes import mark_prices_changed
+
+_HEADER_ALIASES = {
+    "sku": "sku",
+    "price": "price",
+    "unitprice": "price",
+    "currency": "currency",
+}
+_REQUIRED = ("sku", "price")
+_SAMPLE = 20
+_CENT = Decimal("0.01")
+_MAX_PRICE = Decimal("9999999999.99")  # product_variants.price is Numeric(12, 2)
+
+_RESOLVE_SQL = """
+SELECT id, product_id, sku, price, currency
+FROM product_variants
+WHERE sku = ANY(CAST(:skus AS text[])) AND deleted_at IS NULL
+ORDER BY id
+"""
+
+_APPLY_SQL = text("""
+UPDATE product_variants AS v
+SET price = d.price, currency = d.currency, updated_at = now()
+FROM unnest(
+    CAST(:variant_ids AS uuid[]),
+    CAST(:prices AS numeric[]),
+    CAST(:currencies AS text[])
+) AS d(variant_id, price, currency)
+WHERE v.id = d.variant_id
+RETURNING v.id
+""")
+
+_AUDIT_SQL = text("""
+INSERT INTO price_import_changes
+    (import_id, variant_id, sku, old_price, new_price, old_currency, new_currency)
+SELECT CAST(:import_id AS uuid), d.*
+FROM unnest(
+    CAST(:variant_ids AS uuid[]),
+    CAST(:skus AS text[]),
+    CAST(:old_prices AS numeric[]),
+    CAST(:prices AS numeric[]),
+    CAST(:old_currencies AS text[]),
+    CAST(:currencies AS text[])
+) AS d
+""")
+
+
+@dataclass
+class _Columns:
+    """The parsed file, one list per column (price/currency None when invalid/absent)."""
+
+    line_nos: list[int] = field(default_factory=list)
+    skus: list[str] = field(default_factory=list)
+    prices: list[Optional[Decimal]] = field(default_factory=list)
+    currencies: list[Optional[str]] = field(default_factory=list)
+    bad_currency: list[bool] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.line_nos)
+
+
+# ── Parsing ──────────────────────────────────────────────────
+
+def _price(value) -> Optional[Decimal]:
+    try:
+        price = Decimal(str(value).strip().lstrip("$"))
+    except (InvalidOperation, ValueError):
+        return None
+    if not price.is_finite() or price <= 0 or price > _MAX_PRICE or price != price.quantize(_CENT):
+        return None
+    return price.quantize(_CENT)
+
+
+async def _parse(chunks: AsyncIterator[bytes], fmt: str) -> _Columns:
+    columns = _Columns()
+    supported = set(settings.price_import_currencies)
+    line_no = 0
+    async for row in iter_rows(chunks, fmt, _HEADER_ALIASES, required=_REQUIRED):
+        line_no += 1
+        if line_no > settings.price_import_max_rows:
+            raise ValidationError(
+                f"Price file exceeds {settings.price_import_max_rows} rows", field="file"
+            )
+        currency = str(row.get("currency") or "").strip().upper() or None
+        columns.line_nos.append(line_no)
+        columns.skus.append(str(row.get("sku") or "").strip())
+        columns.prices.append(_price(row.get("price")))
+        columns.currencies.append(currency)
+        columns.bad_currency.append(currency is not None and currency not in supported)
+    return columns
+
+
+# ── Validation and diff ──────────────────────────────────────
+
+def _change_percent(old: Decimal, new: Decimal) -> Optional[Decimal]:
+    if not old:
+        return None
+    return ((new - old) * 100 / old).quantize(_CENT)
+
+
+def _validate(
+    columns: _Columns, current: dict[str, object], max_change_percent: Decimal
+) -> tuple[PriceImportErrorsDTO, list[int], int]:
+    """Errors (samples), the positions of rows that change something, and the unchanged count."""
+    errors = PriceImportErrorsDTO()
+    seen: set[str] = set()
+    changed: list[int] = []
+    unchanged = 0
+    for i, sku in enumerate(columns.skus):
+        variant = current.get(sku)
+        if variant is None:
+            if len(errors.unknown_skus) < _SAMPLE:
+                errors.unknown_skus.append(sku)
+            continue
+        if sku in seen:
+            if len(errors.duplicate_skus) < _SAMPLE:
+                errors.duplicate_skus.append(sku)
+            continue
+        seen.add(sku)
+        price = columns.prices[i]
+        if price is None:
+            if len(errors.invalid_price_lines) < _SAMPLE:
+                errors.invalid_price_lines.append(columns.line_nos[i])
+            continue
+        if columns.bad_currency[i]:
+            if len(errors.invalid_currency_lines) < _SAMPLE:
+                errors.invalid_currency_lines.append(columns.line_nos[i])
+            continue
+        currency = columns.currencies[i] or variant.currency
+        if price == variant.price and currency == variant.currency:
+            unchanged += 1
+            continue
+        percent = _change_percent(variant.price, price)
+        if percent is not None and abs(percent) > max_change_percent:
+            if len(errors.guardrail_violations) < _SAMPLE:
+                errors.guardrail_violations.append(
+                    f"{sku}: {variant.price} -> {price} ({percent:+}%)"
+                )
+            continue
+        changed.append(i)
+    return errors, changed, unchanged
+
+
+def _has_errors(errors: PriceImportErrorsDTO) -> bool:
+    return bool(
+        errors.unknown_skus
+        or errors.duplicate_skus
+        or errors.invalid_price_lines
+        or errors.invalid_currency_lines
+        or errors.guardrail_violations
+    )
+
+
+def _diff(
+    columns: _Columns, current: dict[str, object], changed: list[int], unchanged: int
+) -> tuple[PriceImportSummaryDTO, list[PriceImportChangeDTO]]:
+    changes = []
+    increased = decreased = currency_changed = 0
+    for i in changed:
+        variant = current[columns.skus[i]]
+        new_price, new_currency = columns.prices[i], columns.currencies[i] or variant.currency
+        increased += new_price > variant.price
+        decreased += new_price < variant.price
+        currency_changed += new_currency != variant.currency
+        changes.append(
+            PriceImportChangeDTO(
+                sku=variant.sku,
+                current_price=variant.price,
+                new_price=new_price,
+                current_currency=variant.currency,
+                new_currency=new_currency,
+                change_percent=_change_percent(variant.price, new_price),
+            )
+        )
+    changes.sort(
+        key=lambda c: (
+            abs(c.change_percent) if c.change_percent is not None else Decimal("Infinity")
+        ),
+        reverse=True,
+    )
+    summary = PriceImportSummaryDTO(
+        increased=increased,
+        decreased=decreased,
+        unchanged=unchanged,
+        currency_changed=currency_changed,
+    )
+    return summary, changes[: settings.price_import_diff_limit]
+
+
+# ── Pipeline ─────────────────────────────────────────────────
+
+async def _apply(
+    session: AsyncSession,
+    import_id: UUID,
+    columns: _Columns,
+    current: dict[str, object],
+    changed: list[int],
+) -> int:
+    variants = [current[columns.skus[i]] for i in changed]
+    params = {
+        "variant_ids": [v.id for v in variants],
+        "prices": [columns.prices[i] for i in changed],
+        "currencies": [
+            columns.currencies[i] or v.currency for i, v in zip(changed, variants, strict=True)
+        ],
+    }
+    updated = (await session.execute(_APPLY_SQL, params)).all()
+    await session.execute(
+        _AUDIT_SQL,
+        {
+            **params,
+            "import_id": import_id,
+            "skus": [v.sku for v in variants],
+            "old_prices": [v.price for v in variants],
+            "old_currencies": [v.currency for v in variants],
+        },
+    )
+    # Prices are read live by search; only the lookup cache holds copies
+    mark_prices_changed(session, {v.product_id for v in variants})
+    # Percent-off dealer prices follow the new list prices
+    await refresh_effective_prices(session, variant_ids=params["variant_ids"])
+    return len(updated)
+
+
+async def import_prices(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    dry_run: bool = True,
+    max_change_percent: Optional[Decimal] = None,
+    created_by: Optional[UUID] = None,
+) -> PriceImportResultDTO:
+    """Import a supplier price list; dry runs only report what would change."""
+    if fmt not in FORMATS:
+        raise ValidationError(f"Unsupported format {fmt}", field="format", value=fmt)
+    if max_change_percent is None:
+        max_change_percent = Decimal(str(settings.price_import_max_change_percent))
+
+    columns = await _parse(chunks, fmt)
+    import_id = None
+    updated = 0
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            # Applying locks the rows (in id order) so the diff is what gets written
+            resolve = _RESOLVE_SQL + ("" if dry_run else " FOR UPDATE")
+            rows = await session.execute(text(resolve), {"skus": sorted(set(columns.skus))})
+            current = {row.sku: row for row in rows.all()}
+
+            errors, changed, unchanged = _validate(columns, current, max_change_percent)
+            summary, changes = _diff(columns, current, changed, unchanged)
+            applied = not dry_run and not _has_errors(errors)
+
+            if not dry_run:
+                audit = PriceImport(
+                    status="APPLIED" if applied else "REJECTED",
+                    rows=len(columns),
+                    changed=len(changed) if applied else 0,
+                    max_change_percent=max_change_percent,
+                    errors=None if applied else errors.model_dump(by_alias=True),
+                    created_by=created_by,
+                )
+                session.add(audit)
+                await session.flush()
+                import_id = audit.id
+            if applied and changed:
+                updated = await _apply(session, import_id, columns, current, changed)
+
+    logger.info(
+        "Price import finished | import_id={} rows={} dry_run={} applied={} updated={}",
+        import_id,
+        len(columns),
+        dry_run,
+        applied,
+        updated,
+    )
+    return PriceImportResultDTO(
+        import_id=import_id,
+        dry_run=dry_run,
+        applied=applied,
+        rows=len(columns),
+        errors=errors,
+        summary=summary,
+        changes=changes,
+        updated=updated,
+    )
+
+
+async def list_imports(session: AsyncSession, limit: int = 50) -> list[PriceImportDTO]:
+    """Most recent imports first."""
+    stmt = select(PriceImport).order_by(PriceImport.created_at.desc()).limit(limit)
+    result = await session.execute(stmt)
+    return [PriceImportDTO.model_validate(e) for e in result.scalars().all()]
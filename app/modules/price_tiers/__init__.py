@@ -0,0 +1 @@
+from .price_tiers_entity import EffectivePrice, PriceRule, PriceTier
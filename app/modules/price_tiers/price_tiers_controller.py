@@ -0,0 +1,72 @@
+"""Controller layer for the `price_tiers` module."""
+
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.price_tiers import price_tiers_service as service
+from app.modules.price_tiers.price_tiers_dco import (
+    DealerPriceTierDCO,
+    PriceRuleDCO,
+    PriceTierDCO,
+    PriceTierUpdateDCO,
+    ResolvePricesDCO,
+)
+from app.modules.price_tiers.price_tiers_dto import (
+    PriceRebuildDTO,
+    PriceRuleDTO,
+    PriceTierDTO,
+    ResolvedPriceDTO,
+)
+
+
+async def create_tier(session: AsyncSession, data: PriceTierDCO) -> PriceTierDTO:
+    return await service.create_tier(session, data)
+
+
+async def get_tier(session: AsyncSession, tier_id: UUID) -> PriceTierDTO | None:
+    return await service.get_tier(session, tier_id)
+
+
+async def list_tiers(session: AsyncSession) -> list[PriceTierDTO]:
+    return await service.list_tiers(session)
+
+
+async def update_tier(
+    session: AsyncSession, tier_id: UUID, data: PriceTierUpdateDCO
+) -> PriceTierDTO | None:
+    return await service.update_tier(session, tier_id, data)
+
+
+async def delete_tier(session: AsyncSession, tier_id: UUID) -> bool:
+    return await service.delete_tier(session, tier_id)
+
+
+async def create_rule(
+    session: AsyncSession, tier_id: UUID, data: PriceRuleDCO
+) -> PriceRuleDTO | None:
+    return await service.create_rule(session, tier_id, data)
+
+
+async def list_rules(session: AsyncSession, tier_id: UUID) -> list[PriceRuleDTO] | None:
+    return await service.list_rules(session, tier_id)
+
+
+async def delete_rule(session: AsyncSession, tier_id: UUID, rule_id: UUID) -> bool:
+    return await service.delete_rule(session, tier_id, rule_id)
+
+
+async def set_dealer_tier(
+    session: AsyncSession, dealer_id: UUID, data: DealerPriceTierDCO
+) -> PriceTierDTO | None:
+    return await service.set_dealer_tier(session, dealer_id, data)
+
+
+async def rebuild(session: AsyncSession, tier_id: UUID | None) -> PriceRebuildDTO:
+    return await service.rebuild(session, tier_id)
+
+
+async def resolve(
+    session: AsyncSession, dealer_id: UUID, data: ResolvePricesDCO
+) -> list[ResolvedPriceDTO]:
+    return await service.resolve(session, dealer_id, data)
@@ -0,0 +1,39 @@
+"""DCO for the price_tiers module — WRITE operations."""
+
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Optional
+
+from pydantic import Field
+
+from app.common.schemas.base import BaseSchema
+from app.modules.price_tiers.price_tiers_entity import PriceRuleKindEnum
+
+class PriceTierDCO(BaseSchema):
+    code: str = Field(..., min_length=1, max_length=50)
+    name: str = Field(..., min_length=1, max_length=200)
+    parent_id: Optional[UUID] = None   # inherits the parent's rules (one level)
+
+class PriceTierUpdateDCO(BaseSchema):
+    code: Optional[str] = Field(None, min_length=1, max_length=50)
+    name: Optional[str] = Field(None, min_length=1, max_length=200)
+    parent_id: Optional[UUID] = None
+
+class PriceRuleDCO(BaseSchema):
+    """FIXED needs `price` and a variant.
+
+    PERCENT_OFF needs `percent` and at most one of variant / brand.
+    """
+
+    kind: PriceRuleKindEnum
+    variant_id: Optional[UUID] = None
+    brand_id: Optional[UUID] = None
+    price: Optional[Decimal] = Field(None, gt=0, max_digits=12, decimal_places=2)
+    percent: Optional[Decimal] = Field(None, gt=0, le=100, max_digits=5, decimal_places=2)
+    min_quantity: int = Field(1, ge=1, le=100_000)
+
+class DealerPriceTierDCO(BaseSchema):
+    price_tier_id: Optional[UUID] = None   # None returns the dealer to list prices
+
+class ResolvePricesDCO(BaseSchema):
+    variant_ids: List[UUID] = Field(..., min_length=1, max_length=500)
@@ -0,0 +1,41 @@
+"""DTO for the price_tiers module — READ operations."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Optional
+
+from app.common.schemas.base import BaseSchema
+
+class PriceTierDTO(BaseSchema):
+    id: UUID
+    code: str
+    name: str
+    parent_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class PriceRuleDTO(BaseSchema):
+    id: UUID
+    tier_id: UUID
+    kind: str
+    variant_id: Optional[UUID] = None
+    brand_id: Optional[UUID] = None
+    price: Optional[Decimal] = None
+    percent: Optional[Decimal] = None
+    min_quantity: int
+    created_at: datetime
+
+class PriceBreakDTO(BaseSchema):
+    min_quantity: int
+    unit_price: Decimal
+
+class ResolvedPriceDTO(BaseSchema):
+    variant_id: UUID
+    currency: str
+    list_price: Decimal
+    unit_price: Decimal                # for one unit
+    breaks: List[PriceBreakDTO] = []   # volume prices from min_quantity up
+
+class PriceRebuildDTO(BaseSchema):
+    rows: int
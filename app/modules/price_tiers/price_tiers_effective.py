@@ -0,0 +1,177 @@
+"""Compiled dealer prices: `effective_prices` maintenance and the batch resolver.
+
+Rules are never evaluated at request time. `refresh_effective_prices`
+recompiles the rows of a scope (some tiers and/or some variants) with one
+DELETE and one INSERT ... SELECT, in the caller's transaction, so a rule,
+tier, list-price or brand change is visible to readers exactly when it
+commits. Compilation, per tier and variant:
+
+- a tier's rules are its own plus its parent's;
+- a rule applies to its variant, to every variant of its brand, or (neither
+  set) to the whole catalog; PERCENT_OFF is taken off the list price;
+- each distinct `min_quantity` among the applicable rules is a break, priced
+  at the lowest candidate of every rule up to that quantity, never above
+  list price.
+
+`resolve_prices` then prices a whole page, quote or cart with one query.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# NULL arrays mean "no restriction" on that dimension
+_SCOPE_SQL = """
+    (CAST(:variant_ids AS uuid[]) IS NULL OR v.id = ANY(CAST(:variant_ids AS uuid[])))
+    AND (CAST(:product_ids AS uuid[]) IS NULL OR v.product_id = ANY(CAST(:product_ids AS uuid[])))
+    AND (CAST(:brand_ids AS uuid[]) IS NULL OR p.brand_id = ANY(CAST(:brand_ids AS uuid[])))
+"""
+
+_TIER_SCOPE_SQL = "(CAST(:tier_ids AS uuid[]) IS NULL OR {column} = ANY(CAST(:tier_ids AS uuid[])))"
+
+_DELETE_SQL = text(f"""
+DELETE FROM effective_prices AS e
+USING product_variants AS v
+JOIN products AS p ON p.id = v.product_id
+WHERE e.variant_id = v.id
+  AND {_TIER_SCOPE_SQL.format(column="e.tier_id")}
+  AND {_SCOPE_SQL}
+""")
+
+_COMPILE_SQL = text(f"""
+WITH tier_rules AS (
+    SELECT t.id AS tier_id, r.kind, r.variant_id, r.brand_id, r.price, r.percent, r.min_quantity
+    FROM price_tiers AS t
+    JOIN price_rules AS r ON r.tier_id = t.id OR r.tier_id = t.parent_id
+    WHERE {_TIER_SCOPE_SQL.format(column="t.id")}
+),
+live AS (
+    SELECT v.id, v.price, v.currency, p.brand_id
+    FROM product_variants AS v
+    JOIN products AS p ON p.id = v.product_id
+    WHERE v.deleted_at IS NULL AND {_SCOPE_SQL}
+),
+matched AS (
+    SELECT r.*, l.id AS live_id, l.price AS list_price
+    FROM tier_rules AS r JOIN live AS l ON l.id = r.variant_id
+    UNION ALL
+    SELECT r.*, l.id, l.price
+    FROM tier_rules AS r JOIN live AS l ON r.variant_id IS NULL AND l.brand_id = r.brand_id
+    UNION ALL
+    SELECT r.*, l.id, l.price
+    FROM tier_rules AS r CROSS JOIN live AS l
+    WHERE r.variant_id IS NULL AND r.brand_id IS NULL
+),
+candidates AS (
+    SELECT tier_id, live_id AS variant_id, min_quantity,
+           CASE WHEN kind = 'FIXED' THEN price
+                ELSE round(list_price * (100 - percent) / 100, 2) END AS price
+    FROM matched
+),
+breaks AS (
+    SELECT DISTINCT tier_id, variant_id, min_quantity FROM candidates
+)
+INSERT INTO effective_prices (tier_id, variant_id, min_quantity, price, currency, computed_at)
+SELECT b.tier_id, b.variant_id, b.min_quantity, least(l.price, min(c.price)), l.currency, now()
+FROM breaks AS b
+JOIN candidates AS c
+  ON c.tier_id = b.tier_id AND c.variant_id = b.variant_id AND c.min_quantity <= b.min_quantity
+JOIN live AS l ON l.id = b.variant_id
+GROUP BY b.tier_id, b.variant_id, b.min_quantity, l.price, l.currency
+ON CONFLICT (tier_id, variant_id, min_quantity)
+DO UPDATE SET price = EXCLUDED.price,
+              currency = EXCLUDED.currency,
+              computed_at = EXCLUDED.computed_at
+""")
+
+_RESOLVE_SQL = text("""
+SELECT v.id AS variant_id, v.price AS list_price, v.currency, e.min_quantity, e.price
+FROM product_variants AS v
+LEFT JOIN effective_prices AS e
+  ON e.variant_id = v.id
+ AND e.tier_id = coalesce(
+     CAST(:tier_id AS uuid),
+     (SELECT price_tier_id FROM users WHERE id = CAST(:dealer_id AS uuid))
+ )
+WHERE v.id = ANY(CAST(:variant_ids AS uuid[]))
+ORDER BY v.id, e.min_quantity
+""")
+
+
+def _ids(values: Optional[Iterable[UUID]]) -> Optional[list[UUID]]:
+    return None if values is None else list(values)
+
+
+async def refresh_effective_prices(
+    session: AsyncSession,
+    tier_ids: Optional[Iterable[UUID]] = None,
+    variant_ids: Optional[Iterable[UUID]] = None,
+    product_ids: Optional[Iterable[UUID]] = None,
+    brand_ids: Optional[Iterable[UUID]] = None,
+) -> int:
+    """Recompile the effective prices of a scope (None = every tier / every variant).
+
+    Returns the number of rows written.
+    """
+    params = {
+        "tier_ids": _ids(tier_ids),
+        "variant_ids": _ids(variant_ids),
+        "product_ids": _ids(product_ids),
+        "brand_ids": _ids(brand_ids),
+    }
+    # An explicitly empty scope touches nothing
+    if any(values == [] for values in params.values()):
+        return 0
+    await session.execute(_DELETE_SQL, params)
+    result = await session.execute(_COMPILE_SQL, params)
+    return result.rowcount
+
+
+@dataclass(frozen=True)
+class ResolvedPrice:
+    list_price: Decimal
+    currency: str
+    breaks: tuple[tuple[int, Decimal], ...] = ()   # (min_quantity, unit price), ascending
+
+    def unit_price(self, quantity: int = 1) -> Decimal:
+        """The dealer's unit price when buying `quantity` units."""
+        price = self.list_price
+        for min_quantity, break_price in self.breaks:
+            if min_quantity > quantity:
+                break
+            price = break_price
+        # A list price cut after compilation still caps the tier price
+        return min(price, self.list_price)
+
+
+async def resolve_prices(
+    session: AsyncSession,
+    variant_ids: Iterable[UUID],
+    dealer_id: Optional[UUID] = None,
+    tier_id: Optional[UUID] = None,
+) -> dict[UUID, ResolvedPrice]:
+    """Prices of `variant_ids` for a dealer (through their tier) or a tier, in one query.
+
+    Variants without a tier row, and every variant for dealers without a
+    tier, resolve to their list price. Unknown ids are left out.
+    """
+    variant_ids = list(dict.fromkeys(variant_ids))
+    if not variant_ids:
+        return {}
+    rows = await session.execute(
+        _RESOLVE_SQL, {"variant_ids": variant_ids, "dealer_id": dealer_id, "tier_id": tier_id}
+    )
+    list_prices: dict[UUID, tuple[Decimal, str]] = {}
+    breaks: dict[UUID, list[tuple[int, Decimal]]] = {}
+    for row in rows.all():
+        list_prices[row.variant_id] = (row.list_price, row.currency)
+        if row.min_quantity is not None:
+            breaks.setdefault(row.variant_id, []).append((row.min_quantity, row.price))
+    return {
+        variant_id: ResolvedPrice(list_price, currency, tuple(breaks.get(variant_id, ())))
+        for variant_id, (list_price, currency) in list_prices.items()
+    }
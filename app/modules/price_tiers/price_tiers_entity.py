@@ -0,0 +1,81 @@
+"""SQLAlchemy entities for dealer price tiers.
+
+A `PriceTier` is a named price list (e.g. "Gold", or one dealer's contract);
+it may inherit the rules of one `parent_id` tier. Dealers point at a tier
+through `users.price_tier_id`; dealers without one pay list price.
+
+`PriceRule` rows are the source of truth: a FIXED price for a variant
+(contract price) or a PERCENT_OFF for a variant, a brand or the whole
+catalog, each from `min_quantity` units (volume tiers).
+
+`EffectivePrice` is the compiled result per (tier, variant, quantity
+break): maintained by `price_tiers_effective`, read by the resolver. Only
+variants some rule applies to have rows; the rest are at list price.
+"""
+
+from uuid import uuid4
+from enum import Enum as PyEnum
+
+from sqlalchemy import Column, Text, String, Integer, Numeric, DateTime, ForeignKey, Enum, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class PriceRuleKindEnum(str, PyEnum):
+    FIXED = "FIXED"              # `price` for one variant
+    PERCENT_OFF = "PERCENT_OFF"  # `percent` off list price for a variant, a brand, or everything
+
+
+class PriceTier(Base):
+    __tablename__ = "price_tiers"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    code = Column(Text, nullable=False, unique=True)
+    name = Column(Text, nullable=False)
+    parent_id = Column(UUID(as_uuid=True), ForeignKey("price_tiers.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class PriceRule(Base):
+    __tablename__ = "price_rules"
+    __table_args__ = (
+        Index("ix_price_rules_tier_id", "tier_id"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    tier_id = Column(
+        UUID(as_uuid=True), ForeignKey("price_tiers.id", ondelete="CASCADE"), nullable=False
+    )
+    kind = Column(Enum(PriceRuleKindEnum), nullable=False)
+    variant_id = Column(
+        UUID(as_uuid=True), ForeignKey("product_variants.id", ondelete="CASCADE"), nullable=True
+    )
+    brand_id = Column(
+        UUID(as_uuid=True), ForeignKey("brands.id", ondelete="CASCADE"), nullable=True
+    )
+    price = Column(Numeric(12, 2), nullable=True)      # FIXED
+    percent = Column(Numeric(5, 2), nullable=True)     # PERCENT_OFF
+    min_quantity = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class EffectivePrice(Base):
+    __tablename__ = "effective_prices"
+    __table_args__ = (
+        # Refreshes after a list-price change touch every tier of a variant
+        Index("ix_effective_prices_variant_id", "variant_id"),
+    )
+
+    tier_id = Column(
+        UUID(as_uuid=True), ForeignKey("price_tiers.id", ondelete="CASCADE"), primary_key=True
+    )
+    variant_id = Column(
+        UUID(as_uuid=True), ForeignKey("product_variants.id", ondelete="CASCADE"), primary_key=True
+    )
+    min_quantity = Column(Integer, primary_key=True)
+    price = Column(Numeric(12, 2), nullable=False)
+    currency = Column(String(3), nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
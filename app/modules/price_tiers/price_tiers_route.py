@@ -0,0 +1,184 @@
+"""Routes for the `price_tiers` module (admin, except `/resolve`)."""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_current_user, get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.price_tiers import price_tiers_controller as controller
+from app.modules.price_tiers.price_tiers_dco import (
+    DealerPriceTierDCO,
+    PriceRuleDCO,
+    PriceTierDCO,
+    PriceTierUpdateDCO,
+    ResolvePricesDCO,
+)
+
+router = APIRouter()
+
+
+@router.post("/resolve")
+@limiter.limit(RateLimits.LOOKUP)
+async def resolve_prices(
+    request: Request,
+    body: ResolvePricesDCO,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """The signed-in dealer's prices for up to 500 variants.
+
+    Sized for a listing page, a quick order pad or a cart.
+
+    One indexed query against the precompiled price table: list price, unit
+    price for one unit and the volume breaks.
+    """
+    records = await controller.resolve(db, UUID(current_user["user_id"]), body)
+    return respond(data=records, message="Prices resolved")
+
+
+@router.post("/rebuild")
+@limiter.limit(RateLimits.ADMIN)
+async def rebuild_prices(
+    request: Request,
+    tier_id: Optional[UUID] = Query(None, alias="tierId"),
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Recompile every effective price, or one tier's (and the tiers inheriting from it)."""
+    record = await controller.rebuild(db, tier_id)
+    return respond(data=record, message="Effective prices rebuilt")
+
+
+@router.put("/dealers/{dealer_id}")
+@limiter.limit(RateLimits.ADMIN)
+async def set_dealer_tier(
+    request: Request,
+    dealer_id: UUID,
+    body: DealerPriceTierDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Assign a dealer to a price tier; `priceTierId: null` returns them to list prices."""
+    record = await controller.set_dealer_tier(db, dealer_id, body)
+    return respond(data=record, message="Dealer price tier updated")
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+@limiter.limit(RateLimits.ADMIN)
+async def create_price_tier(
+    request: Request,
+    body: PriceTierDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    record = await controller.create_tier(db, body)
+    return respond(data=record, message="Price tier created", status_code=201)
+
+
+@router.get("/")
+@limiter.limit(RateLimits.ADMIN)
+async def list_price_tiers(
+    request: Request,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    records = await controller.list_tiers(db)
+    return respond(data=records, message="Price tiers fetched")
+
+
+@router.get("/{tier_id}")
+@limiter.limit(RateLimits.ADMIN)
+async def get_price_tier(
+    request: Request,
+    tier_id: UUID,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    record = await controller.get_tier(db, tier_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Price tier not found")
+    return respond(data=record, message="Price tier fetched")
+
+
+@router.patch("/{tier_id}")
+@limiter.limit(RateLimits.ADMIN)
+async def update_price_tier(
+    request: Request,
+    tier_id: UUID,
+    body: PriceTierUpdateDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Rename a tier or change the tier it inherits from (recompiles its prices)."""
+    record = await controller.update_tier(db, tier_id, body)
+    if not record:
+        raise HTTPException(status_code=404, detail="Price tier not found")
+    return respond(data=record, message="Price tier updated")
+
+
+@router.delete("/{tier_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit(RateLimits.ADMIN)
+async def delete_price_tier(
+    request: Request,
+    tier_id: UUID,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    deleted = await controller.delete_tier(db, tier_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Price tier not found")
+
+
+@router.post("/{tier_id}/rules", status_code=status.HTTP_201_CREATED)
+@limiter.limit(RateLimits.ADMIN)
+async def create_price_rule(
+    request: Request,
+    tier_id: UUID,
+    body: PriceRuleDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Add a contract price or a discount.
+
+    FIXED prices one variant; PERCENT_OFF discounts a variant, a brand or
+    everything.
+
+    `minQuantity` makes it a volume price. When several rules apply the
+    lowest price wins, and no rule raises a price above list.
+    """
+    record = await controller.create_rule(db, tier_id, body)
+    if not record:
+        raise HTTPException(status_code=404, detail="Price tier not found")
+    return respond(data=record, message="Price rule created", status_code=201)
+
+
+@router.get("/{tier_id}/rules")
+@limiter.limit(RateLimits.ADMIN)
+async def list_price_rules(
+    request: Request,
+    tier_id: UUID,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    records = await controller.list_rules(db, tier_id)
+    if records is None:
+        raise HTTPException(status_code=404, detail="Price tier not found")
+    return respond(data=records, message="Price rules fetched")
+
+
+@router.delete("/{tier_id}/rules/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit(RateLimits.ADMIN)
+async def delete_price_rule(
+    request: Request,
+    tier_id: UUID,
+    rule_id: UUID,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    deleted = await controller.delete_rule(db, tier_id, rule_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Price rule not found")
@@ -0,0 +1,266 @@
+"""Service layer for the `price_tiers` module.
+
+Every write recompiles the affected slice of `effective_prices` in the same
+transaction (see `price_tiers_effective`): a rule change its tier and the
+tiers inheriting from it, limited to the rule's variant or brand; a parent
+change the tier itself. `rebuild` recompiles everything, e.g. after a
+deploy that adds these tables.
+"""
+
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select, update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
+from app.modules.brands.brands_entity import Brand
+from app.modules.price_tiers.price_tiers_dco import (
+    DealerPriceTierDCO,
+    PriceRuleDCO,
+    PriceTierDCO,
+    PriceTierUpdateDCO,
+    ResolvePricesDCO,
+)
+from app.modules.price_tiers.price_tiers_dto import (
+    PriceBreakDTO,
+    PriceRebuildDTO,
+    PriceRuleDTO,
+    PriceTierDTO,
+    ResolvedPriceDTO,
+)
+from app.modules.price_tiers.price_tiers_effective import refresh_effective_prices, resolve_prices
+from app.modules.price_tiers.price_tiers_entity import PriceRule, PriceRuleKindEnum, PriceTier
+from app.modules.product_variants.product_variants_entity import ProductVariant
+from app.modules.users.users_entity import User
+
+
+async def _tier_family(session: AsyncSession, tier_id: UUID) -> list[UUID]:
+    """The tier and the tiers inheriting its rules."""
+    children = await session.execute(select(PriceTier.id).where(PriceTier.parent_id == tier_id))
+    return [tier_id, *children.scalars().all()]
+
+
+async def _check_code(session: AsyncSession, code: str, tier_id: UUID | None = None) -> None:
+    stmt = select(PriceTier.id).where(PriceTier.code == code)
+    if tier_id is not None:
+        stmt = stmt.where(PriceTier.id != tier_id)
+    if (await session.execute(stmt)).first():
+        raise ConflictError("Price tier code already exists", resource="price_tier", field="code")
+
+
+async def _check_parent(
+    session: AsyncSession, parent_id: UUID, tier_id: UUID | None = None
+) -> None:
+    """Inheritance is one level deep: the parent must be a root tier and the child a leaf."""
+    if parent_id == tier_id:
+        raise ValidationError(
+            "A price tier cannot inherit from itself", field="parentId", value=str(parent_id)
+        )
+    parent = (
+        await session.execute(select(PriceTier).where(PriceTier.id == parent_id))
+    ).scalar_one_or_none()
+    if parent is None:
+        raise NotFoundError("price_tier", str(parent_id))
+    if parent.parent_id is not None:
+        raise ValidationError(
+            "The parent tier already inherits from another tier", field="parentId"
+        )
+    if tier_id is not None and len(await _tier_family(session, tier_id)) > 1:
+        raise ValidationError(
+            "A tier other tiers inherit from cannot have a parent", field="parentId"
+        )
+
+
+# ── Tiers ────────────────────────────────────────────────────
+
+async def create_tier(session: AsyncSession, data: PriceTierDCO) -> PriceTierDTO:
+    """Create a tier; one with a parent starts out at its parent's prices."""
+    await _check_code(session, data.code)
+    if data.parent_id is not None:
+        await _check_parent(session, data.parent_id)
+    entity_obj = PriceTier(**data.model_dump())
+    session.add(entity_obj)
+    await session.flush()
+    await session.refresh(entity_obj)
+    if entity_obj.parent_id is not None:
+        await refresh_effective_prices(session, tier_ids=[entity_obj.id])
+    return PriceTierDTO.model_validate(entity_obj)
+
+
+async def get_tier(session: AsyncSession, tier_id: UUID) -> PriceTierDTO | None:
+    stmt = select(PriceTier).where(PriceTier.id == tier_id)
+    entity_obj = (await session.execute(stmt)).scalar_one_or_none()
+    return PriceTierDTO.model_validate(entity_obj) if entity_obj else None
+
+
+async def list_tiers(session: AsyncSession) -> list[PriceTierDTO]:
+    stmt = select(PriceTier).order_by(PriceTier.code)
+    result = await session.execute(stmt)
+    return [PriceTierDTO.model_validate(e) for e in result.scalars().all()]
+
+
+async def update_tier(
+    session: AsyncSession, tier_id: UUID, data: PriceTierUpdateDCO
+) -> PriceTierDTO | None:
+    stmt = select(PriceTier).where(PriceTier.id == tier_id)
+    entity_obj = (await session.execute(stmt)).scalar_one_or_none()
+    if not entity_obj:
+        return None
+    updates = data.model_dump(exclude_unset=True)
+    if updates.get("code") is not None:
+        await _check_code(session, updates["code"], tier_id)
+    parent_changed = "parent_id" in updates and updates["parent_id"] != entity_obj.parent_id
+    if parent_changed and updates["parent_id"] is not None:
+        await _check_parent(session, updates["parent_id"], tier_id)
+    for key, value in updates.items():
+        if value is not None or key == "parent_id":
+            setattr(entity_obj, key, value)
+    await session.flush()
+    await session.refresh(entity_obj)
+    if parent_changed:
+        await refresh_effective_prices(session, tier_ids=[tier_id])
+    return PriceTierDTO.model_validate(entity_obj)
+
+
+async def delete_tier(session: AsyncSession, tier_id: UUID) -> bool:
+    """Delete a tier with its rules and prices; refused while tiers or dealers use it."""
+    stmt = select(PriceTier).where(PriceTier.id == tier_id)
+    entity_obj = (await session.execute(stmt)).scalar_one_or_none()
+    if not entity_obj:
+        return False
+    if len(await _tier_family(session, tier_id)) > 1:
+        raise ConflictError("Other price tiers inherit from this tier", resource="price_tier")
+    assigned = await session.execute(select(User.id).where(User.price_tier_id == tier_id).limit(1))
+    if assigned.first():
+        raise ConflictError("Dealers are still assigned to this price tier", resource="price_tier")
+    await session.delete(entity_obj)
+    await session.flush()
+    return True
+
+
+# ── Rules ────────────────────────────────────────────────────
+
+async def _validate_rule(session: AsyncSession, data: PriceRuleDCO) -> None:
+    if data.kind == PriceRuleKindEnum.FIXED:
+        if data.price is None or data.percent is not None:
+            raise ValidationError("A FIXED rule needs a price and no percent", field="price")
+        if data.variant_id is None or data.brand_id is not None:
+            raise ValidationError("A FIXED rule applies to one variant", field="variantId")
+    else:
+        if data.percent is None or data.price is not None:
+            raise ValidationError(
+                "A PERCENT_OFF rule needs a percent and no price", field="percent"
+            )
+        if data.variant_id is not None and data.brand_id is not None:
+            raise ValidationError(
+                "A rule applies to a variant or a brand, not both", field="brandId"
+            )
+
+    if data.variant_id is not None:
+        stmt = select(ProductVariant.id).where(
+            ProductVariant.id == data.variant_id, ProductVariant.deleted_at.is_(None)
+        )
+        if not (await session.execute(stmt)).first():
+            raise NotFoundError("product_variant", str(data.variant_id))
+    if data.brand_id is not None:
+        if not (await session.execute(select(Brand.id).where(Brand.id == data.brand_id))).first():
+            raise NotFoundError("brand", str(data.brand_id))
+
+
+async def _refresh_for_rule(session: AsyncSession, rule: PriceRule) -> None:
+    await refresh_effective_prices(
+        session,
+        tier_ids=await _tier_family(session, rule.tier_id),
+        variant_ids=[rule.variant_id] if rule.variant_id else None,
+        brand_ids=[rule.brand_id] if rule.brand_id else None,
+    )
+
+
+async def create_rule(
+    session: AsyncSession, tier_id: UUID, data: PriceRuleDCO
+) -> PriceRuleDTO | None:
+    """Add a rule and recompile the prices it can change; None when the tier is missing."""
+    if await get_tier(session, tier_id) is None:
+        return None
+    await _validate_rule(session, data)
+    entity_obj = PriceRule(tier_id=tier_id, **data.model_dump())
+    session.add(entity_obj)
+    await session.flush()
+    await session.refresh(entity_obj)
+    await _refresh_for_rule(session, entity_obj)
+    return PriceRuleDTO.model_validate(entity_obj)
+
+
+async def list_rules(session: AsyncSession, tier_id: UUID) -> list[PriceRuleDTO] | None:
+    if await get_tier(session, tier_id) is None:
+        return None
+    stmt = (
+        select(PriceRule)
+        .where(PriceRule.tier_id == tier_id)
+        .order_by(PriceRule.kind, PriceRule.variant_id, PriceRule.brand_id, PriceRule.min_quantity)
+    )
+    result = await session.execute(stmt)
+    return [PriceRuleDTO.model_validate(e) for e in result.scalars().all()]
+
+
+async def delete_rule(session: AsyncSession, tier_id: UUID, rule_id: UUID) -> bool:
+    stmt = select(PriceRule).where(PriceRule.id == rule_id, PriceRule.tier_id == tier_id)
+    entity_obj = (await session.execute(stmt)).scalar_one_or_none()
+    if not entity_obj:
+        return False
+    await session.delete(entity_obj)
+    await session.flush()
+    await _refresh_for_rule(session, entity_obj)
+    return True
+
+
+# ── Dealers and prices ───────────────────────────────────────
+
+async def set_dealer_tier(
+    session: AsyncSession, dealer_id: UUID, data: DealerPriceTierDCO
+) -> PriceTierDTO | None:
+    """Assign a dealer to a tier (or back to list prices); returns the tier."""
+    tier = None
+    if data.price_tier_id is not None:
+        tier = await get_tier(session, data.price_tier_id)
+        if tier is None:
+            raise NotFoundError("price_tier", str(data.price_tier_id))
+    result = await session.execute(
+        sql_update(User)
+        .where(User.id == dealer_id, User.deleted_at.is_(None))
+        .values(price_tier_id=data.price_tier_id)
+        .returning(User.id)
+    )
+    if result.first() is None:
+        raise NotFoundError("user", str(dealer_id))
+    return tier
+
+
+async def rebuild(session: AsyncSession, tier_id: UUID | None = None) -> PriceRebuildDTO:
+    """Recompile every effective price (or one tier's and its children's)."""
+    tier_ids = await _tier_family(session, tier_id) if tier_id is not None else None
+    rows = await refresh_effective_prices(session, tier_ids=tier_ids)
+    logger.info("Effective prices rebuilt | tier_id={} rows={}", tier_id or "all", rows)
+    return PriceRebuildDTO(rows=rows)
+
+
+async def resolve(
+    session: AsyncSession, dealer_id: UUID, data: ResolvePricesDCO
+) -> list[ResolvedPriceDTO]:
+    """The dealer's prices for a page or cart, in request order (unknown variants left out)."""
+    resolved = await resolve_prices(session, data.variant_ids, dealer_id=dealer_id)
+    return [
+        ResolvedPriceDTO(
+            variant_id=variant_id,
+            currency=price.currency,
+            list_price=price.list_price,
+            unit_price=price.unit_price(1),
+            breaks=[
+                PriceBreakDTO(min_quantity=quantity, unit_price=price.unit_price(quantity))
+                for quantity, _ in price.breaks
+            ],
+        )
+        for variant_id in dict.fromkeys(data.variant_ids)
+        if (price := resolved.get(variant_id)) is not None
+    ]
@@ -5,8 +5,14 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.product_applications import product_applications_service as service
-from app.modules.product_applications.product_applications_dto import ProductApplicationDTO
-from app.modules.product_applications.product_applications_dco import ProductApplicationDCO
+from app.modules.product_applications.product_applications_dto import (
+    LinkedApplicationDTO,
+    ProductApplicationDTO,
+)
+from app.modules.product_applications.product_applications_dco import (
+    ProductApplicationDCO,
+    ProductApplicationsReplaceDCO,
+)
 
 
 async def create(session: AsyncSession, data: ProductApplicationDCO) -> ProductApplicationDTO:
@@ -19,3 +25,15 @@ async def list_all(session: AsyncSession) -> list[ProductApplicationDTO]:
 
 async def delete_record(session: AsyncSession, **kwargs) -> bool:
     return await service.delete_record(session, **kwargs)
+
+
+async def list_product_applications(
+    session: AsyncSession, product_id: UUID
+) -> list[LinkedApplicationDTO]:
+    return await service.list_product_applications(session, product_id)
+
+
+async def replace_for_product(
+    session: AsyncSession, product_id: UUID, data: ProductApplicationsReplaceDCO
+) -> list[LinkedApplicationDTO] | None:
+    return await service.replace_for_product(session, product_id, data)
@@ -1,7 +1,9 @@
 """DCO for the product_applications junction table — WRITE operations."""
 
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import Field
 
 from app.common.schemas.base import BaseSchema
 
@@ -12,3 +14,8 @@ class ProductApplicationDCO(BaseSchema):
 class ProductApplicationUpdateDCO(BaseSchema):
     product_id: Optional[UUID] = None
     application_id: Optional[UUID] = None
+
+class ProductApplicationsReplaceDCO(BaseSchema):
+    """The complete set of a product's applications; links not listed are removed."""
+
+    application_ids: List[UUID] = Field(default_factory=list, max_length=200)
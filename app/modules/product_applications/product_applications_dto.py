@@ -1,6 +1,7 @@
 """DTO for the product_applications junction table — READ operations."""
 
 from uuid import UUID
+from typing import List
 
 from app.common.schemas.base import BaseSchema
 
@@ -8,3 +9,23 @@ class ProductApplicationDTO(BaseSchema):
 
     product_id: UUID
     application_id: UUID
+
+class LinkedProductDTO(BaseSchema):
+    id: UUID
+    name: str
+    slug: str
+    is_active: bool
+    deleted: bool
+
+class LinkedApplicationDTO(BaseSchema):
+    id: UUID
+    name: str
+
+class LinkedProductsPageDTO(BaseSchema):
+    items: List[LinkedProductDTO]
+    total: int
+    page: int
+    limit: int
+    pages: int
+    has_next: bool
+    has_prev: bool
@@ -0,0 +1,149 @@
+"""Cached application <-> product reverse index.
+
+All links are loaded with one query joined to the product (name, slug,
+status) and application names. Each application keeps its products sorted by
+(name, id), plus the live subset (active, not soft-deleted) that storefront
+pages ask for; each product keeps its applications sorted by name. Pages are
+then list slices, with no join at request time.
+
+The index is cached per worker for APPLICATION_INDEX_CACHE_TTL_SECONDS and
+dropped after any committed link, product or application write: locally,
+and in other workers through the cache bus (`applications:changed`).
+"""
+
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache_bus
+from app.core.config import settings
+
+CHANNEL = "applications:changed"
+
+_CHANGED_KEY = "application_index_changed"
+
+# Applications without links come back once, with NULL product columns
+_LINKS_SQL = text("""
+SELECT a.id AS application_id, a.name AS application_name,
+       p.id AS product_id, p.name AS product_name, p.slug, p.is_active,
+       p.deleted_at IS NOT NULL AS deleted
+FROM applications AS a
+LEFT JOIN product_applications AS pa ON pa.application_id = a.id
+LEFT JOIN products AS p ON p.id = pa.product_id
+ORDER BY p.name, p.id
+""")
+
+
+@dataclass(frozen=True)
+class LinkedProduct:
+    id: UUID
+    name: str
+    slug: str
+    is_active: bool
+    deleted: bool
+
+    @property
+    def live(self) -> bool:
+        return self.is_active and not self.deleted
+
+
+@dataclass(frozen=True)
+class LinkedApplication:
+    id: UUID
+    name: str
+
+
+class ApplicationIndex:
+    def __init__(
+        self,
+        products: dict[UUID, tuple[LinkedProduct, ...]],
+        applications: dict[UUID, tuple[LinkedApplication, ...]],
+    ):
+        self._products = products
+        self._live = {
+            app_id: tuple(p for p in linked if p.live) for app_id, linked in products.items()
+        }
+        self._applications = applications
+
+    def has_application(self, application_id: UUID) -> bool:
+        return application_id in self._products
+
+    def products_of(
+        self, application_id: UUID, include_inactive: bool = False, include_deleted: bool = False
+    ) -> tuple[LinkedProduct, ...]:
+        """Linked products in (name, id) order; live ones only unless asked otherwise."""
+        if not include_inactive and not include_deleted:
+            return self._live.get(application_id, ())
+        return tuple(
+            p
+            for p in self._products.get(application_id, ())
+            if (include_inactive or p.is_active) and (include_deleted or not p.deleted)
+        )
+
+    def applications_of(self, product_id: UUID) -> tuple[LinkedApplication, ...]:
+        return self._applications.get(product_id, ())
+
+    @classmethod
+    def from_rows(cls, rows) -> "ApplicationIndex":
+        """Build from link rows ordered by product name, id (application-only rows anywhere)."""
+        products: dict[UUID, list[LinkedProduct]] = {}
+        applications: dict[UUID, list[LinkedApplication]] = {}
+        for row in rows:
+            linked = products.setdefault(row.application_id, [])
+            if row.product_id is None:
+                continue
+            product = LinkedProduct(
+                row.product_id, row.product_name, row.slug, row.is_active, row.deleted
+            )
+            linked.append(product)
+            applications.setdefault(row.product_id, []).append(
+                LinkedApplication(row.application_id, row.application_name)
+            )
+        return cls(
+            {app_id: tuple(linked) for app_id, linked in products.items()},
+            {
+                product_id: tuple(sorted(linked, key=lambda a: (a.name, a.id.hex)))
+                for product_id, linked in applications.items()
+            },
+        )
+
+
+_cached: tuple[ApplicationIndex, float] | None = None
+_generation = 0
+
+
+def invalidate_index() -> None:
+    global _cached, _generation
+    _cached = None
+    _generation += 1
+
+
+async def get_application_index(session: AsyncSession) -> ApplicationIndex:
+    """The cached index, loaded with one query when missing or expired."""
+    global _cached
+    if _cached is not None and _cached[1] > time.monotonic():
+        return _cached[0]
+
+    generation = _generation
+    index = ApplicationIndex.from_rows((await session.execute(_LINKS_SQL)).all())
+    # Don't cache an index read before an invalidation that arrived meanwhile
+    if generation == _generation:
+        _cached = (index, time.monotonic() + settings.application_index_cache_ttl_seconds)
+    return index
+
+
+def mark_changed(session: AsyncSession) -> None:
+    """Drop the cached index in every worker once `session` commits."""
+    session.info[_CHANGED_KEY] = True
+
+
+def _on_commit(_changed) -> None:
+    invalidate_index()
+    cache_bus.publish_soon(CHANNEL, "1")
+
+
+cache_bus.after_commit(_CHANGED_KEY, _on_commit)
+cache_bus.subscribe(CHANNEL, lambda _message: invalidate_index())
@@ -1,12 +1,17 @@
 """Routes for the `product_applications` module."""
 
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
-from app.core import get_db_session
+from app.core import get_db_session, require_admin
 from app.modules.product_applications import product_applications_controller as controller
-from app.modules.product_applications.product_applications_dco import ProductApplicationDCO
+from app.modules.product_applications.product_applications_dco import (
+    ProductApplicationDCO,
+    ProductApplicationsReplaceDCO,
+)
 
 router = APIRouter()
 
@@ -26,3 +31,27 @@ async def list_product_applications(
 ):
     records = await controller.list_all(db)
     return respond(data=records, message="ProductApplication records fetched")
+
+
+@router.get("/products/{product_id}")
+async def list_applications_of_product(
+    product_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """A product's applications by name, from the cached reverse index."""
+    records = await controller.list_product_applications(db, product_id)
+    return respond(data=records, message="Product applications fetched")
+
+
+@router.put("/products/{product_id}")
+async def replace_product_applications(
+    product_id: UUID,
+    body: ProductApplicationsReplaceDCO,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Replace the product's whole set of applications (an empty list removes them all)."""
+    records = await controller.replace_for_product(db, product_id, body)
+    if records is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return respond(data=records, message="Product applications replaced")
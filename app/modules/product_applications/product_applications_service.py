@@ -1,15 +1,37 @@
-"""Service layer for the `product_applications` module."""
+"""Service layer for the `product_applications` module.
 
+Reads by application or by product go through the cached reverse index
+(`product_applications_index`); every link write marks it changed.
+"""
+
+import math
 import uuid
 from uuid import UUID
 
 from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 
+from app.core.exceptions import ValidationError
+from app.modules.applications.applications_entity import Application
+from app.modules.products.products_entity import Product
 from app.modules.product_applications.product_applications_entity import ProductApplication
-from app.modules.product_applications.product_applications_dto import ProductApplicationDTO
-from app.modules.product_applications.product_applications_dco import ProductApplicationDCO
+from app.modules.product_applications.product_applications_dto import (
+    LinkedApplicationDTO,
+    LinkedProductDTO,
+    LinkedProductsPageDTO,
+    ProductApplicationDTO,
+)
+from app.modules.product_applications.product_applications_dco import (
+    ProductApplicationDCO,
+    ProductApplicationsReplaceDCO,
+)
+from app.modules.product_applications.product_applications_index import (
+    get_application_index,
+    mark_changed,
+)
+from app.modules.search.search_service import reindex_products
 
 
 async def create(session: AsyncSession, data: ProductApplicationDCO) -> ProductApplicationDTO:
@@ -18,6 +40,8 @@ async def create(session: AsyncSession, data: ProductApplicationDCO) -> ProductA
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    await reindex_products(session, [entity_obj.product_id])
+    mark_changed(session)
     return ProductApplicationDTO.model_validate(entity_obj)
 
 
@@ -31,7 +55,90 @@ async def list_all(session: AsyncSession) -> list[ProductApplicationDTO]:
 
 async def delete_record(session: AsyncSession, **kwargs) -> bool:
     """Delete a ProductApplication record by composite key."""
-    stmt = delete(ProductApplication).filter_by(**kwargs)
+    stmt = delete(ProductApplication).filter_by(**kwargs).returning(ProductApplication.product_id)
     result = await session.execute(stmt)
     await session.flush()
-    return result.rowcount > 0
+    deleted = result.scalars().all()
+    await reindex_products(session, deleted)
+    if deleted:
+        mark_changed(session)
+    return len(deleted) > 0
+
+
+async def list_application_products(
+    session: AsyncSession,
+    application_id: UUID,
+    page: int = 1,
+    limit: int = 50,
+    include_inactive: bool = False,
+    include_deleted: bool = False,
+) -> LinkedProductsPageDTO | None:
+    """One page of an application's products by name; None if the application doesn't exist."""
+    index = await get_application_index(session)
+    if not index.has_application(application_id):
+        return None
+    linked = index.products_of(application_id, include_inactive, include_deleted)
+    start = (page - 1) * limit
+    pages = math.ceil(len(linked) / limit)
+    return LinkedProductsPageDTO(
+        items=[LinkedProductDTO.model_validate(p) for p in linked[start : start + limit]],
+        total=len(linked),
+        page=page,
+        limit=limit,
+        pages=pages,
+        has_next=page < pages,
+        has_prev=page > 1,
+    )
+
+
+async def list_product_applications(
+    session: AsyncSession, product_id: UUID
+) -> list[LinkedApplicationDTO]:
+    """A product's applications by name."""
+    index = await get_application_index(session)
+    return [LinkedApplicationDTO.model_validate(a) for a in index.applications_of(product_id)]
+
+
+async def replace_for_product(
+    session: AsyncSession, product_id: UUID, data: ProductApplicationsReplaceDCO
+) -> list[LinkedApplicationDTO] | None:
+    """Make `data.application_ids` the product's whole application set; None if no such product."""
+    # Row lock serialises concurrent replaces of the same product
+    stmt = (
+        select(Product.id)
+        .where(Product.id == product_id, Product.deleted_at.is_(None))
+        .with_for_update()
+    )
+    if (await session.execute(stmt)).scalar_one_or_none() is None:
+        return None
+
+    wanted = set(data.application_ids)
+    applications = []
+    if wanted:
+        result = await session.execute(
+            select(Application).where(Application.id.in_(wanted)).order_by(Application.name)
+        )
+        applications = result.scalars().all()
+        missing = wanted - {a.id for a in applications}
+        if missing:
+            raise ValidationError(
+                "Unknown applications",
+                field="applicationIds",
+                value=sorted(str(m) for m in missing),
+            )
+
+    stale = delete(ProductApplication).where(ProductApplication.product_id == product_id)
+    if wanted:
+        stale = stale.where(ProductApplication.application_id.not_in(wanted))
+    await session.execute(stale)
+    if wanted:
+        await session.execute(
+            insert(ProductApplication)
+            .values([{"product_id": product_id, "application_id": a} for a in sorted(wanted)])
+            .on_conflict_do_nothing()
+        )
+    await session.flush()
+
+    await reindex_products(session, [product_id])
+    mark_changed(session)
+    return [LinkedApplicationDTO.model_validate(a) for a in applications]
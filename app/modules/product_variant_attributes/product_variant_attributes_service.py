@@ -10,6 +10,8 @@ from sqlalchemy.sql import func
 from app.modules.product_variant_attributes.product_variant_attributes_entity import ProductVariantAttribute
 from app.modules.product_variant_attributes.product_variant_attributes_dto import ProductVariantAttributeDTO
 from app.modules.product_variant_attributes.product_variant_attributes_dco import ProductVariantAttributeDCO
+from app.modules.search.search_service import reindex_variants
+from app.modules.variant_attribute_values.variant_attribute_values_service import refresh_values
 
 
 async def create(session: AsyncSession, data: ProductVariantAttributeDCO) -> ProductVariantAttributeDTO:
@@ -18,6 +20,8 @@ async def create(session: AsyncSession, data: ProductVariantAttributeDCO) -> Pro
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    await refresh_values(session, variant_ids=[entity_obj.variant_id])
+    await reindex_variants(session, [entity_obj.variant_id])
     return ProductVariantAttributeDTO.model_validate(entity_obj)
 
 
@@ -31,7 +35,14 @@ async def list_all(session: AsyncSession) -> list[ProductVariantAttributeDTO]:
 
 async def delete_record(session: AsyncSession, **kwargs) -> bool:
     """Delete a ProductVariantAttribute record by composite key."""
-    stmt = delete(ProductVariantAttribute).filter_by(**kwargs)
+    stmt = (
+        delete(ProductVariantAttribute)
+        .filter_by(**kwargs)
+        .returning(ProductVariantAttribute.variant_id)
+    )
     result = await session.execute(stmt)
     await session.flush()
-    return result.rowcount > 0
+    deleted = result.scalars().all()
+    await refresh_values(session, variant_ids=deleted)
+    await reindex_variants(session, deleted)
+    return len(deleted) > 0
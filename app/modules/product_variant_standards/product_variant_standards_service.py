@@ -10,6 +10,7 @@ from sqlalchemy.sql import func
 from app.modules.product_variant_standards.product_variant_standards_entity import ProductVariantStandard
 from app.modules.product_variant_standards.product_variant_standards_dto import ProductVariantStandardDTO
 from app.modules.product_variant_standards.product_variant_standards_dco import ProductVariantStandardDCO
+from app.modules.search.search_service import reindex_variants
 
 
 async def create(session: AsyncSession, data: ProductVariantStandardDCO) -> ProductVariantStandardDTO:
@@ -18,6 +19,7 @@ async def create(session: AsyncSession, data: ProductVariantStandardDCO) -> Prod
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    await reindex_variants(session, [entity_obj.variant_id])
     return ProductVariantStandardDTO.model_validate(entity_obj)
 
 
@@ -31,7 +33,13 @@ async def list_all(session: AsyncSession) -> list[ProductVariantStandardDTO]:
 
 async def delete_record(session: AsyncSession, **kwargs) -> bool:
     """Delete a ProductVariantStandard record by composite key."""
-    stmt = delete(ProductVariantStandard).filter_by(**kwargs)
+    stmt = (
+        delete(ProductVariantStandard)
+        .filter_by(**kwargs)
+        .returning(ProductVariantStandard.variant_id)
+    )
     result = await session.execute(stmt)
     await session.flush()
-    return result.rowcount > 0
+    deleted = result.scalars().all()
+    await reindex_variants(session, deleted)
+    return len(deleted) > 0
@@ -3,7 +3,18 @@
 import uuid
 from uuid import uuid4
 
-from sqlalchemy import Column, Text, String, Boolean, Integer, Numeric, DateTime, ForeignKey
+from sqlalchemy import (
+    Column,
+    Text,
+    String,
+    Boolean,
+    Integer,
+    Numeric,
+    DateTime,
+    ForeignKey,
+    Index,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -13,6 +24,12 @@ from app.models.base import Base
 
 class ProductVariant(Base):
     __tablename__ = "product_variants"
+    __table_args__ = (
+        # Scanner lookups by barcode (sku is already unique)
+        Index(
+            "ix_product_variants_barcode", "barcode", postgresql_where=text("barcode IS NOT NULL")
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     product_id = Column(UUID(as_uuid=True), ForeignKey("products.id"), nullable=False)
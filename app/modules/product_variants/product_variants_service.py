@@ -10,6 +10,11 @@ from sqlalchemy.sql import func
 from app.modules.product_variants.product_variants_entity import ProductVariant
 from app.modules.product_variants.product_variants_dto import ProductVariantDTO
 from app.modules.product_variants.product_variants_dco import ProductVariantDCO, ProductVariantUpdateDCO
+from app.modules.price_tiers.price_tiers_effective import refresh_effective_prices
+from app.modules.search.search_service import reindex_products
+
+# Fields the compiled dealer prices depend on
+_PRICED_FIELDS = {"price", "currency", "product_id"}
 
 
 async def create(session: AsyncSession, data: ProductVariantDCO) -> ProductVariantDTO:
@@ -18,6 +23,8 @@ async def create(session: AsyncSession, data: ProductVariantDCO) -> ProductVaria
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    await reindex_products(session, [entity_obj.product_id])
+    await refresh_effective_prices(session, variant_ids=[entity_obj.id])
     return ProductVariantDTO.model_validate(entity_obj)
 
 
@@ -44,11 +51,15 @@ async def update(session: AsyncSession, record_id: UUID, data: ProductVariantUpd
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return None
+    previous_product_id = entity_obj.product_id
     updates = data.model_dump(exclude_unset=True)
     for key, value in updates.items():
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    await reindex_products(session, {previous_product_id, entity_obj.product_id})
+    if _PRICED_FIELDS & updates.keys():
+        await refresh_effective_prices(session, variant_ids=[entity_obj.id])
     return ProductVariantDTO.model_validate(entity_obj)
 
 
@@ -59,8 +70,10 @@ async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return False
+    product_id = entity_obj.product_id
     await session.delete(entity_obj)
     await session.flush()
+    await reindex_products(session, [product_id])
     return True
 
 async def soft_delete_product_variant(session: AsyncSession, record_id: UUID) -> bool:
@@ -72,4 +85,6 @@ async def soft_delete_product_variant(session: AsyncSession, record_id: UUID) ->
         return False
     entity_obj.deleted_at = func.now()
     await session.flush()
+    await reindex_products(session, [entity_obj.product_id])
+    await refresh_effective_prices(session, variant_ids=[entity_obj.id])
     return True
@@ -1,5 +1,6 @@
 """Controller layer for the `products` module."""
 
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,8 +18,10 @@ async def get_by_id(session: AsyncSession, record_id: UUID) -> ProductDTO | None
     return await service.get_by_id(session, record_id)
 
 
-async def list_all(session: AsyncSession) -> list[ProductDTO]:
-    return await service.list_all(session)
+async def list_all(
+    session: AsyncSession, category_id: Optional[UUID] = None, include_descendants: bool = False
+) -> list[ProductDTO]:
+    return await service.list_all(session, category_id, include_descendants)
 
 
 async def update(session: AsyncSession, record_id: UUID, data: ProductUpdateDCO) -> ProductDTO | None:
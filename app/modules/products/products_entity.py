@@ -3,7 +3,7 @@
 import uuid
 from uuid import uuid4
 
-from sqlalchemy import Column, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -13,6 +13,10 @@ from app.models.base import Base
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Category pages filter with category_id IN (<subtree ids>)
+        Index("ix_products_category_id", "category_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     brand_id = Column(UUID(as_uuid=True), ForeignKey("brands.id"), nullable=False)
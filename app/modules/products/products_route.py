@@ -1,8 +1,9 @@
 """Routes for the `products` module."""
 
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.common.response import respond
@@ -24,9 +25,12 @@ async def create_product(
 
 @router.get("/")
 async def list_products(
+    category_id: Optional[UUID] = Query(None, alias="categoryId"),
+    include_descendants: bool = Query(False, alias="includeDescendants"),
     db: AsyncSession = Depends(get_db_session),
 ):
-    records = await controller.list_all(db)
+    """List products, optionally in one category (`includeDescendants` for its whole subtree)."""
+    records = await controller.list_all(db, category_id, include_descendants)
     return respond(data=records, message="Product records fetched")
 
 
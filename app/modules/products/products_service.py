@@ -1,6 +1,7 @@
 """Service layer for the `products` module."""
 
 import uuid
+from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -10,6 +11,17 @@ from sqlalchemy.sql import func
 from app.modules.products.products_entity import Product
 from app.modules.products.products_dto import ProductDTO
 from app.modules.products.products_dco import ProductDCO, ProductUpdateDCO
+from app.modules.categories.categories_tree import apply_product_counts, get_category_tree
+from app.modules.price_tiers.price_tiers_effective import refresh_effective_prices
+from app.modules.product_applications.product_applications_index import (
+    mark_changed as mark_applications_changed,
+)
+from app.modules.search.search_service import reindex_products
+
+
+def _live(entity_obj: Product) -> bool:
+    """Counted in category_product_counts."""
+    return bool(entity_obj.is_active) and entity_obj.deleted_at is None
 
 
 async def create(session: AsyncSession, data: ProductDCO) -> ProductDTO:
@@ -18,6 +30,9 @@ async def create(session: AsyncSession, data: ProductDCO) -> ProductDTO:
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    if _live(entity_obj):
+        await apply_product_counts(session, {entity_obj.category_id: 1})
+    await reindex_products(session, [entity_obj.id])
     return ProductDTO.model_validate(entity_obj)
 
 
@@ -29,9 +44,16 @@ async def get_by_id(session: AsyncSession, record_id: UUID) -> ProductDTO | None
     return ProductDTO.model_validate(entity_obj) if entity_obj else None
 
 
-async def list_all(session: AsyncSession) -> list[ProductDTO]:
-    """List all Product records."""
+async def list_all(
+    session: AsyncSession, category_id: Optional[UUID] = None, include_descendants: bool = False
+) -> list[ProductDTO]:
+    """List all Product records, optionally in one category or its whole subtree."""
     stmt = select(Product).where(Product.deleted_at.is_(None))
+    if category_id is not None:
+        category_ids = {category_id}
+        if include_descendants:
+            category_ids |= (await get_category_tree(session)).descendant_ids(category_id)
+        stmt = stmt.where(Product.category_id.in_(category_ids))
     result = await session.execute(stmt)
     entities = result.scalars().all()
     return [ProductDTO.model_validate(e) for e in entities]
@@ -44,11 +66,22 @@ async def update(session: AsyncSession, record_id: UUID, data: ProductUpdateDCO)
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return None
+    was_live, previous_category_id = _live(entity_obj), entity_obj.category_id
+    previous_brand_id = entity_obj.brand_id
     updates = data.model_dump(exclude_unset=True)
     for key, value in updates.items():
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    counts = {previous_category_id: -1} if was_live else {}
+    if _live(entity_obj):
+        counts[entity_obj.category_id] = counts.get(entity_obj.category_id, 0) + 1
+    await apply_product_counts(session, counts)
+    await reindex_products(session, [entity_obj.id])
+    mark_applications_changed(session)
+    if entity_obj.brand_id != previous_brand_id:
+        # Brand discounts follow the product
+        await refresh_effective_prices(session, product_ids=[entity_obj.id])
     return ProductDTO.model_validate(entity_obj)
 
 
@@ -59,8 +92,13 @@ async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return False
+    was_live, category_id = _live(entity_obj), entity_obj.category_id
     await session.delete(entity_obj)
     await session.flush()
+    if was_live:
+        await apply_product_counts(session, {category_id: -1})
+    await reindex_products(session, [record_id])
+    mark_applications_changed(session)
     return True
 
 async def soft_delete_product(session: AsyncSession, record_id: UUID) -> bool:
@@ -70,6 +108,11 @@ async def soft_delete_product(session: AsyncSession, record_id: UUID) -> bool:
     entity_obj = result.scalar_one_or_none()
     if not entity_obj:
         return False
+    was_live = _live(entity_obj)
     entity_obj.deleted_at = func.now()
     await session.flush()
+    if was_live:
+        await apply_product_counts(session, {entity_obj.category_id: -1})
+    await reindex_products(session, [record_id])
+    mark_applications_changed(session)
     return True
@@ -0,0 +1,2 @@
+from .search_entity import ProductSearchDocument
+from .search_service import reindex_products, reindex_variants
@@ -0,0 +1,97 @@
+"""Post-commit fan-out of catalog changes to the in-process indexes
+(typeahead, facet bitmap, natural-key lookup cache).
+
+Writes that touch search documents record the affected products/brands on
+the session (`mark_changed`). Once the transaction commits, every registered
+listener (`on_change`) is run with that set: in this worker directly, and in
+the others through the cache bus (`search:changed`). A listener receives
+`None` when it should reload everything (after a bus reconnect).
+
+List-price changes (`mark_prices_changed`) alter no indexed text or facet,
+so they only reach listeners registered with `on_change(prices=True)`.
+"""
+
+import uuid
+from typing import Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from loguru import logger
+
+from app.core import cache_bus
+
+CHANNEL = "search:changed"
+
+PRICE = "price"
+
+# ("product" | "brand" | "price", id): what a catalog write invalidates
+OwnerKey = tuple[str, UUID]
+Listener = Callable[[Optional[set[OwnerKey]]], Awaitable[None]]
+
+_CHANGED_KEY = "search_changed"
+_PROCESS_ID = uuid.uuid4().hex
+_listeners: list[tuple[Listener, bool]] = []
+
+
+def on_change(listener: Optional[Listener] = None, *, prices: bool = False):
+    """Register `listener(owners | None)`; usable as `@on_change` or `@on_change(prices=True)`.
+
+    Only `prices=True` listeners are told about ("price", product_id) owners.
+    """
+    def register(listener: Listener) -> Listener:
+        _listeners.append((listener, prices))
+        return listener
+
+    return register(listener) if listener is not None else register
+
+
+def mark_changed(session, owners: Iterable[OwnerKey]) -> None:
+    """Record products/brands whose indexed entries change when `session` commits."""
+    session.info.setdefault(_CHANGED_KEY, set()).update(owners)
+
+
+def mark_prices_changed(session, product_ids: Iterable[UUID]) -> None:
+    """Record products whose list prices change when `session` commits (price listeners only)."""
+    mark_changed(session, ((PRICE, product_id) for product_id in product_ids))
+
+
+async def _notify(owners: Optional[set[OwnerKey]]) -> None:
+    for listener, prices in _listeners:
+        seen = owners
+        if owners is not None and not prices:
+            seen = {owner for owner in owners if owner[0] != PRICE}
+            if not seen:
+                continue
+        try:
+            await listener(seen)
+        except Exception:
+            logger.exception(
+                "Search index refresh failed | listener={} owners={}",
+                listener.__qualname__,
+                "all" if owners is None else len(owners),
+            )
+
+
+def _on_commit(owners: set[OwnerKey]) -> None:
+    cache_bus.spawn(_notify(owners))
+    message = ",".join(f"{kind}:{owner_id}" for kind, owner_id in owners)
+    cache_bus.publish_soon(CHANNEL, f"{_PROCESS_ID}|{message}")
+
+
+cache_bus.after_commit(_CHANGED_KEY, _on_commit)
+
+
+def _on_message(message: str) -> None:
+    if message == cache_bus.FLUSH_ALL:
+        cache_bus.spawn(_notify(None))
+        return
+    sender, _, payload = message.partition("|")
+    if sender == _PROCESS_ID or not payload:
+        return
+    owners = set()
+    for item in payload.split(","):
+        kind, _, owner_id = item.partition(":")
+        owners.add((kind, UUID(owner_id)))
+    cache_bus.spawn(_notify(owners))
+
+
+cache_bus.subscribe(CHANNEL, _on_message)
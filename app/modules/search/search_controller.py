@@ -0,0 +1,34 @@
+"""Controller layer for the `search` module."""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.search import search_service as service
+from app.modules.search.search_dco import ComplianceQueryDCO, SearchFiltersDCO
+from app.modules.search.search_dto import ComplianceResultDTO, SearchResultDTO, SuggestionDTO
+
+
+async def search_products(
+    session: AsyncSession,
+    q: Optional[str],
+    filters: SearchFiltersDCO,
+    limit: int,
+    cursor: Optional[str],
+    with_facets: bool,
+    dealer_id: Optional[UUID] = None,
+) -> SearchResultDTO:
+    return await service.search(session, q, filters, limit, cursor, with_facets, dealer_id)
+
+
+async def suggest(q: str, limit: int) -> list[SuggestionDTO]:
+    return service.suggest(q, limit)
+
+
+async def match_standards(session: AsyncSession, data: ComplianceQueryDCO) -> ComplianceResultDTO:
+    return await service.match_standards(session, data)
+
+
+async def reindex(session: AsyncSession) -> int:
+    return await service.reindex_products(session, None)
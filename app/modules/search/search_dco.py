@@ -0,0 +1,54 @@
+"""DCO for the search module — facet filters and standards expressions.
+
+Values within one facet are OR'ed, different facets are AND'ed.
+"""
+
+from uuid import UUID
+from typing import List, Optional, Union
+
+from pydantic import Field
+
+from app.common.schemas.base import BaseSchema
+
+class SearchFiltersDCO(BaseSchema):
+    brand_ids: List[UUID] = []
+    category_ids: List[UUID] = []
+    product_type_ids: List[UUID] = []
+    standard_types: List[str] = []
+    standard_ids: List[UUID] = []
+    application_ids: List[UUID] = []
+    viscosities: List[str] = []
+
+    def facet_keys(self) -> dict[str, list[str]]:
+        """Filter values as `facet_keys` entries, per facet."""
+        selected = {
+            "brand": self.brand_ids,
+            "category": self.category_ids,
+            "product_type": self.product_type_ids,
+            "standard_type": [v.upper() for v in self.standard_types],
+            "standard": self.standard_ids,
+            "application": self.application_ids,
+            "viscosity": [v.upper() for v in self.viscosities],
+        }
+        return {
+            kind: [f"{kind}:{v}" for v in values] for kind, values in selected.items() if values
+        }
+
+class StandardExpressionDCO(BaseSchema):
+    """allOf AND (any of anyOf) AND NOT (any of noneOf).
+
+    Items are standard ids or nested expressions, e.g. "API SP and
+    (ACEA C3 or dexos2), but not ILSAC GF-6A".
+    """
+
+    all_of: List[Union[UUID, "StandardExpressionDCO"]] = Field(default_factory=list, max_length=50)
+    any_of: List[Union[UUID, "StandardExpressionDCO"]] = Field(default_factory=list, max_length=50)
+    none_of: List[Union[UUID, "StandardExpressionDCO"]] = Field(default_factory=list, max_length=50)
+
+class ComplianceQueryDCO(BaseSchema):
+    standards: StandardExpressionDCO
+    filters: SearchFiltersDCO = Field(default_factory=SearchFiltersDCO)
+    # e.g. from an attribute filter
+    variant_ids: Optional[List[UUID]] = Field(None, max_length=10_000)
+    limit: int = Field(100, ge=1, le=1000)
+    after: Optional[UUID] = None  # `nextAfter` of the previous page
@@ -0,0 +1,49 @@
+"""DTO for the search module — READ operations."""
+
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Optional
+
+from app.common.schemas.base import BaseSchema
+
+class SearchHitDTO(BaseSchema):
+    variant_id: UUID
+    product_id: UUID
+    sku: str
+    product_name: str
+    brand_name: str
+    price: Decimal                         # the signed-in dealer's unit price
+    list_price: Optional[Decimal] = None   # set when the dealer's tier price differs
+    currency: str
+    pack_size: Optional[str] = None
+    score: float
+
+class FacetValueDTO(BaseSchema):
+    value: str
+    label: str
+    count: int
+
+class SearchFacetsDTO(BaseSchema):
+    brand: List[FacetValueDTO] = []
+    category: List[FacetValueDTO] = []
+    product_type: List[FacetValueDTO] = []
+    standard_type: List[FacetValueDTO] = []
+    standard: List[FacetValueDTO] = []
+    application: List[FacetValueDTO] = []
+    viscosity: List[FacetValueDTO] = []
+
+class SearchResultDTO(BaseSchema):
+    items: List[SearchHitDTO]
+    next_cursor: Optional[str] = None
+    facets: Optional[SearchFacetsDTO] = None  # first page only
+
+class SuggestionDTO(BaseSchema):
+    kind: str                          # brand | product | sku
+    id: UUID
+    label: str
+    product_id: Optional[UUID] = None  # for sku and product suggestions
+
+class ComplianceResultDTO(BaseSchema):
+    total: int                         # matches across all pages
+    variant_ids: List[UUID]
+    next_after: Optional[UUID] = None
@@ -0,0 +1,46 @@
+"""SQLAlchemy entity for the `product_search_documents` table.
+
+One row per sellable variant, denormalised from products, brands, standards,
+attributes and applications, and kept current by `search_service.reindex_*`
+in the same transaction as catalog writes. `document` is the weighted
+tsvector (GIN); `search_text` feeds pg_trgm fuzzy matching (GIN, needs the
+`pg_trgm` extension); `facet_keys` lists every facet value of the variant
+("brand:<id>", "standard_type:API", "viscosity:5W-30", ...) for filtering
+(GIN) and single-pass facet counts.
+"""
+
+from sqlalchemy import Column, Text, DateTime, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class ProductSearchDocument(Base):
+    __tablename__ = "product_search_documents"
+    __table_args__ = (
+        Index("ix_product_search_documents_document", "document", postgresql_using="gin"),
+        Index(
+            "ix_product_search_documents_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index("ix_product_search_documents_facet_keys", "facet_keys", postgresql_using="gin"),
+        Index("ix_product_search_documents_product", "product_id"),
+        Index("ix_product_search_documents_browse", "product_name", "variant_id"),
+    )
+
+    variant_id = Column(UUID(as_uuid=True), primary_key=True)
+    product_id = Column(UUID(as_uuid=True), nullable=False)
+    brand_id = Column(UUID(as_uuid=True), nullable=False)
+    category_id = Column(UUID(as_uuid=True), nullable=True)
+    product_type_id = Column(UUID(as_uuid=True), nullable=True)
+    sku = Column(Text, nullable=False)
+    product_name = Column(Text, nullable=False)
+    brand_name = Column(Text, nullable=False)
+    # Lower-cased name, brand, sku, barcode for trigram matching
+    search_text = Column(Text, nullable=False)
+    document = Column(TSVECTOR, nullable=False)
+    facet_keys = Column(ARRAY(Text), nullable=False, server_default="{}")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,90 @@
+"""Facet counts for product search, computed in one pass.
+
+Every search document carries its facet values in `facet_keys`
+("<facet>:<value>"); unnesting that array over the matching documents and
+grouping by key yields the counts of all facets at once, labels joined in the
+same statement. The unfiltered counts (plain browse) are the same for every
+visitor, so they are cached in-process for SEARCH_FACET_CACHE_TTL_SECONDS.
+
+Counts are disjunctive: a facet's values are counted with every filter
+applied except that facet's own, so ticking one brand still shows how many
+results each other brand would add. Each document records how many filters
+it fails and which one; it counts for all facets when it fails none, and
+only for the failed facet when it fails exactly one.
+"""
+
+import time
+from collections import defaultdict
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.modules.search.search_dto import FacetValueDTO, SearchFacetsDTO
+
+_unfiltered: tuple[SearchFacetsDTO, float] | None = None
+
+
+def _facets_sql(where: str, filters: dict[str, str]) -> str:
+    failed, failed_kind = "0", "NULL::text"
+    if filters:
+        failed = " + ".join(f"(NOT ({clause}))::int" for clause in filters.values())
+        cases = " ".join(f"WHEN NOT ({clause}) THEN '{kind}'" for kind, clause in filters.items())
+        failed_kind = f"CASE {cases} END"
+    return f"""
+WITH matched AS (
+    SELECT d.facet_keys, {failed} AS failed, {failed_kind} AS failed_kind
+    FROM product_search_documents AS d
+    WHERE {where} AND {failed} <= 1
+),
+counts AS (
+    SELECT k.key, count(*) AS n
+    FROM matched AS d
+    CROSS JOIN LATERAL unnest(d.facet_keys) AS k(key)
+    WHERE d.failed = 0 OR split_part(k.key, ':', 1) = d.failed_kind
+    GROUP BY k.key
+),
+parsed AS (
+    SELECT split_part(key, ':', 1) AS kind, substr(key, strpos(key, ':') + 1) AS value, n
+    FROM counts
+)
+SELECT f.kind, f.value, f.n,
+       COALESCE(b.name, c.name, pt.name, s.name, a.name, f.value) AS label
+FROM parsed AS f
+LEFT JOIN brands AS b
+    ON b.id = CAST(CASE WHEN f.kind = 'brand' THEN f.value END AS uuid)
+LEFT JOIN categories AS c
+    ON c.id = CAST(CASE WHEN f.kind = 'category' THEN f.value END AS uuid)
+LEFT JOIN product_types AS pt
+    ON pt.id = CAST(CASE WHEN f.kind = 'product_type' THEN f.value END AS uuid)
+LEFT JOIN standards AS s
+    ON s.id = CAST(CASE WHEN f.kind = 'standard' THEN f.value END AS uuid)
+LEFT JOIN applications AS a
+    ON a.id = CAST(CASE WHEN f.kind = 'application' THEN f.value END AS uuid)
+ORDER BY f.kind, f.n DESC, label
+"""
+
+
+async def count_facets(
+    session: AsyncSession, where: str, filters: dict[str, str], params: dict, cacheable: bool
+) -> SearchFacetsDTO:
+    """Counts per facet value over the documents matching `where` (alias `d`).
+
+    `filters` maps each filtered facet to its condition; it is left out of
+    that facet's own counts.
+    """
+    global _unfiltered
+    if cacheable and _unfiltered is not None and _unfiltered[1] > time.monotonic():
+        return _unfiltered[0]
+
+    result = await session.execute(text(_facets_sql(where, filters)), params)
+    by_kind: dict[str, list[FacetValueDTO]] = defaultdict(list)
+    for row in result.all():
+        values = by_kind[row.kind]
+        if len(values) < settings.search_facet_values_limit:
+            values.append(FacetValueDTO(value=row.value, label=row.label, count=row.n))
+    facets = SearchFacetsDTO(**by_kind)
+
+    if cacheable:
+        _unfiltered = (facets, time.monotonic() + settings.search_facet_cache_ttl_seconds)
+    return facets
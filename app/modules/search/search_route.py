@@ -0,0 +1,95 @@
+"""Routes for the `search` module."""
+
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session, get_optional_user, require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.search import search_controller as controller
+from app.modules.search.search_dco import ComplianceQueryDCO, SearchFiltersDCO
+
+router = APIRouter()
+
+
+@router.get("/products")
+@limiter.limit(RateLimits.SEARCH)
+async def search_products(
+    request: Request,
+    q: Optional[str] = Query(None, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, max_length=500),
+    facets: bool = Query(True),
+    brand_ids: List[UUID] = Query([], alias="brandId"),
+    category_ids: List[UUID] = Query([], alias="categoryId"),
+    product_type_ids: List[UUID] = Query([], alias="productTypeId"),
+    standard_types: List[str] = Query([], alias="standardType"),
+    standard_ids: List[UUID] = Query([], alias="standardId"),
+    application_ids: List[UUID] = Query([], alias="applicationId"),
+    viscosities: List[str] = Query([], alias="viscosity"),
+    current_user: Optional[dict] = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Ranked search over name, SKU/barcode, brand, standards and attribute values.
+
+    Filters repeat per value (`?brandId=a&brandId=b`): OR within a facet, AND
+    across facets. The first page carries facet counts for the whole result
+    set; pass `nextCursor` from the previous page as `cursor` for the next one.
+    Signed-in dealers get their tier prices (`listPrice` keeps the original).
+    """
+    filters = SearchFiltersDCO(
+        brand_ids=brand_ids,
+        category_ids=category_ids,
+        product_type_ids=product_type_ids,
+        standard_types=standard_types,
+        standard_ids=standard_ids,
+        application_ids=application_ids,
+        viscosities=viscosities,
+    )
+    dealer_id = UUID(current_user["user_id"]) if current_user else None
+    result = await controller.search_products(db, q, filters, limit, cursor, facets, dealer_id)
+    return respond(data=result, message="Search results fetched")
+
+
+@router.get("/suggest")
+@limiter.limit(RateLimits.SUGGEST)
+async def suggest(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+):
+    """Search-as-you-type over brand names, product names and SKUs, most ordered first."""
+    suggestions = await controller.suggest(q, limit)
+    return respond(data=suggestions, message="Suggestions fetched")
+
+
+@router.post("/standards")
+@limiter.limit(RateLimits.SEARCH)
+async def match_standards(
+    request: Request,
+    data: ComplianceQueryDCO,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Variant ids meeting a standards expression (allOf / anyOf / noneOf, nestable).
+
+    `filters` takes the same facets as product search; `variantIds` narrows to
+    a candidate set computed elsewhere (e.g. an attribute filter). `total`
+    counts every match; page with `nextAfter` as `after`.
+    """
+    result = await controller.match_standards(db, data)
+    return respond(data=result, message="Matching variants fetched")
+
+
+@router.post("/reindex")
+@limiter.limit(RateLimits.ADMIN)
+async def reindex_search(
+    request: Request,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Rebuild every search document (backfill, or after renaming standards/categories)."""
+    indexed = await controller.reindex(db)
+    return respond(data={"indexed": indexed}, message="Search index rebuilt")
@@ -0,0 +1,401 @@
+"""Service layer for the `search` module.
+
+Search reads only `product_search_documents`: a prefix tsquery against the
+weighted `document` (GIN) OR a pg_trgm word-similarity match on
+`search_text` (GIN) for typos, ranked by ts_rank plus similarity with a boost
+for an exact SKU. Pages are keyset-paginated on (score, product_name,
+variant_id), so deep pages cost the same as the first. Filters and facet
+counts use the per-variant `facet_keys` array (see `search_facets`).
+
+Catalog services call `reindex_products` / `reindex_variants` /
+`reindex_brands` after their writes; each is one upsert plus one delete of
+rows that stopped being searchable. Renames of categories, product types,
+standards or applications are picked up by a full `reindex_products(None)`.
+Targeted reindexes also queue the products/brands for the in-process
+typeahead and bitmap indexes (`search_changes`), patched after commit.
+`match_standards` answers standards AND/OR/NOT expressions from the bitmap
+index (`search_bitmap`) without touching the database.
+"""
+
+import base64
+import binascii
+import json
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Optional
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError, ValidationError
+from app.modules.categories.categories_tree import get_category_tree
+from app.modules.price_tiers.price_tiers_effective import resolve_prices
+from app.modules.products.products_entity import Product
+from app.modules.product_variants.product_variants_entity import ProductVariant
+from app.modules.search.search_bitmap import FacetBitmapIndex, get_bitmap_index
+from app.modules.search.search_changes import mark_changed
+from app.modules.search.search_dco import (
+    ComplianceQueryDCO,
+    SearchFiltersDCO,
+    StandardExpressionDCO,
+)
+from app.modules.search.search_dto import (
+    ComplianceResultDTO,
+    SearchHitDTO,
+    SearchResultDTO,
+    SuggestionDTO,
+)
+from app.modules.search.search_facets import count_facets
+from app.modules.search.search_suggest import get_suggest_index
+
+_MAX_TERMS = 8
+_MAX_EXPRESSION_DEPTH = 5
+
+# Weights: A = name / sku / barcode, B = brand / standards,
+# C = short description / attribute values / applications / pack size, D = category / product type
+_SEARCHABLE = """
+    v.deleted_at IS NULL AND v.is_active
+    AND p.deleted_at IS NULL AND p.is_active
+    AND b.deleted_at IS NULL
+"""
+
+
+def _upsert_sql(scope: str) -> str:
+    return f"""
+INSERT INTO product_search_documents AS d (
+    variant_id, product_id, brand_id, category_id, product_type_id,
+    sku, product_name, brand_name, search_text, document, facet_keys, updated_at
+)
+SELECT v.id, p.id, p.brand_id, p.category_id, p.product_type_id,
+       v.sku, p.name, b.name,
+       lower(concat_ws(' ', p.name, b.name, v.sku, v.barcode)),
+       setweight(to_tsvector('simple', concat_ws(' ', p.name, v.sku, v.barcode)), 'A')
+       || setweight(to_tsvector('simple', concat_ws(' ', b.name, st.names)), 'B')
+       || setweight(to_tsvector('simple', concat_ws(
+              ' ', p.short_description, av.vals, ap.names, v.pack_size
+          )), 'C')
+       || setweight(to_tsvector('simple', concat_ws(' ', c.name, pt.name)), 'D'),
+       array_remove(ARRAY[
+           'brand:' || p.brand_id,
+           'category:' || p.category_id,
+           'product_type:' || p.product_type_id
+       ], NULL)
+       || COALESCE(st.keys, '{{}}') || COALESCE(av.keys, '{{}}') || COALESCE(ap.keys, '{{}}'),
+       now()
+FROM product_variants AS v
+JOIN products AS p ON p.id = v.product_id
+JOIN brands AS b ON b.id = p.brand_id
+LEFT JOIN categories AS c ON c.id = p.category_id
+LEFT JOIN product_types AS pt ON pt.id = p.product_type_id
+LEFT JOIN LATERAL (
+    SELECT string_agg(s.standard_type::text || ' ' || s.name, ' ') AS names,
+           array_agg('standard:' || s.id)
+           || array_agg(DISTINCT 'standard_type:' || s.standard_type::text) AS keys
+    FROM product_variant_standards AS pvs
+    JOIN standards AS s ON s.id = pvs.standard_id
+    WHERE pvs.variant_id = v.id
+) AS st ON true
+LEFT JOIN LATERAL (
+    SELECT string_agg(pva.value, ' ') AS vals,
+           array_agg(DISTINCT 'viscosity:' || upper(trim(pva.value)))
+               FILTER (WHERE lower(att.name) = lower(:viscosity_attribute)) AS keys
+    FROM product_variant_attributes AS pva
+    JOIN attributes AS att ON att.id = pva.attribute_id
+    WHERE pva.variant_id = v.id
+) AS av ON true
+LEFT JOIN LATERAL (
+    SELECT string_agg(a.name, ' ') AS names, array_agg('application:' || a.id) AS keys
+    FROM product_applications AS pa
+    JOIN applications AS a ON a.id = pa.application_id
+    WHERE pa.product_id = p.id
+) AS ap ON true
+WHERE {_SEARCHABLE} {scope}
+ORDER BY v.id
+ON CONFLICT (variant_id) DO UPDATE
+SET product_id = EXCLUDED.product_id,
+    brand_id = EXCLUDED.brand_id,
+    category_id = EXCLUDED.category_id,
+    product_type_id = EXCLUDED.product_type_id,
+    sku = EXCLUDED.sku,
+    product_name = EXCLUDED.product_name,
+    brand_name = EXCLUDED.brand_name,
+    search_text = EXCLUDED.search_text,
+    document = EXCLUDED.document,
+    facet_keys = EXCLUDED.facet_keys,
+    updated_at = now()
+"""
+
+
+def _prune_sql(scope: str) -> str:
+    return f"""
+DELETE FROM product_search_documents AS d
+WHERE {scope}
+  AND NOT EXISTS (
+    SELECT 1
+    FROM product_variants AS v
+    JOIN products AS p ON p.id = v.product_id
+    JOIN brands AS b ON b.id = p.brand_id
+    WHERE v.id = d.variant_id AND {_SEARCHABLE}
+  )
+"""
+
+
+_UPSERT_ALL_SQL = text(_upsert_sql(""))
+_UPSERT_PRODUCTS_SQL = text(_upsert_sql("AND p.id = ANY(CAST(:product_ids AS uuid[]))"))
+_PRUNE_ALL_SQL = text(_prune_sql("true"))
+# A variant moved to another product is matched by its own id as well
+_PRUNE_PRODUCTS_SQL = text(_prune_sql("""(
+    d.product_id = ANY(CAST(:product_ids AS uuid[]))
+    OR d.variant_id IN (
+        SELECT id FROM product_variants WHERE product_id = ANY(CAST(:product_ids AS uuid[]))
+    )
+)"""))
+
+
+# ── Maintenance ──────────────────────────────────────────────
+
+async def reindex_products(session: AsyncSession, product_ids: Optional[Iterable[UUID]]) -> int:
+    """Rebuild the documents of these products' variants (`None` = whole catalog)."""
+    viscosity = {"viscosity_attribute": settings.search_viscosity_attribute}
+    if product_ids is None:
+        upserted = await session.execute(_UPSERT_ALL_SQL, viscosity)
+        pruned = await session.execute(_PRUNE_ALL_SQL)
+        logger.info(
+            "Search documents rebuilt | upserted={} pruned={}", upserted.rowcount, pruned.rowcount
+        )
+        return upserted.rowcount
+
+    params = {"product_ids": sorted(set(product_ids))}
+    if not params["product_ids"]:
+        return 0
+    upserted = await session.execute(_UPSERT_PRODUCTS_SQL, {**params, **viscosity})
+    await session.execute(_PRUNE_PRODUCTS_SQL, params)
+    mark_changed(session, [("product", product_id) for product_id in params["product_ids"]])
+    return upserted.rowcount
+
+
+async def reindex_variants(session: AsyncSession, variant_ids: Iterable[UUID]) -> int:
+    """Rebuild documents after a change to variant-level data (standards, attributes)."""
+    variant_ids = list(set(variant_ids))
+    if not variant_ids:
+        return 0
+    result = await session.execute(
+        select(ProductVariant.product_id).where(ProductVariant.id.in_(variant_ids))
+    )
+    return await reindex_products(session, result.scalars().all())
+
+
+async def reindex_brands(session: AsyncSession, brand_ids: Iterable[UUID]) -> int:
+    """Rebuild documents of every product of these brands (rename, soft delete)."""
+    brand_ids = list(set(brand_ids))
+    if not brand_ids:
+        return 0
+    result = await session.execute(select(Product.id).where(Product.brand_id.in_(brand_ids)))
+    mark_changed(session, [("brand", brand_id) for brand_id in brand_ids])
+    return await reindex_products(session, result.scalars().all())
+
+
+# ── Query ────────────────────────────────────────────────────
+
+def _terms(q: Optional[str]) -> list[str]:
+    return re.findall(r"[^\W_]+", (q or "").lower())[:_MAX_TERMS]
+
+
+def encode_cursor(score: Decimal, product_name: str, variant_id: UUID) -> str:
+    raw = json.dumps([str(score), product_name, str(variant_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Decimal, str, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, product_name, variant_id = json.loads(raw)
+        return Decimal(score), str(product_name), UUID(variant_id)
+    except (binascii.Error, ValueError, TypeError, InvalidOperation):
+        raise ValidationError("Invalid search cursor", field="cursor") from None
+
+
+async def _expand_categories(session: AsyncSession, filters: SearchFiltersDCO) -> SearchFiltersDCO:
+    """A category filter includes its subcategories."""
+    if not filters.category_ids:
+        return filters
+    tree = await get_category_tree(session)
+    subtree = {d for category_id in filters.category_ids for d in tree.descendant_ids(category_id)}
+    return filters.model_copy(update={"category_ids": sorted(subtree | set(filters.category_ids))})
+
+
+def _filter_clauses(filters: SearchFiltersDCO, params: dict) -> dict[str, str]:
+    """One condition per filtered facet (alias `d`), keyed by facet."""
+    clauses = {}
+    for kind, keys in filters.facet_keys().items():
+        clauses[kind] = f"d.facet_keys && CAST(:f_{kind} AS text[])"
+        params[f"f_{kind}"] = keys
+    return clauses
+
+
+async def search(
+    session: AsyncSession,
+    q: Optional[str],
+    filters: SearchFiltersDCO,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    with_facets: bool = True,
+    dealer_id: Optional[UUID] = None,
+) -> SearchResultDTO:
+    """Ranked variant search; without a query, browse alphabetically with the same filters.
+
+    A category filter includes its subcategories. Facet counts cover the
+    whole result set, each facet ignoring its own filter, and come with the
+    first page only (`cursor` unset). With `dealer_id` the page carries that
+    dealer's tier prices, resolved with one extra query.
+    """
+    terms = _terms(q)
+    filters = await _expand_categories(session, filters)
+    params: dict = {}
+    clauses = _filter_clauses(filters, params)
+    where = " ".join(f"AND {clause}" for clause in clauses.values())
+
+    if terms:
+        params["tsquery"] = " & ".join(f"{t}:*" for t in terms)
+        params["term"] = " ".join(terms)
+        score = """round((
+            ts_rank('{0.1, 0.2, 0.4, 1.0}', d.document, to_tsquery('simple', :tsquery))
+            + 0.5 * word_similarity(:term, d.search_text)
+            + CASE WHEN lower(d.sku) = :term THEN 2 ELSE 0 END
+        )::numeric, 6)"""
+        matches = "(d.document @@ to_tsquery('simple', :tsquery) OR :term <% d.search_text)"
+    else:
+        score = "0::numeric"
+        matches = "true"
+    where = f"{matches} {where}"
+
+    facets = None
+    if with_facets and not cursor:
+        facets = await count_facets(
+            session, matches, clauses, dict(params), cacheable=not terms and not params
+        )
+
+    after = ""
+    if cursor:
+        params["c_score"], params["c_name"], params["c_id"] = decode_cursor(cursor)
+        after = """WHERE h.score < CAST(:c_score AS numeric)
+           OR (h.score = CAST(:c_score AS numeric)
+               AND (h.product_name, h.variant_id) > (CAST(:c_name AS text), CAST(:c_id AS uuid)))"""
+
+    params["limit"] = limit + 1
+    order = (
+        "h.score DESC, h.product_name, h.variant_id" if terms else "h.product_name, h.variant_id"
+    )
+    statement = text(f"""
+WITH hits AS (
+    SELECT d.variant_id, d.product_id, d.sku, d.product_name, d.brand_name, {score} AS score
+    FROM product_search_documents AS d
+    WHERE {where}
+),
+page AS (
+    SELECT h.* FROM hits AS h
+    {after}
+    ORDER BY {order}
+    LIMIT :limit
+)
+SELECT h.*, v.price, v.currency, v.pack_size
+FROM page AS h
+JOIN product_variants AS v ON v.id = h.variant_id
+ORDER BY {order}
+""")
+
+    rows = (await session.execute(statement, params)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.score, last.product_name, last.variant_id)
+
+    items = [SearchHitDTO.model_validate(row) for row in rows]
+    if dealer_id is not None and items:
+        prices = await resolve_prices(
+            session, [item.variant_id for item in items], dealer_id=dealer_id
+        )
+        for item in items:
+            resolved = prices.get(item.variant_id)
+            if resolved is not None and resolved.unit_price() != item.price:
+                item.list_price, item.price = item.price, resolved.unit_price()
+
+    return SearchResultDTO(
+        items=items,
+        next_cursor=next_cursor,
+        facets=facets,
+    )
+
+
+def suggest(q: str, limit: int = 10) -> list[SuggestionDTO]:
+    """Typeahead from the in-process index (no database round trip)."""
+    return [
+        SuggestionDTO(kind=row.kind, id=row.id, label=row.label, product_id=row.product_id)
+        for row in get_suggest_index().suggest(q, limit)
+    ]
+
+
+def _evaluate(index: FacetBitmapIndex, expression: StandardExpressionDCO, depth: int = 0) -> int:
+    if depth > _MAX_EXPRESSION_DEPTH:
+        raise ValidationError(
+            f"Standards expressions nest at most {_MAX_EXPRESSION_DEPTH} levels", field="standards"
+        )
+
+    def operand(item) -> int:
+        if isinstance(item, StandardExpressionDCO):
+            return _evaluate(index, item, depth + 1)
+        return index.bits(f"standard:{item}")
+
+    bits = index.live
+    for item in expression.all_of:
+        bits &= operand(item)
+    if expression.any_of:
+        matched = 0
+        for item in expression.any_of:
+            matched |= operand(item)
+        bits &= matched
+    for item in expression.none_of:
+        bits &= ~operand(item)
+    return bits
+
+
+async def match_standards(session: AsyncSession, data: ComplianceQueryDCO) -> ComplianceResultDTO:
+    """Searchable variants whose standards satisfy the expression, within the optional filters.
+
+    Pages follow the index's ordinal order (roughly by product name); a
+    cursor may skip or repeat variants if the index is rebuilt in between.
+    """
+    index = get_bitmap_index()
+    if not index.ready:
+        raise ServiceUnavailableError(
+            "Standards index is still loading", service_name="search_bitmap"
+        )
+
+    bits = _evaluate(index, data.standards)
+    filters = await _expand_categories(session, data.filters)
+    for keys in filters.facet_keys().values():
+        bits &= index.any_of(keys)
+    if data.variant_ids is not None:
+        bits &= index.variants_bits(data.variant_ids)
+
+    start = 0
+    if data.after is not None:
+        ordinal = index.ordinal(data.after)
+        if ordinal is None:
+            raise ValidationError(
+                "Cursor variant is no longer indexed; restart from the first page", field="after"
+            )
+        start = ordinal + 1
+
+    variant_ids = index.variant_ids(bits, start, data.limit + 1)
+    next_after = None
+    if len(variant_ids) > data.limit:
+        variant_ids = variant_ids[: data.limit]
+        next_after = variant_ids[-1]
+    return ComplianceResultDTO(
+        total=bits.bit_count(), variant_ids=variant_ids, next_after=next_after
+    )
@@ -0,0 +1,319 @@
+"""Typeahead suggestions from an in-process prefix index.
+
+Product names, SKUs and brand names of searchable variants (read from
+`product_search_documents`) are held in one sorted list of (key, entry)
+pairs; a prefix lookup is two bisects plus a scan of the matching slice (or,
+for very wide prefixes, a walk down the popularity order), ranked by units
+ordered over SEARCH_SUGGEST_POPULARITY_DAYS.
+Every word start of a name is a key, so "edge" finds "Castrol EDGE 5W-30".
+Results per prefix are memoised until the next change.
+
+The index is rebuilt periodically (refreshing popularity) and patched per
+product/brand after every committed catalog write: locally, and in other
+workers through `search_changes`.
+"""
+
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.modules.search.search_changes import OwnerKey, on_change
+
+_MAX_WORD_STARTS = 4   # keys per label: the label from each of its first words
+_MAX_KEY_LENGTH = 48
+_MEMO_SIZE = 4096
+_WALK_FACTOR = 8       # cost of checking one entry's keys relative to ranking one key of a slice
+_KIND_ORDER = {"brand": 0, "product": 1, "sku": 2}
+
+EntryKey = tuple[str, UUID]   # (kind, id)
+
+
+@dataclass(frozen=True)
+class SuggestRow:
+    kind: str
+    id: UUID
+    label: str
+    product_id: Optional[UUID]
+    owner: OwnerKey
+    weight: int = 0
+
+
+def normalize(value: str) -> str:
+    return " ".join(value.lower().split())
+
+
+def _index_keys(label: str) -> set[str]:
+    words = normalize(label).split(" ")
+    return {" ".join(words[i:])[:_MAX_KEY_LENGTH] for i in range(min(len(words), _MAX_WORD_STARTS))}
+
+
+class SuggestIndex:
+    """Sorted (key, slot) arrays plus entries in popularity order.
+
+    A narrow prefix scans its slice of keys; a wide one (thousands of keys,
+    e.g. one letter) instead walks entries from the most popular down and
+    stops after `limit` matches, so neither case depends on catalog size.
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._keys: list[str] = []          # sorted; parallel to _key_slots
+        self._key_slots: list[int] = []
+        self._rows: list[SuggestRow | None] = []
+        self._entry_keys: list[tuple[str, ...]] = []
+        self._free: list[int] = []          # slots emptied by replace, reused first
+        self._slot_of: dict[EntryKey, int] = {}
+        self._owned: dict[OwnerKey, set[int]] = {}
+        self._order: list[tuple] = []       # (rank key..., slot), most popular first
+        self._memo: OrderedDict[tuple[str, int], list[SuggestRow]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    @property
+    def key_count(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _rank(row: SuggestRow, slot: int) -> tuple:
+        return (-row.weight, _KIND_ORDER[row.kind], len(row.label), row.label, slot)
+
+    def build(self, rows: Iterable[SuggestRow]) -> None:
+        """Replace the whole index, keeping the `max_entries` most popular rows."""
+        unique = {(row.kind, row.id): row for row in rows}
+        ranked = sorted(unique.values(), key=lambda r: self._rank(r, 0))[: self._max_entries]
+        pairs: list[tuple[str, int]] = []
+        entry_keys, owned = [], {}
+        for slot, row in enumerate(ranked):
+            keys = tuple(_index_keys(row.label))
+            entry_keys.append(keys)
+            owned.setdefault(row.owner, set()).add(slot)
+            pairs.extend((key, slot) for key in keys)
+        pairs.sort()
+
+        self._keys = [key for key, _ in pairs]
+        self._key_slots = [slot for _, slot in pairs]
+        self._rows = ranked
+        self._entry_keys = entry_keys
+        self._slot_of = {(row.kind, row.id): slot for slot, row in enumerate(ranked)}
+        self._owned = owned
+        self._order = [self._rank(row, slot) for slot, row in enumerate(ranked)]
+        self._free = []
+        self._memo.clear()
+
+    def _key_position(self, key: str, slot: int) -> int:
+        position = bisect_left(self._keys, key)
+        while (
+            position < len(self._keys)
+            and self._keys[position] == key
+            and self._key_slots[position] < slot
+        ):
+            position += 1
+        return position
+
+    def replace(self, owners: Iterable[OwnerKey], rows: Iterable[SuggestRow]) -> None:
+        """Swap every entry of `owners` for `rows`; surviving entries keep their popularity.
+
+        Past `max_entries` the least popular entries are evicted, as `build`
+        would have left them out.
+        """
+        previous: dict[EntryKey, int] = {}
+        for owner in owners:
+            for slot in self._owned.pop(owner, ()):
+                row = self._rows[slot]
+                previous[(row.kind, row.id)] = row.weight
+                self._remove(slot)
+
+        for row in rows:
+            entry = (row.kind, row.id)
+            if entry in self._slot_of:
+                continue
+            if entry in previous:
+                row = SuggestRow(
+                    row.kind, row.id, row.label, row.product_id, row.owner, previous[entry]
+                )
+            self._insert(row)
+        while len(self._slot_of) > self._max_entries:
+            self._remove(self._order[-1][-1])
+        self._memo.clear()
+
+    def _insert(self, row: SuggestRow) -> None:
+        keys = tuple(_index_keys(row.label))
+        if self._free:
+            slot = self._free.pop()
+            self._rows[slot] = row
+            self._entry_keys[slot] = keys
+        else:
+            slot = len(self._rows)
+            self._rows.append(row)
+            self._entry_keys.append(keys)
+        self._slot_of[(row.kind, row.id)] = slot
+        self._owned.setdefault(row.owner, set()).add(slot)
+        for key in keys:
+            position = self._key_position(key, slot)
+            self._keys.insert(position, key)
+            self._key_slots.insert(position, slot)
+        insort(self._order, self._rank(row, slot))
+
+    def _remove(self, slot: int) -> None:
+        row = self._rows[slot]
+        del self._slot_of[(row.kind, row.id)]
+        owned = self._owned.get(row.owner)
+        if owned is not None:
+            owned.discard(slot)
+            if not owned:
+                del self._owned[row.owner]
+        for key in self._entry_keys[slot]:
+            position = self._key_position(key, slot)
+            del self._keys[position], self._key_slots[position]
+        del self._order[bisect_left(self._order, self._rank(row, slot))]
+        self._rows[slot] = None
+        self._entry_keys[slot] = ()
+        self._free.append(slot)
+
+    def suggest(self, prefix: str, limit: int) -> list[SuggestRow]:
+        prefix = normalize(prefix)[:_MAX_KEY_LENGTH]
+        if not prefix:
+            return []
+        memo_key = (prefix, limit)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            self._memo.move_to_end(memo_key)
+            return cached
+
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + "\uffff", lo)
+        # Scanning the slice costs ~(hi - lo); walking ~limit * entries / (hi - lo) key checks
+        if (hi - lo) ** 2 <= _WALK_FACTOR * limit * len(self._order):
+            slots = set(self._key_slots[lo:hi])
+            ranked = [self._rows[slot] for slot in nsmallest(limit, slots, key=self._order_key)]
+        else:
+            ranked = []
+            for rank in self._order:
+                slot = rank[-1]
+                if any(key.startswith(prefix) for key in self._entry_keys[slot]):
+                    ranked.append(self._rows[slot])
+                    if len(ranked) == limit:
+                        break
+
+        self._memo[memo_key] = ranked
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return ranked
+
+    def _order_key(self, slot: int) -> tuple:
+        return self._rank(self._rows[slot], slot)
+
+
+_index: SuggestIndex | None = None
+
+
+def get_suggest_index() -> SuggestIndex:
+    global _index
+    if _index is None:
+        _index = SuggestIndex(settings.search_suggest_max_entries)
+    return _index
+
+
+# ── Loading ──────────────────────────────────────────────────
+
+_PRODUCT_ROWS_SQL = text("""
+SELECT 'sku' AS kind, d.variant_id AS id, d.sku AS label, d.product_id,
+       'product' AS owner_kind, d.product_id AS owner_id
+FROM product_search_documents AS d
+WHERE d.product_id = ANY(CAST(:product_ids AS uuid[]))
+UNION ALL
+SELECT DISTINCT 'product', d.product_id, d.product_name, d.product_id, 'product', d.product_id
+FROM product_search_documents AS d
+WHERE d.product_id = ANY(CAST(:product_ids AS uuid[]))
+""")
+
+_BRAND_ROWS_SQL = text("""
+SELECT DISTINCT 'brand' AS kind, d.brand_id AS id, d.brand_name AS label, NULL::uuid AS product_id,
+       'brand' AS owner_kind, d.brand_id AS owner_id
+FROM product_search_documents AS d
+WHERE d.brand_id = ANY(CAST(:brand_ids AS uuid[]))
+""")
+
+# Units per variant; products and brands add up their variants
+_ALL_ROWS_SQL = text("""
+WITH sales AS (
+    SELECT oi.variant_id, sum(oi.quantity) AS units
+    FROM order_items AS oi
+    JOIN orders AS o ON o.id = oi.order_id
+    WHERE o.created_at >= now() - make_interval(days => :days) AND o.status <> 'CANCELLED'
+    GROUP BY oi.variant_id
+),
+docs AS (
+    SELECT d.*, COALESCE(s.units, 0) AS units
+    FROM product_search_documents AS d
+    LEFT JOIN sales AS s ON s.variant_id = d.variant_id
+)
+SELECT 'sku' AS kind, variant_id AS id, sku AS label, product_id,
+       'product' AS owner_kind, product_id AS owner_id, units AS weight
+FROM docs
+UNION ALL
+SELECT 'product', product_id, min(product_name), product_id, 'product', product_id, sum(units)
+FROM docs GROUP BY product_id
+UNION ALL
+SELECT 'brand', brand_id, min(brand_name), NULL::uuid, 'brand', brand_id, sum(units)
+FROM docs GROUP BY brand_id
+""")
+
+
+def _to_rows(result) -> list[SuggestRow]:
+    return [
+        SuggestRow(
+            row.kind,
+            row.id,
+            row.label,
+            row.product_id,
+            (row.owner_kind, row.owner_id),
+            int(getattr(row, "weight", 0) or 0),
+        )
+        for row in result.all()
+    ]
+
+
+async def rebuild_suggest_index() -> int:
+    """Reload every entry and its popularity (startup and periodic job)."""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            _ALL_ROWS_SQL, {"days": settings.search_suggest_popularity_days}
+        )
+        rows = _to_rows(result)
+    index = get_suggest_index()
+    index.build(rows)
+    logger.info("Suggest index rebuilt | entries={} keys={}", len(index), index.key_count)
+    return len(index)
+
+
+async def refresh_owners(owners: set[OwnerKey]) -> None:
+    """Re-read the entries of changed products/brands and patch them in."""
+    product_ids = [i for kind, i in owners if kind == "product"]
+    brand_ids = [i for kind, i in owners if kind == "brand"]
+    rows: list[SuggestRow] = []
+    async with AsyncSessionLocal() as session:
+        if product_ids:
+            rows += _to_rows(await session.execute(_PRODUCT_ROWS_SQL, {"product_ids": product_ids}))
+        if brand_ids:
+            rows += _to_rows(await session.execute(_BRAND_ROWS_SQL, {"brand_ids": brand_ids}))
+    get_suggest_index().replace(owners, rows)
+
+
+@on_change
+async def _on_catalog_change(owners: Optional[set[OwnerKey]]) -> None:
+    if _index is None:
+        return
+    if owners is None:
+        await rebuild_suggest_index()
+    else:
+        await refresh_owners(owners)
@@ -0,0 +1 @@
+from .shipping_quote_cache import ShippingQuoteCache, get_shipping_quote_cache
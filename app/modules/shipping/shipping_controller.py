@@ -0,0 +1,17 @@
+"""Controller layer for the `shipping` module."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.shipping import shipping_service as service
+from app.modules.shipping.shipping_dco import ShippingQuoteBatchDCO, ShippingQuoteRequestDCO
+from app.modules.shipping.shipping_dto import ShippingQuoteDTO, ShippingQuoteResultDTO
+
+
+async def get_quote(session: AsyncSession, data: ShippingQuoteRequestDCO) -> ShippingQuoteDTO:
+    return await service.get_quote(session, data)
+
+
+async def get_quotes(
+    session: AsyncSession, data: ShippingQuoteBatchDCO
+) -> list[ShippingQuoteResultDTO]:
+    return await service.get_quotes(session, data.requests)
@@ -0,0 +1,14 @@
+"""DCO for the shipping module — quote requests."""
+
+from pydantic import Field
+
+from app.common.schemas.base import BaseSchema
+
+class ShippingQuoteRequestDCO(BaseSchema):
+    warehouse_code: str = Field(..., min_length=1, max_length=50)
+    destination_postal_code: str = Field(..., min_length=3, max_length=10)
+    weight_kg: float = Field(..., gt=0, le=1000)
+    service_level: str = Field(default="GROUND", min_length=1, max_length=30)
+
+class ShippingQuoteBatchDCO(BaseSchema):
+    requests: list[ShippingQuoteRequestDCO] = Field(..., min_length=1, max_length=200)
@@ -0,0 +1,26 @@
+"""DTO for the shipping module — quote responses."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from app.common.schemas.base import BaseSchema
+
+class ShippingQuoteDTO(BaseSchema):
+
+    warehouse_code: str
+    destination_fsa: str
+    weight_band_kg: float
+    service_level: str
+    amount: Decimal
+    currency: str
+    transit_days: Optional[int] = None
+    quoted_at: datetime
+    stale: bool = False
+
+class ShippingQuoteResultDTO(BaseSchema):
+    """One entry of a batch response; exactly one of `quote` / `error` is set."""
+
+    destination_postal_code: str
+    quote: Optional[ShippingQuoteDTO] = None
+    error: Optional[str] = None
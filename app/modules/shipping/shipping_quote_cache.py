@@ -0,0 +1,301 @@
+"""Shipping-rate quote cache.
+
+Carrier prices barely move for the same origin, destination FSA (first three
+characters of a Canadian postal code) and weight bracket, so quotes are cached
+on the normalized key (warehouse code, FSA, weight band, service level).
+
+- One carrier call returns every service level for a lane, so entries are
+  stored per lane (warehouse, FSA, band) and read by service level.
+- Fresh for SHIPPING_QUOTE_TTL_SECONDS; after that the entry is still served
+  for up to SHIPPING_QUOTE_STALE_SECONDS while one background task refreshes it.
+- Concurrent misses for the same lane share a single upstream call.
+- In-process LRU in front of an optional Redis layer shared across workers.
+"""
+
+import asyncio
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Mapping
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from app.common.services.http_client import ShippingClient
+from app.core.config import settings
+from app.core.exceptions import ExternalServiceError, ValidationError
+from app.core.redis_client import get_redis
+
+# Canadian FSA: letter (no D, F, I, O, Q, U, W, Z), digit, letter
+_FSA_PATTERN = re.compile(r"^[ABCEGHJ-NPRSTVXY]\d[A-Z]")
+_REDIS_KEY = "shipping:quote:{}:{}:{}"
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared fetch whose leader was cancelled; followers take over."""
+
+
+def normalize_postal_code(postal_code: str) -> str:
+    return postal_code.replace(" ", "").replace("-", "").upper()
+
+
+def destination_fsa(postal_code: str) -> str:
+    """Forward sortation area of a Canadian postal code (e.g. 'B3H 4R2' → 'B3H')."""
+    compact = normalize_postal_code(postal_code)
+    if not _FSA_PATTERN.match(compact):
+        raise ValidationError("Invalid Canadian postal code", field="postalCode", value=postal_code)
+    return compact[:3]
+
+
+def weight_band(weight_kg: float) -> float:
+    """Upper bound of the bracket containing `weight_kg`.
+
+    The carrier is quoted at the band's upper bound, so a cached price never
+    under-charges a heavier parcel in the same band.
+    """
+    if weight_kg <= 0:
+        raise ValidationError("Weight must be positive", field="weightKg", value=weight_kg)
+    bands = sorted(settings.shipping_weight_bands_kg)
+    for band in bands:
+        if weight_kg <= band:
+            return float(band)
+    return float(math.ceil(weight_kg / 10) * 10)
+
+
+@dataclass(frozen=True)
+class LaneKey:
+    warehouse_code: str
+    fsa: str
+    weight_band_kg: float
+
+
+@dataclass(frozen=True)
+class ServiceRate:
+    amount: Decimal
+    days: int | None
+
+
+@dataclass(frozen=True)
+class RateCard:
+    rates: Mapping[str, ServiceRate]
+    currency: str
+    fetched_at: float
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "currency": self.currency,
+            "fetched_at": self.fetched_at,
+            "rates": {s: {"amount": str(r.amount), "days": r.days} for s, r in self.rates.items()},
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "RateCard":
+        data = json.loads(raw)
+        return cls(
+            rates={
+                s: ServiceRate(Decimal(r["amount"]), r.get("days"))
+                for s, r in data["rates"].items()
+            },
+            currency=data["currency"],
+            fetched_at=data["fetched_at"],
+        )
+
+    @classmethod
+    def from_provider(cls, payload: dict) -> "RateCard":
+        return cls(
+            rates={
+                str(r["service"]).upper(): ServiceRate(Decimal(str(r["amount"])), r.get("days"))
+                for r in payload.get("rates", [])
+            },
+            currency=payload.get("currency", "CAD"),
+            fetched_at=time.time(),
+        )
+
+
+@dataclass(frozen=True)
+class Quote:
+    lane: LaneKey
+    service_level: str
+    rate: ServiceRate
+    currency: str
+    fetched_at: float
+    stale: bool
+
+
+class ShippingQuoteCache:
+    """Lane-level rate-card cache with stale-while-revalidate and single-flight."""
+
+    def __init__(self, client: ShippingClient | None = None):
+        self._client = client
+        self._entries: OrderedDict[LaneKey, RateCard] = OrderedDict()
+        self._inflight: dict[LaneKey, asyncio.Future] = {}
+        self._background: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @property
+    def client(self) -> ShippingClient:
+        if self._client is None:
+            self._client = ShippingClient()
+        return self._client
+
+    async def quote(
+        self,
+        warehouse_code: str,
+        origin_postal_code: str,
+        destination_postal_code: str,
+        weight_kg: float,
+        service_level: str,
+    ) -> Quote:
+        lane = LaneKey(
+            warehouse_code, destination_fsa(destination_postal_code), weight_band(weight_kg)
+        )
+        service_level = service_level.upper()
+
+        card = self._entries.get(lane)
+        if card is None:
+            card = await self._read_shared(lane)
+
+        if card is not None and card.age() < settings.shipping_quote_stale_seconds:
+            self._entries.move_to_end(lane)
+            stale = card.age() >= settings.shipping_quote_ttl_seconds
+            if stale:
+                self.stale_hits += 1
+                self._refresh_in_background(lane, origin_postal_code, destination_postal_code)
+            else:
+                self.hits += 1
+        else:
+            self.misses += 1
+            card = await self._load(lane, origin_postal_code, destination_postal_code)
+            stale = False
+
+        rate = card.rates.get(service_level)
+        if rate is None:
+            raise ValidationError(
+                f"Service level {service_level} not offered for this lane",
+                field="serviceLevel",
+                value=service_level,
+            )
+        return Quote(lane, service_level, rate, card.currency, card.fetched_at, stale)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "staleHits": self.stale_hits,
+            "misses": self.misses,
+            "inflight": len(self._inflight),
+        }
+
+    # ── Internals ───────────────────────────────────────────
+
+    async def _load(self, lane: LaneKey, origin: str, destination: str) -> RateCard:
+        """Fetch a lane, joining an in-flight fetch for the same lane if there is one."""
+        while (pending := self._inflight.get(lane)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except _LeaderCancelled:
+                # The leader's caller went away, not ours: the next follower fetches
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[lane] = future
+        try:
+            payload = await self.client.get_shipping_rates(
+                normalize_postal_code(origin),
+                normalize_postal_code(destination),
+                lane.weight_band_kg,
+            )
+            card = RateCard.from_provider(payload)
+            self._store(lane, card)
+            await self._write_shared(lane, card)
+            future.set_result(card)
+            return card
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel every follower with it
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when no one else was waiting
+            raise
+        finally:
+            # Always clear our marker, or every later miss would wait on a dead future
+            if self._inflight.get(lane) is future:
+                del self._inflight[lane]
+
+    def _refresh_in_background(self, lane: LaneKey, origin: str, destination: str) -> None:
+        if lane in self._inflight:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._load(lane, origin, destination)
+            except ExternalServiceError as exc:
+                logger.warning(
+                    "Shipping quote refresh failed | lane={} error={}", lane, exc.message
+                )
+            except Exception:
+                # A malformed provider payload, a bug: the stale card keeps serving
+                logger.exception("Shipping quote refresh crashed | lane={}", lane)
+
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _store(self, lane: LaneKey, card: RateCard) -> None:
+        self._entries[lane] = card
+        self._entries.move_to_end(lane)
+        while len(self._entries) > settings.shipping_quote_cache_max_entries:
+            self._entries.popitem(last=False)
+
+    async def _read_shared(self, lane: LaneKey) -> RateCard | None:
+        redis = get_redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(
+                _REDIS_KEY.format(lane.warehouse_code, lane.fsa, lane.weight_band_kg)
+            )
+        except RedisError as exc:
+            logger.warning("Shipping quote cache read failed | error={}", str(exc))
+            return None
+        if raw is None:
+            return None
+        card = RateCard.from_json(raw)
+        self._store(lane, card)
+        return card
+
+    async def _write_shared(self, lane: LaneKey, card: RateCard) -> None:
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                _REDIS_KEY.format(lane.warehouse_code, lane.fsa, lane.weight_band_kg),
+                card.to_json(),
+                ex=settings.shipping_quote_stale_seconds,
+            )
+        except RedisError as exc:
+            logger.warning("Shipping quote cache write failed | error={}", str(exc))
+
+
+_cache: ShippingQuoteCache | None = None
+
+
+def get_shipping_quote_cache() -> ShippingQuoteCache:
+    """Return the process-wide quote cache."""
+    global _cache
+
+    if _cache is None:
+        _cache = ShippingQuoteCache()
+    return _cache
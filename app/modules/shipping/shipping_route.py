@@ -0,0 +1,47 @@
+"""Routes for the `shipping` module."""
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.shipping import shipping_controller as controller
+from app.modules.shipping.shipping_dco import ShippingQuoteBatchDCO, ShippingQuoteRequestDCO
+
+router = APIRouter()
+
+
+@router.get("/quote")
+@limiter.limit(RateLimits.PUBLIC)
+async def get_shipping_quote(
+    request: Request,
+    warehouse_code: str = Query(..., alias="warehouseCode"),
+    destination_postal_code: str = Query(..., alias="postalCode"),
+    weight_kg: float = Query(..., alias="weightKg", gt=0, le=1000),
+    service_level: str = Query(default="GROUND", alias="serviceLevel"),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Quote one destination (served from the lane cache when warm)."""
+    quote = await controller.get_quote(
+        db,
+        ShippingQuoteRequestDCO(
+            warehouse_code=warehouse_code,
+            destination_postal_code=destination_postal_code,
+            weight_kg=weight_kg,
+            service_level=service_level,
+        ),
+    )
+    return respond(data=quote, message="Shipping quote fetched")
+
+
+@router.post("/quotes")
+@limiter.limit(RateLimits.API_READ)
+async def get_shipping_quotes(
+    request: Request,
+    body: ShippingQuoteBatchDCO,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Quote many destinations at once; per-entry errors do not fail the batch."""
+    quotes = await controller.get_quotes(db, body)
+    return respond(data=quotes, message="Shipping quotes fetched")
@@ -0,0 +1,104 @@
+"""Service layer for the `shipping` module."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BusinessRuleError, EcommerceException, NotFoundError
+from app.modules.shipping.shipping_dco import ShippingQuoteRequestDCO
+from app.modules.shipping.shipping_dto import ShippingQuoteDTO, ShippingQuoteResultDTO
+from app.modules.shipping.shipping_quote_cache import Quote, get_shipping_quote_cache
+from app.modules.warehouses.warehouses_entity import Warehouse
+
+# Warehouse origins change rarely; keep lookups off the quote hot path
+_ORIGIN_TTL_SECONDS = 300
+_origins: dict[str, tuple[str | None, float]] = {}
+
+
+async def _resolve_origins(session: AsyncSession, codes: set[str]) -> dict[str, str | None]:
+    """Map warehouse codes to origin postal codes (one query for all misses).
+
+    Unknown codes are left out of the result.
+    """
+    now = time.monotonic()
+    missing = {c for c in codes if c not in _origins or _origins[c][1] <= now}
+    if missing:
+        result = await session.execute(
+            select(Warehouse.code, Warehouse.postal_code).where(Warehouse.code.in_(missing))
+        )
+        for code, postal_code in result.all():
+            _origins[code] = (postal_code, now + _ORIGIN_TTL_SECONDS)
+
+    return {code: _origins[code][0] for code in codes if code in _origins}
+
+
+def _origin_for(origins: dict[str, str | None], warehouse_code: str) -> str:
+    if warehouse_code not in origins:
+        raise NotFoundError("warehouse", warehouse_code)
+    postal_code = origins[warehouse_code]
+    if not postal_code:
+        raise BusinessRuleError(
+            f"Warehouse {warehouse_code} has no origin postal code",
+            rule_name="warehouse_origin_required",
+        )
+    return postal_code
+
+
+def _to_dto(quote: Quote) -> ShippingQuoteDTO:
+    return ShippingQuoteDTO(
+        warehouse_code=quote.lane.warehouse_code,
+        destination_fsa=quote.lane.fsa,
+        weight_band_kg=quote.lane.weight_band_kg,
+        service_level=quote.service_level,
+        amount=quote.rate.amount,
+        currency=quote.currency,
+        transit_days=quote.rate.days,
+        quoted_at=datetime.fromtimestamp(quote.fetched_at, tz=timezone.utc),
+        stale=quote.stale,
+    )
+
+
+async def get_quote(session: AsyncSession, data: ShippingQuoteRequestDCO) -> ShippingQuoteDTO:
+    """Quote one destination from the cache (carrier call only on a cold lane)."""
+    origins = await _resolve_origins(session, {data.warehouse_code})
+    quote = await get_shipping_quote_cache().quote(
+        data.warehouse_code,
+        _origin_for(origins, data.warehouse_code),
+        data.destination_postal_code,
+        data.weight_kg,
+        data.service_level,
+    )
+    return _to_dto(quote)
+
+
+async def get_quotes(
+    session: AsyncSession, requests: list[ShippingQuoteRequestDCO]
+) -> list[ShippingQuoteResultDTO]:
+    """Quote many destinations concurrently; failures are reported per entry.
+
+    Requests that normalize to the same lane share one carrier call.
+    """
+    origins = await _resolve_origins(session, {r.warehouse_code for r in requests})
+    cache = get_shipping_quote_cache()
+
+    async def one(request: ShippingQuoteRequestDCO) -> ShippingQuoteResultDTO:
+        try:
+            quote = await cache.quote(
+                request.warehouse_code,
+                _origin_for(origins, request.warehouse_code),
+                request.destination_postal_code,
+                request.weight_kg,
+                request.service_level,
+            )
+        except EcommerceException as exc:
+            return ShippingQuoteResultDTO(
+                destination_postal_code=request.destination_postal_code, error=exc.message
+            )
+        return ShippingQuoteResultDTO(
+            destination_postal_code=request.destination_postal_code, quote=_to_dto(quote)
+        )
+
+    return list(await asyncio.gather(*(one(r) for r in requests)))
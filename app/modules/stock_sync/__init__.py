@@ -0,0 +1 @@
+from .stock_sync_entity import StockSyncStaging
@@ -0,0 +1,12 @@
+"""Controller layer for the `stock_sync` module."""
+
+from typing import AsyncIterator
+
+from app.modules.stock_sync import stock_sync_service as service
+from app.modules.stock_sync.stock_sync_dto import StockSyncResultDTO
+
+
+async def sync_stock(
+    chunks: AsyncIterator[bytes], fmt: str, dry_run: bool, zero_missing: bool
+) -> StockSyncResultDTO:
+    return await service.sync_stock(chunks, fmt, dry_run, zero_missing)
@@ -0,0 +1,40 @@
+"""DTO for the stock_sync module — import results."""
+
+from uuid import UUID
+from typing import List
+
+from app.common.schemas.base import BaseSchema
+
+class StockSyncErrorsDTO(BaseSchema):
+    unknown_skus: List[str] = []
+    unknown_warehouses: List[str] = []
+    duplicates: List[str] = []            # "sku@warehouseCode"
+    invalid_quantity_lines: List[int] = []
+
+class StockSyncSummaryDTO(BaseSchema):
+    created: int
+    increased: int
+    decreased: int
+    unchanged: int
+    below_reserved: int
+    net_delta: int
+
+class StockSyncChangeDTO(BaseSchema):
+    sku: str
+    warehouse_code: str
+    current_quantity: int
+    new_quantity: int
+    delta: int
+
+class StockSyncResultDTO(BaseSchema):
+    sync_id: UUID
+    dry_run: bool
+    applied: bool
+    rows: int
+    zeroed: int
+    errors: StockSyncErrorsDTO
+    summary: StockSyncSummaryDTO
+    changes: List[StockSyncChangeDTO]   # largest deltas first, capped
+    movements_written: int
+    skipped_below_reserved: int = 0   # rows left unchanged: quantity below reserved stock
+    below_reserved: List[str] = []    # "sku@warehouseCode", capped
@@ -0,0 +1,24 @@
+"""SQLAlchemy entity for the `stock_sync_staging` table.
+
+Scratch space for bulk stock imports: rows are COPY'd in per sync run,
+resolved to ids, merged into `inventory` and deleted. UNLOGGED — no WAL, not
+crash-safe, which is fine for data that is re-imported on failure.
+"""
+
+from sqlalchemy import Column, Text, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class StockSyncStaging(Base):
+    __tablename__ = "stock_sync_staging"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    sync_id = Column(UUID(as_uuid=True), primary_key=True)
+    line_no = Column(Integer, primary_key=True)
+    sku = Column(Text, nullable=True)
+    warehouse_code = Column(Text, nullable=True)
+    quantity = Column(Integer, nullable=True)      # NULL when the file value did not parse
+    variant_id = Column(UUID(as_uuid=True), nullable=True)    # resolved from sku
+    warehouse_id = Column(UUID(as_uuid=True), nullable=True)  # resolved from warehouse_code
@@ -0,0 +1,48 @@
+"""Routes for the `stock_sync` module (admin only)."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from app.common.response import respond
+from app.core import require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.stock_sync import stock_sync_controller as controller
+
+router = APIRouter()
+
+_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/")
+@limiter.limit(RateLimits.ADMIN)
+async def sync_stock(
+    request: Request,
+    dry_run: bool = Query(True, alias="dryRun"),
+    zero_missing: bool = Query(False, alias="zeroMissing"),
+    fmt: Optional[str] = Query(
+        None, alias="format", description="csv | ndjson (default: from Content-Type)"
+    ),
+    admin: dict = Depends(require_admin),
+):
+    """Import a full stock file sent as the raw request body (streamed, not buffered).
+
+    CSV needs a header with sku, warehouse_code and quantity; NDJSON one
+    object per line with the same keys. Defaults to a dry run.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    result = await controller.sync_stock(
+        request.stream(), fmt or _CONTENT_TYPES.get(content_type, "csv"), dry_run, zero_missing
+    )
+    if result.dry_run:
+        message = "Stock sync dry run completed"
+    elif result.applied:
+        message = "Stock sync applied"
+    else:
+        message = "Stock sync rejected"
+    status_code = 422 if not result.dry_run and not result.applied else 200
+    return respond(data=result, message=message, status_code=status_code)
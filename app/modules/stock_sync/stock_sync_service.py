@@ -0,0 +1,374 @@
+"""Bulk stock sync from a warehouse-management export (CSV or NDJSON).
+
+Pipeline, for a file of (sku, warehouse code, quantity) rows:
+
+1. stream the request body through asyncpg `COPY` into `stock_sync_staging`
+   (binary protocol, no per-row round trips, nothing held in memory);
+2. resolve sku/code to ids with one hash join and validate (unknown sku or
+   warehouse, duplicates, bad quantities) — any error rejects the whole file;
+3. optionally stage zeros for stock in the file's warehouses that the file
+   no longer lists (`zero_missing`);
+4. dry run: report the diff; otherwise merge in chunks of
+   STOCK_SYNC_CHUNK_SIZE rows, one short transaction each, so row locks last
+   milliseconds. Each chunk sets the balances and writes the ADJUSTMENT
+   movements for the deltas in one statement. A row whose quantity is below
+   the stock reserved by open orders is skipped, not applied, and reported
+   (`skippedBelowReserved`, `belowReserved`).
+"""
+
+import uuid
+from typing import AsyncIterator
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.utils.tabular import FORMATS, iter_rows
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import ValidationError
+from app.modules.availability.availability_service import apply_deltas
+from app.modules.stock_sync.stock_sync_dto import (
+    StockSyncChangeDTO,
+    StockSyncErrorsDTO,
+    StockSyncResultDTO,
+    StockSyncSummaryDTO,
+)
+
+SYNC_REFERENCE = "STOCK_SYNC"
+
+_COLUMNS = ["sync_id", "line_no", "sku", "warehouse_code", "quantity", "variant_id", "warehouse_id"]
+_HEADER_ALIASES = {
+    "sku": "sku",
+    "warehousecode": "warehouse_code",
+    "warehouse": "warehouse_code",
+    "quantity": "quantity",
+    "qty": "quantity",
+}
+_REQUIRED = ("sku", "warehouse_code", "quantity")
+_SAMPLE = 20
+
+_RESOLVE_SQL = text("""
+UPDATE stock_sync_staging AS s
+SET variant_id = r.variant_id, warehouse_id = r.warehouse_id
+FROM (
+    SELECT s2.line_no, v.id AS variant_id, w.id AS warehouse_id
+    FROM stock_sync_staging AS s2
+    LEFT JOIN product_variants AS v ON v.sku = s2.sku
+    LEFT JOIN warehouses AS w ON w.code = s2.warehouse_code
+    WHERE s2.sync_id = :sync_id
+) AS r
+WHERE s.sync_id = :sync_id AND s.line_no = r.line_no
+""")
+
+_UNKNOWN_SKUS_SQL = text("""
+SELECT DISTINCT sku FROM stock_sync_staging
+WHERE sync_id = :sync_id AND variant_id IS NULL
+LIMIT :sample
+""")
+
+_UNKNOWN_WAREHOUSES_SQL = text("""
+SELECT DISTINCT warehouse_code FROM stock_sync_staging
+WHERE sync_id = :sync_id AND warehouse_id IS NULL
+LIMIT :sample
+""")
+
+_DUPLICATES_SQL = text("""
+SELECT sku, warehouse_code FROM stock_sync_staging
+WHERE sync_id = :sync_id
+GROUP BY sku, warehouse_code
+HAVING count(*) > 1
+LIMIT :sample
+""")
+
+_INVALID_QUANTITIES_SQL = text("""
+SELECT line_no FROM stock_sync_staging
+WHERE sync_id = :sync_id AND (quantity IS NULL OR quantity < 0)
+ORDER BY line_no
+LIMIT :sample
+""")
+
+_ZERO_MISSING_SQL = text("""
+INSERT INTO stock_sync_staging
+    (sync_id, line_no, sku, warehouse_code, quantity, variant_id, warehouse_id)
+SELECT :sync_id, :after + row_number() OVER (ORDER BY i.id),
+       v.sku, w.code, 0, i.variant_id, i.warehouse_id
+FROM inventory AS i
+JOIN product_variants AS v ON v.id = i.variant_id
+JOIN warehouses AS w ON w.id = i.warehouse_id
+WHERE i.stock_quantity <> 0
+  AND i.warehouse_id IN (
+      SELECT DISTINCT warehouse_id FROM stock_sync_staging WHERE sync_id = :sync_id
+  )
+  AND NOT EXISTS (
+      SELECT 1 FROM stock_sync_staging AS s
+      WHERE s.sync_id = :sync_id AND s.variant_id = i.variant_id AND s.warehouse_id = i.warehouse_id
+  )
+""")
+
+_DIFF_SUMMARY_SQL = text("""
+SELECT
+    count(*) FILTER (WHERE i.id IS NULL AND s.quantity <> 0) AS created,
+    count(*) FILTER (WHERE s.quantity > i.stock_quantity) AS increased,
+    count(*) FILTER (WHERE s.quantity < i.stock_quantity) AS decreased,
+    count(*) FILTER (WHERE s.quantity = COALESCE(i.stock_quantity, 0)) AS unchanged,
+    count(*) FILTER (WHERE s.quantity < COALESCE(i.reserved_quantity, 0)) AS below_reserved,
+    COALESCE(sum(s.quantity - COALESCE(i.stock_quantity, 0)), 0) AS net_delta
+FROM stock_sync_staging AS s
+LEFT JOIN inventory AS i ON i.variant_id = s.variant_id AND i.warehouse_id = s.warehouse_id
+WHERE s.sync_id = :sync_id
+""")
+
+_DIFF_CHANGES_SQL = text("""
+SELECT s.sku, s.warehouse_code, COALESCE(i.stock_quantity, 0) AS current_quantity,
+       s.quantity AS new_quantity, s.quantity - COALESCE(i.stock_quantity, 0) AS delta
+FROM stock_sync_staging AS s
+LEFT JOIN inventory AS i ON i.variant_id = s.variant_id AND i.warehouse_id = s.warehouse_id
+WHERE s.sync_id = :sync_id AND s.quantity <> COALESCE(i.stock_quantity, 0)
+ORDER BY abs(s.quantity - COALESCE(i.stock_quantity, 0)) DESC, s.line_no
+LIMIT :limit
+""")
+
+_MERGE_CHUNK_SQL = text("""
+WITH batch AS (
+    SELECT sku, warehouse_code, variant_id, warehouse_id, quantity
+    FROM stock_sync_staging
+    WHERE sync_id = :sync_id AND line_no > :after AND line_no <= :upto
+),
+locked AS (
+    SELECT i.id, i.variant_id, i.warehouse_id, i.stock_quantity,
+           COALESCE(i.reserved_quantity, 0) AS reserved,
+           b.quantity AS target, b.sku, b.warehouse_code
+    FROM inventory AS i
+    JOIN batch AS b ON b.variant_id = i.variant_id AND b.warehouse_id = i.warehouse_id
+    WHERE i.stock_quantity <> b.quantity
+    ORDER BY i.id
+    FOR UPDATE OF i
+),
+-- Stock still reserved by open orders is never counted away: those rows are
+-- left as they are and reported back
+applicable AS (
+    SELECT * FROM locked WHERE target >= reserved
+),
+updated AS (
+    UPDATE inventory AS i
+    SET stock_quantity = l.target, updated_at = now()
+    FROM applicable AS l
+    WHERE i.id = l.id
+),
+created AS (
+    INSERT INTO inventory
+        (id, variant_id, warehouse_id, stock_quantity, reserved_quantity, updated_at)
+    SELECT gen_random_uuid(), b.variant_id, b.warehouse_id, b.quantity, 0, now()
+    FROM batch AS b
+    WHERE b.quantity <> 0
+      AND NOT EXISTS (
+          SELECT 1 FROM inventory AS i
+          WHERE i.variant_id = b.variant_id AND i.warehouse_id = b.warehouse_id
+      )
+    ON CONFLICT (variant_id, warehouse_id) DO NOTHING
+    RETURNING variant_id, warehouse_id, stock_quantity
+),
+changes AS (
+    SELECT variant_id, warehouse_id, target - stock_quantity AS delta FROM applicable
+    UNION ALL
+    SELECT variant_id, warehouse_id, stock_quantity FROM created
+),
+movements AS (
+    INSERT INTO inventory_movements
+        (id, variant_id, warehouse_id, movement_type, quantity,
+         reference_type, reference_id, created_at)
+    SELECT gen_random_uuid(), c.variant_id, c.warehouse_id, 'ADJUSTMENT', c.delta,
+           :reference_type, CAST(:sync_id AS uuid), now()
+    FROM changes AS c
+)
+SELECT variant_id, delta, NULL AS skipped FROM changes
+UNION ALL
+SELECT variant_id, 0, sku || '@' || warehouse_code FROM locked WHERE target < reserved
+""")
+
+_BELOW_RESERVED_SQL = text("""
+SELECT s.sku || '@' || s.warehouse_code
+FROM stock_sync_staging AS s
+JOIN inventory AS i ON i.variant_id = s.variant_id AND i.warehouse_id = s.warehouse_id
+WHERE s.sync_id = :sync_id AND s.quantity < COALESCE(i.reserved_quantity, 0)
+ORDER BY s.line_no
+LIMIT :sample
+""")
+
+_CLEANUP_SQL = text("DELETE FROM stock_sync_staging WHERE sync_id = :sync_id")
+
+
+# ── Parsing ──────────────────────────────────────────────────
+
+def _quantity(value) -> int | None:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+async def _records(sync_id: UUID, chunks: AsyncIterator[bytes], fmt: str, counter: list[int]):
+    """Yield COPY records; `counter[0]` ends as the number of data rows."""
+    line_no = 0
+    async for row in iter_rows(chunks, fmt, _HEADER_ALIASES, required=_REQUIRED):
+        line_no += 1
+        if line_no > settings.stock_sync_max_rows:
+            raise ValidationError(
+                f"Stock file exceeds {settings.stock_sync_max_rows} rows", field="file"
+            )
+        counter[0] = line_no
+        sku = str(row.get("sku") or "").strip() or None
+        code = str(row.get("warehouse_code") or "").strip() or None
+        yield (sync_id, line_no, sku, code, _quantity(row.get("quantity")), None, None)
+
+
+# ── Pipeline ─────────────────────────────────────────────────
+
+async def _stage(sync_id: UUID, chunks: AsyncIterator[bytes], fmt: str) -> int:
+    counter = [0]
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            connection = await session.connection()
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                "stock_sync_staging",
+                records=_records(sync_id, chunks, fmt, counter),
+                columns=_COLUMNS,
+            )
+            await session.execute(_RESOLVE_SQL, {"sync_id": sync_id})
+    return counter[0]
+
+
+async def _validate(session: AsyncSession, sync_id: UUID) -> StockSyncErrorsDTO:
+    params = {"sync_id": sync_id, "sample": _SAMPLE}
+    unknown_skus = (await session.execute(_UNKNOWN_SKUS_SQL, params)).scalars().all()
+    unknown_warehouses = (await session.execute(_UNKNOWN_WAREHOUSES_SQL, params)).scalars().all()
+    duplicates = (await session.execute(_DUPLICATES_SQL, params)).all()
+    invalid = (await session.execute(_INVALID_QUANTITIES_SQL, params)).scalars().all()
+    return StockSyncErrorsDTO(
+        unknown_skus=[s or "" for s in unknown_skus],
+        unknown_warehouses=[c or "" for c in unknown_warehouses],
+        duplicates=[f"{row.sku}@{row.warehouse_code}" for row in duplicates],
+        invalid_quantity_lines=list(invalid),
+    )
+
+
+def _has_errors(errors: StockSyncErrorsDTO) -> bool:
+    return bool(
+        errors.unknown_skus
+        or errors.unknown_warehouses
+        or errors.duplicates
+        or errors.invalid_quantity_lines
+    )
+
+
+async def _diff(
+    session: AsyncSession, sync_id: UUID
+) -> tuple[StockSyncSummaryDTO, list[StockSyncChangeDTO]]:
+    summary = (await session.execute(_DIFF_SUMMARY_SQL, {"sync_id": sync_id})).one()
+    changes = (
+        await session.execute(
+            _DIFF_CHANGES_SQL, {"sync_id": sync_id, "limit": settings.stock_sync_diff_limit}
+        )
+    ).all()
+    return (
+        StockSyncSummaryDTO.model_validate(summary),
+        [StockSyncChangeDTO.model_validate(row) for row in changes],
+    )
+
+
+async def _merge(sync_id: UUID, total_lines: int) -> tuple[int, int, list[str]]:
+    """Apply the staged rows chunk by chunk.
+
+    Returns the movements written, the number of rows skipped because their
+    quantity is below the reserved stock, and a sample of those rows.
+    """
+    written = skipped = 0
+    sample: list[str] = []
+    chunk = settings.stock_sync_chunk_size
+    for after in range(0, total_lines, chunk):
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                result = await session.execute(
+                    _MERGE_CHUNK_SQL,
+                    {
+                        "sync_id": sync_id,
+                        "after": after,
+                        "upto": after + chunk,
+                        "reference_type": SYNC_REFERENCE,
+                    },
+                )
+                rows = result.all()
+                changes = [row for row in rows if row.skipped is None]
+                await apply_deltas(session, [(row.variant_id, row.delta, 0) for row in changes])
+        written += len(changes)
+        for row in rows:
+            if row.skipped is not None:
+                skipped += 1
+                if len(sample) < _SAMPLE:
+                    sample.append(row.skipped)
+    return written, skipped, sample
+
+
+async def sync_stock(
+    chunks: AsyncIterator[bytes], fmt: str, dry_run: bool = True, zero_missing: bool = False
+) -> StockSyncResultDTO:
+    """Import a full stock file; dry runs only report what would change."""
+    if fmt not in FORMATS:
+        raise ValidationError(f"Unsupported format {fmt}", field="format", value=fmt)
+
+    sync_id = uuid.uuid4()
+    try:
+        rows = await _stage(sync_id, chunks, fmt)
+        total_lines = rows
+
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                errors = await _validate(session, sync_id)
+                if zero_missing and not _has_errors(errors):
+                    result = await session.execute(
+                        _ZERO_MISSING_SQL, {"sync_id": sync_id, "after": rows}
+                    )
+                    total_lines += result.rowcount
+                summary, changes = await _diff(session, sync_id)
+                below_reserved = (
+                    await session.execute(
+                        _BELOW_RESERVED_SQL, {"sync_id": sync_id, "sample": _SAMPLE}
+                    )
+                ).scalars().all()
+                skipped = summary.below_reserved
+
+        applied = not dry_run and not _has_errors(errors)
+        movements = 0
+        if applied:
+            movements, skipped, below_reserved = await _merge(sync_id, total_lines)
+    finally:
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(_CLEANUP_SQL, {"sync_id": sync_id})
+
+    logger.info(
+        "Stock sync finished | sync_id={} rows={} dry_run={} applied={} movements={} "
+        "skipped_below_reserved={}",
+        sync_id,
+        rows,
+        dry_run,
+        applied,
+        movements,
+        skipped,
+    )
+    return StockSyncResultDTO(
+        sync_id=sync_id,
+        dry_run=dry_run,
+        applied=applied,
+        rows=rows,
+        zeroed=total_lines - rows,
+        errors=errors,
+        summary=summary,
+        changes=changes,
+        movements_written=movements,
+        skipped_below_reserved=skipped,
+        below_reserved=list(below_reserved),
+    )
@@ -15,3 +15,4 @@ class TaxRuleDTO(BaseSchema):
     pst_rate: Optional[Decimal] = None
     hst_rate: Optional[Decimal] = None
     created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -19,3 +19,5 @@ class TaxRule(Base):
     pst_rate = Column(Numeric(5, 2), nullable=True)
     hst_rate = Column(Numeric(5, 2), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Part of the tax-table version
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -10,6 +10,7 @@ from sqlalchemy.sql import func
 from app.modules.tax_rules.tax_rules_entity import TaxRule
 from app.modules.tax_rules.tax_rules_dto import TaxRuleDTO
 from app.modules.tax_rules.tax_rules_dco import TaxRuleDCO, TaxRuleUpdateDCO
+from app.modules.tax_rules.tax_rules_table import mark_tax_rules_changed
 
 
 async def create(session: AsyncSession, data: TaxRuleDCO) -> TaxRuleDTO:
@@ -18,6 +19,7 @@ async def create(session: AsyncSession, data: TaxRuleDCO) -> TaxRuleDTO:
     session.add(entity_obj)
     await session.flush()
     await session.refresh(entity_obj)
+    mark_tax_rules_changed(session)
     return TaxRuleDTO.model_validate(entity_obj)
 
 
@@ -49,6 +51,7 @@ async def update(session: AsyncSession, record_id: UUID, data: TaxRuleUpdateDCO)
         setattr(entity_obj, key, value)
     await session.flush()
     await session.refresh(entity_obj)
+    mark_tax_rules_changed(session)
     return TaxRuleDTO.model_validate(entity_obj)
 
 
@@ -61,4 +64,5 @@ async def delete_record(session: AsyncSession, record_id: UUID) -> bool:
         return False
     await session.delete(entity_obj)
     await session.flush()
+    mark_tax_rules_changed(session)
     return True
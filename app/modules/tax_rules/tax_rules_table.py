@@ -0,0 +1,188 @@
+"""Process-wide, immutable snapshot of `tax_rules` plus batch tax computation.
+
+`tax_rules` is a handful of rows (one per province) read by every quote,
+checkout and invoice. The snapshot is a read-only mapping of frozen rate
+records keyed by upper-cased province; lookups do no I/O.
+
+Freshness: at most every TAX_TABLE_CHECK_SECONDS a one-row probe
+(count + latest created/updated timestamp) compares the table version with
+the snapshot's, and the table is reloaded only when it differs. Writes through
+`tax_rules_service` also invalidate the local snapshot once they commit
+(`mark_tax_rules_changed`), so a rolled-back write cannot be re-read early.
+
+Rates are percentages (5.00 = 5%). HST replaces GST+PST where set.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache_bus
+from app.core.config import settings
+from app.core.exceptions import BusinessRuleError
+from app.modules.tax_rules.tax_rules_entity import TaxRule
+
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal("100")
+_ZERO = Decimal("0.00")
+_CHANGED_KEY = "tax_rules_changed"
+
+
+def _money(value: Decimal) -> Decimal:
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class TaxRates:
+    province: str
+    gst_rate: Decimal
+    pst_rate: Decimal | None
+    hst_rate: Decimal | None
+
+
+@dataclass(frozen=True)
+class TaxBreakdown:
+    gst: Decimal
+    pst: Decimal
+    hst: Decimal
+
+    @property
+    def total(self) -> Decimal:
+        return self.gst + self.pst + self.hst
+
+
+def compute_tax(taxable: Decimal, rates: TaxRates) -> TaxBreakdown:
+    """Tax on one amount, each component rounded to the cent."""
+    if rates.hst_rate:
+        return TaxBreakdown(_ZERO, _ZERO, _money(taxable * rates.hst_rate / _HUNDRED))
+    return TaxBreakdown(
+        _money(taxable * rates.gst_rate / _HUNDRED),
+        _money(taxable * (rates.pst_rate or 0) / _HUNDRED),
+        _ZERO,
+    )
+
+
+@dataclass(frozen=True)
+class TaxTable:
+    rules: Mapping[str, TaxRates]
+    version: tuple
+
+    def rates_for(self, province: str) -> TaxRates:
+        rates = self.rules.get(province.strip().upper())
+        if rates is None:
+            raise BusinessRuleError(
+                f"No tax rule configured for province {province}", rule_name="tax_rule_required"
+            )
+        return rates
+
+
+# ── Batch computation ─────────────────────────────────────────
+
+@dataclass(frozen=True)
+class TaxableDocument:
+    """An order or invoice to tax: `lines` are (line key, taxable amount)."""
+
+    key: object
+    province: str
+    lines: tuple[tuple[object, Decimal], ...]
+
+
+@dataclass(frozen=True)
+class DocumentTax:
+    key: object
+    province: str
+    line_taxes: Mapping[object, TaxBreakdown]  # per line, rounded per line (display)
+    taxes: TaxBreakdown                        # on the document total, rounded once (charged)
+
+
+def compute_tax_breakdowns(
+    table: TaxTable, documents: Iterable[TaxableDocument]
+) -> list[DocumentTax]:
+    """Per-line and per-document GST/PST/HST for many documents in one pass.
+
+    The document-level figure is computed on the summed taxable amount, as
+    charged; per-line figures can differ from it by rounding cents. A
+    document in a province without a tax rule raises BusinessRuleError.
+    """
+    results = []
+    for document in documents:
+        rates = table.rates_for(document.province)
+        line_taxes = {key: compute_tax(amount, rates) for key, amount in document.lines}
+        taxable = sum((amount for _, amount in document.lines), _ZERO)
+        results.append(
+            DocumentTax(
+                document.key,
+                rates.province,
+                MappingProxyType(line_taxes),
+                compute_tax(taxable, rates),
+            )
+        )
+    return results
+
+
+# ── Snapshot ──────────────────────────────────────────────────
+
+_table: TaxTable | None = None
+_checked_at = 0.0
+_lock = asyncio.Lock()
+
+
+async def _table_version(session: AsyncSession) -> tuple:
+    result = await session.execute(
+        select(
+            func.count(TaxRule.id), func.max(func.coalesce(TaxRule.updated_at, TaxRule.created_at))
+        )
+    )
+    count, latest = result.one()
+    return (count, latest)
+
+
+async def _load(session: AsyncSession, version: tuple) -> TaxTable:
+    result = await session.execute(select(TaxRule))
+    rules = {
+        rule.province.strip().upper(): TaxRates(
+            rule.province, rule.gst_rate, rule.pst_rate, rule.hst_rate
+        )
+        for rule in result.scalars().all()
+    }
+    logger.info("Tax table loaded | provinces={}", len(rules))
+    return TaxTable(MappingProxyType(rules), version)
+
+
+async def get_tax_table(session: AsyncSession) -> TaxTable:
+    """Return the current snapshot, re-validating its version at most every N seconds."""
+    global _table, _checked_at
+
+    if _table is not None and time.monotonic() - _checked_at < settings.tax_table_check_seconds:
+        return _table
+
+    async with _lock:
+        if _table is not None and time.monotonic() - _checked_at < settings.tax_table_check_seconds:
+            return _table
+
+        version = await _table_version(session)
+        if _table is None or _table.version != version:
+            _table = await _load(session, version)
+        _checked_at = time.monotonic()
+        return _table
+
+
+def invalidate_tax_table() -> None:
+    """Force a version check on the next lookup (called after local writes)."""
+    global _checked_at
+    _checked_at = 0.0
+
+
+def mark_tax_rules_changed(session) -> None:
+    """Invalidate the local snapshot when `session` commits."""
+    session.info[_CHANGED_KEY] = True
+
+
+cache_bus.after_commit(_CHANGED_KEY, lambda _changed: invalidate_tax_table())
@@ -4,7 +4,18 @@ import uuid
 from uuid import uuid4
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, Text, String, Boolean, Integer, DateTime, Enum
+from sqlalchemy import (
+    Column,
+    Text,
+    String,
+    Boolean,
+    Integer,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -20,6 +31,17 @@ class RoleEnum(str, PyEnum):
 class User(Base):
     __tablename__ = "users"
 
+    __table_args__ = (
+        # Phone must be unique among live accounts; registration relies on this
+        # constraint instead of a pre-insert lookup.
+        Index(
+            "uq_users_phone_active",
+            "phone",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL AND phone IS NOT NULL"),
+        ),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     role = Column(Enum(RoleEnum), nullable=False)
     business_name = Column(Text, nullable=False)
@@ -29,14 +51,13 @@ class User(Base):
     contact_name = Column(Text, nullable=True)
     phone = Column(Text, nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
+    # Dealer pricing; NULL pays list price (see app.modules.price_tiers)
+    price_tier_id = Column(UUID(as_uuid=True), ForeignKey("price_tiers.id"), nullable=True)
     last_login_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Internal auth field (not in DBML, required by auth module for JWT rotation)
-    current_refresh_jti = Column(Text, nullable=True)
-
     # Relationships
     dealer_addresses = relationship("DealerAddress", back_populates="dealer")
     orders = relationship("Order", back_populates="dealer")
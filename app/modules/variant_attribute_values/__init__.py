@@ -0,0 +1,2 @@
+from .variant_attribute_values_entity import VariantAttributeValue
+from .variant_attribute_values_service import refresh_values
@@ -0,0 +1,59 @@
+"""Parsing and unit normalisation for attribute values.
+
+Numbers are converted to one canonical unit per dimension (litres,
+kilograms, cSt, ...) so "500 mL" and "0.5 L" compare equal. A value without a
+unit takes the attribute's own `unit`; units not listed here are kept as
+written (lower-cased) and only compare with themselves.
+"""
+
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+
+# alias -> (canonical unit, factor to canonical)
+_UNITS: dict[str, tuple[str, Decimal]] = {}
+
+for _canonical, _factor, _aliases in (
+    ("L", "1", ("l", "lt", "ltr", "litre", "litres", "liter", "liters")),
+    ("L", "0.001", ("ml", "millilitre", "millilitres", "milliliter", "milliliters")),
+    ("L", "3.785411784", ("gal", "gallon", "gallons", "usgal")),
+    ("L", "0.946352946", ("qt", "quart", "quarts")),
+    ("kg", "1", ("kg", "kgs", "kilogram", "kilograms")),
+    ("kg", "0.001", ("g", "gram", "grams")),
+    ("kg", "0.45359237", ("lb", "lbs", "pound", "pounds")),
+    ("cSt", "1", ("cst", "mm2/s", "mm²/s")),
+    ("%", "1", ("%", "percent")),
+):
+    for _alias in _aliases:
+        _UNITS[_alias] = (_canonical, Decimal(_factor))
+
+_SCALE = Decimal("0.000001")  # matches variant_attribute_values.value_number
+
+_NUMBER = re.compile(r"^\s*([-+]?\d+(?:[.,]\d+)?)\s*([A-Za-z%²][\w%²/.]*)?\s*$")
+
+
+def normalize_text(value: str) -> str:
+    return " ".join(value.lower().split())
+
+
+def canonical_unit(unit: Optional[str]) -> tuple[Optional[str], Decimal]:
+    """(canonical unit, factor) for a unit as written; unknown units map to themselves."""
+    if not unit or not unit.strip():
+        return None, Decimal(1)
+    key = normalize_text(unit)
+    return _UNITS.get(key, (key, Decimal(1)))
+
+
+def parse_number(
+    value: str, default_unit: Optional[str] = None
+) -> Optional[tuple[Decimal, Optional[str]]]:
+    """'5 L', '500ml', '4,5' -> (amount in canonical unit, canonical unit); None if not a number."""
+    match = _NUMBER.match(str(value))
+    if not match:
+        return None
+    try:
+        amount = Decimal(match.group(1).replace(",", "."))
+    except InvalidOperation:
+        return None
+    unit, factor = canonical_unit(match.group(2) or default_unit)
+    return (amount * factor).quantize(_SCALE), unit
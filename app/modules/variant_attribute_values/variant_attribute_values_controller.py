@@ -0,0 +1,19 @@
+"""Controller layer for the `variant_attribute_values` module."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.variant_attribute_values import variant_attribute_values_service as service
+from app.modules.variant_attribute_values.variant_attribute_values_dco import AttributeFilterDCO
+from app.modules.variant_attribute_values.variant_attribute_values_dto import (
+    AttributeFilterResultDTO,
+)
+
+
+async def filter_variants(
+    session: AsyncSession, data: AttributeFilterDCO
+) -> AttributeFilterResultDTO:
+    return await service.filter_variants(session, data)
+
+
+async def rebuild(session: AsyncSession) -> int:
+    return await service.refresh_values(session)
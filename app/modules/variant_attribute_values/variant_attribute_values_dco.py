@@ -0,0 +1,33 @@
+"""DCO for the variant_attribute_values module — attribute filters."""
+
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Literal, Optional, Union
+
+from pydantic import Field, model_validator
+
+from app.common.schemas.base import BaseSchema
+
+class AttributePredicateDCO(BaseSchema):
+    """One spec-sheet condition. Numbers may carry a unit ("4.5 L") or use `unit`."""
+
+    attribute_id: UUID
+    op: Literal["eq", "in", "gt", "gte", "lt", "lte", "between"]
+    value: Optional[Union[Decimal, str]] = None
+    values: List[Union[Decimal, str]] = Field(default_factory=list, max_length=100)
+    unit: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_operands(self):
+        if self.op == "between" and len(self.values) != 2:
+            raise ValueError("between needs exactly two values")
+        if self.op == "in" and not self.values:
+            raise ValueError("in needs at least one value")
+        if self.op not in ("between", "in") and self.value is None:
+            raise ValueError(f"{self.op} needs a value")
+        return self
+
+class AttributeFilterDCO(BaseSchema):
+    predicates: List[AttributePredicateDCO] = Field(..., min_length=1, max_length=10)
+    limit: int = Field(100, ge=1, le=500)
+    after: Optional[UUID] = None  # `nextAfter` of the previous page
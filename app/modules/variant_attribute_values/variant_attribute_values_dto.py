@@ -0,0 +1,15 @@
+"""DTO for the variant_attribute_values module — READ operations."""
+
+from uuid import UUID
+from typing import List, Optional
+
+from app.common.schemas.base import BaseSchema
+
+class FilteredVariantDTO(BaseSchema):
+    variant_id: UUID
+    product_id: UUID
+    sku: str
+
+class AttributeFilterResultDTO(BaseSchema):
+    items: List[FilteredVariantDTO]
+    next_after: Optional[UUID] = None
@@ -0,0 +1,43 @@
+"""SQLAlchemy entity for the `variant_attribute_values` table.
+
+Typed projection of `product_variant_attributes`: numeric values parsed and
+converted to the canonical unit of their dimension (`value_number`, `unit`),
+every value also normalised as text (`value_text`). Maintained by
+`variant_attribute_values_service.refresh_values` in the same transaction as
+attribute writes. The covering indexes answer "attribute X in range" with an
+index-only scan that yields variant ids.
+"""
+
+from sqlalchemy import Column, Text, Numeric, ForeignKey, Index, PrimaryKeyConstraint, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class VariantAttributeValue(Base):
+    __tablename__ = "variant_attribute_values"
+    __table_args__ = (
+        PrimaryKeyConstraint("variant_id", "attribute_id"),
+        Index(
+            "ix_variant_attribute_values_number",
+            "attribute_id", "value_number",
+            postgresql_include=["variant_id", "unit"],
+            postgresql_where=text("value_number IS NOT NULL"),
+        ),
+        Index(
+            "ix_variant_attribute_values_text",
+            "attribute_id",
+            "value_text",
+            postgresql_include=["variant_id"],
+        ),
+    )
+
+    variant_id = Column(
+        UUID(as_uuid=True), ForeignKey("product_variants.id", ondelete="CASCADE"), nullable=False
+    )
+    attribute_id = Column(
+        UUID(as_uuid=True), ForeignKey("attributes.id", ondelete="CASCADE"), nullable=False
+    )
+    value_number = Column(Numeric(18, 6), nullable=True)  # NULL for text, unparseable numbers
+    unit = Column(Text, nullable=True)                    # canonical unit of value_number
+    value_text = Column(Text, nullable=False)             # lower-cased, whitespace collapsed
@@ -0,0 +1,37 @@
+"""Routes for the `variant_attribute_values` module."""
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.response import respond
+from app.core import get_db_session, require_admin
+from app.core.rate_limit import RateLimits, limiter
+from app.modules.variant_attribute_values import variant_attribute_values_controller as controller
+from app.modules.variant_attribute_values.variant_attribute_values_dco import AttributeFilterDCO
+
+router = APIRouter()
+
+
+@router.post("/filter")
+@limiter.limit(RateLimits.API_READ)
+async def filter_variants(
+    request: Request,
+    body: AttributeFilterDCO,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Variants matching every spec-sheet predicate, e.g. viscosity index ≥ 150 and
+    pack size between 4 and 5 L (numbers compared in canonical units)."""
+    result = await controller.filter_variants(db, body)
+    return respond(data=result, message="Variants filtered")
+
+
+@router.post("/rebuild")
+@limiter.limit(RateLimits.ADMIN)
+async def rebuild_values(
+    request: Request,
+    admin: dict = Depends(require_admin),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Re-project every attribute value (backfill, or after changing unit rules)."""
+    projected = await controller.rebuild(db)
+    return respond(data={"projected": projected}, message="Attribute values rebuilt")
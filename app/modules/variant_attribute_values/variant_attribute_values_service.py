@@ -0,0 +1,225 @@
+"""Service layer for the `variant_attribute_values` module.
+
+`refresh_values` re-projects attribute values after writes to
+`product_variant_attributes` or to an attribute's type/unit (same
+transaction). `filter_variants` compiles each predicate into
+`variant_id IN (<index-only scan of one attribute>)`; Postgres intersects
+them as semi-joins, so the cost follows the most selective predicate rather
+than the catalog size.
+"""
+
+from decimal import Decimal
+from typing import Iterable, Optional, Union
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import delete, exists, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.modules.attributes.attributes_entity import Attribute, DataTypeEnum
+from app.modules.product_variant_attributes.product_variant_attributes_entity import (
+    ProductVariantAttribute,
+)
+from app.modules.product_variants.product_variants_entity import ProductVariant
+from app.modules.variant_attribute_values.variant_attribute_units import (
+    canonical_unit,
+    normalize_text,
+    parse_number,
+)
+from app.modules.variant_attribute_values.variant_attribute_values_dco import (
+    AttributeFilterDCO,
+    AttributePredicateDCO,
+)
+from app.modules.variant_attribute_values.variant_attribute_values_dto import (
+    AttributeFilterResultDTO,
+    FilteredVariantDTO,
+)
+from app.modules.variant_attribute_values.variant_attribute_values_entity import (
+    VariantAttributeValue,
+)
+
+_BATCH_SIZE = 5000  # 5 bind parameters per row, well under the 32767 limit
+
+
+# ── Projection ───────────────────────────────────────────────
+
+def _project(row) -> dict:
+    number = unit = None
+    if row.data_type == DataTypeEnum.number:
+        parsed = parse_number(row.value, row.attribute_unit)
+        if parsed is not None:
+            number, unit = parsed
+    return {
+        "variant_id": row.variant_id,
+        "attribute_id": row.attribute_id,
+        "value_number": number,
+        "unit": unit,
+        "value_text": normalize_text(row.value),
+    }
+
+
+async def _upsert(session: AsyncSession, values: list[dict]) -> None:
+    stmt = insert(VariantAttributeValue).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[VariantAttributeValue.variant_id, VariantAttributeValue.attribute_id],
+        set_={
+            "value_number": stmt.excluded.value_number,
+            "unit": stmt.excluded.unit,
+            "value_text": stmt.excluded.value_text,
+        },
+    )
+    await session.execute(stmt)
+
+
+async def refresh_values(
+    session: AsyncSession,
+    variant_ids: Optional[Iterable[UUID]] = None,
+    attribute_ids: Optional[Iterable[UUID]] = None,
+) -> int:
+    """Re-project values of these variants and/or attributes (neither = everything)."""
+    source = (
+        select(
+            ProductVariantAttribute.variant_id,
+            ProductVariantAttribute.attribute_id,
+            ProductVariantAttribute.value,
+            Attribute.data_type,
+            Attribute.unit.label("attribute_unit"),
+        )
+        .join(Attribute, Attribute.id == ProductVariantAttribute.attribute_id)
+        .order_by(ProductVariantAttribute.variant_id, ProductVariantAttribute.attribute_id)
+        .limit(_BATCH_SIZE)
+    )
+    stale = delete(VariantAttributeValue).where(
+        ~exists().where(
+            ProductVariantAttribute.variant_id == VariantAttributeValue.variant_id,
+            ProductVariantAttribute.attribute_id == VariantAttributeValue.attribute_id,
+        )
+    )
+    if variant_ids is not None:
+        variant_ids = list(set(variant_ids))
+        if not variant_ids:
+            return 0
+        source = source.where(ProductVariantAttribute.variant_id.in_(variant_ids))
+        stale = stale.where(VariantAttributeValue.variant_id.in_(variant_ids))
+    if attribute_ids is not None:
+        attribute_ids = list(set(attribute_ids))
+        if not attribute_ids:
+            return 0
+        source = source.where(ProductVariantAttribute.attribute_id.in_(attribute_ids))
+        stale = stale.where(VariantAttributeValue.attribute_id.in_(attribute_ids))
+
+    await session.execute(stale)
+
+    # Keyset batches: bounded memory and statement size for full rebuilds
+    projected, last = 0, None
+    while True:
+        batch_stmt = source
+        if last is not None:
+            batch_stmt = batch_stmt.where(
+                tuple_(ProductVariantAttribute.variant_id, ProductVariantAttribute.attribute_id)
+                > last
+            )
+        rows = (await session.execute(batch_stmt)).all()
+        if not rows:
+            break
+        await _upsert(session, [_project(row) for row in rows])
+        projected += len(rows)
+        last = (rows[-1].variant_id, rows[-1].attribute_id)
+        if len(rows) < _BATCH_SIZE:
+            break
+
+    if variant_ids is None:
+        logger.info(
+            "Attribute values projected | rows={} attributes={}", projected, attribute_ids or "all"
+        )
+    return projected
+
+
+# ── Filtering ────────────────────────────────────────────────
+
+def _number(
+    value: Union[Decimal, str], unit: Optional[str], attribute: Attribute
+) -> tuple[Decimal, Optional[str]]:
+    parsed = parse_number(str(value), unit or attribute.unit)
+    if parsed is None:
+        raise ValidationError("Expected a number", field="value", value=str(value))
+    expected, _ = canonical_unit(attribute.unit)
+    if expected and parsed[1] and parsed[1] != expected:
+        raise ValidationError(
+            f"Unit '{parsed[1]}' cannot be compared with '{expected}' values of {attribute.name}",
+            field="unit",
+            value=unit,
+        )
+    return parsed
+
+
+def _compile(predicate: AttributePredicateDCO, attribute: Attribute):
+    """`SELECT variant_id` of the rows matching one predicate (index-only on the covering index)."""
+    v = VariantAttributeValue
+    stmt = select(v.variant_id).where(v.attribute_id == attribute.id)
+
+    if attribute.data_type != DataTypeEnum.number:
+        if predicate.op not in ("eq", "in"):
+            raise ValidationError(
+                f"{attribute.name} is text; only eq and in are supported",
+                field="op",
+                value=predicate.op,
+            )
+        texts = [
+            normalize_text(str(x))
+            for x in (predicate.values if predicate.op == "in" else [predicate.value])
+        ]
+        return stmt.where(v.value_text.in_(texts))
+
+    operands = predicate.values if predicate.op in ("in", "between") else [predicate.value]
+    numbers = [_number(x, predicate.unit, attribute) for x in operands]
+    stmt = stmt.where(v.unit.is_not_distinct_from(numbers[0][1]))
+    amounts = [amount for amount, _ in numbers]
+    column = v.value_number
+    if predicate.op == "eq":
+        return stmt.where(column == amounts[0])
+    if predicate.op == "in":
+        return stmt.where(column.in_(amounts))
+    if predicate.op == "between":
+        return stmt.where(column.between(min(amounts), max(amounts)))
+    comparisons = {
+        "gt": column > amounts[0],
+        "gte": column >= amounts[0],
+        "lt": column < amounts[0],
+        "lte": column <= amounts[0],
+    }
+    return stmt.where(comparisons[predicate.op])
+
+
+async def filter_variants(
+    session: AsyncSession, data: AttributeFilterDCO
+) -> AttributeFilterResultDTO:
+    """Live variants matching every predicate, keyset-paginated by variant id."""
+    attribute_ids = {p.attribute_id for p in data.predicates}
+    result = await session.execute(select(Attribute).where(Attribute.id.in_(attribute_ids)))
+    attributes = {a.id: a for a in result.scalars().all()}
+
+    stmt = select(
+        ProductVariant.id.label("variant_id"), ProductVariant.product_id, ProductVariant.sku
+    ).where(ProductVariant.deleted_at.is_(None), ProductVariant.is_active.is_(True))
+    for predicate in data.predicates:
+        attribute = attributes.get(predicate.attribute_id)
+        if attribute is None:
+            raise ValidationError(
+                "Unknown attribute", field="attributeId", value=str(predicate.attribute_id)
+            )
+        stmt = stmt.where(ProductVariant.id.in_(_compile(predicate, attribute)))
+    if data.after is not None:
+        stmt = stmt.where(ProductVariant.id > data.after)
+
+    rows = (await session.execute(stmt.order_by(ProductVariant.id).limit(data.limit + 1))).all()
+    next_after = None
+    if len(rows) > data.limit:
+        rows = rows[: data.limit]
+        next_after = rows[-1].variant_id
+    return AttributeFilterResultDTO(
+        items=[FilteredVariantDTO.model_validate(row) for row in rows],
+        next_after=next_after,
+    )
@@ -7,7 +7,9 @@ from app.common.schemas.base import BaseSchema
 class WarehouseDCO(BaseSchema):
     name: str
     code: str
+    postal_code: Optional[str] = None
 
 class WarehouseUpdateDCO(BaseSchema):
     name: Optional[str] = None
     code: Optional[str] = None
+    postal_code: Optional[str] = None
@@ -11,4 +11,5 @@ class WarehouseDTO(BaseSchema):
     id: UUID
     name: str
     code: str
+    postal_code: Optional[str] = None
     created_at: Optional[datetime] = None
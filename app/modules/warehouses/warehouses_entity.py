@@ -17,6 +17,7 @@ class Warehouse(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(Text, nullable=False)
     code = Column(Text, nullable=False, unique=True)
+    postal_code = Column(Text, nullable=True)  # shipping origin for carrier quotes
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -0,0 +1,51 @@
+"""In-process periodic jobs started from the app lifespan.
+
+Each job runs on its own asyncio task; an exception is logged and the job
+keeps its schedule. Jobs that must not run twice concurrently across workers
+guard themselves in SQL (e.g. `FOR UPDATE SKIP LOCKED`).
+"""
+
+import asyncio
+import random
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+_jobs: dict[str, asyncio.Task] = {}
+
+
+async def run_periodic(
+    name: str,
+    func: Callable[[], Awaitable[object]],
+    interval_seconds: float,
+    jitter: float = 0.1,
+) -> None:
+    """Call `func` forever, sleeping `interval_seconds` (± jitter) between runs."""
+    while True:
+        try:
+            await func()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Background job failed | job={}", name)
+        await asyncio.sleep(interval_seconds * (1 + random.uniform(-jitter, jitter)))
+
+
+def start_periodic(
+    name: str, func: Callable[[], Awaitable[object]], interval_seconds: float
+) -> None:
+    """Schedule a named periodic job on the running loop (idempotent per name)."""
+    if name in _jobs and not _jobs[name].done():
+        return
+    _jobs[name] = asyncio.create_task(run_periodic(name, func, interval_seconds), name=name)
+    logger.info("Background job started | job={} interval={}s", name, interval_seconds)
+
+
+async def stop_background_jobs() -> None:
+    """Cancel every job and wait for it to unwind (called on shutdown)."""
+    for task in _jobs.values():
+        task.cancel()
+    await asyncio.gather(*_jobs.values(), return_exceptions=True)
+    if _jobs:
+        logger.info("Background jobs stopped | count={}", len(_jobs))
+    _jobs.clear()
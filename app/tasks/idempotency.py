@@ -0,0 +1,69 @@
+"""Consumer-side dedupe for tasks delivered at least once.
+
+The outbox relay publishes each event with `task_id = outbox_events.id`, so a
+redelivery (relay crashed between publish and commit, broker redelivered an
+unacked message) carries the same task id. A task wrapped with `deduplicated`
+records its id in Redis after success and skips later deliveries of that id.
+Celery retries keep the task id too, but only a *successful* run is recorded,
+so retries still execute.
+"""
+
+import functools
+
+import redis
+from loguru import logger
+
+from app.core.config import settings
+
+_DONE_KEY = "task:done:{}"
+_client: redis.Redis | None = None
+
+
+def _redis() -> redis.Redis | None:
+    global _client
+
+    if not settings.redis_url:
+        return None
+    if _client is None:
+        _client = redis.from_url(settings.redis_url)
+    return _client
+
+
+def already_processed(task_id: str) -> bool:
+    client = _redis()
+    if client is None:
+        return False
+    try:
+        return bool(client.exists(_DONE_KEY.format(task_id)))
+    except redis.RedisError as exc:
+        # Prefer a possible duplicate over dropping the side effect
+        logger.warning("Task dedupe check failed | task_id={} error={}", task_id, str(exc))
+        return False
+
+
+def mark_processed(task_id: str) -> None:
+    client = _redis()
+    if client is None:
+        return
+    try:
+        client.set(_DONE_KEY.format(task_id), "1", ex=settings.task_dedupe_ttl_seconds)
+    except redis.RedisError as exc:
+        logger.warning("Task dedupe mark failed | task_id={} error={}", task_id, str(exc))
+
+
+def deduplicated(func):
+    """Decorator for bound Celery tasks: run each task id to success at most once."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        task_id = self.request.id
+        if task_id and already_processed(task_id):
+            logger.info("Duplicate task delivery skipped | task={} task_id={}", self.name, task_id)
+            return {"status": "duplicate", "task_id": task_id}
+
+        result = func(self, *args, **kwargs)
+        if task_id:
+            mark_processed(task_id)
+        return result
+
+    return wrapper
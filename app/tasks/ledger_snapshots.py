@@ -0,0 +1,14 @@
+"""Periodic inventory snapshots for fast as-of stock queries.
+
+Every API worker schedules the job; the advisory lock and the "latest
+snapshot is recent" check in `take_snapshot` make only one of them write.
+"""
+
+from app.core.database import AsyncSessionLocal
+from app.modules.inventory_ledger.inventory_ledger_service import take_snapshot
+
+
+async def snapshot_if_due() -> int:
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            return await take_snapshot(session)
@@ -0,0 +1,133 @@
+"""Outbox relay — publishes `outbox_events` rows to Celery.
+
+Delivery is at-least-once: a row is marked published only after the broker
+accepted it, in the same transaction that locked it. If that commit is lost
+the row is sent again with the same task id, which consumers drop via
+`app.tasks.idempotency.deduplicated`.
+
+Runs inside the API process (started from the lifespan) or standalone:
+
+    python -m app.tasks.outbox_relay
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import delete, func, select, update
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.modules.outbox.outbox_entity import OutboxEvent
+from app.tasks.celery_app import celery_app
+
+_MAX_BACKOFF_SECONDS = 300
+
+
+def _publish(events: list[tuple[str, str, list, dict]]) -> tuple[list[str], str | None]:
+    """Send events over one pooled broker connection (blocking; run in a thread).
+
+    Stops at the first failure — the broker is most likely down, and the
+    remaining rows are simply picked up next cycle. Returns the ids sent and
+    the error, if any.
+    """
+    sent: list[str] = []
+    with celery_app.producer_or_acquire() as producer:
+        for event_id, task_name, args, kwargs in events:
+            try:
+                celery_app.send_task(
+                    task_name, args=args, kwargs=kwargs, task_id=event_id, producer=producer
+                )
+            except Exception as exc:
+                return sent, repr(exc)
+            sent.append(event_id)
+    return sent, None
+
+
+async def relay_batch(batch_size: int | None = None) -> int:
+    """Lock, publish and mark one batch of due events. Returns rows published."""
+    batch_size = batch_size or settings.outbox_relay_batch_size
+
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            result = await session.execute(
+                select(OutboxEvent)
+                .where(OutboxEvent.published_at.is_(None), OutboxEvent.available_at <= func.now())
+                .order_by(OutboxEvent.available_at)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            events = result.scalars().all()
+            if not events:
+                return 0
+
+            sent, error = await asyncio.to_thread(
+                _publish, [(str(e.id), e.task_name, e.args, e.kwargs) for e in events]
+            )
+
+            sent_ids = set(sent)
+            if sent_ids:
+                await session.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id.in_([e.id for e in events if str(e.id) in sent_ids]))
+                    .values(published_at=func.now())
+                    .execution_options(synchronize_session=False)
+                )
+
+            if error:
+                failed = next(e for e in events if str(e.id) not in sent_ids)
+                failed.attempts += 1
+                failed.last_error = error
+                failed.available_at = datetime.now(timezone.utc) + timedelta(
+                    seconds=min(_MAX_BACKOFF_SECONDS, 2 ** failed.attempts)
+                )
+                logger.warning(
+                    "Outbox publish failed | event_id={} task={} attempts={} error={}",
+                    failed.id,
+                    failed.task_name,
+                    failed.attempts,
+                    error,
+                )
+
+    if sent:
+        logger.debug("Outbox events published | count={}", len(sent))
+    return len(sent)
+
+
+async def relay_pending() -> int:
+    """Drain due events batch by batch until a short batch or a publish error."""
+    total = 0
+    while True:
+        published = await relay_batch()
+        total += published
+        if published < settings.outbox_relay_batch_size:
+            return total
+
+
+async def purge_published() -> int:
+    """Delete published events older than OUTBOX_RETENTION_DAYS."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.outbox_retention_days)
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            result = await session.execute(
+                delete(OutboxEvent).where(
+                    OutboxEvent.published_at.is_not(None), OutboxEvent.published_at < cutoff
+                )
+            )
+    if result.rowcount:
+        logger.info("Outbox events purged | count={}", result.rowcount)
+    return result.rowcount
+
+
+async def _main() -> None:
+    from app.tasks.background import run_periodic
+
+    logger.info("Outbox relay running | interval={}s", settings.outbox_relay_interval_seconds)
+    await asyncio.gather(
+        run_periodic("outbox-relay", relay_pending, settings.outbox_relay_interval_seconds),
+        run_periodic("outbox-purge", purge_published, 3600),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,50 @@
+"""Reservation sweeper — gives back stock held by unpaid orders past expiry.
+
+Finds overdue holds through the partial index on `expires_at` (ACTIVE rows
+only), never by scanning orders. Batches are claimed with
+`FOR UPDATE SKIP LOCKED`, so every API worker can run the sweeper at once.
+
+Runs inside the API process (started from the lifespan) or standalone:
+
+    python -m app.tasks.reservation_sweeper
+"""
+
+import asyncio
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.modules.inventory_reservations.inventory_reservations_service import expire_batch
+
+
+async def sweep_expired() -> int:
+    """Expire overdue holds batch by batch (one transaction each) until a short batch."""
+    batch_size = settings.reservation_sweep_batch_size
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                expired = await expire_batch(session, batch_size)
+        total += expired
+        if expired < batch_size:
+            break
+
+    if total:
+        logger.info("Expired reservations released | holds={}", total)
+    return total
+
+
+async def _main() -> None:
+    from app.tasks.background import run_periodic
+
+    logger.info(
+        "Reservation sweeper running | interval={}s", settings.reservation_sweep_interval_seconds
+    )
+    await run_periodic(
+        "reservation-sweeper", sweep_expired, settings.reservation_sweep_interval_seconds
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
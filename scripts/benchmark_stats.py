@@ -0,0 +1,6 @@
+"""Latency summaries shared by the benchmark scripts."""
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank `q` quantile (0-1) of an ascending, non-empty sample."""
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
@@ -0,0 +1,169 @@
+"""Stress test for `reserve_stock` on a hot SKU.
+
+Sets one existing inventory row to STOCK units with nothing reserved, then
+has WORKERS concurrent sessions reserve random small quantities (alone or
+together with a second SKU, in varying line order) until stock runs out.
+Checks that nothing is oversold, that no deadlock was raised, and prints
+throughput. The row's original quantities are restored and the test
+movements deleted afterwards; every overwrite moves `variant_availability`
+by the same delta, so the projection stays in step.
+
+    python -m scripts.inventory_reservation_stress \\
+        --variant-id <uuid> --warehouse-id <uuid> [--second-variant-id <uuid>] \\
+        [--stock 500] [--workers 15] [--attempts 40]
+
+Needs DATABASE_URL. The engine pool holds 15 connections; more workers than
+that also measure pool queueing.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.core.exceptions import InsufficientStockError
+from app.modules.availability.availability_service import apply_deltas
+from app.modules.inventory.inventory_stock import StockLine, reserve_stock
+
+_REFERENCE_TYPE = "STRESS_TEST"
+
+_SET_SQL = text("""
+UPDATE inventory AS i
+SET stock_quantity = :s, reserved_quantity = :r
+FROM (
+    SELECT id, stock_quantity, COALESCE(reserved_quantity, 0) AS reserved
+    FROM inventory
+    WHERE variant_id = :v AND warehouse_id = :w
+    FOR UPDATE
+) AS old
+WHERE i.id = old.id
+RETURNING old.stock_quantity, old.reserved
+""")
+
+
+async def _snapshot(variant_ids: list[UUID], warehouse_id: UUID) -> dict:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            text(
+                "SELECT variant_id, stock_quantity, reserved_quantity FROM inventory "
+                "WHERE warehouse_id = :w AND variant_id = ANY(CAST(:v AS uuid[]))"
+            ),
+            {"w": warehouse_id, "v": variant_ids},
+        )
+        return {
+            row.variant_id: (row.stock_quantity, row.reserved_quantity or 0) for row in result.all()
+        }
+
+
+async def _set(variant_id: UUID, warehouse_id: UUID, stock: int, reserved: int) -> None:
+    """Overwrite the row's quantities, moving `variant_availability` by the same delta."""
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            result = await session.execute(
+                _SET_SQL, {"s": stock, "r": reserved, "v": variant_id, "w": warehouse_id}
+            )
+            old = result.one()
+            await apply_deltas(
+                session, [(variant_id, stock - old.stock_quantity, reserved - old.reserved)]
+            )
+
+
+async def _worker(variants: list[UUID], warehouse_id: UUID, attempts: int, stats: dict) -> None:
+    for _ in range(attempts):
+        lines = [
+            StockLine(v, warehouse_id, random.randint(1, 5))
+            for v in variants
+            if random.random() < 0.8
+        ]
+        lines = lines or [StockLine(variants[0], warehouse_id, 1)]
+        random.shuffle(lines)  # line order must not matter for lock order
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    await reserve_stock(session, lines, _REFERENCE_TYPE, uuid.uuid4())
+        except InsufficientStockError:
+            stats["rejected"] += 1
+        except Exception as exc:  # deadlocks, serialization errors: the thing we test for
+            stats["errors"].append(repr(exc))
+        else:
+            stats["accepted"] += 1
+            for line in lines:
+                stats["reserved"][line.variant_id] = (
+                    stats["reserved"].get(line.variant_id, 0) + line.quantity
+                )
+        stats["latencies"].append(time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> int:
+    if AsyncSessionLocal is None:
+        print("DATABASE_URL is not set")
+        return 1
+
+    variants = [UUID(args.variant_id)] + (
+        [UUID(args.second_variant_id)] if args.second_variant_id else []
+    )
+    warehouse_id = UUID(args.warehouse_id)
+
+    original = await _snapshot(variants, warehouse_id)
+    if len(original) != len(variants):
+        print("Inventory row not found for every variant in that warehouse")
+        return 1
+
+    for variant_id in variants:
+        await _set(variant_id, warehouse_id, args.stock, 0)
+
+    stats = {"accepted": 0, "rejected": 0, "errors": [], "reserved": {}, "latencies": []}
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(_worker(variants, warehouse_id, args.attempts, stats) for _ in range(args.workers))
+        )
+        elapsed = time.perf_counter() - started
+        final = await _snapshot(variants, warehouse_id)
+    finally:
+        for variant_id, (stock, reserved) in original.items():
+            await _set(variant_id, warehouse_id, stock, reserved)
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(
+                    text("DELETE FROM inventory_movements WHERE reference_type = :t"),
+                    {"t": _REFERENCE_TYPE},
+                )
+
+    latencies = sorted(stats["latencies"])
+    calls = len(latencies)
+    print(f"calls={calls} accepted={stats['accepted']} rejected={stats['rejected']} "
+          f"errors={len(stats['errors'])}")
+    print(f"throughput={calls / elapsed:.0f}/s p50={latencies[calls // 2] * 1000:.1f}ms "
+          f"p95={latencies[int(calls * 0.95) - 1] * 1000:.1f}ms")
+
+    ok = not stats["errors"]
+    for variant_id in variants:
+        stock, reserved = final[variant_id]
+        expected = stats["reserved"].get(variant_id, 0)
+        print(f"variant={variant_id} stock={stock} reserved={reserved} accepted_total={expected}")
+        ok = ok and reserved == expected and reserved <= stock
+    for error in stats["errors"][:5]:
+        print(f"error: {error}")
+
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--variant-id", required=True)
+    parser.add_argument("--warehouse-id", required=True)
+    parser.add_argument("--second-variant-id")
+    parser.add_argument("--stock", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=15)
+    parser.add_argument("--attempts", type=int, default=40)
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
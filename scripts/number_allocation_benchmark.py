@@ -0,0 +1,124 @@
+"""Benchmark for order and invoice number allocation across worker processes.
+
+Starts WORKERS processes (like API workers), each running TASKS concurrent
+sessions. Every process allocates ORDERS block-allocated order numbers and
+INVOICES gapless numbers of a throwaway series, one committed transaction
+per invoice number. Prints throughput and latency of both, and checks that
+order numbers are unique and that the gapless series has no hole or
+duplicate. The benchmark series row is deleted afterwards; the order
+numbers it consumes are simply skipped by real orders.
+
+    python -m scripts.number_allocation_benchmark [--workers 4] [--tasks 20] \\
+        [--orders 5000] [--invoices 500] [--prefix BENCH]
+
+Needs DATABASE_URL and the order_number_seq / number_counters objects.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal
+from app.modules.numbering.numbering_service import next_gapless_number, next_order_number
+from scripts.benchmark_stats import percentile
+
+_YEAR = 2000  # a year no real series uses
+
+
+async def _orders(count: int, timings: list[float], numbers: list[str]) -> None:
+    async with AsyncSessionLocal() as session:
+        for _ in range(count):
+            started = time.perf_counter()
+            numbers.append(await next_order_number(session))
+            timings.append(time.perf_counter() - started)
+        await session.commit()
+
+
+async def _invoices(count: int, prefix: str, timings: list[float], numbers: list[str]) -> None:
+    async with AsyncSessionLocal() as session:
+        for _ in range(count):
+            started = time.perf_counter()
+            async with session.begin():
+                numbers.append(await next_gapless_number(session, prefix, _YEAR))
+            timings.append(time.perf_counter() - started)
+
+
+async def _run(tasks: int, orders: int, invoices: int, prefix: str) -> dict:
+    result = {"orders": [], "order_timings": [], "invoices": [], "invoice_timings": []}
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(_orders(orders // tasks, result["order_timings"], result["orders"]) for _ in range(tasks))
+    )
+    result["order_seconds"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _invoices(invoices // tasks, prefix, result["invoice_timings"], result["invoices"])
+            for _ in range(tasks)
+        )
+    )
+    result["invoice_seconds"] = time.perf_counter() - started
+    return result
+
+
+def _worker(args: tuple) -> dict:
+    return asyncio.run(_run(*args))
+
+
+async def _reset(prefix: str) -> None:
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await session.execute(
+                text("DELETE FROM number_counters WHERE series = :series"),
+                {"series": f"{prefix}-{_YEAR}"},
+            )
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples.sort()
+    p50, p99 = (percentile(samples, q) * 1e3 for q in (0.50, 0.99))
+    return f"p50={p50:.2f}ms p99={p99:.2f}ms max={samples[-1] * 1e3:.2f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--orders", type=int, default=5000, help="per worker")
+    parser.add_argument("--invoices", type=int, default=500, help="per worker")
+    parser.add_argument("--prefix", default="BENCH")
+    args = parser.parse_args()
+
+    asyncio.run(_reset(args.prefix))
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(args.workers) as pool:
+        results = pool.map(
+            _worker, [(args.tasks, args.orders, args.invoices, args.prefix)] * args.workers
+        )
+    asyncio.run(_reset(args.prefix))
+
+    orders = [n for r in results for n in r["orders"]]
+    seconds = max(r["order_seconds"] for r in results)
+    print(
+        f"order numbers: {len(orders)} in {seconds:.2f}s = {len(orders) / seconds:.0f}/s "
+        f"{_percentiles([t for r in results for t in r['order_timings']])}"
+    )
+    print(f"  unique: {len(set(orders)) == len(orders)}")
+
+    invoices = [n for r in results for n in r["invoices"]]
+    seconds = max(r["invoice_seconds"] for r in results)
+    print(
+        f"gapless numbers: {len(invoices)} in {seconds:.2f}s = {len(invoices) / seconds:.0f}/s "
+        f"{_percentiles([t for r in results for t in r['invoice_timings']])}"
+    )
+    values = sorted(int(n.rsplit("-", 1)[1]) for n in invoices)
+    print(f"  gapless and unique: {values == list(range(1, len(values) + 1))}")
+
+
+if __name__ == "__main__":
+    main()
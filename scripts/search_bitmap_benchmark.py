@@ -0,0 +1,108 @@
+"""Benchmark for the standards bitmap index (`FacetBitmapIndex`), no database needed.
+
+Builds an index of VARIANTS synthetic variants carrying a few of STANDARDS
+standards each (skewed, like real approvals), then reports build time and
+memory, latency of AND / OR / NOT expressions including counting and reading
+the first page of ids, and the cost of patching one product in place.
+
+    python -m scripts.search_bitmap_benchmark [--variants 100000] [--standards 400] [--queries 5000]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+import uuid
+
+from app.modules.search.search_bitmap import BitmapRow, FacetBitmapIndex
+from scripts.benchmark_stats import percentile
+
+
+def _rows(variants: int, standards: list[str], brands: list[str]) -> list[BitmapRow]:
+    rows: list[BitmapRow] = []
+    while len(rows) < variants:
+        product_id = uuid.uuid4()
+        keys = {random.choice(brands)}
+        keys.update(
+            standards[min(len(standards) - 1, int(random.paretovariate(0.8)))]
+            for _ in range(random.randint(1, 8))
+        )
+        for _ in range(random.randint(1, 4)):
+            rows.append(BitmapRow(uuid.uuid4(), product_id, tuple(keys)))
+    return rows[:variants]
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples.sort()
+    p50, p99 = (percentile(samples, q) * 1e6 for q in (0.50, 0.99))
+    return f"p50={p50:.1f}µs p99={p99:.1f}µs max={samples[-1] * 1e6:.1f}µs"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--variants", type=int, default=100_000)
+    parser.add_argument("--standards", type=int, default=400)
+    parser.add_argument("--queries", type=int, default=5000)
+    args = parser.parse_args()
+
+    random.seed(7)
+    standards = [f"standard:{uuid.uuid4()}" for _ in range(args.standards)]
+    brands = [f"brand:{uuid.uuid4()}" for _ in range(100)]
+    rows = _rows(args.variants, standards, brands)
+
+    tracemalloc.start()
+    measured = FacetBitmapIndex()
+    measured.build(rows)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measured
+
+    started = time.perf_counter()
+    index = FacetBitmapIndex()
+    index.build(rows)
+    build_seconds = time.perf_counter() - started
+    print(
+        f"build: variants={len(index)} keys={index.key_count} time={build_seconds:.2f}s "
+        f"memory≈{memory / 2**20:.0f} MiB"
+    )
+
+    popular = standards[:20]
+    shapes = {
+        "all of 2": lambda: (
+            index.live & index.bits(random.choice(popular)) & index.bits(random.choice(popular))
+        ),
+        "all of 3, not 1": lambda: (
+            index.live & index.bits(random.choice(popular)) & index.bits(random.choice(popular))
+            & index.bits(random.choice(standards)) & ~index.bits(random.choice(popular))
+        ),
+        "any of 5 and brand": lambda: (
+            index.any_of(random.sample(standards, 5)) & index.bits(random.choice(brands))
+        ),
+    }
+    for name, expression in shapes.items():
+        timings, matched = [], 0
+        for _ in range(args.queries):
+            started = time.perf_counter()
+            bits = expression()
+            matched += bits.bit_count()
+            index.variant_ids(bits, 0, 101)
+            timings.append(time.perf_counter() - started)
+        print(f"{name}: {_percentiles(timings)} avg matches={matched // args.queries}")
+
+    owned: dict[uuid.UUID, list[BitmapRow]] = {}
+    for row in rows:
+        owned.setdefault(row.product_id, []).append(row)
+    timings = []
+    for product_id in random.sample(list(owned), min(2000, len(owned))):
+        changed = [
+            BitmapRow(r.variant_id, r.product_id, r.facet_keys + (random.choice(standards),))
+            for r in owned[product_id]
+        ]
+        started = time.perf_counter()
+        index.replace([product_id], changed)
+        timings.append(time.perf_counter() - started)
+    print(f"patch one product: {_percentiles(timings)}")
+
+
+if __name__ == "__main__":
+    main()
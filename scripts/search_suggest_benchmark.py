@@ -0,0 +1,149 @@
+"""Benchmark for the typeahead prefix index (`SuggestIndex`), no database needed.
+
+Builds an index of TERMS synthetic entries (brands, product names, SKUs with
+skewed popularity), then reports build time, memory held by the index,
+lookup latency for cold and memoised prefixes of 1-6 characters, and the
+cost of patching one product in place.
+
+    python -m scripts.search_suggest_benchmark [--terms 200000] [--lookups 20000]
+"""
+
+import argparse
+import random
+import string
+import time
+import tracemalloc
+import uuid
+
+from app.modules.search.search_suggest import SuggestIndex, SuggestRow
+from scripts.benchmark_stats import percentile
+
+_WORDS = [
+    "castrol", "mobil", "shell", "valvoline", "petro", "canada", "total", "quartz", "edge",
+    "magnatec", "rotella", "delvac", "helix", "ultra", "synthetic", "blend", "diesel", "engine",
+    "oil", "gear", "hydraulic", "transmission", "fluid", "grease", "coolant", "atf", "dexron",
+    "supreme", "premium", "pro",
+]
+_VISCOSITIES = ["0W-20", "5W-20", "5W-30", "10W-30", "10W-40", "15W-40", "75W-90", "80W-90"]
+
+
+def _rows(terms: int) -> list[SuggestRow]:
+    rows: list[SuggestRow] = []
+    brands = [uuid.uuid4() for _ in range(200)]
+    for brand_id in brands:
+        rows.append(
+            SuggestRow(
+                "brand",
+                brand_id,
+                random.choice(_WORDS).title() + " " + random.choice(_WORDS).title(),
+                None,
+                ("brand", brand_id),
+                random.randint(0, 50_000),
+            )
+        )
+    while len(rows) < terms:
+        product_id = uuid.uuid4()
+        name = (
+            " ".join(random.sample(_WORDS, random.randint(2, 4))).title()
+            + " "
+            + random.choice(_VISCOSITIES)
+        )
+        popularity = int(random.paretovariate(1.2))
+        rows.append(
+            SuggestRow("product", product_id, name, product_id, ("product", product_id), popularity)
+        )
+        for _ in range(random.randint(1, 4)):
+            variant_id = uuid.uuid4()
+            sku = (
+                "".join(random.choices(string.ascii_uppercase, k=3))
+                + "-"
+                + "".join(random.choices(string.digits, k=6))
+            )
+            rows.append(
+                SuggestRow("sku", variant_id, sku, product_id, ("product", product_id), popularity)
+            )
+    return rows[:terms]
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples.sort()
+    p50, p99 = (percentile(samples, q) * 1e6 for q in (0.50, 0.99))
+    return f"p50={p50:.1f}µs p99={p99:.1f}µs max={samples[-1] * 1e6:.1f}µs"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--terms", type=int, default=200_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    random.seed(7)
+    rows = _rows(args.terms)
+
+    # Memory is measured on a separate build: tracing slows allocation down several-fold
+    tracemalloc.start()
+    measured = SuggestIndex(max_entries=args.terms)
+    measured.build(rows)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del measured
+
+    started = time.perf_counter()
+    index = SuggestIndex(max_entries=args.terms)
+    index.build(rows)
+    build_seconds = time.perf_counter() - started
+    print(
+        f"build: entries={len(index)} keys={index.key_count} time={build_seconds:.2f}s "
+        f"memory≈{memory / 2**20:.0f} MiB"
+    )
+
+    labels = [row.label.lower() for row in random.sample(rows, min(len(rows), 5000))]
+    prefixes = []
+    for _ in range(args.lookups):
+        words = random.choice(labels).split()
+        word = " ".join(words[random.randrange(len(words)):])
+        prefixes.append(word[: random.randint(1, 6)])
+
+    for label in ("cold", "memoised"):
+        timings = []
+        for prefix in prefixes:
+            if label == "cold":
+                index._memo.clear()
+            started = time.perf_counter()
+            index.suggest(prefix, 10)
+            timings.append(time.perf_counter() - started)
+        print(f"lookup ({label}): {_percentiles(timings)}")
+
+    by_length: dict[int, list[float]] = {}
+    for prefix in prefixes[:5000]:
+        index._memo.clear()
+        started = time.perf_counter()
+        index.suggest(prefix, 10)
+        by_length.setdefault(len(prefix), []).append(time.perf_counter() - started)
+    for length in sorted(by_length):
+        print(f"  cold, {length} chars: {_percentiles(by_length[length])}")
+
+    owned: dict[tuple, list[SuggestRow]] = {}
+    for row in rows:
+        owned.setdefault(row.owner, []).append(row)
+    products = [owner for owner in owned if owner[0] == "product"]
+    timings = []
+    for owner in random.sample(products, min(1000, len(products))):
+        renamed = [
+            SuggestRow(
+                r.kind,
+                r.id,
+                r.label + " Plus" if r.kind == "product" else r.label,
+                r.product_id,
+                r.owner,
+            )
+            for r in owned[owner]
+        ]
+        started = time.perf_counter()
+        index.replace([owner], renamed)
+        timings.append(time.perf_counter() - started)
+    print(f"patch one product: {_percentiles(timings)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""Shared pytest setup: settings that app modules need at import time."""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-" + "k3y" * 12)
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
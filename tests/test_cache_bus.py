@@ -0,0 +1,51 @@
+"""After-commit hooks of the cache bus."""
+
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core import cache_bus
+
+
+def _hook() -> tuple[str, list]:
+    key = f"test_changed_{uuid.uuid4().hex[:8]}"
+    calls: list = []
+    cache_bus.after_commit(key, calls.append)
+    return key, calls
+
+
+def test_handler_gets_the_collected_changes_on_commit():
+    key, calls = _hook()
+    session = Session()
+    session.info[key] = {"a", "b"}
+    session.commit()
+
+    assert calls == [{"a", "b"}]
+    assert key not in session.info
+
+
+def test_rollback_discards_the_changes():
+    key, calls = _hook()
+    session = Session()
+    session.begin()
+    session.info[key] = {"a"}
+    session.rollback()
+    session.commit()
+
+    assert calls == []
+    assert key not in session.info
+
+
+def test_sessions_without_changes_are_ignored():
+    key, calls = _hook()
+    session = Session()
+    session.commit()
+
+    assert calls == []
+
+
+def test_spawn_without_a_running_loop_is_a_no_op():
+    async def never_awaited():
+        raise AssertionError("should not run")
+
+    cache_bus.spawn(never_awaited())
@@ -0,0 +1,103 @@
+"""Category moves: the cycle check runs against the table, under the move lock."""
+
+import sqlite3
+import uuid
+
+import pytest
+
+from app.core.exceptions import BusinessRuleError
+from app.modules.categories import categories_service
+from app.modules.categories.categories_dco import CategoryUpdateDCO
+from app.modules.categories.categories_service import _MOVE_CYCLE_SQL, _MOVE_LOCK_SQL
+
+
+@pytest.fixture
+def db():
+    # oils ─ engine ─ synthetic, and a separate root for filters
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE categories (id TEXT, parent_id TEXT)")
+    conn.executemany(
+        "INSERT INTO categories VALUES (?, ?)",
+        [("oils", None), ("engine", "oils"), ("synthetic", "engine"), ("filters", None)],
+    )
+    yield conn
+    conn.close()
+
+
+def _creates_cycle(conn, category_id: str, parent_id: str) -> bool:
+    params = {"category_id": category_id, "parent_id": parent_id}
+    return bool(conn.execute(_MOVE_CYCLE_SQL.text, params).fetchone()[0])
+
+
+@pytest.mark.parametrize(
+    ("category_id", "parent_id", "expected"),
+    [
+        ("oils", "oils", True),
+        ("oils", "synthetic", True),
+        ("engine", "synthetic", True),
+        ("synthetic", "oils", False),
+        ("oils", "filters", False),
+    ],
+)
+def test_cycle_check_walks_the_new_parents_ancestors(db, category_id, parent_id, expected):
+    assert _creates_cycle(db, category_id, parent_id) is expected
+
+
+def test_crossed_moves_are_caught_once_the_first_commits(db):
+    # B under A passes; A under B, checked after it under the lock, must not
+    assert not _creates_cycle(db, "filters", "oils")
+    db.execute("UPDATE categories SET parent_id = 'oils' WHERE id = 'filters'")
+    assert _creates_cycle(db, "oils", "filters")
+
+
+def test_cycle_check_terminates_on_a_cycle_already_in_the_data(db):
+    db.execute("UPDATE categories SET parent_id = 'synthetic' WHERE id = 'oils'")
+    assert not _creates_cycle(db, "filters", "engine")
+
+
+class Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    """Answers the category lookup and the cycle check, recording statement order."""
+
+    def __init__(self, cycle: bool = False, found: bool = True):
+        self.cycle = cycle
+        self.found = found
+        self.statements = []
+
+    async def execute(self, statement, params=None) -> Result:
+        self.statements.append(statement)
+        if statement is _MOVE_CYCLE_SQL:
+            return Result(self.cycle)
+        if statement is _MOVE_LOCK_SQL:
+            return Result(None)
+        return Result(object() if self.found else None)
+
+
+@pytest.mark.anyio
+async def test_move_into_own_subtree_is_rejected_after_taking_the_lock():
+    session = FakeSession(cycle=True)
+    data = CategoryUpdateDCO(parent_id=uuid.uuid4())
+    with pytest.raises(BusinessRuleError) as raised:
+        await categories_service.update(session, uuid.uuid4(), data)
+
+    assert raised.value.details == {"rule_name": "category_cycle"}
+    assert session.statements[0] is _MOVE_LOCK_SQL
+    assert session.statements[-1] is _MOVE_CYCLE_SQL
+
+
+@pytest.mark.anyio
+async def test_rename_takes_no_move_lock():
+    session = FakeSession(found=False)
+    data = CategoryUpdateDCO(name="Oils")
+    assert await categories_service.update(session, uuid.uuid4(), data) is None
+    assert _MOVE_LOCK_SQL not in session.statements
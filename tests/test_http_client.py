@@ -0,0 +1,236 @@
+"""Circuit breaker and retry behaviour of the shared HTTP client."""
+
+import uuid
+
+import httpx
+import pytest
+
+from app.common.services import http_client
+from app.common.services.http_client import CircuitBreaker, HTTPClient
+from app.common.services.http_stub import create_shipping_stub_app
+from app.core.config import settings
+from app.core.exceptions import ExternalServiceError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(http_client.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(settings, "http_retry_backoff_seconds", 0.0)
+
+
+def _client(app_or_transport, max_retries: int = 2) -> HTTPClient:
+    transport = (
+        app_or_transport
+        if isinstance(app_or_transport, httpx.AsyncBaseTransport)
+        else httpx.ASGITransport(app=app_or_transport)
+    )
+    # A fresh upstream name per test: breakers and stats are process-wide
+    return HTTPClient(
+        "http://stub",
+        upstream=f"test-{uuid.uuid4().hex[:8]}",
+        max_retries=max_retries,
+        transport=transport,
+    )
+
+
+# ── CircuitBreaker ───────────────────────────────────────
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_lets_one_probe_through_after_cool_down(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()  # the probe is in flight
+
+
+def test_breaker_probe_outcome_closes_or_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_released_probe_frees_the_slot(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+
+    breaker.release_probe()
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_breaker_replaces_a_probe_that_never_reports(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow()
+
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+
+
+# ── HTTPClient retries ───────────────────────────────────
+
+
+@pytest.mark.anyio
+async def test_idempotent_call_is_retried_up_to_max_retries():
+    stub = create_shipping_stub_app(fail_every=1)
+    client = _client(stub, max_retries=2)
+    with pytest.raises(ExternalServiceError):
+        await client.get("/rates", params={"from": "A", "to": "B", "weight": 1})
+    await client.aclose()
+
+    assert stub.state.calls == 3
+    assert client._stats.retries == 2
+    assert client._stats.errors == 3
+
+
+@pytest.mark.anyio
+async def test_retry_recovers_from_a_transient_gateway_error():
+    stub = create_shipping_stub_app(fail_every=2)
+    client = _client(stub, max_retries=2)
+    await client.get("/rates", params={"from": "A", "to": "B", "weight": 1})
+    body = await client.get("/rates", params={"from": "A", "to": "B", "weight": 1})
+    await client.aclose()
+
+    assert body["currency"] == "CAD"
+    assert stub.state.calls == 3
+    assert client._stats.retries == 1
+
+
+@pytest.mark.anyio
+async def test_post_is_retried_only_with_an_idempotency_key():
+    stub = create_shipping_stub_app(fail_every=1)
+    client = _client(stub, max_retries=2)
+    with pytest.raises(ExternalServiceError):
+        await client.post("/shipments", payload={"order_id": "1"})
+    assert stub.state.calls == 1
+
+    with pytest.raises(ExternalServiceError):
+        await client.post("/shipments", payload={"order_id": "1"}, idempotency_key="shipment-1")
+    await client.aclose()
+    assert stub.state.calls == 4
+
+
+@pytest.mark.anyio
+async def test_open_circuit_fails_fast(monkeypatch):
+    monkeypatch.setattr(settings, "http_circuit_failure_threshold", 2)
+    stub = create_shipping_stub_app(fail_every=1)
+    client = _client(stub, max_retries=5)
+    with pytest.raises(ExternalServiceError) as raised:
+        await client.get("/rates", params={"from": "A", "to": "B", "weight": 1})
+    await client.aclose()
+
+    # The third attempt found the circuit open and never reached the stub
+    assert stub.state.calls == 2
+    assert raised.value.status_code == 503
+    assert client._breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.anyio
+async def test_probe_failing_unexpectedly_releases_the_slot(clock):
+    def explode(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("boom")
+
+    client = _client(httpx.MockTransport(explode), max_retries=0)
+    client._breaker.failure_threshold = 1
+    client._breaker.record_failure()
+    clock.now += client._breaker.reset_seconds
+
+    with pytest.raises(RuntimeError):
+        await client.get("/rates")
+    await client.aclose()
+
+    assert client._breaker.state == CircuitBreaker.OPEN
+    assert client._breaker.allow()  # the next call probes again at once
+
+
+@pytest.mark.anyio
+async def test_non_retryable_5xx_opens_the_circuit():
+    calls = []
+
+    def server_error(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500, json={"detail": "boom"})
+
+    client = _client(httpx.MockTransport(server_error), max_retries=0)
+    client._breaker.failure_threshold = 2
+    for _ in range(2):
+        with pytest.raises(ExternalServiceError):
+            await client.get("/rates")
+
+    with pytest.raises(ExternalServiceError) as raised:
+        await client.get("/rates")
+    await client.aclose()
+
+    assert len(calls) == 2
+    assert raised.value.status_code == 503
+    assert client._breaker.state == CircuitBreaker.OPEN
+    assert client._stats.errors == 2
+
+
+@pytest.mark.anyio
+async def test_4xx_does_not_count_against_the_upstream():
+    def not_found(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"detail": "missing"})
+
+    client = _client(httpx.MockTransport(not_found), max_retries=0)
+    client._breaker.failure_threshold = 1
+    with pytest.raises(ExternalServiceError):
+        await client.get("/rates")
+    await client.aclose()
+
+    assert client._breaker.state == CircuitBreaker.CLOSED
+    assert client._stats.errors == 0
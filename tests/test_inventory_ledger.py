@@ -0,0 +1,132 @@
+"""Ledger posting rules: movement signs, entry validation and the stock floor."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import BusinessRuleError, ValidationError
+from app.modules.inventory_ledger import inventory_ledger_service as ledger
+from app.modules.inventory_ledger.inventory_ledger_service import LedgerEntry, post_movements
+from app.modules.inventory_movements.inventory_movements_entity import MovementTypeEnum
+
+VARIANT = uuid.uuid4()
+WAREHOUSE = uuid.uuid4()
+
+
+def _entry(movement_type: MovementTypeEnum, quantity: int) -> LedgerEntry:
+    return LedgerEntry(VARIANT, WAREHOUSE, movement_type, quantity)
+
+
+class Result:
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    def all(self) -> list:
+        return self.rows
+
+
+class FakeSession:
+    """Returns the balances the post statement would produce."""
+
+    def __init__(self, stock_quantity: int, reserved: int = 0):
+        self.stock_quantity = stock_quantity
+        self.reserved = reserved
+        self.params = None
+
+    async def execute(self, statement, params=None) -> Result:
+        self.params = params
+        delta = sum(params["deltas"])
+        row = SimpleNamespace(
+            variant_id=VARIANT,
+            warehouse_id=WAREHOUSE,
+            stock_quantity=self.stock_quantity + delta,
+            reserved=self.reserved,
+            delta=delta,
+        )
+        return Result([row])
+
+
+@pytest.fixture
+def applied(monkeypatch):
+    calls = []
+
+    async def apply_deltas(session, deltas):
+        calls.append(list(deltas))
+
+    monkeypatch.setattr(ledger, "apply_deltas", apply_deltas)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("movement_type", "quantity", "delta"),
+    [
+        (MovementTypeEnum.IN, 5, 5),
+        (MovementTypeEnum.RETURN, 2, 2),
+        (MovementTypeEnum.OUT, 3, -3),
+        (MovementTypeEnum.ADJUSTMENT, -4, -4),
+        (MovementTypeEnum.ADJUSTMENT, 4, 4),
+    ],
+)
+def test_stock_delta_sign(movement_type, quantity, delta):
+    assert _entry(movement_type, quantity).stock_delta == delta
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("movement_type", [MovementTypeEnum.RESERVED, MovementTypeEnum.RELEASED])
+async def test_holds_are_rejected(movement_type, applied):
+    session = FakeSession(10)
+    with pytest.raises(ValidationError) as raised:
+        await post_movements(session, [_entry(MovementTypeEnum.IN, 1), _entry(movement_type, 1)])
+    assert raised.value.details["field"] == "entries[1].movementType"
+    assert session.params is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("movement_type", "quantity"),
+    [(MovementTypeEnum.IN, 0), (MovementTypeEnum.OUT, -1), (MovementTypeEnum.ADJUSTMENT, 0)],
+)
+async def test_invalid_quantities_are_rejected(movement_type, quantity, applied):
+    session = FakeSession(10)
+    with pytest.raises(ValidationError) as raised:
+        await post_movements(session, [_entry(movement_type, quantity)])
+    assert raised.value.details["field"] == "entries[0].quantity"
+    assert session.params is None
+
+
+@pytest.mark.anyio
+async def test_no_entries_posts_nothing(applied):
+    session = FakeSession(10)
+    assert await post_movements(session, []) == []
+    assert session.params is None
+    assert applied == []
+
+
+@pytest.mark.anyio
+async def test_posting_moves_the_projection(applied):
+    session = FakeSession(10)
+    ids = await post_movements(
+        session, [_entry(MovementTypeEnum.IN, 5), _entry(MovementTypeEnum.OUT, 3)], "ORDER"
+    )
+    assert len(ids) == 2
+    assert session.params["deltas"] == [5, -3]
+    assert session.params["movement_types"] == ["IN", "OUT"]
+    assert applied == [[(VARIANT, 2, 0)]]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(("stock", "reserved", "out"), [(3, 0, 4), (10, 8, 3)])
+async def test_stock_may_not_drop_below_zero_or_reserved(stock, reserved, out, applied):
+    session = FakeSession(stock, reserved)
+    with pytest.raises(BusinessRuleError) as raised:
+        await post_movements(session, [_entry(MovementTypeEnum.OUT, out)])
+    assert raised.value.details == {"rule_name": "stock_not_negative"}
+    assert applied == []
+
+
+@pytest.mark.anyio
+async def test_taking_stock_down_to_reserved_is_allowed(applied):
+    session = FakeSession(10, reserved=7)
+    await post_movements(session, [_entry(MovementTypeEnum.OUT, 3)])
+    assert applied == [[(VARIANT, -3, 0)]]
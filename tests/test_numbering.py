@@ -0,0 +1,65 @@
+"""Block allocation of order numbers."""
+
+import asyncio
+
+import pytest
+
+from app.modules.numbering import numbering_service
+from app.modules.numbering.numbering_service import BlockAllocator, format_number
+
+
+class Result:
+    def __init__(self, value: int):
+        self.value = value
+
+    def scalar_one(self) -> int:
+        return self.value
+
+
+class FakeSequence:
+    """Stands in for a session running `nextval` on a sequence incremented by `block`."""
+
+    def __init__(self, block: int):
+        self.block = block
+        self.calls = 0
+
+    async def execute(self, statement, params=None) -> Result:
+        self.calls += 1
+        await asyncio.sleep(0)  # a real round trip lets other allocations run
+        return Result(1 + (self.calls - 1) * self.block)
+
+
+@pytest.mark.anyio
+async def test_values_are_consecutive_with_one_refill_per_block():
+    session = FakeSequence(block=10)
+    allocator = BlockAllocator("nextval", 10)
+
+    values = [await allocator.allocate(session) for _ in range(25)]
+    assert values == list(range(1, 26))
+    assert session.calls == 3
+
+
+@pytest.mark.anyio
+async def test_concurrent_allocations_share_blocks():
+    session = FakeSequence(block=10)
+    allocator = BlockAllocator("nextval", 10)
+
+    values = await asyncio.gather(*(allocator.allocate(session) for _ in range(35)))
+    assert sorted(values) == list(range(1, 36))
+    assert session.calls == 4
+
+
+@pytest.mark.anyio
+async def test_forked_worker_drops_the_parents_block(monkeypatch):
+    session = FakeSequence(block=10)
+    allocator = BlockAllocator("nextval", 10)
+    assert await allocator.allocate(session) == 1
+
+    monkeypatch.setattr(numbering_service.os, "getpid", lambda: -1)
+    assert await allocator.allocate(session) == 11
+    assert session.calls == 2
+
+
+def test_format_number_pads_to_configured_digits(monkeypatch):
+    monkeypatch.setattr(numbering_service.settings, "numbering_digits", 6)
+    assert format_number("EC", 2026, 123) == "EC-2026-000123"
@@ -0,0 +1,82 @@
+"""Patching the in-process suggest index."""
+
+import random
+import uuid
+
+from app.modules.search.search_suggest import SuggestIndex, SuggestRow
+
+
+def _product(name: str, weight: int = 0) -> SuggestRow:
+    product_id = uuid.uuid4()
+    return SuggestRow("product", product_id, name, product_id, ("product", product_id), weight)
+
+
+def _relabel(row: SuggestRow, name: str) -> SuggestRow:
+    return SuggestRow(row.kind, row.id, name, row.product_id, row.owner, row.weight)
+
+
+def test_replace_evicts_the_least_popular_past_max_entries():
+    index = SuggestIndex(max_entries=3)
+    rows = [
+        _product("Castrol Edge", 30),
+        _product("Castrol GTX", 20),
+        _product("Castrol Magnatec", 10),
+    ]
+    index.build(rows)
+
+    newcomer = _product("Castrol Power1", 15)
+    index.replace([newcomer.owner], [newcomer])
+
+    assert len(index) == 3
+    assert [r.label for r in index.suggest("castrol", 10)] == [
+        "Castrol Edge",
+        "Castrol GTX",
+        "Castrol Power1",
+    ]
+    assert index.suggest("magnatec", 10) == []
+    assert rows[2].owner not in index._owned
+
+
+def test_unpopular_newcomer_is_not_kept_past_max_entries():
+    index = SuggestIndex(max_entries=2)
+    index.build([_product("Mobil 1", 5), _product("Mobil Delvac", 4)])
+
+    newcomer = _product("Mobil Super", 0)
+    index.replace([newcomer.owner], [newcomer])
+
+    assert len(index) == 2
+    assert index.suggest("super", 10) == []
+
+
+def test_repeated_patches_reuse_slots():
+    index = SuggestIndex(max_entries=10)
+    rows = [_product(f"Filter {i}", i) for i in range(5)]
+    index.build(rows)
+
+    for n in range(100):
+        index.replace([rows[0].owner], [_relabel(rows[0], f"Filter renamed {n}")])
+
+    assert len(index._rows) == 5
+    assert [r.label for r in index.suggest("filter renamed", 10)] == ["Filter renamed 99"]
+
+
+def test_patched_index_answers_like_a_fresh_build():
+    rng = random.Random(7)
+    words = ["castrol", "edge", "mobil", "gtx", "synthetic", "filter", "5w-30", "diesel"]
+    current = {}
+    index = SuggestIndex(max_entries=40)
+    index.build([])
+
+    for _ in range(300):
+        row = _product(" ".join(rng.sample(words, 3)), rng.randrange(50))
+        if current and rng.random() < 0.4:
+            row = _relabel(rng.choice(list(current.values())), row.label)
+        current[row.id] = row
+        index.replace([row.owner], [row])
+
+    fresh = SuggestIndex(max_entries=40)
+    fresh.build(index._rows[slot] for slot in index._slot_of.values())
+    assert len(index) == 40
+    assert len(index._rows) <= 41
+    for prefix in words + ["c", "m", "edge 5"]:
+        assert index.suggest(prefix, 8) == fresh.suggest(prefix, 8)
@@ -0,0 +1,101 @@
+"""Background refresh of the shipping quote cache."""
+
+import asyncio
+
+import pytest
+
+from app.modules.shipping.shipping_quote_cache import LaneKey, ShippingQuoteCache
+
+_RATES = {"currency": "CAD", "rates": [{"service": "GROUND", "amount": "12.50", "days": 5}]}
+
+
+class FakeClient:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def get_shipping_rates(self, from_zip: str, to_zip: str, weight: float) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0)  # a real call yields to the other waiters
+        await self.release.wait()
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+async def _drain(cache: ShippingQuoteCache) -> None:
+    await asyncio.gather(*cache._background, return_exceptions=True)
+
+
+@pytest.mark.anyio
+async def test_unexpected_refresh_error_is_contained_and_clears_inflight():
+    client = FakeClient({"rates": [{"service": "GROUND"}]}, _RATES)  # no amount: KeyError
+    cache = ShippingQuoteCache(client)
+    lane = LaneKey("TOR", "M5V", 5.0)
+
+    cache._refresh_in_background(lane, "M1M1M1", "M5V2T6")
+    await _drain(cache)
+    assert cache._inflight == {}
+    assert not cache._background
+
+    card = await cache._load(lane, "M1M1M1", "M5V2T6")
+    assert card.rates["GROUND"].amount == 12.5
+    assert client.calls == 2
+
+
+@pytest.mark.anyio
+async def test_concurrent_loads_share_one_call():
+    client = FakeClient(_RATES)
+    cache = ShippingQuoteCache(client)
+    lane = LaneKey("TOR", "M5V", 5.0)
+
+    cards = await asyncio.gather(*(cache._load(lane, "M1M1M1", "M5V2T6") for _ in range(5)))
+    assert client.calls == 1
+    assert all(card is cards[0] for card in cards)
+    assert cache._inflight == {}
+
+
+@pytest.mark.anyio
+async def test_cancelled_leader_hands_the_fetch_to_a_follower():
+    client = FakeClient(_RATES, _RATES)
+    client.release.clear()
+    cache = ShippingQuoteCache(client)
+    lane = LaneKey("TOR", "M5V", 5.0)
+
+    leader = asyncio.create_task(cache._load(lane, "M1M1M1", "M5V2T6"))
+    await asyncio.sleep(0)  # the leader is now inside the provider call
+    followers = [asyncio.create_task(cache._load(lane, "M1M1M1", "M5V2T6")) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    client.release.set()
+
+    cards = await asyncio.gather(*followers)
+    assert leader.cancelled()
+    assert client.calls == 2
+    assert all(card is cards[0] for card in cards)
+    assert cache._inflight == {}
+
+
+@pytest.mark.anyio
+async def test_cancelled_follower_leaves_the_fetch_running():
+    client = FakeClient(_RATES)
+    client.release.clear()
+    cache = ShippingQuoteCache(client)
+    lane = LaneKey("TOR", "M5V", 5.0)
+
+    leader = asyncio.create_task(cache._load(lane, "M1M1M1", "M5V2T6"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache._load(lane, "M1M1M1", "M5V2T6"))
+    await asyncio.sleep(0)
+    follower.cancel()
+    await asyncio.sleep(0)
+    client.release.set()
+
+    card = await leader
+    assert follower.cancelled()
+    assert card.rates["GROUND"].amount == 12.5
+    assert client.calls == 1
@@ -0,0 +1,81 @@
+"""Stock sync: rows below reserved stock, with `inventory.reserved_quantity` NULL.
+
+The statements are plain SQL; the parts that classify rows run unchanged on
+SQLite, so the preview, the report and the merge are checked against the
+same data.
+"""
+
+import re
+import sqlite3
+
+import pytest
+
+from app.modules.stock_sync.stock_sync_service import (
+    _BELOW_RESERVED_SQL,
+    _DIFF_SUMMARY_SQL,
+    _MERGE_CHUNK_SQL,
+)
+
+SYNC = "sync-1"
+
+
+@pytest.fixture
+def db():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE inventory (
+            id TEXT, variant_id TEXT, warehouse_id TEXT,
+            stock_quantity INTEGER, reserved_quantity INTEGER
+        );
+        CREATE TABLE stock_sync_staging (
+            sync_id TEXT, line_no INTEGER, sku TEXT, warehouse_code TEXT,
+            quantity INTEGER, variant_id TEXT, warehouse_id TEXT
+        );
+    """)
+    # sku, on hand, reserved (NULL = never reserved), synced quantity
+    rows = [
+        ("NULL-RES", 10, None, 4),
+        ("BELOW", 10, 6, 4),
+        ("ABOVE", 10, 2, 4),
+    ]
+    for line_no, (sku, stock, reserved, quantity) in enumerate(rows, start=1):
+        conn.execute(
+            "INSERT INTO inventory VALUES (?, ?, 'w1', ?, ?)", (f"i-{sku}", sku, stock, reserved)
+        )
+        conn.execute(
+            "INSERT INTO stock_sync_staging VALUES (?, ?, ?, 'WH1', ?, ?, 'w1')",
+            (SYNC, line_no, sku, quantity, sku),
+        )
+    yield conn
+    conn.close()
+
+
+def _merge_classification(conn) -> tuple[set[str], set[str]]:
+    """SKUs the merge would apply and skip, using its own `locked` CTE and predicates."""
+    sql = _MERGE_CHUNK_SQL.text
+    ctes = sql[sql.index("WITH batch") : sql.index("    FOR UPDATE OF i")] + ")"
+    applicable = re.search(r"applicable AS \(\s*SELECT \* FROM locked WHERE (.+)\n", sql)[1]
+    skipped = re.search(r"FROM locked WHERE (target < \w+)\n", sql)[1]
+    params = {"sync_id": SYNC, "after": 0, "upto": 10}
+
+    def skus(predicate: str) -> set[str]:
+        rows = conn.execute(f"{ctes} SELECT sku FROM locked WHERE {predicate}", params)
+        return {row[0] for row in rows}
+
+    return skus(applicable), skus(skipped)
+
+
+def test_null_reserved_counts_as_nothing_reserved(db):
+    applied, skipped = _merge_classification(db)
+    assert applied == {"NULL-RES", "ABOVE"}
+    assert skipped == {"BELOW"}
+
+
+def test_preview_and_report_agree_with_the_merge(db):
+    summary = db.execute(_DIFF_SUMMARY_SQL.text, {"sync_id": SYNC}).fetchone()
+    below_reserved = summary[4]
+    sample = [r[0] for r in db.execute(_BELOW_RESERVED_SQL.text, {"sync_id": SYNC, "sample": 10})]
+
+    _, skipped = _merge_classification(db)
+    assert below_reserved == len(skipped) == 1
+    assert sample == ["BELOW@WH1"]
@@ -0,0 +1,58 @@
+"""Streaming CSV / NDJSON row reader."""
+
+import pytest
+
+from app.common.utils.tabular import iter_rows
+from app.core.exceptions import ValidationError
+
+ALIASES = {"sku": "sku", "name": "name", "price": "price"}
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _rows(data: bytes, fmt: str = "csv") -> list[dict]:
+    return [row async for row in iter_rows(_chunks(data), fmt, ALIASES, required=("sku",))]
+
+
+@pytest.mark.anyio
+async def test_quoted_field_may_span_lines():
+    data = b'SKU,Name,Price\r\nA-1,"Engine oil\r\n\r\n5W-30",12.50\r\nA-2,"Says ""hi""",3\r\n'
+    assert await _rows(data) == [
+        {"sku": "A-1", "name": "Engine oil\n\n5W-30", "price": "12.50"},
+        {"sku": "A-2", "name": 'Says "hi"', "price": "3"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_blank_lines_and_unknown_columns_are_dropped():
+    data = b"\xef\xbb\xbfsku,colour,price\n\nA-1,red,1\n\n"
+    assert await _rows(data) == [{"sku": "A-1", "price": "1"}]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("line", [b"A-2,x", b"A-2,x,1,extra"])
+async def test_row_with_wrong_field_count_rejects_the_file(line):
+    with pytest.raises(ValidationError) as raised:
+        await _rows(b"sku,name,price\nA-1,y,2\n" + line + b"\n")
+    assert "CSV row 2" in raised.value.message
+
+
+@pytest.mark.anyio
+async def test_unterminated_quote_rejects_the_file():
+    with pytest.raises(ValidationError):
+        await _rows(b'sku,name,price\nA-1,"open,1\nA-2,x,2\n')
+
+
+@pytest.mark.anyio
+async def test_missing_required_column_rejects_the_file():
+    with pytest.raises(ValidationError):
+        await _rows(b"name,price\nx,1\n")
+
+
+@pytest.mark.anyio
+async def test_ndjson_non_object_yields_an_empty_row():
+    data = b'{"SKU": "A-1", "price": 2}\n\n[1]\nnot json\n'
+    assert await _rows(data, "ndjson") == [{"sku": "A-1", "price": 2}, {}, {}]
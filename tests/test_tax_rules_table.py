@@ -0,0 +1,70 @@
+"""Batch per-line and per-document tax breakdowns."""
+
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+
+from app.core.exceptions import BusinessRuleError
+from app.modules.tax_rules.tax_rules_table import (
+    TaxableDocument,
+    TaxBreakdown,
+    TaxRates,
+    TaxTable,
+    compute_tax_breakdowns,
+)
+
+D = Decimal
+ZERO = D("0.00")
+
+TABLE = TaxTable(
+    MappingProxyType(
+        {
+            "ON": TaxRates("ON", D("5.00"), None, D("13.00")),
+            "BC": TaxRates("BC", D("5.00"), D("7.00"), None),
+            "AB": TaxRates("AB", D("5.00"), None, None),
+        }
+    ),
+    version=(3, None),
+)
+
+
+def test_hst_province_taxes_lines_and_total():
+    [result] = compute_tax_breakdowns(
+        TABLE, [TaxableDocument("o1", "on", (("a", D("100.00")), ("b", D("50.00"))))]
+    )
+    assert result.key == "o1"
+    assert result.province == "ON"
+    assert result.line_taxes["a"] == TaxBreakdown(ZERO, ZERO, D("13.00"))
+    assert result.line_taxes["b"] == TaxBreakdown(ZERO, ZERO, D("6.50"))
+    assert result.taxes == TaxBreakdown(ZERO, ZERO, D("19.50"))
+
+
+def test_gst_pst_province_splits_components():
+    [result] = compute_tax_breakdowns(TABLE, [TaxableDocument("i1", "BC", (("a", D("80.00")),))])
+    assert result.taxes == TaxBreakdown(D("4.00"), D("5.60"), ZERO)
+    assert result.taxes.total == D("9.60")
+
+
+def test_document_total_is_rounded_once():
+    # Each line rounds 0.165 -> 0.17 GST; the total 0.33 is charged, not 0.34
+    lines = (("a", D("3.30")), ("b", D("3.30")))
+    [result] = compute_tax_breakdowns(TABLE, [TaxableDocument("o1", "AB", lines)])
+    assert sum(t.gst for t in result.line_taxes.values()) == D("0.34")
+    assert result.taxes.gst == D("0.33")
+
+
+def test_many_documents_keep_their_order():
+    documents = [
+        TaxableDocument("o1", "ON", (("a", D("10.00")),)),
+        TaxableDocument("o2", "AB", (("a", D("10.00")),)),
+        TaxableDocument("o3", "BC", ()),
+    ]
+    results = compute_tax_breakdowns(TABLE, documents)
+    assert [r.key for r in results] == ["o1", "o2", "o3"]
+    assert [r.taxes.total for r in results] == [D("1.30"), D("0.50"), ZERO]
+
+
+def test_unknown_province_is_rejected():
+    with pytest.raises(BusinessRuleError):
+        compute_tax_breakdowns(TABLE, [TaxableDocument("o1", "YT", (("a", D("1.00")),))])